@@ -7,12 +7,14 @@ Credentials are read from environment variables set by Claude Desktop.
 Falls back to config file for Claude Code compatibility.
 """
 
+import asyncio
 import json
 import os
 import sys
 import time
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urljoin, urlsplit
 import httpx
 from mcp.server.fastmcp import FastMCP
 
@@ -428,6 +430,193 @@ async def celigo_resolve_step_errors(flow_id: str, step_id: str, error_ids: list
         return _handle_error(e)
 
 
+# Bulk retry/resolve mirrors celigo-integration's celigo_bulk_errors.py: the
+# same step shapes, nextPageURL paging of the error lists, and a shared
+# request rate with backoff on 429.
+
+_BULK_MAX_PAGES = 1000   # safety stop for an error list that keeps returning nextPageURL
+_BULK_MAX_429_RETRIES = 4
+_BULK_BACKOFF_CAP = 30.0
+
+
+class _RateLimiter:
+    """Spaces request starts at least 1/rate seconds apart across tasks."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next)
+        self._next = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _flow_steps(flow: dict) -> list[tuple[str, str]]:
+    """(step_id, 'exports'|'imports') for every source and processor step of a flow."""
+    steps: list[tuple[str, str]] = []
+
+    def add(step_id, kind):
+        if step_id and (step_id, kind) not in steps:
+            steps.append((step_id, kind))
+
+    def add_processors(processors):
+        for pp in processors or []:
+            if pp.get("type") == "import" or pp.get("_importId"):
+                add(pp.get("_importId"), "imports")
+            else:
+                add(pp.get("_exportId"), "exports")
+
+    for pg in flow.get("pageGenerators") or []:
+        add(pg.get("_exportId"), "exports")
+    add(flow.get("_exportId"), "exports")  # legacy single-export flows
+    add(flow.get("_importId"), "imports")
+    add_processors(flow.get("pageProcessors"))
+    for router in flow.get("routers") or []:
+        for branch in router.get("branches") or []:
+            add_processors(branch.get("pageProcessors"))
+    return steps
+
+
+def _next_endpoint(data, api_url: str) -> Optional[str]:
+    """nextPageURL of an errors page as an endpoint relative to api_url (None on the last page)."""
+    nxt = data.get("nextPageURL") if isinstance(data, dict) else None
+    if not nxt:
+        return None
+    path = urlsplit(urljoin(api_url + "/", nxt))
+    endpoint = path.path + (f"?{path.query}" if path.query else "")
+    base_path = urlsplit(api_url).path.rstrip("/")
+    return endpoint[len(base_path):] if base_path and endpoint.startswith(base_path + "/") else endpoint
+
+
+@mcp.tool(
+    name="celigo_bulk_step_errors",
+    annotations={"title": "Bulk Retry/Resolve Errors", "readOnlyHint": False, "destructiveHint": True, "idempotentHint": False, "openWorldHint": True}
+)
+async def celigo_bulk_step_errors(
+    action: str,
+    integration_id: Optional[str] = None,
+    flow_id: Optional[str] = None,
+    codes: Optional[list[str]] = None,
+    dry_run: bool = True,
+    batch_size: int = 1000,
+    max_concurrency: int = 6,
+    rate: float = 5.0,
+) -> str:
+    """Retry or resolve every open error in an integration or flow, in batches.
+
+    Steps are enumerated and their errors listed concurrently (following
+    nextPageURL), then retried (by retryDataKey) or resolved (by errorId) in
+    batches of up to batch_size. Requests are spaced to `rate` per second and
+    backed off on 429.
+
+    Args:
+        action: 'retry' or 'resolve'
+        integration_id: Scope to all flows with open errors in this integration
+        flow_id: Scope to one flow (used when integration_id is not given)
+        codes: Only errors with these error codes (optional)
+        dry_run: Only report matching errors per step (default: True)
+        batch_size: Keys/ids per request (default: 1000)
+        max_concurrency: Requests in flight (default: 6)
+        rate: Requests per second across all in-flight calls (default: 5, 0 = unlimited)
+
+    Returns:
+        JSON with per-step counts, and per-batch results when dry_run is false.
+    """
+    try:
+        if action not in ("retry", "resolve"):
+            return "Error: action must be 'retry' or 'resolve'."
+        if not integration_id and not flow_id:
+            return "Error: integration_id or flow_id is required."
+        api_url, _ = _get_credentials()
+        sem = asyncio.Semaphore(max(1, max_concurrency))
+        limiter = _RateLimiter(rate)
+
+        async def call(method, endpoint, data=None):
+            async with sem:
+                for attempt in range(_BULK_MAX_429_RETRIES + 1):
+                    await limiter.wait()
+                    try:
+                        return await _celigo_request(method, endpoint, data=data)
+                    except httpx.HTTPStatusError as e:
+                        if e.response.status_code != 429 or attempt == _BULK_MAX_429_RETRIES:
+                            raise
+                        try:
+                            delay = float(e.response.headers.get("Retry-After", ""))
+                        except ValueError:
+                            delay = 2.0 ** attempt
+                        await asyncio.sleep(min(_BULK_BACKOFF_CAP, max(0.0, delay)))
+
+        async def list_errors(fid, sid, kind):
+            """Every open error of one step, and whether the page cap cut the list short."""
+            endpoint, errors = f"/flows/{fid}/{kind}/{sid}/errors", []
+            for _ in range(_BULK_MAX_PAGES):
+                data = await call("GET", endpoint)
+                errors.extend(data.get("errors", []) if isinstance(data, dict) else data or [])
+                endpoint = _next_endpoint(data, api_url)
+                if not endpoint:
+                    return errors, False
+            return errors, True
+
+        if flow_id:
+            flow_ids = [flow_id]
+        else:
+            summary = await call("GET", f"/integrations/{integration_id}/errors")
+            flow_ids = list(dict.fromkeys(
+                e["_flowId"] for e in summary if e.get("_flowId") and e.get("numError", 0) > 0))
+
+        flows = await asyncio.gather(*[call("GET", f"/flows/{fid}") for fid in flow_ids])
+        steps = [(fid, sid, kind) for fid, flow in zip(flow_ids, flows)
+                 for sid, kind in _flow_steps(flow)]
+        listed = await asyncio.gather(*[list_errors(*step) for step in steps])
+
+        wanted = {str(c).lower() for c in codes or []}
+        field = "retryDataKey" if action == "retry" else "errorId"
+        step_rows, batches = [], []
+        for (fid, sid, kind), (errors, truncated) in zip(steps, listed):
+            if not errors:
+                continue
+            matched = [e for e in errors if not wanted or str(e.get("code", "")).lower() in wanted]
+            keys = [e[field] for e in matched if e.get(field)]
+            row = {"flow": fid, "step": sid, "kind": kind,
+                   "open": len(errors), "matched": len(matched), "keys": len(keys)}
+            if truncated:
+                row["truncated"] = True
+            step_rows.append(row)
+            size = max(1, batch_size)
+            batches.extend((fid, sid, kind, n // size + 1, keys[n:n + size])
+                           for n in range(0, len(keys), size))
+
+        result = {"action": action, "dry_run": dry_run, "steps": step_rows,
+                  "batches_planned": len(batches)}
+        if any(r.get("truncated") for r in step_rows):
+            result["WARNING_truncated"] = (f"Some steps have more than {_BULK_MAX_PAGES} pages of errors; "
+                                           "run again after this pass to cover the rest.")
+        if dry_run:
+            return _fmt(result)
+
+        async def send(fid, sid, kind, n, keys):
+            try:
+                if action == "retry":
+                    await call("POST", f"/flows/{fid}/{kind}/{sid}/errors/retry", {"retryDataKeys": keys})
+                else:
+                    await call("PUT", f"/flows/{fid}/{sid}/resolved", {"errorIds": keys})
+                return {"flow": fid, "step": sid, "batch": n, "size": len(keys), "ok": True}
+            except Exception as e:
+                return {"flow": fid, "step": sid, "batch": n, "size": len(keys), "ok": False,
+                        "message": _handle_error(e)}
+
+        result["batches"] = await asyncio.gather(*[send(*b) for b in batches])
+        result["succeeded"] = sum(1 for b in result["batches"] if b["ok"])
+        return _fmt(result)
+    except Exception as e:
+        return _handle_error(e)
+
+
 # =============================================================================
 # Connections
 # =============================================================================
@@ -549,6 +738,113 @@ def _is_edi_integration(name: str) -> bool:
     return any(kw in name.upper() for kw in _EDI_KEYWORDS) and name.startswith("EDI")
 
 
+# =============================================================================
+# EDI Topology Cache
+# =============================================================================
+# Integrations, flows and the partner/network/doc-type parsing of their names
+# change rarely, but every EDI tool needs them. One process-level snapshot is
+# served for _TOPOLOGY_TTL seconds; after that it is still served (up to
+# _TOPOLOGY_MAX_STALE) while a background task rebuilds it. Error counts move
+# faster and are cached per integration for _EDI_ERRORS_TTL seconds, fetched
+# at most _EDI_ERROR_CONCURRENCY at a time. Every EDI tool takes refresh=True
+# to bypass both.
+
+_TOPOLOGY_TTL = 300.0
+_TOPOLOGY_MAX_STALE = 3600.0
+_EDI_ERRORS_TTL = 60.0
+_EDI_ERROR_CONCURRENCY = 8
+
+# {"account", "built_at" (monotonic), "integrations": {_id: meta}, "flows": {_integrationId: [flow]}}
+_topology: dict = {}
+_topology_lock = asyncio.Lock()
+_topology_task: Optional[asyncio.Task] = None
+# integration _id -> (fetched_at monotonic, /integrations/{id}/errors rows)
+_edi_errors: dict[str, tuple[float, list]] = {}
+_edi_error_sem = asyncio.Semaphore(_EDI_ERROR_CONCURRENCY)
+
+
+async def _build_topology() -> dict:
+    started = time.monotonic()
+    integrations, flows = await asyncio.gather(
+        _celigo_request("GET", "/integrations"),
+        _celigo_request("GET", "/flows"),
+    )
+    by_id = {}
+    for i in integrations:
+        name = i.get("name", "")
+        meta = {"_id": i["_id"], "name": name, "lastModified": i.get("lastModified"),
+                "edi": _is_edi_integration(name)}
+        meta.update(_parse_edi_integration(name))
+        by_id[i["_id"]] = meta
+    by_integration: dict = {}
+    for f in flows:
+        by_integration.setdefault(f.get("_integrationId", ""), []).append({
+            "_id": f["_id"],
+            "name": f.get("name", ""),
+            "doc_type": _extract_doc_type(f.get("name", "")),
+            "disabled": bool(f.get("disabled", False)),
+            "lastExecutedAt": f.get("lastExecutedAt"),
+        })
+    return {"account": _get_credentials(), "built_at": started,
+            "integrations": by_id, "flows": by_integration}
+
+
+async def _refresh_topology() -> dict:
+    """Rebuild the topology unless a rebuild that started after this call already finished."""
+    global _topology
+    requested = time.monotonic()
+    async with _topology_lock:
+        if _topology.get("built_at", -1.0) >= requested:
+            return _topology
+        _topology = await _build_topology()
+        return _topology
+
+
+async def _refresh_topology_in_background() -> None:
+    try:
+        await _refresh_topology()
+    except Exception as e:  # the stale copy keeps being served; the next call retries
+        print(f"EDI topology refresh failed: {_handle_error(e)}", file=sys.stderr)
+
+
+async def _get_topology(refresh: bool = False) -> dict:
+    global _topology_task
+    fresh_enough = _topology and _topology["account"] == _get_credentials()
+    age = time.monotonic() - _topology["built_at"] if fresh_enough else None
+    if refresh or age is None or age >= _TOPOLOGY_MAX_STALE:
+        return await _refresh_topology()
+    if age >= _TOPOLOGY_TTL and (_topology_task is None or _topology_task.done()):
+        _topology_task = asyncio.create_task(_refresh_topology_in_background())
+    return _topology
+
+
+def _topology_info(topo: dict) -> dict:
+    return {"topology_age_s": round(time.monotonic() - topo["built_at"]),
+            "refreshing": bool(_topology_task and not _topology_task.done())}
+
+
+def _edi_integrations(topo: dict, include_staging: bool = False) -> list[dict]:
+    return [i for i in topo["integrations"].values()
+            if i["edi"] and (include_staging or not i["staging"])]
+
+
+async def _edi_error_rows(integration_ids: list[str], refresh: bool = False) -> dict[str, Optional[list]]:
+    """/integrations/{id}/errors rows per integration (None if the fetch failed)."""
+    async def one(iid):
+        cached = _edi_errors.get(iid)
+        if cached and not refresh and time.monotonic() - cached[0] < _EDI_ERRORS_TTL:
+            return iid, cached[1]
+        async with _edi_error_sem:
+            try:
+                rows = await _celigo_request("GET", f"/integrations/{iid}/errors") or []
+            except Exception:
+                return iid, None
+        _edi_errors[iid] = (time.monotonic(), rows)
+        return iid, rows
+
+    return dict(await asyncio.gather(*[one(iid) for iid in integration_ids]))
+
+
 @mcp.tool(
     name="celigo_list_edi_integrations",
     annotations={"title": "List EDI Integrations", "readOnlyHint": True, "openWorldHint": True}
@@ -556,37 +852,27 @@ def _is_edi_integration(name: str) -> bool:
 async def celigo_list_edi_integrations(
     include_staging: bool = False,
     network: Optional[str] = None,
+    refresh: bool = False,
 ) -> str:
     """List all EDI trading partner integrations with metadata.
 
     Args:
         include_staging: Include staging/dated copies (e.g. 'EDI - Academy (10/14/2025)'). Default False.
         network: Filter by network type: 'VAN', 'SPS', or 'direct'. Default returns all.
+        refresh: Re-fetch integrations instead of using the cached EDI topology (up to 5 min old).
 
     Returns:
         JSON array of EDI integrations with partner name, network type, integration ID,
         and staging status. Use _id values with other EDI tools.
     """
     try:
-        data = await _celigo_request("GET", "/integrations")
-        edi = []
-        for i in data:
-            name = i.get("name", "")
-            if not _is_edi_integration(name):
-                continue
-            meta = _parse_edi_integration(name)
-            if not include_staging and meta["staging"]:
-                continue
-            if network and meta["network"].upper() != network.upper():
-                continue
-            edi.append({
-                "_id": i["_id"],
-                "name": name,
-                "partner": meta["partner"],
-                "network": meta["network"],
-                "staging": meta["staging"],
-                "lastModified": i.get("lastModified"),
-            })
+        topo = await _get_topology(refresh)
+        edi = [
+            {"_id": i["_id"], "name": i["name"], "partner": i["partner"], "network": i["network"],
+             "staging": i["staging"], "lastModified": i["lastModified"]}
+            for i in _edi_integrations(topo, include_staging)
+            if not network or i["network"].upper() == network.upper()
+        ]
         edi.sort(key=lambda x: x["partner"].lower())
         return _fmt(edi, "integrations")
     except Exception as e:
@@ -597,7 +883,7 @@ async def celigo_list_edi_integrations(
     name="celigo_get_edi_error_summary",
     annotations={"title": "EDI Error Summary", "readOnlyHint": True, "openWorldHint": True}
 )
-async def celigo_get_edi_error_summary(include_staging: bool = False) -> str:
+async def celigo_get_edi_error_summary(include_staging: bool = False, refresh: bool = False) -> str:
     """Get aggregated error summary across all active EDI trading partner integrations.
 
     Calls the errors endpoint for each active EDI integration and returns a
@@ -605,6 +891,7 @@ async def celigo_get_edi_error_summary(include_staging: bool = False) -> str:
 
     Args:
         include_staging: Include staging/dated integration copies. Default False.
+        refresh: Bypass the cached topology and error counts (errors are cached for 60s).
 
     Returns:
         JSON object with:
@@ -613,37 +900,27 @@ async def celigo_get_edi_error_summary(include_staging: bool = False) -> str:
         - by_partner: list sorted by error count (partner, network, _integrationId, total_errors, flow_errors)
     """
     try:
-        integrations = await _celigo_request("GET", "/integrations")
-        edi_integrations = []
-        for i in integrations:
-            name = i.get("name", "")
-            if not _is_edi_integration(name):
-                continue
-            meta = _parse_edi_integration(name)
-            if not include_staging and meta["staging"]:
-                continue
-            edi_integrations.append({**i, **meta})
+        topo = await _get_topology(refresh)
+        edi_integrations = _edi_integrations(topo, include_staging)
+        error_rows = await _edi_error_rows([i["_id"] for i in edi_integrations], refresh)
 
-        # Fetch errors for each EDI integration concurrently
-        import asyncio
-        async def get_errors(integ):
-            try:
-                errors = await _celigo_request("GET", f"/integrations/{integ['_id']}/errors")
-                total = sum(e.get("numError", 0) for e in (errors or []))
-                flows_with_errors = [e for e in (errors or []) if e.get("numError", 0) > 0]
-                return {
-                    "partner": integ["partner"],
-                    "network": integ["network"],
-                    "_integrationId": integ["_id"],
-                    "total_errors": total,
-                    "flows_with_errors": len(flows_with_errors),
-                    "flow_details": flows_with_errors[:10],
-                }
-            except Exception:
-                return {"partner": integ["partner"], "network": integ["network"],
-                        "_integrationId": integ["_id"], "total_errors": -1, "error": "fetch_failed"}
-
-        results = await asyncio.gather(*[get_errors(i) for i in edi_integrations])
+        results = []
+        for integ in edi_integrations:
+            errors = error_rows[integ["_id"]]
+            if errors is None:
+                results.append({"partner": integ["partner"], "network": integ["network"],
+                                "_integrationId": integ["_id"], "total_errors": -1,
+                                "error": "fetch_failed"})
+                continue
+            flows_with_errors = [e for e in errors if e.get("numError", 0) > 0]
+            results.append({
+                "partner": integ["partner"],
+                "network": integ["network"],
+                "_integrationId": integ["_id"],
+                "total_errors": sum(e.get("numError", 0) for e in errors),
+                "flows_with_errors": len(flows_with_errors),
+                "flow_details": flows_with_errors[:10],
+            })
         results = sorted(results, key=lambda x: x.get("total_errors", 0), reverse=True)
 
         total_errors = sum(r.get("total_errors", 0) for r in results if r.get("total_errors", 0) >= 0)
@@ -654,6 +931,7 @@ async def celigo_get_edi_error_summary(include_staging: bool = False) -> str:
             "partners_with_errors": partners_with_errors,
             "total_edi_integrations": len(edi_integrations),
             "by_partner": results,
+            "cache": _topology_info(topo),
         }
         return _fmt(report)
     except Exception as e:
@@ -664,11 +942,13 @@ async def celigo_get_edi_error_summary(include_staging: bool = False) -> str:
     name="celigo_get_edi_flow_summary",
     annotations={"title": "EDI Flow Summary by Partner", "readOnlyHint": True, "openWorldHint": True}
 )
-async def celigo_get_edi_flow_summary(integration_id: str) -> str:
+async def celigo_get_edi_flow_summary(integration_id: str, refresh: bool = False) -> str:
     """Get detailed flow status for a specific EDI trading partner integration.
 
     Args:
         integration_id: The integration _id (get from celigo_list_edi_integrations).
+        refresh: Bypass the cached topology and error counts. Flow enabled state and
+            lastExecutedAt come from the topology, which may be up to 5 min old.
 
     Returns:
         JSON with integration name, partner info, and flows grouped by document type
@@ -676,42 +956,42 @@ async def celigo_get_edi_flow_summary(integration_id: str) -> str:
         and last execution time.
     """
     try:
-        import asyncio
-        integ, flows_all, errors = await asyncio.gather(
-            _celigo_request("GET", f"/integrations/{integration_id}"),
-            _celigo_request("GET", "/flows"),
-            _celigo_request("GET", f"/integrations/{integration_id}/errors"),
-        )
-
-        # Filter flows belonging to this integration
-        flows = [f for f in flows_all if f.get("_integrationId") == integration_id]
+        topo = await _get_topology(refresh)
+        if integration_id not in topo["integrations"] and not refresh:
+            topo = await _get_topology(refresh=True)  # created since the last refresh?
+        integ = topo["integrations"].get(integration_id)
+        if integ is None:
+            return "Error: Resource not found. Check the ID is correct."
+        flows = topo["flows"].get(integration_id, [])
+        errors = (await _edi_error_rows([integration_id], refresh))[integration_id]
+        if errors is None:  # surface the API error instead of reporting zero errors
+            await _celigo_request("GET", f"/integrations/{integration_id}/errors")
         error_map = {e["_flowId"]: e.get("numError", 0) for e in (errors or [])}
 
         by_doc_type: dict = {}
         for f in flows:
-            doc = _extract_doc_type(f["name"])
+            doc = f["doc_type"]
             label = _EDI_DOC_TYPES.get(doc, f"Doc {doc}")
             if doc not in by_doc_type:
                 by_doc_type[doc] = {"doc_type": doc, "description": label, "flows": []}
             by_doc_type[doc]["flows"].append({
                 "_id": f["_id"],
                 "name": f["name"],
-                "enabled": not f.get("disabled", False),
-                "lastExecutedAt": f.get("lastExecutedAt"),
+                "enabled": not f["disabled"],
+                "lastExecutedAt": f["lastExecutedAt"],
                 "numError": error_map.get(f["_id"], 0),
             })
 
-        name = integ.get("name", "")
-        meta = _parse_edi_integration(name)
         return _fmt({
             "_integrationId": integration_id,
-            "name": name,
-            "partner": meta["partner"],
-            "network": meta["network"],
+            "name": integ["name"],
+            "partner": integ["partner"],
+            "network": integ["network"],
             "total_flows": len(flows),
-            "active_flows": sum(1 for f in flows if not f.get("disabled")),
+            "active_flows": sum(1 for f in flows if not f["disabled"]),
             "total_errors": sum(error_map.values()),
             "by_doc_type": sorted(by_doc_type.values(), key=lambda x: x["doc_type"]),
+            "cache": _topology_info(topo),
         })
     except Exception as e:
         return _handle_error(e)
@@ -721,7 +1001,7 @@ async def celigo_get_edi_flow_summary(integration_id: str) -> str:
     name="celigo_get_edi_health_dashboard",
     annotations={"title": "EDI Health Dashboard", "readOnlyHint": True, "openWorldHint": True}
 )
-async def celigo_get_edi_health_dashboard() -> str:
+async def celigo_get_edi_health_dashboard(refresh: bool = False) -> str:
     """Get a high-level health dashboard across all active EDI trading partners.
 
     Returns a compact summary suitable for a quick status overview:
@@ -730,63 +1010,28 @@ async def celigo_get_edi_health_dashboard() -> str:
     - Network type (VAN/SPS/direct)
     - Partners sorted by error count (most problematic first)
 
-    No arguments needed. Filters out staging/dated integration copies.
+    Filters out staging/dated integration copies. Served from the cached EDI
+    topology (refreshed in the background after 5 min) and 60s error counts;
+    pass refresh=True to re-fetch everything.
     """
     try:
-        import asyncio
-        integrations, flows_all = await asyncio.gather(
-            _celigo_request("GET", "/integrations"),
-            _celigo_request("GET", "/flows"),
-        )
-
-        edi_integrations = []
-        for i in integrations:
-            name = i.get("name", "")
-            if not _is_edi_integration(name):
-                continue
-            meta = _parse_edi_integration(name)
-            if meta["staging"]:
-                continue
-            edi_integrations.append({**i, **meta})
-
-        # Build flow counts per integration
-        flow_map: dict = {}
-        for f in flows_all:
-            iid = f.get("_integrationId", "")
-            if iid not in flow_map:
-                flow_map[iid] = {"active": 0, "disabled": 0, "doc_types": set()}
-            if f.get("disabled"):
-                flow_map[iid]["disabled"] += 1
-            else:
-                flow_map[iid]["active"] += 1
-            doc = _extract_doc_type(f["name"])
-            if doc != "other":
-                flow_map[iid]["doc_types"].add(doc)
-
-        # Fetch errors concurrently
-        async def get_error_count(integ):
-            try:
-                errors = await _celigo_request("GET", f"/integrations/{integ['_id']}/errors")
-                return integ["_id"], sum(e.get("numError", 0) for e in (errors or []))
-            except Exception:
-                return integ["_id"], -1
-
-        error_results = await asyncio.gather(*[get_error_count(i) for i in edi_integrations])
-        error_map = dict(error_results)
+        topo = await _get_topology(refresh)
+        edi_integrations = _edi_integrations(topo)
+        error_rows = await _edi_error_rows([i["_id"] for i in edi_integrations], refresh)
 
-        # Build dashboard rows
         rows = []
         for integ in edi_integrations:
             iid = integ["_id"]
-            fmap = flow_map.get(iid, {"active": 0, "disabled": 0, "doc_types": set()})
+            flows = topo["flows"].get(iid, [])
+            errors = error_rows[iid]
             rows.append({
                 "partner": integ["partner"],
                 "network": integ["network"],
                 "_integrationId": iid,
-                "active_flows": fmap["active"],
-                "disabled_flows": fmap["disabled"],
-                "doc_types": sorted(fmap["doc_types"]),
-                "errors": error_map.get(iid, 0),
+                "active_flows": sum(1 for f in flows if not f["disabled"]),
+                "disabled_flows": sum(1 for f in flows if f["disabled"]),
+                "doc_types": sorted({f["doc_type"] for f in flows if f["doc_type"] != "other"}),
+                "errors": -1 if errors is None else sum(e.get("numError", 0) for e in errors),
             })
 
         rows.sort(key=lambda x: (-x["errors"], x["partner"].lower()))
@@ -800,6 +1045,7 @@ async def celigo_get_edi_health_dashboard() -> str:
                 "total_active_flows": sum(r["active_flows"] for r in rows),
             },
             "partners": rows,
+            "cache": _topology_info(topo),
         })
     except Exception as e:
         return _handle_error(e)
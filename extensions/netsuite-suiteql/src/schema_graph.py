@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+NetSuite FK Graph and Join Planner
+
+Builds an in-memory foreign key graph from fkeys.json and plans SuiteQL joins
+between two or more tables.
+
+Every FK (fk_table.fk_column → pk_table.pk_column) is an edge that can be
+walked in both directions:
+  - fk → pk is many-to-one: joining it never multiplies rows
+  - pk → fk is one-to-many: joining it fans out (one row per child)
+
+Paths are found with breadth-first search over the adjacency index, so the
+shortest chains (fewest joins) come first; among equally short chains the
+ones with the fewest one-to-many hops rank higher. BFS trees are cached per
+source table for the life of the graph.
+
+For three or more tables the planner grows a join tree from the first table,
+repeatedly attaching the nearest remaining table by its best path.
+
+This module is shared by schema_lookup.py and the netsuite-suiteql MCP
+extension (extensions/netsuite-suiteql/src/schema_graph.py) — keep the two
+copies identical (tests/test_shared_modules.py checks this).
+
+Usage:
+  from schema_graph import FkGraph
+  graph = FkGraph.from_fkeys(load_cache(cache_dir, 'fkeys.json'))
+  plan = graph.plan(['Customer', 'TransactionLine'])
+  print(plan['sql'])
+"""
+
+from collections import deque
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# (from_table, to_table, fk_table, fk_column, pk_table, pk_column) — all canonical names
+Edge = Tuple[str, str, str, str, str, str]
+
+DEFAULT_MAX_HOPS = 6
+# Upper bound on shortest paths enumerated before ranking (hub tables can have thousands)
+_MAX_ENUMERATED = 500
+
+
+def edge_fans_out(edge: Edge) -> bool:
+    """True when walking the edge goes pk → fk (one-to-many)."""
+    return edge[0] == edge[4]
+
+
+def edge_on_clause(edge: Edge) -> str:
+    _, _, fk_table, fk_column, pk_table, pk_column = edge
+    return f'{fk_table}.{fk_column} = {pk_table}.{pk_column}'
+
+
+def describe_edge(edge: Edge) -> Dict[str, Any]:
+    return {
+        'from': edge[0],
+        'to': edge[1],
+        'on': edge_on_clause(edge),
+        'cardinality': 'one-to-many' if edge_fans_out(edge) else 'many-to-one',
+    }
+
+
+class FkGraph:
+    """Undirected FK adjacency with BFS join-path planning."""
+
+    def __init__(self, foreign_keys: Iterable[Dict[str, Any]]):
+        self.tables: Dict[str, str] = {}           # lower → canonical
+        self.adjacency: Dict[str, List[Edge]] = {}  # lower → outgoing edges (both directions)
+        self._trees: Dict[FrozenSet[str], Tuple[Dict[str, int], Dict[str, List[Tuple[str, Edge]]]]] = {}
+
+        for fk in foreign_keys:
+            fk_table, pk_table = fk.get('fk_table', ''), fk.get('pk_table', '')
+            fk_column, pk_column = fk.get('fk_column', ''), fk.get('pk_column', '')
+            if not (fk_table and pk_table and fk_column and pk_column):
+                continue
+            fk_table = self.tables.setdefault(fk_table.lower(), fk_table)
+            pk_table = self.tables.setdefault(pk_table.lower(), pk_table)
+            if fk_table == pk_table:
+                continue  # self-references never help connect two tables
+            self.adjacency.setdefault(fk_table.lower(), []).append(
+                (fk_table, pk_table, fk_table, fk_column, pk_table, pk_column))
+            self.adjacency.setdefault(pk_table.lower(), []).append(
+                (pk_table, fk_table, fk_table, fk_column, pk_table, pk_column))
+
+        # Many-to-one edges first so enumeration naturally favours them
+        for edges in self.adjacency.values():
+            edges.sort(key=lambda e: (edge_fans_out(e), e[1].lower(), e[3]))
+
+    @classmethod
+    def from_fkeys(cls, fkeys_data: Optional[Dict[str, Any]]) -> 'FkGraph':
+        return cls((fkeys_data or {}).get('foreign_keys', []))
+
+    def canonical(self, table: str) -> Optional[str]:
+        return self.tables.get((table or '').lower())
+
+    # -- BFS ----------------------------------------------------------------
+
+    def _bfs(self, sources: FrozenSet[str]) -> Tuple[Dict[str, int], Dict[str, List[Tuple[str, Edge]]]]:
+        """Hop distance from the source set to every reachable table, plus all shortest-path parents."""
+        cached = self._trees.get(sources)
+        if cached is not None:
+            return cached
+        dist: Dict[str, int] = {s: 0 for s in sources}
+        parents: Dict[str, List[Tuple[str, Edge]]] = {}
+        queue = deque(sources)
+        while queue:
+            node = queue.popleft()
+            for edge in self.adjacency.get(node, ()):
+                nxt = edge[1].lower()
+                if nxt not in dist:
+                    dist[nxt] = dist[node] + 1
+                    parents[nxt] = [(node, edge)]
+                    queue.append(nxt)
+                elif dist[nxt] == dist[node] + 1:
+                    parents[nxt].append((node, edge))
+        if len(sources) == 1:  # only per-table trees are reused; multi-source sets are one-off
+            self._trees[sources] = (dist, parents)
+        return dist, parents
+
+    def _shortest_paths(self, sources: FrozenSet[str], target: str, max_paths: int) -> List[List[Edge]]:
+        """All shortest edge paths from the source set to target, ranked by one-to-many hops."""
+        _, parents = self._bfs(sources)
+        paths: List[List[Edge]] = []
+
+        def walk(node: str, suffix: List[Edge]) -> None:
+            if len(paths) >= _MAX_ENUMERATED:
+                return
+            if node in sources:
+                paths.append(list(reversed(suffix)))
+                return
+            for prev, edge in parents.get(node, ()):
+                suffix.append(edge)
+                walk(prev, suffix)
+                suffix.pop()
+
+        walk(target, [])
+        paths.sort(key=lambda p: (sum(edge_fans_out(e) for e in p), [(e[1].lower(), e[3]) for e in p]))
+        return paths[:max_paths]
+
+    # -- planning -----------------------------------------------------------
+
+    def join_paths(self, source: str, target: str, max_paths: int = 3,
+                   max_hops: int = DEFAULT_MAX_HOPS) -> List[List[Edge]]:
+        """Best join chains between two tables (shortest first, then fewest fan-outs)."""
+        src, dst = (source or '').lower(), (target or '').lower()
+        if src not in self.tables or dst not in self.tables:
+            return []
+        if src == dst:
+            return [[]]
+        dist, _ = self._bfs(frozenset([src]))
+        if dist.get(dst, max_hops + 1) > max_hops:
+            return []
+        return self._shortest_paths(frozenset([src]), dst, max_paths)
+
+    def plan(self, tables: List[str], max_paths: int = 3,
+             max_hops: int = DEFAULT_MAX_HOPS) -> Dict[str, Any]:
+        """
+        Plan joins connecting all tables.
+
+        Returns a dict with:
+          tables       canonical names in join order (including intermediate tables)
+          steps        [{from, to, on, cardinality}] — each step joins 'to' onto the tree
+          sql          FROM/INNER JOIN skeleton
+          alternatives other chains of the same length (two-table plans only)
+          unknown      input tables not present in the FK graph
+          unreachable  input tables with no path within max_hops
+        """
+        unknown = [t for t in tables if self.canonical(t) is None]
+        wanted: List[str] = []
+        for t in tables:
+            key = (t or '').lower()
+            if key in self.tables and key not in wanted:
+                wanted.append(key)
+
+        result: Dict[str, Any] = {
+            'tables': [self.tables[k] for k in wanted[:1]],
+            'steps': [],
+            'sql': '',
+            'alternatives': [],
+            'unknown': unknown,
+            'unreachable': [],
+        }
+        if not wanted:
+            return result
+
+        tree = [wanted[0]]
+        remaining = wanted[1:]
+        while remaining:
+            dist, _ = self._bfs(frozenset(tree))
+            reachable = [k for k in remaining if dist.get(k, max_hops + 1) <= max_hops]
+            if not reachable:
+                result['unreachable'] = [self.tables[k] for k in remaining]
+                break
+            nearest = min(reachable, key=lambda k: (dist[k], remaining.index(k)))
+            paths = self._shortest_paths(frozenset(tree), nearest, max_paths)
+            best = paths[0]
+            if len(wanted) == 2:
+                result['alternatives'] = [[describe_edge(e) for e in p] for p in paths[1:]]
+            for edge in best:
+                result['steps'].append(describe_edge(edge))
+                node = edge[1].lower()
+                if node not in tree:
+                    tree.append(node)
+                    result['tables'].append(self.tables[node])
+            remaining = [k for k in remaining if k not in tree]
+
+        lines = [f'FROM {self.tables[wanted[0]]}']
+        for step in result['steps']:
+            lines.append(f"INNER JOIN {step['to']} ON {step['on']}")
+        result['sql'] = '\n'.join(lines)
+        return result
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+NetSuite Schema Search Index
+
+Trigram inverted index over table names, column names, descriptions and
+custom-field labels from the schema cache (tables.json, columns.json,
+custom_records.json, custom_fields.json).
+
+A search resolves the trigrams of the pattern (or of the literal segments of
+a glob) to a small candidate set, verifies each candidate with the same
+substring/glob semantics as matches_pattern(), and ranks the hits:
+
+  100  name equals the pattern
+   80  name starts with the pattern
+   70  pattern is a whole word of the name (edi → custbody_edi_status)
+   60  pattern is anywhere in the name (or the glob matches the name)
+   20  pattern only matches the description / label
+
+The index is persisted next to the schema cache as search_index.marshal and
+rebuilt automatically when any source file's mtime or size changes.
+
+This module is shared by schema_lookup.py and the netsuite-suiteql MCP
+extension (extensions/netsuite-suiteql/src/schema_index.py) — keep the two
+copies identical (tests/test_shared_modules.py checks this).
+
+Usage:
+  from schema_index import load_or_build
+  index = load_or_build(cache_dir, load_json)
+  tables, columns = index.search('shipping*')
+"""
+
+import fnmatch
+import marshal
+import os
+import re
+import sys
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+INDEX_FILENAME = 'search_index.marshal'
+INDEX_VERSION = 1
+SOURCE_FILES = ('tables.json', 'columns.json', 'custom_records.json', 'custom_fields.json')
+
+KIND_TABLE = 0
+KIND_COLUMN = 1
+
+# Glob metacharacters: [...] classes, * and ?
+_GLOB_META_RE = re.compile(r'\[[^\]]*\]|[*?]')
+_WORD_SPLIT_RE = re.compile(r'[^a-z0-9]+')
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def source_stamp(cache_dir: str) -> List[Any]:
+    """Cache dir plus [filename, mtime_ns, size] for each schema source file (missing → zeros)."""
+    stamp: List[Any] = [os.path.abspath(cache_dir)]
+    for fname in SOURCE_FILES:
+        try:
+            st = os.stat(os.path.join(cache_dir, fname))
+            stamp.append([fname, st.st_mtime_ns, st.st_size])
+        except OSError:
+            stamp.append([fname, 0, 0])
+    return stamp
+
+
+class SchemaSearchIndex:
+    """Ranked substring/glob search over schema tables and columns."""
+
+    def __init__(self, kinds: List[int], tables: List[str], names: List[str],
+                 types: List[str], descs: List[str], custom: List[bool],
+                 postings: Dict[str, array]):
+        self.kinds = kinds
+        self.tables = tables
+        self.names = names
+        self.types = types
+        self.descs = descs
+        self.custom = custom
+        self.postings = postings
+        self._names_lc = [n.lower() for n in names]
+        self._descs_lc = [d.lower() for d in descs]
+
+    # -- construction -------------------------------------------------------
+
+    @classmethod
+    def build(cls, tables_data: Optional[Dict[str, Any]], cols_data: Optional[Dict[str, Any]],
+              custom_records_data: Optional[Dict[str, Any]],
+              custom_fields_data: Optional[Dict[str, Any]]) -> 'SchemaSearchIndex':
+        """
+        Build the index from parsed schema files. Source precedence matches the
+        linear search: ODBC tables/columns when present, otherwise the custom
+        record/field caches. ODBC columns without a description inherit their
+        custom-field label.
+        """
+        kinds: List[int] = []
+        tables: List[str] = []
+        names: List[str] = []
+        types: List[str] = []
+        descs: List[str] = []
+        custom: List[bool] = []
+
+        def add(kind: int, table: str, name: str, typ: str, desc: str, is_custom: bool) -> None:
+            kinds.append(kind)
+            tables.append(table)
+            names.append(name or '')
+            types.append(typ or '')
+            descs.append(desc or '')
+            custom.append(bool(is_custom))
+
+        if tables_data:
+            for t in tables_data.get('tables', []):
+                name = t.get('table_name', '')
+                add(KIND_TABLE, name, name, '', t.get('description', ''), t.get('is_custom', False))
+        elif custom_records_data:
+            for r in custom_records_data.get('custom_record_types', []):
+                name = r.get('scriptid', '')
+                add(KIND_TABLE, name, name, '', r.get('name', ''), True)
+
+        labels: Dict[str, Dict[str, str]] = {}
+        if custom_fields_data:
+            for rec, fields in custom_fields_data.get('custom_fields', {}).items():
+                rec_labels = labels.setdefault(rec.lower(), {})
+                for f in fields:
+                    sid = (f.get('scriptid') or '').lower()
+                    if sid and f.get('label'):
+                        rec_labels[sid] = f['label']
+
+        if cols_data:
+            for tname, cols in cols_data.get('columns', {}).items():
+                rec_labels = labels.get(tname.lower(), {})
+                for c in cols:
+                    cname = c.get('column_name', '')
+                    desc = c.get('description') or rec_labels.get(cname.lower(), '')
+                    add(KIND_COLUMN, tname, cname, c.get('data_type', ''), desc, False)
+        elif custom_fields_data:
+            for rec, fields in custom_fields_data.get('custom_fields', {}).items():
+                for f in fields:
+                    add(KIND_COLUMN, rec, f.get('scriptid', ''), f.get('field_type', ''), f.get('label', ''), True)
+
+        grams: Dict[str, List[int]] = {}
+        for doc_id, (name, desc) in enumerate(zip(names, descs)):
+            for g in _trigrams(name.lower()) | _trigrams(desc.lower()):
+                grams.setdefault(g, []).append(doc_id)
+        postings = {g: array('I', ids) for g, ids in grams.items()}
+
+        return cls(kinds, tables, names, types, descs, custom, postings)
+
+    # -- persistence --------------------------------------------------------
+
+    def dump(self, path: str, stamp: List[Any]) -> None:
+        """Write the index atomically; stamp identifies the source files it was built from."""
+        payload = {
+            'version': INDEX_VERSION,
+            'python': list(sys.version_info[:2]),
+            'stamp': stamp,
+            'kinds': bytes(self.kinds),
+            'tables': self.tables,
+            'names': self.names,
+            'types': self.types,
+            'descs': self.descs,
+            'custom': bytes(self.custom),
+            'postings': {g: ids.tobytes() for g, ids in self.postings.items()},
+        }
+        tmp = f'{path}.tmp'
+        with open(tmp, 'wb') as f:
+            marshal.dump(payload, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, stamp: List[Any]) -> Optional['SchemaSearchIndex']:
+        """Load a persisted index; None if missing, unreadable or built from other sources."""
+        try:
+            with open(path, 'rb') as f:
+                payload = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if (not isinstance(payload, dict)
+                or payload.get('version') != INDEX_VERSION
+                or payload.get('python') != list(sys.version_info[:2])
+                or payload.get('stamp') != stamp):
+            return None
+        postings = {}
+        for g, raw in payload['postings'].items():
+            ids = array('I')
+            ids.frombytes(raw)
+            postings[g] = ids
+        return cls(list(payload['kinds']), payload['tables'], payload['names'], payload['types'],
+                   payload['descs'], [bool(b) for b in payload['custom']], postings)
+
+    # -- search -------------------------------------------------------------
+
+    def _candidates(self, literals: List[str]) -> Optional[set]:
+        """Doc ids containing every trigram of the literals; None means 'all docs'."""
+        grams = set()
+        for lit in literals:
+            grams |= _trigrams(lit)
+        if not grams:
+            return None
+        lists = []
+        for g in grams:
+            ids = self.postings.get(g)
+            if ids is None:
+                return set()
+            lists.append(ids)
+        lists.sort(key=len)
+        result = set(lists[0])
+        for ids in lists[1:]:
+            if not result:
+                break
+            result.intersection_update(ids)
+        return result
+
+    def _score(self, doc_id: int, pattern: str, glob: Optional['re.Pattern']) -> int:
+        name = self._names_lc[doc_id]
+        if glob is not None:
+            if glob.match(name):
+                return 60
+            return 20 if glob.match(self._descs_lc[doc_id]) else 0
+        if pattern in name:
+            if name == pattern:
+                return 100
+            if name.startswith(pattern):
+                return 80
+            if pattern in _WORD_SPLIT_RE.split(name):
+                return 70
+            return 60
+        return 20 if pattern in self._descs_lc[doc_id] else 0
+
+    def search(self, pattern: str, limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Ranked search for a substring or glob (* ? [...]) pattern, case-insensitive.
+
+        Returns (tables, columns); each hit is a dict with table, column (columns
+        only), type, description, custom and score. Equal scores keep schema order.
+        """
+        p = (pattern or '').lower()
+        if not p:
+            return [], []
+        glob = None
+        if '*' in p or '?' in p:
+            glob = re.compile(fnmatch.translate(p))
+            literals = [s for s in _GLOB_META_RE.split(p) if s]
+        else:
+            literals = [p]
+
+        cands = self._candidates(literals)
+        doc_ids = range(len(self.names)) if cands is None else sorted(cands)
+
+        hits: List[Tuple[int, int]] = []
+        for doc_id in doc_ids:
+            score = self._score(doc_id, p, glob)
+            if score:
+                hits.append((-score, doc_id))
+        hits.sort()
+
+        table_hits: List[Dict[str, Any]] = []
+        col_hits: List[Dict[str, Any]] = []
+        for neg_score, doc_id in hits:
+            if self.kinds[doc_id] == KIND_TABLE:
+                if limit is None or len(table_hits) < limit:
+                    table_hits.append({
+                        'table': self.tables[doc_id],
+                        'description': self.descs[doc_id],
+                        'custom': self.custom[doc_id],
+                        'score': -neg_score,
+                    })
+            elif limit is None or len(col_hits) < limit:
+                col_hits.append({
+                    'table': self.tables[doc_id],
+                    'column': self.names[doc_id],
+                    'type': self.types[doc_id],
+                    'description': self.descs[doc_id],
+                    'custom': self.custom[doc_id],
+                    'score': -neg_score,
+                })
+        return table_hits, col_hits
+
+
+def load_or_build(cache_dir: str, load_json: Callable[[str], Optional[Dict[str, Any]]],
+                  index_dir: Optional[str] = None) -> SchemaSearchIndex:
+    """
+    Return the persisted index for cache_dir if it is still current, otherwise
+    build it from the schema files (via load_json(filename)) and persist it.
+
+    index_dir defaults to cache_dir; persisting is best-effort (read-only
+    locations just skip the write).
+    """
+    stamp = source_stamp(cache_dir)
+    path = os.path.join(index_dir or cache_dir, INDEX_FILENAME)
+    index = SchemaSearchIndex.load(path, stamp)
+    if index is not None:
+        return index
+
+    index = SchemaSearchIndex.build(
+        load_json('tables.json'),
+        load_json('columns.json'),
+        load_json('custom_records.json'),
+        load_json('custom_fields.json'),
+    )
+    # Re-stamp: load_json may have just fetched missing files into cache_dir
+    stamp = source_stamp(cache_dir)
+    try:
+        os.makedirs(index_dir or cache_dir, exist_ok=True)
+        index.dump(path, stamp)
+    except OSError:
+        pass
+    return index
@@ -16,6 +16,10 @@ Schema resolution order (for each tool call):
   1. ~/.cache/netsuite-schema/{account}/{env}/ — fresh data from refresh tool
   2. data/schema/ bundled in this extension  — production snapshot
 
+Schema files are parsed once per process and kept in memory with precomputed
+lookups (table map, FK adjacency, custom field labels); a file is re-parsed
+only when its mtime or size changes on disk.
+
 Supported accounts:
   twistedx (twx): Twisted X, OAuth 1.0a TBA, account 4829859
 
@@ -25,6 +29,7 @@ Supported environments: production, sandbox, sandbox2
 import fnmatch
 import json
 import os
+import threading
 from datetime import datetime, date, timedelta, timezone
 from pathlib import Path
 from typing import Optional
@@ -32,6 +37,9 @@ from typing import Optional
 import httpx
 from mcp.server.fastmcp import FastMCP
 
+from schema_graph import FkGraph
+from schema_index import SchemaSearchIndex, load_or_build, source_stamp
+
 # =============================================================================
 # System prompt
 # =============================================================================
@@ -46,7 +54,8 @@ UI field labels and many fields are not exposed in SuiteQL at all. Never guess.
 ## Quick Schema Lookup Workflow
 1. Unsure which table? → netsuite_search_schema("keyword") or netsuite_list_tables("pattern*")
 2. Know the table? → netsuite_describe_table("TableName")
-3. Planning JOINs? → netsuite_show_relationships("TableName")
+3. Planning JOINs? → netsuite_plan_joins(["TableA", "TableB"]) for the ON clauses,
+   netsuite_show_relationships("TableName") for a table's direct FKs
 4. Need query examples? → netsuite_query_examples("keyword")
 5. Run the query → netsuite_run_suiteql("SELECT ...")
 
@@ -137,6 +146,129 @@ def _load_json(path: Path) -> Optional[dict]:
         return None
 
 
+# =============================================================================
+# Schema store — each file parsed once per process, reloaded on mtime change
+# =============================================================================
+
+def _index_columns(data: dict) -> dict:
+    """Case-insensitive table name → canonical key in columns.json."""
+    return {"tables": {name.lower(): name for name in data.get("columns", {})}}
+
+
+def _index_fkeys(data: dict) -> dict:
+    """Per-table FK adjacency (outbound/inbound), primary keys, canonical names and join graph."""
+    outbound: dict[str, list] = {}
+    inbound: dict[str, list] = {}
+    primary_keys: dict[str, list] = {}
+    tables: dict[str, str] = {}
+    for fk in data.get("foreign_keys", []):
+        fk_table, pk_table = fk.get("fk_table", ""), fk.get("pk_table", "")
+        outbound.setdefault(fk_table.lower(), []).append(fk)
+        inbound.setdefault(pk_table.lower(), []).append(fk)
+        tables.setdefault(fk_table.lower(), fk_table)
+        tables.setdefault(pk_table.lower(), pk_table)
+    for pk in data.get("primary_keys", []):
+        table = pk.get("table_name", "")
+        primary_keys.setdefault(table.lower(), []).append(pk.get("column_name", ""))
+        tables.setdefault(table.lower(), table)
+    for fks in outbound.values():
+        fks.sort(key=lambda x: x.get("fk_column", ""))
+    for fks in inbound.values():
+        fks.sort(key=lambda x: x.get("fk_table", ""))
+    return {
+        "outbound": outbound,
+        "inbound": inbound,
+        "primary_keys": primary_keys,
+        "tables": tables,
+        "graph": FkGraph(data.get("foreign_keys", [])),
+    }
+
+
+def _index_custom_fields(data: dict) -> dict:
+    """Case-insensitive record key → canonical key, and per-record scriptid → label."""
+    records: dict[str, str] = {}
+    labels: dict[str, dict[str, str]] = {}
+    for rec_key, fields in data.get("custom_fields", {}).items():
+        records.setdefault(rec_key.lower(), rec_key)
+        rec_labels = labels.setdefault(rec_key.lower(), {})
+        for f in fields:
+            sid = f.get("scriptid", "").lower()
+            lbl = f.get("label", "")
+            if sid and lbl:
+                rec_labels[sid] = lbl
+    return {"records": records, "labels": labels}
+
+
+_SCHEMA_INDEXERS = {
+    "columns.json": _index_columns,
+    "fkeys.json": _index_fkeys,
+    "custom_fields.json": _index_custom_fields,
+}
+
+# path → ((st_mtime_ns, st_size), {"data": parsed JSON, **precomputed lookups})
+_schema_store: dict[Path, tuple[tuple[int, int], dict]] = {}
+_schema_store_lock = threading.Lock()
+
+
+def _schema(schema_dir: Path, filename: str) -> Optional[dict]:
+    """Return a schema file's parsed data and lookups, re-parsing only when it changed.
+
+    The entry is a dict with the raw JSON under "data" plus whatever the
+    file's indexer precomputes (see _SCHEMA_INDEXERS). Returns None when the
+    file is missing or unreadable, same as _load_json.
+    """
+    path = schema_dir / filename
+    try:
+        st = path.stat()
+    except OSError:
+        with _schema_store_lock:
+            _schema_store.pop(path, None)
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    with _schema_store_lock:
+        cached = _schema_store.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        data = _load_json(path)
+        if data is None:
+            _schema_store.pop(path, None)
+            return None
+        indexer = _SCHEMA_INDEXERS.get(filename)
+        entry = {"data": data, **(indexer(data) if indexer else {})}
+        _schema_store[path] = (stamp, entry)
+        return entry
+
+
+def _schema_data(schema_dir: Path, filename: str) -> Optional[dict]:
+    """Parsed JSON for a schema file, served from the schema store."""
+    entry = _schema(schema_dir, filename)
+    return entry["data"] if entry else None
+
+
+# path → (source stamp, index); the index is also persisted under _CACHE_ROOT
+_search_indexes: dict[Path, tuple[list, SchemaSearchIndex]] = {}
+# Held across a rebuild so concurrent searches wait for one build instead of racing
+_search_indexes_lock = threading.Lock()
+
+
+def _search_index(schema_dir: Path, account: str, environment: str) -> SchemaSearchIndex:
+    """Trigram search index for a schema dir, rebuilt when any source file changes."""
+    stamp = source_stamp(str(schema_dir))
+    with _search_indexes_lock:
+        cached = _search_indexes.get(schema_dir)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        index = load_or_build(
+            str(schema_dir),
+            lambda fname: _schema_data(schema_dir, fname),
+            index_dir=str(_CACHE_ROOT / account / environment),
+        )
+        _search_indexes[schema_dir] = (stamp, index)
+        return index
+
+
 def _matches(text: str, pattern: str) -> bool:
     """Glob or substring match, case-insensitive."""
     if not pattern:
@@ -323,30 +455,22 @@ def netsuite_describe_table(
     env = _resolve_env(environment)
     schema_dir = _get_schema_dir(acct, env)
 
-    cols_data = _load_json(schema_dir / "columns.json")
-    fkeys_data = _load_json(schema_dir / "fkeys.json")
-    custom_fields_data = _load_json(schema_dir / "custom_fields.json")
+    cols = _schema(schema_dir, "columns.json")
+    fkeys = _schema(schema_dir, "fkeys.json")
+    custom_fields = _schema(schema_dir, "custom_fields.json")
+    cols_data = cols["data"] if cols else None
+    custom_fields_data = custom_fields["data"] if custom_fields else None
+    table_key = table_name.lower()
 
     # Find table (case-insensitive)
     odbc_columns = None
     canonical_table = table_name
-    if cols_data:
-        for key in cols_data.get("columns", {}):
-            if key.lower() == table_name.lower():
-                canonical_table = key
-                odbc_columns = cols_data["columns"][key]
-                break
-
-    # Build custom field label map
-    label_map: dict[str, str] = {}
-    if custom_fields_data:
-        for rec_key, fields in custom_fields_data.get("custom_fields", {}).items():
-            if rec_key.lower() == table_name.lower():
-                for f in fields:
-                    sid = f.get("scriptid", "").lower()
-                    lbl = f.get("label", "")
-                    if sid and lbl:
-                        label_map[sid] = lbl
+    if cols and table_key in cols["tables"]:
+        canonical_table = cols["tables"][table_key]
+        odbc_columns = cols_data["columns"][canonical_table]
+
+    # Custom field label map
+    label_map: dict[str, str] = custom_fields["labels"].get(table_key, {}) if custom_fields else {}
 
     columns_to_show = []
     source = "bundled snapshot" if schema_dir == _BUNDLED_SCHEMA_DIR else "user cache"
@@ -368,11 +492,9 @@ def netsuite_describe_table(
     elif table_name.lower().startswith("customrecord_") and custom_fields_data:
         # Custom cache fallback
         rec_fields = None
-        for rec_key, fields in custom_fields_data.get("custom_fields", {}).items():
-            if rec_key.lower() == table_name.lower():
-                canonical_table = rec_key
-                rec_fields = fields
-                break
+        if table_key in custom_fields["records"]:
+            canonical_table = custom_fields["records"][table_key]
+            rec_fields = custom_fields_data["custom_fields"][canonical_table]
         if rec_fields:
             cf_refreshed = (custom_fields_data.get("_refreshed_at", "unknown") or "unknown")[:10]
             source = f"custom field cache ({cf_refreshed})"
@@ -405,15 +527,15 @@ def netsuite_describe_table(
     fk_outbound = []
     fk_inbound = []
     pk_cols = []
-    if fkeys_data:
-        for fk in fkeys_data.get("foreign_keys", []):
-            if fk.get("fk_table", "").lower() == canonical_table.lower():
-                fk_outbound.append(fk)
-            elif fk.get("pk_table", "").lower() == canonical_table.lower():
-                fk_inbound.append(fk)
-        for pk in fkeys_data.get("primary_keys", []):
-            if pk.get("table_name", "").lower() == canonical_table.lower():
-                pk_cols.append(pk.get("column_name", ""))
+    if fkeys:
+        canonical_key = canonical_table.lower()
+        fk_outbound = fkeys["outbound"].get(canonical_key, [])
+        # Self-referencing FKs are reported once, as outbound
+        fk_inbound = [
+            fk for fk in fkeys["inbound"].get(canonical_key, [])
+            if fk.get("fk_table", "").lower() != canonical_key
+        ]
+        pk_cols = list(fkeys["primary_keys"].get(canonical_key, []))
 
     # Enrich column descriptions with FK references
     fk_out_map = {fk.get("fk_column", "").lower(): f"→ {fk.get('pk_table','')}.{fk.get('pk_column','')}" for fk in fk_outbound}
@@ -430,8 +552,8 @@ def netsuite_describe_table(
         "column_count": len(columns_to_show),
         "columns": columns_to_show,
         "foreign_keys": {
-            "outbound": sorted(fk_outbound, key=lambda x: x.get("fk_column", "")),
-            "inbound": sorted(fk_inbound, key=lambda x: x.get("fk_table", "")),
+            "outbound": fk_outbound,
+            "inbound": fk_inbound,
         },
         "primary_keys": pk_cols,
     }
@@ -453,7 +575,9 @@ def netsuite_search_schema(
     """Search all NetSuite table and column names for a keyword or glob pattern.
 
     Use when unsure which table or column contains the data you need. Searches both
-    table names and column names/descriptions simultaneously.
+    table names and column names/descriptions/custom field labels simultaneously.
+    Results are ranked: exact name matches first, then prefix, whole-word and
+    substring name matches, then description-only matches.
 
     Args:
         pattern: Search keyword or glob. Substring match by default.
@@ -476,55 +600,15 @@ def netsuite_search_schema(
     env = _resolve_env(environment)
     schema_dir = _get_schema_dir(acct, env)
 
-    tables_data = _load_json(schema_dir / "tables.json")
-    cols_data = _load_json(schema_dir / "columns.json")
-    custom_records_data = _load_json(schema_dir / "custom_records.json")
-    custom_fields_data = _load_json(schema_dir / "custom_fields.json")
-
-    table_matches = []
-    col_matches = []
-
-    if tables_data:
-        for t in tables_data.get("tables", []):
-            name = t.get("table_name", "")
-            desc = t.get("description", "")
-            if _matches(name, pattern) or _matches(desc, pattern):
-                table_matches.append({
-                    "table": name,
-                    "description": desc,
-                    "custom": t.get("is_custom", False),
-                })
-    elif custom_records_data:
-        for r in custom_records_data.get("custom_record_types", []):
-            name = r.get("scriptid", "")
-            label = r.get("name", "")
-            if _matches(name, pattern) or _matches(label, pattern):
-                table_matches.append({"table": name, "description": label, "custom": True})
-
-    if cols_data:
-        for tname, cols in cols_data.get("columns", {}).items():
-            for c in cols:
-                cname = c.get("column_name", "")
-                desc = c.get("description", "")
-                if _matches(cname, pattern) or _matches(desc, pattern):
-                    col_matches.append({
-                        "table": tname,
-                        "column": cname,
-                        "type": c.get("data_type", ""),
-                        "description": desc,
-                    })
-    elif custom_fields_data:
-        for rec, fields in custom_fields_data.get("custom_fields", {}).items():
-            for f in fields:
-                sid = f.get("scriptid", "")
-                lbl = f.get("label", "")
-                if _matches(sid, pattern) or _matches(lbl, pattern):
-                    col_matches.append({
-                        "table": rec,
-                        "column": sid,
-                        "type": f.get("field_type", ""),
-                        "description": lbl,
-                    })
+    tables_found, cols_found = _search_index(schema_dir, acct, env).search(pattern)
+    table_matches = [
+        {"table": m["table"], "description": m["description"], "custom": m["custom"]}
+        for m in tables_found
+    ]
+    col_matches = [
+        {"table": m["table"], "column": m["column"], "type": m["type"], "description": m["description"]}
+        for m in cols_found
+    ]
 
     result = {
         "pattern": pattern,
@@ -567,8 +651,8 @@ def netsuite_list_tables(
     schema_dir = _get_schema_dir(acct, env)
     limit = max(1, min(limit, 2042))
 
-    tables_data = _load_json(schema_dir / "tables.json")
-    custom_records_data = _load_json(schema_dir / "custom_records.json")
+    tables_data = _schema_data(schema_dir, "tables.json")
+    custom_records_data = _schema_data(schema_dir, "custom_records.json")
 
     results = []
     source = "bundled snapshot"
@@ -648,39 +732,21 @@ def netsuite_show_relationships(
     env = _resolve_env(environment)
     schema_dir = _get_schema_dir(acct, env)
 
-    fkeys_data = _load_json(schema_dir / "fkeys.json")
-    if not fkeys_data:
+    fkeys = _schema(schema_dir, "fkeys.json")
+    if not fkeys or not fkeys["data"]:
         return _fmt({
             "error": f"FK cache not found for {acct}/{env}.",
             "suggestion": "The bundled schema should always have fkeys.json. Try refreshing: netsuite_refresh_custom_schema.",
         })
+    fkeys_data = fkeys["data"]
 
     # Case-insensitive canonical name resolution
-    canonical = table_name
-    all_tables: set[str] = set()
-    for fk in fkeys_data.get("foreign_keys", []):
-        all_tables.add(fk.get("fk_table", ""))
-        all_tables.add(fk.get("pk_table", ""))
-    for pk in fkeys_data.get("primary_keys", []):
-        all_tables.add(pk.get("table_name", ""))
-    for t in all_tables:
-        if t.lower() == table_name.lower():
-            canonical = t
-            break
-
-    outbound = sorted(
-        [fk for fk in fkeys_data.get("foreign_keys", []) if fk.get("fk_table", "").lower() == canonical.lower()],
-        key=lambda x: x.get("fk_column", ""),
-    )
-    inbound = sorted(
-        [fk for fk in fkeys_data.get("foreign_keys", []) if fk.get("pk_table", "").lower() == canonical.lower()],
-        key=lambda x: x.get("fk_table", ""),
-    )
-    pk_cols = [
-        pk.get("column_name", "")
-        for pk in fkeys_data.get("primary_keys", [])
-        if pk.get("table_name", "").lower() == canonical.lower()
-    ]
+    table_key = table_name.lower()
+    canonical = fkeys["tables"].get(table_key, table_name)
+
+    outbound = fkeys["outbound"].get(table_key, [])
+    inbound = fkeys["inbound"].get(table_key, [])
+    pk_cols = fkeys["primary_keys"].get(table_key, [])
 
     refreshed = (fkeys_data.get("_refreshed_at", "unknown") or "unknown")[:10]
     return _fmt({
@@ -696,6 +762,69 @@ def netsuite_show_relationships(
     })
 
 
+# =============================================================================
+# Tool: plan_joins
+# =============================================================================
+
+@mcp.tool(
+    annotations={"title": "Plan Table Joins", "readOnlyHint": True}
+)
+def netsuite_plan_joins(
+    tables: list[str],
+    max_paths: int = 3,
+    max_hops: int = 6,
+    account: Optional[str] = None,
+    environment: Optional[str] = None,
+) -> str:
+    """Find the shortest FK join chain connecting two or more NetSuite tables.
+
+    Searches the foreign key graph (both directions) and returns the exact ON
+    clauses, so multi-hop JOINs need no rounds of relationship lookups. Among
+    equally short chains, the one with the fewest one-to-many (row-multiplying)
+    hops is preferred.
+
+    Args:
+        tables: Two or more table names; the first is the FROM table
+                (e.g. ['Customer', 'TransactionLine', 'Item']).
+        max_paths: For two tables, how many alternative chains to return. Default 3.
+        max_hops: Maximum joins per connection. Default 6.
+        account: 'twistedx'. Default from config.
+        environment: 'production', 'sandbox', or 'sandbox2'. Default from config.
+
+    Returns:
+        JSON with join order, steps (from, to, on, cardinality), a FROM/INNER JOIN
+        SQL skeleton, alternatives, and any unknown/unreachable tables.
+
+    Example:
+        netsuite_plan_joins(["Customer", "TransactionLine"]) →
+          FROM Customer
+          INNER JOIN Transaction ON Transaction.entity = Customer.id
+          INNER JOIN TransactionLine ON TransactionLine.transaction = Transaction.id
+    """
+    if not tables or len(tables) < 2:
+        return _fmt({"error": "tables must list at least two table names"})
+
+    acct = _resolve_account(account)
+    env = _resolve_env(environment)
+    schema_dir = _get_schema_dir(acct, env)
+
+    fkeys = _schema(schema_dir, "fkeys.json")
+    if not fkeys or not fkeys["data"]:
+        return _fmt({
+            "error": f"FK cache not found for {acct}/{env}.",
+            "suggestion": "The bundled schema should always have fkeys.json. Try refreshing: netsuite_refresh_custom_schema.",
+        })
+
+    plan = fkeys["graph"].plan(tables, max_paths=max(1, min(max_paths, 10)), max_hops=max(1, min(max_hops, 10)))
+    refreshed = (fkeys["data"].get("_refreshed_at", "unknown") or "unknown")[:10]
+    return _fmt({
+        "account": acct,
+        "environment": env,
+        "source": f"ODBC cache ({refreshed})",
+        **plan,
+    })
+
+
 # =============================================================================
 # Tool: refresh_custom_schema
 # =============================================================================
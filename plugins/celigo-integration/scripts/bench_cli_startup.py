@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark for celigo_api.py startup.
+
+Every agent step that shells out to the CLI pays interpreter start, imports
+and parser construction before the first request is sent. This times, in
+fresh interpreters:
+
+  python      `python3 -c pass` (the floor)
+  import      `import celigo_api`, and celigo_core with it
+  parser      create_parser() for one resource vs. for all of them
+  cli         `celigo_api.py <resource> --help` end to end (no network)
+
+and checks that parsing one resource imports only that resource's module.
+The script exits 1 if it does not.
+
+Usage:
+  python3 bench_cli_startup.py
+  python3 bench_cli_startup.py --repeat 31 --resource errors --resource caches
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CLI = os.path.join(SCRIPT_DIR, "celigo_api.py")
+
+# Runs in a fresh interpreter; prints one JSON object of millisecond timings.
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import celigo_api
+t1 = time.perf_counter()
+import celigo_core
+t2 = time.perf_counter()
+celigo_api.create_parser([{resource!r}])
+t3 = time.perf_counter()
+loaded = sorted(m for m in sys.modules if m.startswith("celigo_commands."))
+celigo_api.create_parser()
+t4 = time.perf_counter()
+print(json.dumps({{"import": (t1 - t0) * 1e3, "core": (t2 - t1) * 1e3,
+                  "parser_one": (t3 - t2) * 1e3, "parser_all": (t4 - t3) * 1e3,
+                  "loaded": loaded}}))
+"""
+
+
+def wall_ms(cmd: List[str], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=SCRIPT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(times)
+
+
+def probe(resource: str, repeat: int) -> Dict[str, object]:
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", PROBE.format(resource=resource)],
+                             cwd=SCRIPT_DIR, capture_output=True, text=True, check=True)
+        runs.append(json.loads(out.stdout))
+    result: Dict[str, object] = {k: statistics.median(r[k] for r in runs)
+                                 for k in ("import", "core", "parser_one", "parser_all")}
+    result["loaded"] = runs[0]["loaded"]
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=15, help="Runs per measurement (median reported)")
+    parser.add_argument("--resource", action="append",
+                        help="Resource to time (repeatable; default: flows, errors, caches, health-digest)")
+    args = parser.parse_args()
+    resources = args.resource or ["flows", "errors", "caches", "health-digest"]
+
+    sys.path.insert(0, SCRIPT_DIR)
+    from celigo_commands import COMMANDS
+
+    floor = wall_ms([sys.executable, "-c", "pass"], args.repeat)
+    top = wall_ms([sys.executable, CLI, "--help"], args.repeat)
+    print(f"python -c pass            {floor:7.1f} ms")
+    print(f"celigo_api.py --help      {top:7.1f} ms   (+{top - floor:.1f} ms)")
+
+    ok = True
+    for resource in resources:
+        module = f"celigo_commands.{COMMANDS[resource][0]}"
+        stats = probe(resource, max(3, args.repeat // 3))
+        cli = wall_ms([sys.executable, CLI, resource, "--help"], args.repeat)
+        print(f"\n{resource}")
+        print(f"  import celigo_api       {stats['import']:7.1f} ms")
+        print(f"  import celigo_core      {stats['core']:7.1f} ms")
+        print(f"  parser, this resource   {stats['parser_one']:7.1f} ms   (includes importing {module})")
+        print(f"  parser, all {len(COMMANDS)} resources {stats['parser_all']:5.1f} ms")
+        print(f"  {resource} --help end to end {cli:7.1f} ms   (+{cli - floor:.1f} ms)")
+        if stats["loaded"] != [module]:
+            print(f"  FAIL: parsing {resource} imported {stats['loaded']}", file=sys.stderr)
+            ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
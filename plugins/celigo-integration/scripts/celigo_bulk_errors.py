@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Bulk retry/resolve of open Celigo errors across a scope.
+
+A scope is an integration, a flow, or a partner (every integration whose name
+contains it). Open errors are listed for every export/import step in scope
+concurrently, optionally filtered by error code, then retried (by
+retryDataKey) or resolved (by errorId) in batches of up to `batch_size`.
+All API calls share one rate limiter, so `workers` bounds concurrency and
+`rate` bounds requests per second.
+
+Used by `celigo_api.py errors bulk`:
+    python3 celigo_api.py errors bulk --partner Buckle --action retry --code 429 --dry-run
+    python3 celigo_api.py errors bulk --integration <id> --action resolve
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from celigo_paging import is_error, page_items
+
+DEFAULT_BATCH_SIZE = 1000  # keys/ids per retry or resolve request
+DEFAULT_WORKERS = 6
+DEFAULT_RATE = 5.0         # requests per second across all workers
+
+ACTIONS = ("retry", "resolve")
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def chunked(items: List[Any], size: int) -> Iterable[List[Any]]:
+    size = max(1, size)
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def flow_steps(flow: dict) -> List[Tuple[str, str]]:
+    """(step_id, "export"|"import") for every source and processor step of a flow."""
+    steps: List[Tuple[str, str]] = []
+
+    def add(step_id, kind):
+        if step_id and (step_id, kind) not in steps:
+            steps.append((step_id, kind))
+
+    def add_processors(processors):
+        for pp in processors or []:
+            if pp.get("type") == "import" or pp.get("_importId"):
+                add(pp.get("_importId"), "import")
+            else:
+                add(pp.get("_exportId"), "export")
+
+    for pg in flow.get("pageGenerators") or []:
+        add(pg.get("_exportId"), "export")
+    add(flow.get("_exportId"), "export")  # legacy single-export flows
+    add(flow.get("_importId"), "import")
+    add_processors(flow.get("pageProcessors"))
+    for router in flow.get("routers") or []:
+        for branch in router.get("branches") or []:
+            add_processors(branch.get("pageProcessors"))
+    return steps
+
+
+class BulkErrors:
+    """Scope → open errors → batched retry/resolve, over a CeligoClient and ErrorsAPI."""
+
+    def __init__(self, client, errors_api, workers: int = DEFAULT_WORKERS,
+                 rate: float = DEFAULT_RATE, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.client = client
+        self.api = errors_api
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.limiter = RateLimiter(rate)
+
+    def _call(self, fn: Callable, *args, **kwargs) -> Any:
+        self.limiter.wait()
+        return fn(*args, **kwargs)
+
+    def _map(self, fn: Callable, items: List[Any]) -> List[Any]:
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(items))) as pool:
+            return list(pool.map(fn, items))
+
+    # -- scope ---------------------------------------------------------------
+
+    def flows_in_scope(self, integration_id: Optional[str] = None,
+                       flow_id: Optional[str] = None,
+                       partner: Optional[str] = None,
+                       since: Optional[str] = None, until: Optional[str] = None,
+                       source: Optional[str] = None) -> List[str]:
+        """Flow IDs to scan. Integration and partner scopes skip flows with no open errors."""
+        if flow_id:
+            return [flow_id]
+        if integration_id:
+            integration_ids = [integration_id]
+        else:
+            integrations = self._call(self.client.get_all, "/integrations")
+            if is_error(integrations):
+                raise RuntimeError(f"/integrations failed: {integrations.get('message')}")
+            integration_ids = [i["_id"] for i in integrations
+                               if partner.lower() in i.get("name", "").lower()]
+
+        def summary(iid):
+            return self._call(self.api.integration_summary, iid, occurred_gte=since,
+                              occurred_lte=until, source=source)
+
+        flow_ids: List[str] = []
+        for iid, result in zip(integration_ids, self._map(summary, integration_ids)):
+            if is_error(result):
+                raise RuntimeError(f"Error summary for integration {iid} failed: "
+                                   f"{result.get('message')}")
+            for row in page_items(result):
+                fid = row.get("_flowId")
+                if fid and (row.get("numError") or 0) > 0 and fid not in flow_ids:
+                    flow_ids.append(fid)
+        return flow_ids
+
+    def open_errors(self, flow_ids: List[str], since: Optional[str] = None,
+                    until: Optional[str] = None, source: Optional[str] = None,
+                    codes: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Open errors per step: [{flow, step, kind, open, errors}] where errors
+        are those matching codes (all when codes is empty). Steps with no open
+        errors are dropped.
+        """
+        flows = self._map(lambda fid: self._call(self.client.get, f"/flows/{fid}"), flow_ids)
+        steps = []
+        for fid, flow in zip(flow_ids, flows):
+            if is_error(flow):
+                raise RuntimeError(f"Flow {fid} failed: {flow.get('message')}")
+            steps.extend((fid, step_id, kind) for step_id, kind in flow_steps(flow))
+
+        wanted = {c.strip().lower() for c in codes or [] if c.strip()}
+
+        def list_step(step):
+            fid, step_id, kind = step
+            lister = self.api.list_export if kind == "export" else self.api.list_import
+            return self._call(lister, fid, step_id, occurred_gte=since,
+                              occurred_lte=until, source=source)
+
+        result = []
+        for (fid, step_id, kind), data in zip(steps, self._map(list_step, steps)):
+            if is_error(data):
+                raise RuntimeError(f"Listing errors for {kind} {step_id} (flow {fid}) failed: "
+                                   f"{data.get('message')}")
+            errors = page_items(data)
+            if not errors:
+                continue
+            matched = [e for e in errors
+                       if not wanted or str(e.get("code", "")).lower() in wanted]
+            result.append({"flow": fid, "step": step_id, "kind": kind,
+                           "open": len(errors), "errors": matched})
+        return result
+
+    # -- apply ---------------------------------------------------------------
+
+    def plan(self, steps: List[Dict[str, Any]], action: str) -> List[Dict[str, Any]]:
+        """One entry per request to send: {flow, step, kind, action, batch, keys}."""
+        field = "retryDataKey" if action == "retry" else "errorId"
+        batches = []
+        for step in steps:
+            keys = [e[field] for e in step["errors"] if e.get(field)]
+            for n, chunk in enumerate(chunked(keys, self.batch_size), 1):
+                batches.append({"flow": step["flow"], "step": step["step"],
+                                "kind": step["kind"], "action": action,
+                                "batch": n, "keys": chunk})
+        return batches
+
+    def apply(self, batches: List[Dict[str, Any]],
+              on_result: Optional[Callable[[dict], None]] = None) -> List[Dict[str, Any]]:
+        """Send every batch; returns one result row per batch, in plan order."""
+        lock = threading.Lock()
+
+        def send(batch):
+            if batch["action"] == "retry":
+                fn = self.api.retry_export if batch["kind"] == "export" else self.api.retry_import
+            else:
+                fn = self.api.resolve_export if batch["kind"] == "export" else self.api.resolve_import
+            resp = self._call(fn, batch["flow"], batch["step"], batch["keys"])
+            row = {k: batch[k] for k in ("flow", "step", "kind", "action", "batch")}
+            row["size"] = len(batch["keys"])
+            row["ok"] = not is_error(resp)
+            row["message"] = "" if row["ok"] else str(resp.get("message") or resp.get("details") or "")
+            if on_result:
+                with lock:
+                    on_result(row)
+            return row
+
+        return self._map(send, batches)
@@ -0,0 +1,58 @@
+"""
+Resource command modules for celigo_api.py.
+
+Each module holds one resource group: its API wrapper class, its `cmd_*`
+handler and `build_parser(parser)`, which adds the group's actions to the
+resource's subparser. COMMANDS maps the CLI resource name to
+(module, handler, help) so that celigo_api.py can list every resource while
+importing only the one being invoked.
+"""
+
+import importlib
+from types import ModuleType
+from typing import Dict, Tuple
+
+COMMANDS: Dict[str, Tuple[str, str, str]] = {
+    "integrations": ("integrations", "cmd_integrations", "Integration operations"),
+    "flows": ("flows", "cmd_flows", "Flow operations"),
+    "connections": ("connections", "cmd_connections", "Connection operations"),
+    "exports": ("exports", "cmd_exports", "Export operations"),
+    "imports": ("imports", "cmd_imports", "Import operations"),
+    "scripts": ("scripts", "cmd_scripts", "Script operations"),
+    "jobs": ("jobs", "cmd_jobs", "Job operations"),
+    "errors": ("errors", "cmd_errors", "Error operations"),
+    "caches": ("caches", "cmd_caches", "Lookup cache operations"),
+    "tags": ("tags", "cmd_tags", "Tag operations"),
+    "users": ("users", "cmd_users", "User operations"),
+    "health-digest": ("health_digest", "cmd_health_digest", "Generate health digest"),
+    "state": ("state", "cmd_state", "State API operations"),
+    "filedefinitions": ("filedefinitions", "cmd_filedefinitions", "File definition operations"),
+    "recyclebin": ("recyclebin", "cmd_recyclebin", "Recycle bin operations"),
+    "audit": ("audit", "cmd_audit", "Account audit log"),
+    "iclients": ("iclients", "cmd_iclients", "iClient (OAuth2 app) operations"),
+    "connectors": ("connectors", "cmd_connectors", "Connector and license operations"),
+    "processors": ("processors", "cmd_processors", "Data processor operations"),
+    "templates": ("templates", "cmd_templates", "Template operations"),
+    "edi-reports": ("edi_reports", "cmd_edi_reports", "EDI trading partner reporting and health"),
+    "edi": ("edi", "cmd_edi", "EDI/B2B operations"),
+    "tools": ("tools", "cmd_tools", "Celigo Tools (reusable processing units)"),
+    "builder-apis": ("builder_apis", "cmd_builder_apis",
+                     "Celigo builder-mode REST endpoint definitions"),
+    "mcp-servers": ("mcp_servers", "cmd_mcp_servers",
+                    "Celigo MCP Servers (expose Tools/APIs to AI agents)"),
+    "async": ("async_helpers", "cmd_async", "Celigo Async Helpers (submit/poll/result pattern)"),
+    "notifications": ("notifications", "cmd_notifications",
+                      "Email notification subscription management"),
+    "opa": ("opa", "cmd_opa", "On-Premise Agent management"),
+    "trading-partners": ("trading_partners", "cmd_trading_partners",
+                         "Trading Partner Connectors (B2B onboarding templates)"),
+    "accesstokens": ("accesstokens", "cmd_accesstokens", "Account-level API token management"),
+    "parsers": ("parsers", "cmd_parsers", "Stateless EDI parse/generate using file definitions"),
+    "snapshots": ("snapshots", "cmd_snapshots",
+                  "Local integration snapshots and structural diff (sandbox vs production)"),
+}
+
+
+def load(resource: str) -> ModuleType:
+    """Import the command module for a CLI resource name."""
+    return importlib.import_module(f"{__name__}.{COMMANDS[resource][0]}")
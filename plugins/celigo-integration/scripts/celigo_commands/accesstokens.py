@@ -0,0 +1,93 @@
+"""`celigo_api.py accesstokens` - account-level API token management."""
+
+import argparse
+import sys
+
+from celigo_core import CeligoClient, _merge_updates_for_put, print_result, _resolve_json_input
+
+
+class AccessTokensAPI:
+    """Account-level API token management."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        return self.client.get("/accesstokens")
+
+    def get(self, token_id: str) -> dict:
+        return self.client.get(f"/accesstokens/{token_id}")
+
+    def create(self, data: dict) -> dict:
+        return self.client.post("/accesstokens", data)
+
+    def update(self, token_id: str, data: dict) -> dict:
+        return self.client.put(f"/accesstokens/{token_id}", data)
+
+    def delete(self, token_id: str) -> dict:
+        return self.client.delete(f"/accesstokens/{token_id}")
+
+
+ACCESS_TOKEN_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt", "token"])
+
+
+def cmd_accesstokens(args):
+    """Handle access token subcommands."""
+    client = CeligoClient(args.env)
+    api = AccessTokensAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "name", "scope", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No token data provided. Use --data or --file", file=sys.stderr)
+            sys.exit(1)
+        print_result(api.create(data), args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, ACCESS_TOKEN_READONLY_FIELDS)
+        print_result(api.update(args.id, merged), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `accesstokens` actions to its resource parser."""
+    at_sub = parser.add_subparsers(dest="action")
+
+    at_sub.add_parser("list", help="List access tokens")
+
+    at_get = at_sub.add_parser("get", help="Get access token")
+    at_get.add_argument("id", help="Token ID")
+
+    at_create = at_sub.add_parser("create", help="Create access token")
+    at_create.add_argument("--data", help="Full JSON (inline); include name, scope")
+    at_create.add_argument("--file", help="Path to JSON file")
+
+    at_update = at_sub.add_parser("update", help="Update access token (fetch-merge-PUT)")
+    at_update.add_argument("id", help="Token ID")
+    at_update.add_argument("--data", help="Partial JSON (inline)")
+    at_update.add_argument("--file", help="Path to JSON file")
+
+    at_delete = at_sub.add_parser("delete", help="Delete access token")
+    at_delete.add_argument("id", help="Token ID")
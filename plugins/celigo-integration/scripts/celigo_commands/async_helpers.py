@@ -0,0 +1,101 @@
+"""`celigo_api.py async` - celigo Async Helpers (submit/poll/result pattern)."""
+
+import argparse
+import sys
+import time
+
+from celigo_core import CeligoClient, print_result, _resolve_json_input
+
+
+class AsyncHelpersAPI:
+    """Three-phase submit/poll/result pattern for long-running Celigo operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def submit(self, operation: str, data: dict = None) -> dict:
+        """Submit a long-running operation and return a job ID."""
+        return self.client.post(f"/asyncHelpers/{operation}/submit", data)
+
+    def poll(self, job_id: str) -> dict:
+        """Check status of a submitted async operation."""
+        return self.client.get(f"/asyncHelpers/jobs/{job_id}")
+
+    def result(self, job_id: str) -> dict:
+        """Fetch final result of a completed async operation."""
+        return self.client.get(f"/asyncHelpers/jobs/{job_id}/result")
+
+    def wait(self, operation: str, data: dict = None,
+             timeout: int = 120, interval: int = 2) -> dict:
+        """Submit + poll until done, then return result. Raises TimeoutError."""
+        resp = self.submit(operation, data)
+        job_id = resp.get("_id") or resp.get("jobId")
+        if not job_id:
+            return resp
+
+        elapsed = 0
+        while elapsed < timeout:
+            status = self.poll(job_id)
+            state = status.get("status", "").lower()
+            if state == "done":
+                return self.result(job_id)
+            if state == "failed":
+                return {"error": True, "message": "Async operation failed", "details": status}
+            time.sleep(interval)
+            elapsed += interval
+
+        raise TimeoutError(f"Async operation {job_id} did not complete within {timeout}s")
+
+
+def cmd_async(args):
+    """Handle Async Helpers subcommands."""
+    client = CeligoClient(args.env)
+    api = AsyncHelpersAPI(client)
+
+    if args.action == "submit":
+        data = _resolve_json_input(args) if hasattr(args, 'data') and args.data else None
+        print_result(api.submit(args.operation, data), args.format)
+
+    elif args.action == "poll":
+        print_result(api.poll(args.id), args.format)
+
+    elif args.action == "result":
+        print_result(api.result(args.id), args.format)
+
+    elif args.action == "wait":
+        data = _resolve_json_input(args) if hasattr(args, 'data') and args.data else None
+        timeout = getattr(args, "timeout", 120)
+        interval = getattr(args, "interval", 2)
+        try:
+            result = api.wait(args.operation, data, timeout=timeout, interval=interval)
+            print_result(result, args.format)
+        except TimeoutError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `async` actions to its resource parser."""
+    async_sub = parser.add_subparsers(dest="action")
+
+    async_submit = async_sub.add_parser("submit", help="Submit a long-running operation")
+    async_submit.add_argument("operation", help="Operation name (e.g. 'dataLoaderExport')")
+    async_submit.add_argument("--data", help="Operation payload JSON")
+    async_submit.add_argument("--file", help="Path to JSON file")
+
+    async_poll = async_sub.add_parser("poll", help="Check status of async operation")
+    async_poll.add_argument("id", help="Job ID returned from submit")
+
+    async_result = async_sub.add_parser("result", help="Fetch result of completed async operation")
+    async_result.add_argument("id", help="Job ID")
+
+    async_wait = async_sub.add_parser("wait", help="Submit + poll until done, then return result")
+    async_wait.add_argument("operation", help="Operation name")
+    async_wait.add_argument("--data", help="Operation payload JSON")
+    async_wait.add_argument("--file", help="Path to JSON file")
+    async_wait.add_argument("--timeout", type=int, default=120, help="Max wait seconds (default 120)")
+    async_wait.add_argument("--interval", type=int, default=2, help="Poll interval seconds (default 2)")
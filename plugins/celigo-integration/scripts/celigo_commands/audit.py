@@ -0,0 +1,56 @@
+"""`celigo_api.py audit` - account audit log."""
+
+import argparse
+
+from celigo_core import CeligoClient, print_result
+
+
+class AuditAPI:
+    """Account-wide audit log."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self, resource_type: str = None, user: str = None,
+             since: str = None, until: str = None) -> list:
+        """List account-wide audit entries."""
+        params = {}
+        if resource_type:
+            params["resourceType"] = resource_type
+        if user:
+            params["byUser"] = user
+        if since:
+            params["startDate"] = since
+        if until:
+            params["endDate"] = until
+        return self.client.get("/audit", params)
+
+
+def cmd_audit(args):
+    """Handle account audit log subcommands."""
+    client = CeligoClient(args.env)
+    api = AuditAPI(client)
+
+    if args.action == "list":
+        data = api.list(
+            resource_type=getattr(args, 'resource_type', None),
+            user=getattr(args, 'user', None),
+            since=getattr(args, 'since', None),
+            until=getattr(args, 'until', None)
+        )
+        print_result(data, args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `audit` actions to its resource parser."""
+    audit_sub = parser.add_subparsers(dest="action")
+
+    audit_list = audit_sub.add_parser("list", help="List audit entries")
+    audit_list.add_argument("--resource-type", help="Filter by resource type")
+    audit_list.add_argument("--user", help="Filter by user")
+    audit_list.add_argument("--since", help="Start date (ISO 8601)")
+    audit_list.add_argument("--until", help="End date (ISO 8601)")
@@ -0,0 +1,111 @@
+"""`celigo_api.py builder-apis` - celigo builder-mode REST endpoint definitions."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    BUILDERAPI_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class BuilderApisAPI:
+    """Celigo builder-mode REST endpoint definitions."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        return self.client.get("/apis")
+
+    def get(self, api_id: str) -> dict:
+        return self.client.get(f"/apis/{api_id}")
+
+    def create(self, data: dict) -> dict:
+        return self.client.post("/apis", data)
+
+    def update(self, api_id: str, data: dict) -> dict:
+        return self.client.put(f"/apis/{api_id}", data)
+
+    def delete(self, api_id: str) -> dict:
+        return self.client.delete(f"/apis/{api_id}")
+
+    def deploy(self, api_id: str) -> dict:
+        return self.client.post(f"/apis/{api_id}/deploy")
+
+    def versions(self, api_id: str) -> list:
+        return self.client.get(f"/apis/{api_id}/versions")
+
+
+def cmd_builder_apis(args):
+    """Handle builder-mode API subcommands."""
+    client = CeligoClient(args.env)
+    api = BuilderApisAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "name", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        print_result(api.create(data), args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, BUILDERAPI_READONLY_FIELDS)
+        print_result(api.update(args.id, merged), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+    elif args.action == "deploy":
+        print_result(api.deploy(args.id), args.format)
+
+    elif args.action == "versions":
+        print_result(api.versions(args.id), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `builder-apis` actions to its resource parser."""
+    apis_sub = parser.add_subparsers(dest="action")
+
+    apis_sub.add_parser("list", help="List builder APIs")
+
+    apis_get = apis_sub.add_parser("get", help="Get builder API")
+    apis_get.add_argument("id", help="API ID")
+
+    apis_create = apis_sub.add_parser("create", help="Create builder API")
+    apis_create.add_argument("--data", help="Full JSON (inline)")
+    apis_create.add_argument("--file", help="Path to JSON file")
+
+    apis_update = apis_sub.add_parser("update", help="Update builder API (fetch-merge-PUT)")
+    apis_update.add_argument("id", help="API ID")
+    apis_update.add_argument("--data", help="Partial JSON (inline)")
+    apis_update.add_argument("--file", help="Path to JSON file")
+
+    apis_delete = apis_sub.add_parser("delete", help="Delete builder API")
+    apis_delete.add_argument("id", help="API ID")
+
+    apis_deploy = apis_sub.add_parser("deploy", help="Deploy builder API")
+    apis_deploy.add_argument("id", help="API ID")
+
+    apis_versions = apis_sub.add_parser("versions", help="List API version history")
+    apis_versions.add_argument("id", help="API ID")
@@ -0,0 +1,264 @@
+"""`celigo_api.py caches` - lookup cache operations."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+from celigo_core import CeligoClient, print_result, _resolve_json_input
+
+
+class LookupCachesAPI:
+    """Lookup caches resource operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        """List all lookup caches."""
+        return self.client.get("/lookupcaches")
+
+    def get(self, cache_id: str) -> dict:
+        """Get lookup cache metadata."""
+        return self.client.get(f"/lookupcaches/{cache_id}")
+
+    def delete(self, cache_id: str) -> dict:
+        """Delete a lookup cache."""
+        return self.client.delete(f"/lookupcaches/{cache_id}")
+
+    def data(self, cache_id: str, keys: list = None, starts_with: str = None,
+             page_size: int = None, start_after_key: str = None) -> dict:
+        """Get lookup cache data (POST /getData — NOT GET)."""
+        body = {}
+        if keys:
+            body["keys"] = keys
+        if starts_with:
+            body["starts_with"] = starts_with
+        if page_size:
+            body["pageSize"] = page_size
+        if start_after_key:
+            body["start_after_key"] = start_after_key
+        return self.client.post(f"/lookupcaches/{cache_id}/getData", body if body else None)
+
+    def data_update(self, cache_id: str, data: dict) -> dict:
+        """Upsert lookup cache data (POST /data)."""
+        return self.client.post(f"/lookupcaches/{cache_id}/data", data)
+
+    def data_delete(self, cache_id: str, keys: list) -> dict:
+        """Delete specific keys from lookup cache data."""
+        return self.client.delete(f"/lookupcaches/{cache_id}/data", data={"keys": keys})
+
+    def data_purge(self, cache_id: str) -> dict:
+        """Delete all data from lookup cache."""
+        return self.client.delete(f"/lookupcaches/{cache_id}/data/purge")
+
+    def patch(self, cache_id: str, data: list) -> dict:
+        """Partial update lookup cache metadata (JSON Patch RFC 6902)."""
+        return self.client.patch(f"/lookupcaches/{cache_id}", data)
+
+    def clone_preview(self, cache_id: str) -> dict:
+        """Preview clone of a lookup cache (shows what will be created)."""
+        return self.client.get(f"/lookupcaches/{cache_id}/clone/preview")
+
+    def dependencies(self, cache_id: str) -> dict:
+        """Get dependency graph for a lookup cache."""
+        return self.client.get(f"/lookupcaches/{cache_id}/dependencies")
+
+
+def cmd_caches(args):
+    """Handle lookup caches subcommands."""
+    client = CeligoClient(args.env)
+    api = LookupCachesAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "name", "description"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "data":
+        keys = args.keys.split(",") if args.keys else None
+        data = api.data(args.id, keys=keys, starts_with=args.starts_with,
+                        page_size=args.page_size, start_after_key=args.start_after)
+        print_result(data, args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+    elif args.action == "data-update":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No data provided. Use --data or --file with {\"data\": [{\"key\": ..., \"value\": ...}]}",
+                  file=sys.stderr)
+            sys.exit(1)
+        print_result(api.data_update(args.id, data), args.format)
+
+    elif args.action == "data-delete":
+        keys = args.keys.split(",")
+        print_result(api.data_delete(args.id, keys), args.format)
+
+    elif args.action == "data-purge":
+        print_result(api.data_purge(args.id), args.format)
+
+    elif args.action == "patch":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No patch data provided.", file=sys.stderr)
+            sys.exit(1)
+        patch_ops = data if isinstance(data, list) else [data]
+        print_result(api.patch(args.id, patch_ops), args.format)
+
+    elif args.action == "clone-preview":
+        print_result(api.clone_preview(args.id), args.format)
+
+    elif args.action == "dependencies":
+        print_result(api.dependencies(args.id), args.format)
+
+    elif args.action in ("export", "import", "diff"):
+        try:
+            _cmd_caches_stream(api, args)
+        except (RuntimeError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+
+def _open_output(path: Optional[str]):
+    return open(path, "w") if path and path != "-" else sys.stdout
+
+
+def _cache_source(spec: str, default_env: Optional[str], page_size: int):
+    """
+    Entry stream for a diff side: a JSONL export path, ENV:CACHE_ID, or CACHE_ID
+    in the --env environment.
+    """
+    from celigo_lookup_cache import iter_entries, read_jsonl
+
+    if spec.endswith(".jsonl") or Path(spec).is_file():
+        fp = open(spec)
+        return read_jsonl(fp), fp
+    env, _, cache_id = spec.rpartition(":")
+    caches = LookupCachesAPI(CeligoClient(env or default_env))
+    return iter_entries(caches, cache_id, page_size=page_size), None
+
+
+def _cmd_caches_stream(api: "LookupCachesAPI", args):
+    """caches export / import / diff (see celigo_lookup_cache)."""
+    from celigo_lookup_cache import diff_entries, import_entries, iter_entries, read_jsonl, write_jsonl
+
+    if args.action == "export":
+        out = _open_output(args.output)
+        try:
+            count = write_jsonl(iter_entries(api, args.id, page_size=args.page_size,
+                                             starts_with=args.starts_with), out)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        print(f"Exported {count} entries from cache {args.id}", file=sys.stderr)
+
+    elif args.action == "import":
+        fp = open(args.input) if args.input != "-" else sys.stdin
+        try:
+            def progress(row):
+                mark = "ok" if row["ok"] else f"FAILED: {row['message']}"
+                print(f"  batch {row['batch']} ({row['size']}: {row['first_key']}..{row['last_key']}): {mark}",
+                      file=sys.stderr)
+
+            results = import_entries(api, args.id, read_jsonl(fp), batch_size=args.batch_size,
+                                     workers=args.workers, on_result=progress)
+        finally:
+            if fp is not sys.stdin:
+                fp.close()
+        failed = [r for r in results if not r["ok"]]
+        print(f"Imported {sum(r['size'] for r in results if r['ok'])} entries into cache {args.id} "
+              f"({len(results) - len(failed)}/{len(results)} batches ok)", file=sys.stderr)
+        if failed:
+            print_result(failed, args.format, ["batch", "first_key", "last_key", "size", "message"])
+            sys.exit(1)
+
+    elif args.action == "diff":
+        left, left_fp = _cache_source(args.left, args.env, args.page_size)
+        right, right_fp = _cache_source(args.right, args.env, args.page_size)
+        out = _open_output(args.output)
+        counts = {"only_left": 0, "only_right": 0, "changed": 0}
+        try:
+            for d in diff_entries(left, right):
+                counts[d["status"]] += 1
+                if not args.summary_only:
+                    out.write(json.dumps(d, separators=(",", ":"), sort_keys=True) + "\n")
+        finally:
+            for fp in (left_fp, right_fp):
+                if fp:
+                    fp.close()
+            if out is not sys.stdout:
+                out.close()
+        print(f"{counts['only_left']} only in {args.left}, {counts['only_right']} only in {args.right}, "
+              f"{counts['changed']} changed", file=sys.stderr)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `caches` actions to its resource parser."""
+    cache_sub = parser.add_subparsers(dest="action")
+
+    cache_list = cache_sub.add_parser("list", help="List caches")
+
+    cache_get = cache_sub.add_parser("get", help="Get cache metadata")
+    cache_get.add_argument("id", help="Cache ID")
+
+    cache_data = cache_sub.add_parser("data", help="Get cache data")
+    cache_data.add_argument("id", help="Cache ID")
+    cache_data.add_argument("--keys", help="Comma-separated keys to retrieve")
+    cache_data.add_argument("--starts-with", help="Key prefix filter")
+    cache_data.add_argument("--page-size", type=int, help="Items per page")
+    cache_data.add_argument("--start-after", help="Pagination cursor (key)")
+
+    cache_delete = cache_sub.add_parser("delete", help="Delete a cache")
+    cache_delete.add_argument("id", help="Cache ID")
+
+    cache_data_upd = cache_sub.add_parser("data-update", help="Upsert cache data")
+    cache_data_upd.add_argument("id", help="Cache ID")
+    cache_data_upd.add_argument("--data", help='JSON: {"data": [{"key": "...", "value": {...}}]}')
+    cache_data_upd.add_argument("--file", help="Path to JSON file")
+
+    cache_data_del = cache_sub.add_parser("data-delete", help="Delete specific cache keys")
+    cache_data_del.add_argument("id", help="Cache ID")
+    cache_data_del.add_argument("--keys", required=True, help="Comma-separated keys to delete")
+
+    cache_data_purge = cache_sub.add_parser("data-purge", help="Delete all cache data")
+    cache_data_purge.add_argument("id", help="Cache ID")
+
+    cache_patch = cache_sub.add_parser("patch", help="Partial update cache metadata (JSON Patch)")
+    cache_patch.add_argument("id", help="Cache ID")
+    cache_patch.add_argument("--data", help="JSON Patch array")
+    cache_patch.add_argument("--file", help="Path to JSON Patch file")
+
+    cache_clone_prev = cache_sub.add_parser("clone-preview", help="Preview clone of a cache")
+    cache_clone_prev.add_argument("id", help="Cache ID")
+
+    cache_deps = cache_sub.add_parser("dependencies", help="Get cache dependency graph")
+    cache_deps.add_argument("id", help="Cache ID")
+
+    cache_export = cache_sub.add_parser("export", help="Stream all cache entries to JSONL")
+    cache_export.add_argument("id", help="Cache ID")
+    cache_export.add_argument("--output", "-o", help="JSONL file (default: stdout)")
+    cache_export.add_argument("--starts-with", help="Key prefix filter")
+    cache_export.add_argument("--page-size", type=int, default=1000, help="Entries per getData page")
+
+    cache_import = cache_sub.add_parser("import", help="Upsert JSONL entries in concurrent batches")
+    cache_import.add_argument("id", help="Cache ID")
+    cache_import.add_argument("--input", "-i", required=True, help="JSONL file from 'caches export' (- for stdin)")
+    cache_import.add_argument("--batch-size", type=int, default=500, help="Entries per data update (default: 500)")
+    cache_import.add_argument("--workers", type=int, default=4, help="Batches in flight (default: 4)")
+
+    cache_diff = cache_sub.add_parser("diff", help="Compare two caches key by key (streaming)")
+    cache_diff.add_argument("left", help="CACHE_ID, ENV:CACHE_ID, or a JSONL export")
+    cache_diff.add_argument("right", help="CACHE_ID, ENV:CACHE_ID, or a JSONL export")
+    cache_diff.add_argument("--output", "-o", help="JSONL of differing keys (default: stdout)")
+    cache_diff.add_argument("--summary-only", action="store_true", help="Only print the counts")
+    cache_diff.add_argument("--page-size", type=int, default=1000, help="Entries per getData page")
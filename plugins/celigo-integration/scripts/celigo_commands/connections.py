@@ -0,0 +1,229 @@
+"""`celigo_api.py connections` - connection operations."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    CONNECTION_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class ConnectionsAPI:
+    """Connections resource operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self, integration_id: str = None, conn_type: str = None) -> list:
+        """List all connections."""
+        params = {}
+        if integration_id:
+            params["_integrationId"] = integration_id
+        if conn_type:
+            params["type"] = conn_type
+        return self.client.get("/connections", params)
+
+    def get(self, connection_id: str) -> dict:
+        """Get single connection."""
+        return self.client.get(f"/connections/{connection_id}")
+
+    def test(self, connection_id: str) -> dict:
+        """Test/ping connection."""
+        return self.client.post(f"/connections/{connection_id}/ping")
+
+    def debug_log(self, connection_id: str) -> dict:
+        """Get connection debug log."""
+        return self.client.get(f"/connections/{connection_id}/debuglog")
+
+    def logs(self, connection_id: str) -> list:
+        """Get connection usage logs."""
+        return self.client.get(f"/connections/{connection_id}/logs")
+
+    def dependencies(self, connection_id: str) -> dict:
+        """Get connection dependencies."""
+        return self.client.get(f"/connections/{connection_id}/dependencies")
+
+    def create(self, data: dict) -> dict:
+        """Create a new connection."""
+        return self.client.post("/connections", data)
+
+    def update(self, connection_id: str, data: dict) -> dict:
+        """Update an existing connection (full-replace PUT)."""
+        return self.client.put(f"/connections/{connection_id}", data)
+
+    def patch(self, connection_id: str, data: list) -> dict:
+        """Partial update connection (JSON Patch RFC 6902)."""
+        return self.client.patch(f"/connections/{connection_id}", data)
+
+    def delete(self, connection_id: str) -> dict:
+        """Delete a connection."""
+        return self.client.delete(f"/connections/{connection_id}")
+
+    def audit(self, connection_id: str) -> list:
+        """Get connection audit log."""
+        return self.client.get(f"/connections/{connection_id}/audit")
+
+    def oauth2(self, connection_id: str) -> dict:
+        """Get OAuth2 token info for connection."""
+        return self.client.get(f"/connections/{connection_id}/oauth2")
+
+    def ping_virtual(self, data: dict) -> dict:
+        """Test a virtual (unsaved) connection."""
+        return self.client.post("/connections/ping", data)
+
+    def virtual_export(self, connection_id: str, data: dict) -> dict:
+        """Run a virtual export against a connection."""
+        return self.client.post(f"/connections/{connection_id}/export", data)
+
+    def virtual_export_pages(self, connection_id: str, data: dict) -> dict:
+        """Run a paged virtual export against a connection."""
+        return self.client.post(f"/connections/{connection_id}/export/pages", data)
+
+    def virtual_import(self, connection_id: str, data: dict) -> dict:
+        """Run a virtual import against a connection."""
+        return self.client.post(f"/connections/{connection_id}/import", data)
+
+    def virtual_import_map(self, connection_id: str, data: dict) -> dict:
+        """Get virtual import mapping for a connection."""
+        return self.client.post(f"/connections/{connection_id}/import/map", data)
+
+
+def cmd_connections(args):
+    """Handle connections subcommands."""
+    client = CeligoClient(args.env)
+    api = ConnectionsAPI(client)
+
+    if args.action == "list":
+        data = api.list(integration_id=args.integration, conn_type=args.type)
+        columns = ["_id", "name", "type", "offline"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "test":
+        print_result(api.test(args.id), args.format)
+
+    elif args.action == "debug-log":
+        print_result(api.debug_log(args.id), args.format)
+
+    elif args.action == "logs":
+        print_result(api.logs(args.id), args.format)
+
+    elif args.action == "dependencies":
+        print_result(api.dependencies(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        result = api.create(data)
+        print_result(result, args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, CONNECTION_READONLY_FIELDS)
+        print_result(api.update(args.id, merged), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+    elif args.action == "patch":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No patch data provided.", file=sys.stderr)
+            sys.exit(1)
+        patch_ops = data if isinstance(data, list) else [data]
+        print_result(api.patch(args.id, patch_ops), args.format)
+
+    elif args.action == "audit":
+        print_result(api.audit(args.id), args.format)
+
+    elif args.action == "oauth2":
+        print_result(api.oauth2(args.id), args.format)
+
+    elif args.action == "ping-virtual":
+        data = _resolve_json_input(args)
+        print_result(api.ping_virtual(data), args.format)
+
+    elif args.action == "virtual-export":
+        data = _resolve_json_input(args)
+        print_result(api.virtual_export(args.id, data), args.format)
+
+    elif args.action == "virtual-import":
+        data = _resolve_json_input(args)
+        print_result(api.virtual_import(args.id, data), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `connections` actions to its resource parser."""
+    conn_sub = parser.add_subparsers(dest="action")
+
+    conn_list = conn_sub.add_parser("list", help="List connections")
+    conn_list.add_argument("--integration", help="Filter by integration ID")
+    conn_list.add_argument("--type", help="Filter by connection type")
+
+    conn_get = conn_sub.add_parser("get", help="Get connection")
+    conn_get.add_argument("id", help="Connection ID")
+
+    conn_test = conn_sub.add_parser("test", help="Test/ping connection")
+    conn_test.add_argument("id", help="Connection ID")
+
+    conn_debug = conn_sub.add_parser("debug-log", help="Get debug log")
+    conn_debug.add_argument("id", help="Connection ID")
+
+    conn_logs = conn_sub.add_parser("logs", help="Get usage logs")
+    conn_logs.add_argument("id", help="Connection ID")
+
+    conn_deps = conn_sub.add_parser("dependencies", help="Get dependencies")
+    conn_deps.add_argument("id", help="Connection ID")
+
+    conn_create = conn_sub.add_parser("create", help="Create a new connection")
+    conn_create.add_argument("--data", help="Full connection JSON (inline string)")
+    conn_create.add_argument("--file", help="Path to JSON file with connection definition")
+
+    conn_update = conn_sub.add_parser("update", help="Update connection (fetch-merge-PUT)")
+    conn_update.add_argument("id", help="Connection ID")
+    conn_update.add_argument("--data", help="Partial JSON (inline)")
+    conn_update.add_argument("--file", help="Path to JSON file")
+
+    conn_delete = conn_sub.add_parser("delete", help="Delete a connection")
+    conn_delete.add_argument("id", help="Connection ID")
+
+    conn_patch = conn_sub.add_parser("patch", help="Partial update (JSON Patch)")
+    conn_patch.add_argument("id", help="Connection ID")
+    conn_patch.add_argument("--data", help="JSON Patch array")
+    conn_patch.add_argument("--file", help="Path to JSON Patch file")
+
+    conn_audit = conn_sub.add_parser("audit", help="Get audit log")
+    conn_audit.add_argument("id", help="Connection ID")
+
+    conn_oauth2 = conn_sub.add_parser("oauth2", help="Get OAuth2 token info")
+    conn_oauth2.add_argument("id", help="Connection ID")
+
+    conn_pingv = conn_sub.add_parser("ping-virtual", help="Test virtual (unsaved) connection")
+    conn_pingv.add_argument("--data", help="Connection definition JSON")
+    conn_pingv.add_argument("--file", help="Path to JSON file")
+
+    conn_vexp = conn_sub.add_parser("virtual-export", help="Run virtual export")
+    conn_vexp.add_argument("id", help="Connection ID")
+    conn_vexp.add_argument("--data", help="Export definition JSON")
+    conn_vexp.add_argument("--file", help="Path to JSON file")
+
+    conn_vimp = conn_sub.add_parser("virtual-import", help="Run virtual import")
+    conn_vimp.add_argument("id", help="Connection ID")
+    conn_vimp.add_argument("--data", help="Import definition JSON")
+    conn_vimp.add_argument("--file", help="Path to JSON file")
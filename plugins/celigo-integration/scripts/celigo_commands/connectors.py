@@ -0,0 +1,182 @@
+"""`celigo_api.py connectors` - connector and license operations."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    CONNECTOR_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class ConnectorsAPI:
+    """Connectors and licenses resource operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        """List all connectors."""
+        return self.client.get("/connectors")
+
+    def get(self, connector_id: str) -> dict:
+        """Get a connector."""
+        return self.client.get(f"/connectors/{connector_id}")
+
+    def create(self, data: dict) -> dict:
+        """Create a connector."""
+        return self.client.post("/connectors", data)
+
+    def update(self, connector_id: str, data: dict) -> dict:
+        """Update a connector (full-replace PUT)."""
+        return self.client.put(f"/connectors/{connector_id}", data)
+
+    def delete(self, connector_id: str) -> dict:
+        """Delete a connector."""
+        return self.client.delete(f"/connectors/{connector_id}")
+
+    def install_base(self, connector_id: str) -> list:
+        """Get connector install base."""
+        return self.client.get(f"/connectors/{connector_id}/installBase")
+
+    def publish_update(self, connector_id: str, data: dict) -> dict:
+        """Publish a connector update."""
+        return self.client.put(f"/connectors/{connector_id}/update", data)
+
+    def list_licenses(self, connector_id: str) -> list:
+        """List licenses for a connector."""
+        return self.client.get(f"/connectors/{connector_id}/licenses")
+
+    def create_license(self, connector_id: str, data: dict) -> dict:
+        """Create a license for a connector."""
+        return self.client.post(f"/connectors/{connector_id}/licenses", data)
+
+    def get_license(self, connector_id: str, license_id: str) -> dict:
+        """Get a specific license."""
+        return self.client.get(f"/connectors/{connector_id}/licenses/{license_id}")
+
+    def update_license(self, connector_id: str, license_id: str, data: dict) -> dict:
+        """Update a license."""
+        return self.client.put(f"/connectors/{connector_id}/licenses/{license_id}", data)
+
+    def delete_license(self, connector_id: str, license_id: str) -> dict:
+        """Delete a license."""
+        return self.client.delete(f"/connectors/{connector_id}/licenses/{license_id}")
+
+
+def cmd_connectors(args):
+    """Handle connectors and licenses subcommands."""
+    client = CeligoClient(args.env)
+    api = ConnectorsAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "name", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        print_result(api.create(data), args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, CONNECTOR_READONLY_FIELDS)
+        print_result(api.update(args.id, merged), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+    elif args.action == "install-base":
+        print_result(api.install_base(args.id), args.format)
+
+    elif args.action == "publish-update":
+        data = _resolve_json_input(args)
+        print_result(api.publish_update(args.id, data), args.format)
+
+    elif args.action == "list-licenses":
+        data = api.list_licenses(args.id)
+        columns = ["_id", "name", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "create-license":
+        data = _resolve_json_input(args)
+        print_result(api.create_license(args.id, data), args.format)
+
+    elif args.action == "get-license":
+        print_result(api.get_license(args.id, args.license_id), args.format)
+
+    elif args.action == "update-license":
+        data = _resolve_json_input(args)
+        print_result(api.update_license(args.id, args.license_id, data), args.format)
+
+    elif args.action == "delete-license":
+        print_result(api.delete_license(args.id, args.license_id), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `connectors` actions to its resource parser."""
+    cnr_sub = parser.add_subparsers(dest="action")
+
+    cnr_sub.add_parser("list", help="List connectors")
+
+    cnr_get = cnr_sub.add_parser("get", help="Get connector")
+    cnr_get.add_argument("id", help="Connector ID")
+
+    cnr_create = cnr_sub.add_parser("create", help="Create connector")
+    cnr_create.add_argument("--data", help="Full JSON (inline)")
+    cnr_create.add_argument("--file", help="Path to JSON file")
+
+    cnr_update = cnr_sub.add_parser("update", help="Update connector")
+    cnr_update.add_argument("id", help="Connector ID")
+    cnr_update.add_argument("--data", help="Partial JSON (inline)")
+    cnr_update.add_argument("--file", help="Path to JSON file")
+
+    cnr_delete = cnr_sub.add_parser("delete", help="Delete connector")
+    cnr_delete.add_argument("id", help="Connector ID")
+
+    cnr_ib = cnr_sub.add_parser("install-base", help="Get install base")
+    cnr_ib.add_argument("id", help="Connector ID")
+
+    cnr_pub = cnr_sub.add_parser("publish-update", help="Publish connector update")
+    cnr_pub.add_argument("id", help="Connector ID")
+    cnr_pub.add_argument("--data", help="Update JSON")
+    cnr_pub.add_argument("--file", help="Path to JSON file")
+
+    cnr_ll = cnr_sub.add_parser("list-licenses", help="List licenses")
+    cnr_ll.add_argument("id", help="Connector ID")
+
+    cnr_cl = cnr_sub.add_parser("create-license", help="Create license")
+    cnr_cl.add_argument("id", help="Connector ID")
+    cnr_cl.add_argument("--data", help="License JSON")
+    cnr_cl.add_argument("--file", help="Path to JSON file")
+
+    cnr_gl = cnr_sub.add_parser("get-license", help="Get license")
+    cnr_gl.add_argument("id", help="Connector ID")
+    cnr_gl.add_argument("license_id", help="License ID")
+
+    cnr_ul = cnr_sub.add_parser("update-license", help="Update license")
+    cnr_ul.add_argument("id", help="Connector ID")
+    cnr_ul.add_argument("license_id", help="License ID")
+    cnr_ul.add_argument("--data", help="License update JSON")
+    cnr_ul.add_argument("--file", help="Path to JSON file")
+
+    cnr_dl = cnr_sub.add_parser("delete-license", help="Delete license")
+    cnr_dl.add_argument("id", help="Connector ID")
+    cnr_dl.add_argument("license_id", help="License ID")
@@ -0,0 +1,205 @@
+"""`celigo_api.py edi` - EDI/B2B operations."""
+
+import argparse
+import json
+import sys
+
+from celigo_core import (
+    EDIPROFILE_IMMUTABLE_FIELDS,
+    EDIPROFILE_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class EDIAPI:
+    """EDI/B2B profile and transaction operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        """List all EDI profiles."""
+        return self.client.get("/ediprofiles")
+
+    def get(self, profile_id: str) -> dict:
+        """Get an EDI profile."""
+        return self.client.get(f"/ediprofiles/{profile_id}")
+
+    def create(self, data: dict) -> dict:
+        """Create an EDI profile."""
+        return self.client.post("/ediprofiles", data)
+
+    def update(self, profile_id: str, data: dict) -> dict:
+        """Update an EDI profile (full-replace PUT)."""
+        return self.client.put(f"/ediprofiles/{profile_id}", data)
+
+    def patch(self, profile_id: str, data: list) -> dict:
+        """Partial update EDI profile (JSON Patch RFC 6902)."""
+        return self.client.patch(f"/ediprofiles/{profile_id}", data)
+
+    def delete(self, profile_id: str) -> dict:
+        """Delete an EDI profile."""
+        return self.client.delete(f"/ediprofiles/{profile_id}")
+
+    def update_transactions(self, data: dict) -> dict:
+        """Update EDI transactions."""
+        return self.client.patch("/ediTransactions", data)
+
+    def query_transactions(self, data: dict) -> dict:
+        """Query EDI transactions."""
+        return self.client.post("/ediTransactions/query", data)
+
+    def get_fa_details(self, transaction_id: str) -> dict:
+        """Get functional acknowledgment details for a transaction."""
+        return self.client.get(f"/ediTransactions/{transaction_id}/faDetails")
+
+    def dependencies(self, profile_id: str) -> dict:
+        """Get resources that reference this EDI profile."""
+        return self.client.get(f"/ediprofiles/{profile_id}/dependencies")
+
+    def update_transaction(self, transaction_id: str, data: dict) -> dict:
+        """Update a single EDI transaction (PATCH)."""
+        return self.client.patch(f"/ediTransactions/{transaction_id}", data)
+
+    def download_transaction(self, transaction_id: str) -> str:
+        """Download raw EDI envelope for a transaction (returns raw content)."""
+        return self.client.get(f"/ediTransactions/{transaction_id}/download")
+
+
+def cmd_edi(args):
+    """Handle EDI/B2B subcommands."""
+    client = CeligoClient(args.env)
+    api = EDIAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "name", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        print_result(api.create(data), args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        # fileType is immutable — reject mutation client-side
+        if "fileType" in updates:
+            print("Error: 'fileType' is immutable after EDI profile creation and cannot be changed.",
+                  file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        readonly = EDIPROFILE_READONLY_FIELDS | EDIPROFILE_IMMUTABLE_FIELDS
+        merged = _merge_updates_for_put(current, updates, readonly)
+        print_result(api.update(args.id, merged), args.format)
+
+    elif args.action == "patch":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No patch data provided.", file=sys.stderr)
+            sys.exit(1)
+        patch_ops = data if isinstance(data, list) else [data]
+        print_result(api.patch(args.id, patch_ops), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+    elif args.action == "dependencies":
+        print_result(api.dependencies(args.id), args.format)
+
+    elif args.action == "update-transactions":
+        data = _resolve_json_input(args)
+        print_result(api.update_transactions(data), args.format)
+
+    elif args.action == "update-transaction":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        print_result(api.update_transaction(args.id, data), args.format)
+
+    elif args.action == "query-transactions":
+        data = _resolve_json_input(args)
+        print_result(api.query_transactions(data), args.format)
+
+    elif args.action == "fa-details":
+        print_result(api.get_fa_details(args.id), args.format)
+
+    elif args.action == "download-transaction":
+        result = api.download_transaction(args.id)
+        out_path = getattr(args, "out", None)
+        if out_path:
+            with open(out_path, "w") as f:
+                content = result if isinstance(result, str) else json.dumps(result, indent=2)
+                f.write(content)
+            print(f"Downloaded to {out_path}")
+        else:
+            if isinstance(result, str):
+                print(result)
+            else:
+                print_result(result, args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `edi` actions to its resource parser."""
+    edi_sub = parser.add_subparsers(dest="action")
+
+    edi_sub.add_parser("list", help="List EDI profiles")
+
+    edi_get = edi_sub.add_parser("get", help="Get EDI profile")
+    edi_get.add_argument("id", help="EDI profile ID")
+
+    edi_create = edi_sub.add_parser("create", help="Create EDI profile")
+    edi_create.add_argument("--data", help="Full JSON (inline)")
+    edi_create.add_argument("--file", help="Path to JSON file")
+
+    edi_update = edi_sub.add_parser("update", help="Update EDI profile")
+    edi_update.add_argument("id", help="EDI profile ID")
+    edi_update.add_argument("--data", help="Partial JSON (inline)")
+    edi_update.add_argument("--file", help="Path to JSON file")
+
+    edi_patch = edi_sub.add_parser("patch", help="Partial update (JSON Patch)")
+    edi_patch.add_argument("id", help="EDI profile ID")
+    edi_patch.add_argument("--data", help="JSON Patch array")
+    edi_patch.add_argument("--file", help="Path to JSON Patch file")
+
+    edi_delete = edi_sub.add_parser("delete", help="Delete EDI profile")
+    edi_delete.add_argument("id", help="EDI profile ID")
+
+    edi_utxn = edi_sub.add_parser("update-transactions", help="Update EDI transactions")
+    edi_utxn.add_argument("--data", help="Transaction update JSON")
+    edi_utxn.add_argument("--file", help="Path to JSON file")
+
+    edi_qtxn = edi_sub.add_parser("query-transactions", help="Query EDI transactions")
+    edi_qtxn.add_argument("--data", help="Query JSON")
+    edi_qtxn.add_argument("--file", help="Path to JSON file")
+
+    edi_fa = edi_sub.add_parser("fa-details", help="Get FA details for transaction")
+    edi_fa.add_argument("id", help="Transaction ID")
+
+    edi_deps = edi_sub.add_parser("dependencies", help="Get resources referencing this EDI profile")
+    edi_deps.add_argument("id", help="EDI profile ID")
+
+    edi_utxn_single = edi_sub.add_parser("update-transaction", help="Update a single EDI transaction (PATCH)")
+    edi_utxn_single.add_argument("id", help="Transaction ID")
+    edi_utxn_single.add_argument("--data", help="Partial JSON (inline)")
+    edi_utxn_single.add_argument("--file", help="Path to JSON file")
+
+    edi_dl = edi_sub.add_parser("download-transaction", help="Download raw EDI envelope for a transaction")
+    edi_dl.add_argument("id", help="Transaction ID")
+    edi_dl.add_argument("--out", help="Write output to file path instead of stdout")
@@ -0,0 +1,450 @@
+"""`celigo_api.py errors` - error operations."""
+
+import argparse
+import json
+import sys
+
+from celigo_core import CeligoClient, print_result, _resolve_json_input
+
+
+class ErrorsAPI:
+    """Errors resource operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    # Export Errors
+    def list_export(self, flow_id: str, export_id: str,
+                    occurred_gte: str = None, occurred_lte: str = None,
+                    source: str = None) -> dict:
+        """List export errors."""
+        params = {}
+        if occurred_gte:
+            params["occurredAt_gte"] = occurred_gte
+        if occurred_lte:
+            params["occurredAt_lte"] = occurred_lte
+        if source:
+            params["source"] = source
+        return self.client.get_all(f"/flows/{flow_id}/exports/{export_id}/errors", params)
+
+    def resolved_export(self, flow_id: str, export_id: str,
+                        occurred_gte: str = None, occurred_lte: str = None,
+                        source: str = None) -> dict:
+        """List resolved export errors."""
+        params = {}
+        if occurred_gte:
+            params["occurredAt_gte"] = occurred_gte
+        if occurred_lte:
+            params["occurredAt_lte"] = occurred_lte
+        if source:
+            params["source"] = source
+        return self.client.get_all(f"/flows/{flow_id}/exports/{export_id}/resolved", params)
+
+    def retry_data_export(self, flow_id: str, export_id: str, retry_key: str) -> dict:
+        """Get export error retry data."""
+        return self.client.get(f"/flows/{flow_id}/exports/{export_id}/errors/{retry_key}")
+
+    def resolve_export(self, flow_id: str, export_id: str, error_ids: list) -> dict:
+        """Resolve export errors (PUT /resolved, not POST)."""
+        return self.client.put(f"/flows/{flow_id}/{export_id}/resolved",
+                               {"errorIds": error_ids})
+
+    def retry_export(self, flow_id: str, export_id: str, retry_keys: list) -> dict:
+        """Retry export errors."""
+        return self.client.post(f"/flows/{flow_id}/exports/{export_id}/errors/retry",
+                                {"retryDataKeys": retry_keys})
+
+    def assign_export(self, flow_id: str, export_id: str, error_ids: list,
+                      email: str) -> dict:
+        """Assign export errors to user."""
+        return self.client.post(f"/flows/{flow_id}/exports/{export_id}/errors/assign",
+                                {"errorIds": error_ids, "email": email})
+
+    def tags_export(self, flow_id: str, export_id: str, errors: list,
+                    tag_ids: list) -> dict:
+        """Tag export errors."""
+        return self.client.post(f"/flows/{flow_id}/exports/{export_id}/errors/tags",
+                                {"errors": errors, "tagIds": tag_ids})
+
+    # Import Errors
+    def list_import(self, flow_id: str, import_id: str,
+                    occurred_gte: str = None, occurred_lte: str = None,
+                    source: str = None) -> dict:
+        """List import errors."""
+        params = {}
+        if occurred_gte:
+            params["occurredAt_gte"] = occurred_gte
+        if occurred_lte:
+            params["occurredAt_lte"] = occurred_lte
+        if source:
+            params["source"] = source
+        return self.client.get_all(f"/flows/{flow_id}/imports/{import_id}/errors", params)
+
+    def resolved_import(self, flow_id: str, import_id: str,
+                        occurred_gte: str = None, occurred_lte: str = None,
+                        source: str = None) -> dict:
+        """List resolved import errors."""
+        params = {}
+        if occurred_gte:
+            params["occurredAt_gte"] = occurred_gte
+        if occurred_lte:
+            params["occurredAt_lte"] = occurred_lte
+        if source:
+            params["source"] = source
+        return self.client.get_all(f"/flows/{flow_id}/imports/{import_id}/resolved", params)
+
+    def retry_data_import(self, flow_id: str, import_id: str, retry_key: str) -> dict:
+        """Get import error retry data."""
+        return self.client.get(f"/flows/{flow_id}/imports/{import_id}/errors/{retry_key}")
+
+    def resolve_import(self, flow_id: str, import_id: str, error_ids: list) -> dict:
+        """Resolve import errors (PUT /resolved, not POST)."""
+        return self.client.put(f"/flows/{flow_id}/{import_id}/resolved",
+                               {"errorIds": error_ids})
+
+    def retry_import(self, flow_id: str, import_id: str, retry_keys: list) -> dict:
+        """Retry import errors."""
+        return self.client.post(f"/flows/{flow_id}/imports/{import_id}/errors/retry",
+                                {"retryDataKeys": retry_keys})
+
+    def assign_import(self, flow_id: str, import_id: str, error_ids: list,
+                      email: str) -> dict:
+        """Assign import errors to user."""
+        return self.client.post(f"/flows/{flow_id}/imports/{import_id}/errors/assign",
+                                {"errorIds": error_ids, "email": email})
+
+    def tags_import(self, flow_id: str, import_id: str, errors: list,
+                    tag_ids: list) -> dict:
+        """Tag import errors."""
+        return self.client.post(f"/flows/{flow_id}/imports/{import_id}/errors/tags",
+                                {"errors": errors, "tagIds": tag_ids})
+
+    # Integration Errors
+    def integration_summary(self, integration_id: str, occurred_gte: str = None,
+                            occurred_lte: str = None, source: str = None) -> list:
+        """Get integration error summary."""
+        params = {}
+        if occurred_gte:
+            params["occurredAt_gte"] = occurred_gte
+        if occurred_lte:
+            params["occurredAt_lte"] = occurred_lte
+        if source:
+            params["source"] = source
+        return self.client.get_all(f"/integrations/{integration_id}/errors", params)
+
+    def assign_integration(self, integration_id: str, error_ids: list,
+                           email: str) -> dict:
+        """Assign integration errors to user."""
+        return self.client.post(f"/integrations/{integration_id}/errors/assign",
+                                {"errorIds": error_ids, "email": email})
+
+    def delete_resolved_export(self, flow_id: str, export_id: str) -> dict:
+        """Delete resolved export errors."""
+        return self.client.delete(f"/flows/{flow_id}/{export_id}/resolved")
+
+    def delete_resolved_import(self, flow_id: str, import_id: str) -> dict:
+        """Delete resolved import errors."""
+        return self.client.delete(f"/flows/{flow_id}/{import_id}/resolved")
+
+    def update_retry_data(self, flow_id: str, exp_or_imp_id: str,
+                          retry_key: str, data: dict) -> dict:
+        """Update retry data for an error before retrying."""
+        return self.client.put(f"/flows/{flow_id}/{exp_or_imp_id}/{retry_key}/data", data)
+
+    def view_request(self, flow_id: str, page_processor_id: str,
+                     request_key: str) -> dict:
+        """View request/response details for an error."""
+        return self.client.get(f"/flows/{flow_id}/{page_processor_id}/requests/{request_key}")
+
+
+def cmd_errors(args):
+    """Handle errors subcommands."""
+    client = CeligoClient(args.env)
+    api = ErrorsAPI(client)
+
+    # Determine if export or import based on provided args
+    is_export = hasattr(args, 'export') and args.export
+    is_import = hasattr(args, 'import_id') and args.import_id
+
+    if args.action == "list":
+        if is_export:
+            data = api.list_export(args.flow, args.export,
+                                   occurred_gte=args.since, occurred_lte=args.until,
+                                   source=args.source)
+        elif is_import:
+            data = api.list_import(args.flow, args.import_id,
+                                   occurred_gte=args.since, occurred_lte=args.until,
+                                   source=args.source)
+        else:
+            print("Error: Specify --export or --import", file=sys.stderr)
+            sys.exit(1)
+        print_result(data, args.format)
+
+    elif args.action == "resolved":
+        if is_export:
+            data = api.resolved_export(args.flow, args.export,
+                                       occurred_gte=args.since, occurred_lte=args.until,
+                                       source=args.source)
+        elif is_import:
+            data = api.resolved_import(args.flow, args.import_id,
+                                       occurred_gte=args.since, occurred_lte=args.until,
+                                       source=args.source)
+        else:
+            print("Error: Specify --export or --import", file=sys.stderr)
+            sys.exit(1)
+        print_result(data, args.format)
+
+    elif args.action == "retry-data":
+        if is_export:
+            data = api.retry_data_export(args.flow, args.export, args.key)
+        elif is_import:
+            data = api.retry_data_import(args.flow, args.import_id, args.key)
+        else:
+            print("Error: Specify --export or --import", file=sys.stderr)
+            sys.exit(1)
+        print_result(data, args.format)
+
+    elif args.action == "resolve":
+        error_ids = args.ids.split(",")
+        if is_export:
+            data = api.resolve_export(args.flow, args.export, error_ids)
+        elif is_import:
+            data = api.resolve_import(args.flow, args.import_id, error_ids)
+        else:
+            print("Error: Specify --export or --import", file=sys.stderr)
+            sys.exit(1)
+        print_result(data, args.format)
+
+    elif args.action == "retry":
+        retry_keys = args.keys.split(",")
+        if is_export:
+            data = api.retry_export(args.flow, args.export, retry_keys)
+        elif is_import:
+            data = api.retry_import(args.flow, args.import_id, retry_keys)
+        else:
+            print("Error: Specify --export or --import", file=sys.stderr)
+            sys.exit(1)
+        print_result(data, args.format)
+
+    elif args.action == "assign":
+        error_ids = args.ids.split(",")
+        if is_export:
+            data = api.assign_export(args.flow, args.export, error_ids, args.email)
+        elif is_import:
+            data = api.assign_import(args.flow, args.import_id, error_ids, args.email)
+        else:
+            print("Error: Specify --export or --import", file=sys.stderr)
+            sys.exit(1)
+        print_result(data, args.format)
+
+    elif args.action == "tags":
+        # Parse errors as JSON list: [{"id": "...", "rdk": "..."}]
+        errors = json.loads(args.errors)
+        tag_ids = args.tag_ids.split(",")
+        if is_export:
+            data = api.tags_export(args.flow, args.export, errors, tag_ids)
+        elif is_import:
+            data = api.tags_import(args.flow, args.import_id, errors, tag_ids)
+        else:
+            print("Error: Specify --export or --import", file=sys.stderr)
+            sys.exit(1)
+        print_result(data, args.format)
+
+    elif args.action == "integration-summary":
+        data = api.integration_summary(args.integration,
+                                       occurred_gte=args.since, occurred_lte=args.until,
+                                       source=args.source)
+        columns = ["_flowId", "numError"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "integration-assign":
+        error_ids = args.ids.split(",")
+        data = api.assign_integration(args.integration, error_ids, args.email)
+        print_result(data, args.format)
+
+    elif args.action == "delete-resolved":
+        if is_export:
+            data = api.delete_resolved_export(args.flow, args.export)
+        elif is_import:
+            data = api.delete_resolved_import(args.flow, args.import_id)
+        else:
+            print("Error: Specify --export or --import", file=sys.stderr)
+            sys.exit(1)
+        print_result(data, args.format)
+
+    elif args.action == "update-retry-data":
+        exp_or_imp = args.export or args.import_id
+        if not exp_or_imp:
+            print("Error: Specify --export or --import", file=sys.stderr)
+            sys.exit(1)
+        update_data = _resolve_json_input(args)
+        data = api.update_retry_data(args.flow, exp_or_imp, args.key, update_data)
+        print_result(data, args.format)
+
+    elif args.action == "view-request":
+        pp_id = args.export or args.import_id
+        if not pp_id:
+            print("Error: Specify --export or --import (page processor ID)", file=sys.stderr)
+            sys.exit(1)
+        data = api.view_request(args.flow, pp_id, args.key)
+        print_result(data, args.format)
+
+    elif args.action == "bulk":
+        _cmd_errors_bulk(client, api, args)
+
+
+def _cmd_errors_bulk(client: CeligoClient, api: ErrorsAPI, args):
+    """Retry or resolve every open error in a scope, in batches (see celigo_bulk_errors)."""
+    from celigo_bulk_errors import BulkErrors
+
+    bulk = BulkErrors(client, api, workers=args.workers, rate=args.rate,
+                      batch_size=args.batch_size)
+    codes = args.code.split(",") if args.code else None
+    try:
+        flow_ids = bulk.flows_in_scope(args.integration, args.flow, args.partner,
+                                       since=args.since, until=args.until, source=args.source)
+        print(f"Scanning {len(flow_ids)} flow(s) for open errors...", file=sys.stderr)
+        steps = bulk.open_errors(flow_ids, since=args.since, until=args.until,
+                                 source=args.source, codes=codes)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    batches = bulk.plan(steps, args.bulk_action)
+    matched = sum(len(s["errors"]) for s in steps)
+    keyed = sum(len(b["keys"]) for b in batches)
+    print(f"{sum(s['open'] for s in steps)} open errors on {len(steps)} step(s); {matched} match, "
+          f"{keyed} {'retryable' if args.bulk_action == 'retry' else 'resolvable'} "
+          f"in {len(batches)} batch(es)", file=sys.stderr)
+
+    if args.dry_run:
+        rows = [{"flow": s["flow"], "step": s["step"], "kind": s["kind"], "open": s["open"],
+                 "matched": len(s["errors"]),
+                 "batches": sum(1 for b in batches if b["step"] == s["step"] and b["flow"] == s["flow"])}
+                for s in steps]
+        print_result(rows, args.format, ["flow", "step", "kind", "open", "matched", "batches"])
+        return
+
+    def progress(row):
+        mark = "ok" if row["ok"] else f"FAILED: {row['message']}"
+        print(f"  {row['action']} {row['kind']} {row['step']} batch {row['batch']} "
+              f"({row['size']}): {mark}", file=sys.stderr)
+
+    results = bulk.apply(batches, on_result=progress)
+    failed = [r for r in results if not r["ok"]]
+    done = {"retry": "retried", "resolve": "resolved"}[args.bulk_action]
+    print(f"\n{len(results) - len(failed)}/{len(results)} batches succeeded "
+          f"({sum(r['size'] for r in results if r['ok'])} errors {done})", file=sys.stderr)
+    print_result(results, args.format, ["flow", "step", "kind", "action", "batch", "size", "ok", "message"])
+    if failed:
+        sys.exit(1)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `errors` actions to its resource parser."""
+    err_sub = parser.add_subparsers(dest="action")
+
+    # Common error args
+    def add_error_args(p, with_keys=False, with_ids=False, with_email=False):
+        p.add_argument("--flow", required=True, help="Flow ID")
+        p.add_argument("--export", help="Export ID")
+        p.add_argument("--import", dest="import_id", help="Import ID")
+        p.add_argument("--since", help="Occurred after (ISO 8601)")
+        p.add_argument("--until", help="Occurred before (ISO 8601)")
+        p.add_argument("--source", help="Error source filter")
+        if with_keys:
+            p.add_argument("--keys", required=True, help="Comma-separated retry data keys")
+        if with_ids:
+            p.add_argument("--ids", required=True, help="Comma-separated error IDs")
+        if with_email:
+            p.add_argument("--email", required=True, help="User email")
+
+    err_list = err_sub.add_parser("list", help="List errors")
+    add_error_args(err_list)
+
+    err_resolved = err_sub.add_parser("resolved", help="List resolved errors")
+    add_error_args(err_resolved)
+
+    err_retry_data = err_sub.add_parser("retry-data", help="Get retry data")
+    err_retry_data.add_argument("--flow", required=True, help="Flow ID")
+    err_retry_data.add_argument("--export", help="Export ID")
+    err_retry_data.add_argument("--import", dest="import_id", help="Import ID")
+    err_retry_data.add_argument("--key", required=True, help="Retry data key")
+
+    err_resolve = err_sub.add_parser("resolve", help="Resolve errors")
+    err_resolve.add_argument("--flow", required=True, help="Flow ID")
+    err_resolve.add_argument("--export", help="Export ID")
+    err_resolve.add_argument("--import", dest="import_id", help="Import ID")
+    err_resolve.add_argument("--ids", required=True, help="Comma-separated error IDs")
+
+    err_retry = err_sub.add_parser("retry", help="Retry errors")
+    err_retry.add_argument("--flow", required=True, help="Flow ID")
+    err_retry.add_argument("--export", help="Export ID")
+    err_retry.add_argument("--import", dest="import_id", help="Import ID")
+    err_retry.add_argument("--keys", required=True, help="Comma-separated retry data keys")
+
+    err_assign = err_sub.add_parser("assign", help="Assign errors to user")
+    err_assign.add_argument("--flow", required=True, help="Flow ID")
+    err_assign.add_argument("--export", help="Export ID")
+    err_assign.add_argument("--import", dest="import_id", help="Import ID")
+    err_assign.add_argument("--ids", required=True, help="Comma-separated error IDs")
+    err_assign.add_argument("--email", required=True, help="User email")
+
+    err_tags = err_sub.add_parser("tags", help="Tag errors")
+    err_tags.add_argument("--flow", required=True, help="Flow ID")
+    err_tags.add_argument("--export", help="Export ID")
+    err_tags.add_argument("--import", dest="import_id", help="Import ID")
+    err_tags.add_argument("--errors", required=True, help='JSON array: [{"id":"...","rdk":"..."}]')
+    err_tags.add_argument("--tag-ids", required=True, help="Comma-separated tag IDs")
+
+    err_bulk = err_sub.add_parser(
+        "bulk", help="Retry or resolve all open errors in an integration, flow or partner (batched)")
+    scope = err_bulk.add_mutually_exclusive_group(required=True)
+    scope.add_argument("--integration", help="Integration ID")
+    scope.add_argument("--flow", help="Flow ID")
+    scope.add_argument("--partner", help="Every integration whose name contains this (case-insensitive)")
+    err_bulk.add_argument("--action", dest="bulk_action", choices=["retry", "resolve"], required=True,
+                          help="retry (by retry data key) or resolve (by error ID)")
+    err_bulk.add_argument("--code", help="Only errors with these codes (comma-separated)")
+    err_bulk.add_argument("--since", help="Occurred after (ISO 8601)")
+    err_bulk.add_argument("--until", help="Occurred before (ISO 8601)")
+    err_bulk.add_argument("--source", help="Error source filter")
+    err_bulk.add_argument("--batch-size", type=int, default=1000, help="Keys per request (default: 1000)")
+    err_bulk.add_argument("--workers", type=int, default=6, help="Requests in flight (default: 6)")
+    err_bulk.add_argument("--rate", type=float, default=5.0,
+                          help="Max requests per second across workers (default: 5)")
+    err_bulk.add_argument("--dry-run", action="store_true", help="Show matching errors per step; change nothing")
+
+    err_int_summary = err_sub.add_parser("integration-summary", help="Get integration error summary")
+    err_int_summary.add_argument("--integration", required=True, help="Integration ID")
+    err_int_summary.add_argument("--since", help="Occurred after (ISO 8601)")
+    err_int_summary.add_argument("--until", help="Occurred before (ISO 8601)")
+    err_int_summary.add_argument("--source", help="Error source filter")
+
+    err_int_assign = err_sub.add_parser("integration-assign", help="Assign integration errors")
+    err_int_assign.add_argument("--integration", required=True, help="Integration ID")
+    err_int_assign.add_argument("--ids", required=True, help="Comma-separated error IDs")
+    err_int_assign.add_argument("--email", required=True, help="User email")
+
+    err_del_resolved = err_sub.add_parser("delete-resolved", help="Delete resolved errors")
+    err_del_resolved.add_argument("--flow", required=True, help="Flow ID")
+    err_del_resolved.add_argument("--export", help="Export ID")
+    err_del_resolved.add_argument("--import", dest="import_id", help="Import ID")
+
+    err_upd_retry = err_sub.add_parser("update-retry-data", help="Update retry data before retrying")
+    err_upd_retry.add_argument("--flow", required=True, help="Flow ID")
+    err_upd_retry.add_argument("--export", help="Export ID")
+    err_upd_retry.add_argument("--import", dest="import_id", help="Import ID")
+    err_upd_retry.add_argument("--key", required=True, help="Retry data key")
+    err_upd_retry.add_argument("--data", help="Updated record JSON")
+    err_upd_retry.add_argument("--file", help="Path to JSON file")
+
+    err_view_req = err_sub.add_parser("view-request", help="View request/response for error")
+    err_view_req.add_argument("--flow", required=True, help="Flow ID")
+    err_view_req.add_argument("--export", help="Export/page-processor ID")
+    err_view_req.add_argument("--import", dest="import_id", help="Import/page-processor ID")
+    err_view_req.add_argument("--key", required=True, help="Request key")
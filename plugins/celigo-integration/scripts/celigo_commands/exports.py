@@ -0,0 +1,211 @@
+"""`celigo_api.py exports` - export operations."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    EXPORT_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class ExportsAPI:
+    """Exports resource operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self, page: int = 1, page_size: int = 100) -> list:
+        """List all exports."""
+        params = {"page": page, "pageSize": page_size}
+        return self.client.get("/exports", params)
+
+    def get(self, export_id: str) -> dict:
+        """Get single export."""
+        return self.client.get(f"/exports/{export_id}")
+
+    def audit(self, export_id: str) -> list:
+        """Get export audit log."""
+        return self.client.get(f"/exports/{export_id}/audit")
+
+    def dependencies(self, export_id: str) -> dict:
+        """Get export dependencies."""
+        return self.client.get(f"/exports/{export_id}/dependencies")
+
+    def create(self, data: dict) -> dict:
+        """Create a new export."""
+        return self.client.post("/exports", data)
+
+    def update(self, export_id: str, data: dict) -> dict:
+        """Update an existing export."""
+        return self.client.put(f"/exports/{export_id}", data)
+
+    def delete(self, export_id: str) -> dict:
+        """Delete an export."""
+        return self.client.delete(f"/exports/{export_id}")
+
+    def clone(self, export_id: str) -> dict:
+        """Clone an export."""
+        return self.client.post(f"/exports/{export_id}/clone")
+
+    def invoke(self, export_id: str, data: dict = None) -> dict:
+        """Invoke an export (run standalone)."""
+        return self.client.post(f"/exports/{export_id}/invoke", data)
+
+    def patch(self, export_id: str, data: list) -> dict:
+        """Partial update export (JSON Patch RFC 6902)."""
+        return self.client.patch(f"/exports/{export_id}", data)
+
+    def replace_connection(self, export_id: str, data: dict) -> dict:
+        """Replace connection in an export."""
+        return self.client.put(f"/exports/{export_id}/replaceConnection", data)
+
+    def distributed_get(self, export_id: str) -> dict:
+        """Get distributed settings (NetSuite/Salesforce real-time exports)."""
+        return self.client.get(f"/exports/{export_id}/distributed")
+
+    def distributed_update(self, export_id: str, data: dict) -> dict:
+        """Update distributed settings (NetSuite/Salesforce real-time exports)."""
+        return self.client.put(f"/exports/{export_id}/distributed", data)
+
+
+def cmd_exports(args):
+    """Handle exports subcommands."""
+    client = CeligoClient(args.env)
+    api = ExportsAPI(client)
+
+    if args.action == "list":
+        data = api.list(page=args.page, page_size=args.page_size)
+        columns = ["_id", "name", "adaptorType", "_connectionId"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "audit":
+        print_result(api.audit(args.id), args.format)
+
+    elif args.action == "dependencies":
+        print_result(api.dependencies(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        result = api.create(data)
+        print_result(result, args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided. Use --data or --file",
+                  file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, EXPORT_READONLY_FIELDS)
+        result = api.update(args.id, merged)
+        print_result(result, args.format)
+
+    elif args.action == "delete":
+        result = api.delete(args.id)
+        print_result(result, args.format)
+
+    elif args.action == "clone":
+        print_result(api.clone(args.id), args.format)
+
+    elif args.action == "invoke":
+        data = _resolve_json_input(args) if hasattr(args, 'data') else None
+        print_result(api.invoke(args.id, data), args.format)
+
+    elif args.action == "patch":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No patch data provided.", file=sys.stderr)
+            sys.exit(1)
+        patch_ops = data if isinstance(data, list) else [data]
+        print_result(api.patch(args.id, patch_ops), args.format)
+
+    elif args.action == "replace-connection":
+        data = _resolve_json_input(args)
+        print_result(api.replace_connection(args.id, data), args.format)
+
+    elif args.action == "distributed-get":
+        print_result(api.distributed_get(args.id), args.format)
+
+    elif args.action == "distributed-update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided. Use --data or --file", file=sys.stderr)
+            sys.exit(1)
+        current = api.distributed_get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, EXPORT_READONLY_FIELDS)
+        print_result(api.distributed_update(args.id, merged), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `exports` actions to its resource parser."""
+    exp_sub = parser.add_subparsers(dest="action")
+
+    exp_list = exp_sub.add_parser("list", help="List exports")
+    exp_list.add_argument("--page", type=int, default=1)
+    exp_list.add_argument("--page-size", type=int, default=100)
+
+    exp_get = exp_sub.add_parser("get", help="Get export")
+    exp_get.add_argument("id", help="Export ID")
+
+    exp_audit = exp_sub.add_parser("audit", help="Get audit log")
+    exp_audit.add_argument("id", help="Export ID")
+
+    exp_deps = exp_sub.add_parser("dependencies", help="Get dependencies")
+    exp_deps.add_argument("id", help="Export ID")
+
+    exp_create = exp_sub.add_parser("create", help="Create a new export")
+    exp_create.add_argument("--data", help="Full export JSON (inline string)")
+    exp_create.add_argument("--file", help="Path to JSON file with export definition")
+
+    exp_update = exp_sub.add_parser("update", help="Update an export (fetch-merge-PUT)")
+    exp_update.add_argument("id", help="Export ID")
+    exp_update.add_argument("--data", help="Partial export JSON (inline string)")
+    exp_update.add_argument("--file", help="Path to JSON file with updates")
+
+    exp_delete = exp_sub.add_parser("delete", help="Delete an export")
+    exp_delete.add_argument("id", help="Export ID")
+
+    exp_clone = exp_sub.add_parser("clone", help="Clone an export")
+    exp_clone.add_argument("id", help="Export ID")
+
+    exp_invoke = exp_sub.add_parser("invoke", help="Invoke export (run standalone)")
+    exp_invoke.add_argument("id", help="Export ID")
+    exp_invoke.add_argument("--data", help="Invoke parameters JSON")
+    exp_invoke.add_argument("--file", help="Path to JSON file")
+
+    exp_patch = exp_sub.add_parser("patch", help="Partial update (JSON Patch)")
+    exp_patch.add_argument("id", help="Export ID")
+    exp_patch.add_argument("--data", help="JSON Patch array")
+    exp_patch.add_argument("--file", help="Path to JSON Patch file")
+
+    exp_replconn = exp_sub.add_parser("replace-connection", help="Replace connection")
+    exp_replconn.add_argument("id", help="Export ID")
+    exp_replconn.add_argument("--data", help="Connection replacement JSON")
+    exp_replconn.add_argument("--file", help="Path to JSON file")
+
+    exp_distget = exp_sub.add_parser("distributed-get",
+                                     help="Get distributed settings (NetSuite/Salesforce RT exports)")
+    exp_distget.add_argument("id", help="Export ID")
+
+    exp_distupd = exp_sub.add_parser("distributed-update",
+                                     help="Update distributed settings (NetSuite/Salesforce RT exports)")
+    exp_distupd.add_argument("id", help="Export ID")
+    exp_distupd.add_argument("--data", help="Distributed settings JSON")
+    exp_distupd.add_argument("--file", help="Path to JSON file")
@@ -0,0 +1,125 @@
+"""`celigo_api.py filedefinitions` - file definition operations."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    EDI_FORMATS,
+    FILEDEFINITION_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class FileDefinitionsAPI:
+    """File definitions resource operations (standard CRUD)."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        """List all file definitions."""
+        return self.client.get("/filedefinitions")
+
+    def get(self, fd_id: str) -> dict:
+        """Get a file definition."""
+        return self.client.get(f"/filedefinitions/{fd_id}")
+
+    def create(self, data: dict) -> dict:
+        """Create a file definition."""
+        return self.client.post("/filedefinitions", data)
+
+    def update(self, fd_id: str, data: dict) -> dict:
+        """Update a file definition (full-replace PUT)."""
+        return self.client.put(f"/filedefinitions/{fd_id}", data)
+
+    def delete(self, fd_id: str) -> dict:
+        """Delete a file definition."""
+        return self.client.delete(f"/filedefinitions/{fd_id}")
+
+    def dependencies(self, fd_id: str) -> dict:
+        """Get resources that reference this file definition."""
+        return self.client.get(f"/filedefinitions/{fd_id}/dependencies")
+
+
+def cmd_filedefinitions(args):
+    """Handle file definitions subcommands."""
+    client = CeligoClient(args.env)
+    api = FileDefinitionsAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "name", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        fmt = data.get("format", "")
+        if fmt in EDI_FORMATS:
+            if not data.get("documentType"):
+                print(f"Error: 'documentType' required for format '{fmt}'.", file=sys.stderr)
+                sys.exit(1)
+            if not data.get("globalId"):
+                print(f"Error: 'globalId' required for format '{fmt}'.", file=sys.stderr)
+                sys.exit(1)
+        if hasattr(args, "schema_version") and args.schema_version:
+            data["version"] = int(args.schema_version)
+        print_result(api.create(data), args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        if hasattr(args, "schema_version") and args.schema_version:
+            updates["version"] = int(args.schema_version)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, FILEDEFINITION_READONLY_FIELDS)
+        print_result(api.update(args.id, merged), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+    elif args.action == "dependencies":
+        print_result(api.dependencies(args.id), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `filedefinitions` actions to its resource parser."""
+    fd_sub = parser.add_subparsers(dest="action")
+
+    fd_sub.add_parser("list", help="List file definitions")
+
+    fd_get = fd_sub.add_parser("get", help="Get file definition")
+    fd_get.add_argument("id", help="File definition ID")
+
+    fd_create = fd_sub.add_parser("create", help="Create file definition")
+    fd_create.add_argument("--data", help="Full JSON (inline)")
+    fd_create.add_argument("--file", help="Path to JSON file")
+    fd_create.add_argument("--schema-version", choices=["1", "2"],
+                           help="Schema version for x12/edifact formats (1 or 2)")
+
+    fd_update = fd_sub.add_parser("update", help="Update file definition")
+    fd_update.add_argument("id", help="File definition ID")
+    fd_update.add_argument("--data", help="Partial JSON (inline)")
+    fd_update.add_argument("--file", help="Path to JSON file")
+    fd_update.add_argument("--schema-version", choices=["1", "2"],
+                           help="Schema version for x12/edifact formats (1 or 2)")
+
+    fd_delete = fd_sub.add_parser("delete", help="Delete file definition")
+    fd_delete.add_argument("id", help="File definition ID")
+
+    fd_deps = fd_sub.add_parser("dependencies", help="Get file definition dependencies")
+    fd_deps.add_argument("id", help="File definition ID")
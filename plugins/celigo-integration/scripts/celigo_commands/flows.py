@@ -0,0 +1,257 @@
+"""`celigo_api.py flows` - flow operations."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    FLOW_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class FlowsAPI:
+    """Flows resource operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self, integration_id: str = None, disabled: bool = None,
+             page: int = 1, page_size: int = 100) -> list:
+        """List all flows."""
+        params = {"page": page, "pageSize": page_size}
+        if integration_id:
+            params["_integrationId"] = integration_id
+        if disabled is not None:
+            params["disabled"] = str(disabled).lower()
+        return self.client.get("/flows", params)
+
+    def get(self, flow_id: str) -> dict:
+        """Get single flow."""
+        return self.client.get(f"/flows/{flow_id}")
+
+    def run(self, flow_id: str, export_ids: list = None,
+            start_date: str = None, end_date: str = None) -> dict:
+        """Run/trigger a flow."""
+        data = {}
+        if export_ids:
+            data["_exportIds"] = export_ids
+        if start_date:
+            data["startDate"] = start_date
+        if end_date:
+            data["endDate"] = end_date
+        return self.client.post(f"/flows/{flow_id}/run", data if data else None)
+
+    def template(self, flow_id: str) -> dict:
+        """Get flow template download URL."""
+        return self.client.get(f"/flows/{flow_id}/template")
+
+    def dependencies(self, flow_id: str) -> dict:
+        """Get flow dependencies."""
+        return self.client.get(f"/flows/{flow_id}/dependencies")
+
+    def descendants(self, flow_id: str) -> dict:
+        """Get flow descendants (exports and imports)."""
+        return self.client.get(f"/flows/{flow_id}/descendants")
+
+    def jobs_latest(self, flow_id: str) -> list:
+        """Get latest jobs for flow."""
+        return self.client.get(f"/flows/{flow_id}/jobs/latest")
+
+    def last_export_datetime(self, flow_id: str) -> dict:
+        """Get last export datetime for flow."""
+        return self.client.get(f"/flows/{flow_id}/lastExportDateTime")
+
+    def audit(self, flow_id: str) -> list:
+        """Get flow audit log."""
+        return self.client.get(f"/flows/{flow_id}/audit")
+
+    def create(self, data: dict) -> dict:
+        """Create a new flow."""
+        return self.client.post("/flows", data)
+
+    def update(self, flow_id: str, data: dict) -> dict:
+        """Update an existing flow."""
+        return self.client.put(f"/flows/{flow_id}", data)
+
+    def delete(self, flow_id: str) -> dict:
+        """Delete a flow."""
+        return self.client.delete(f"/flows/{flow_id}")
+
+    def clone(self, flow_id: str) -> dict:
+        """Clone a flow."""
+        return self.client.post(f"/flows/{flow_id}/clone")
+
+    def patch(self, flow_id: str, data: list) -> dict:
+        """Partial update flow (JSON Patch RFC 6902)."""
+        return self.client.patch(f"/flows/{flow_id}", data)
+
+    def replace_connection(self, flow_id: str, data: dict) -> dict:
+        """Replace connection in a flow."""
+        return self.client.put(f"/flows/{flow_id}/replaceConnection", data)
+
+
+def cmd_flows(args):
+    """Handle flows subcommands."""
+    client = CeligoClient(args.env)
+    api = FlowsAPI(client)
+
+    if args.action == "list":
+        data = api.list(integration_id=args.integration, disabled=args.disabled,
+                        page=args.page, page_size=args.page_size)
+        columns = ["_id", "name", "disabled", "_integrationId"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "run":
+        export_ids = args.export_ids.split(",") if args.export_ids else None
+        data = api.run(args.id, export_ids=export_ids,
+                       start_date=args.start_date, end_date=args.end_date)
+        print_result(data, args.format)
+
+    elif args.action == "template":
+        print_result(api.template(args.id), args.format)
+
+    elif args.action == "dependencies":
+        print_result(api.dependencies(args.id), args.format)
+
+    elif args.action == "descendants":
+        print_result(api.descendants(args.id), args.format)
+
+    elif args.action == "jobs-latest":
+        data = api.jobs_latest(args.id)
+        columns = ["_id", "type", "status", "numSuccess", "numError", "endedAt"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "last-export-datetime":
+        print_result(api.last_export_datetime(args.id), args.format)
+
+    elif args.action == "audit":
+        print_result(api.audit(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        if not data.get("name"):
+            print("Error: Flow name is required. Use --name or include 'name' in --data/--file",
+                  file=sys.stderr)
+            sys.exit(1)
+        result = api.create(data)
+        print_result(result, args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided. Use --name, --disabled, --data, or --file",
+                  file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, FLOW_READONLY_FIELDS)
+        result = api.update(args.id, merged)
+        print_result(result, args.format)
+
+    elif args.action == "delete":
+        result = api.delete(args.id)
+        print_result(result, args.format)
+
+    elif args.action == "clone":
+        print_result(api.clone(args.id), args.format)
+
+    elif args.action == "patch":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No patch data provided. Use --data with JSON Patch array.", file=sys.stderr)
+            sys.exit(1)
+        patch_ops = data if isinstance(data, list) else [data]
+        print_result(api.patch(args.id, patch_ops), args.format)
+
+    elif args.action == "replace-connection":
+        data = _resolve_json_input(args)
+        print_result(api.replace_connection(args.id, data), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `flows` actions to its resource parser."""
+    flow_sub = parser.add_subparsers(dest="action")
+
+    flow_list = flow_sub.add_parser("list", help="List flows")
+    flow_list.add_argument("--integration", help="Filter by integration ID")
+    flow_list.add_argument("--disabled", type=lambda x: x.lower() == 'true',
+                           help="Filter by disabled status")
+    flow_list.add_argument("--page", type=int, default=1)
+    flow_list.add_argument("--page-size", type=int, default=100)
+
+    flow_get = flow_sub.add_parser("get", help="Get flow")
+    flow_get.add_argument("id", help="Flow ID")
+
+    flow_run = flow_sub.add_parser("run", help="Run/trigger flow")
+    flow_run.add_argument("id", help="Flow ID")
+    flow_run.add_argument("--export-ids", help="Comma-separated export IDs")
+    flow_run.add_argument("--start-date", help="Start date for delta flows (ISO 8601)")
+    flow_run.add_argument("--end-date", help="End date for delta flows (ISO 8601)")
+
+    flow_template = flow_sub.add_parser("template", help="Get flow template URL")
+    flow_template.add_argument("id", help="Flow ID")
+
+    flow_deps = flow_sub.add_parser("dependencies", help="Get flow dependencies")
+    flow_deps.add_argument("id", help="Flow ID")
+
+    flow_desc = flow_sub.add_parser("descendants", help="Get flow descendants")
+    flow_desc.add_argument("id", help="Flow ID")
+
+    flow_jobs = flow_sub.add_parser("jobs-latest", help="Get latest flow jobs")
+    flow_jobs.add_argument("id", help="Flow ID")
+
+    flow_last = flow_sub.add_parser("last-export-datetime", help="Get last export time")
+    flow_last.add_argument("id", help="Flow ID")
+
+    flow_audit = flow_sub.add_parser("audit", help="Get flow audit log")
+    flow_audit.add_argument("id", help="Flow ID")
+
+    flow_create = flow_sub.add_parser("create", help="Create a new flow")
+    flow_create.add_argument("--name", help="Flow name (required unless in --data/--file)")
+    flow_create.add_argument("--description", help="Flow description")
+    flow_create.add_argument("--integration", help="Integration ID (_integrationId)")
+    flow_create.add_argument("--disabled", type=lambda x: x.lower() == 'true',
+                             help="Set disabled status (true/false)")
+    flow_create.add_argument("--schedule", help="Cron schedule expression")
+    flow_create.add_argument("--timezone", help="Timezone for schedule")
+    flow_create.add_argument("--data", help="Full flow JSON (inline string)")
+    flow_create.add_argument("--file", help="Path to JSON file with flow definition")
+
+    flow_update = flow_sub.add_parser("update", help="Update a flow")
+    flow_update.add_argument("id", help="Flow ID")
+    flow_update.add_argument("--name", help="New flow name")
+    flow_update.add_argument("--description", help="New description")
+    flow_update.add_argument("--disabled", type=lambda x: x.lower() == 'true',
+                             help="Set disabled status (true/false)")
+    flow_update.add_argument("--schedule", help="New cron schedule expression")
+    flow_update.add_argument("--timezone", help="Timezone for schedule")
+    flow_update.add_argument("--data", help="Partial flow JSON (inline string)")
+    flow_update.add_argument("--file", help="Path to JSON file with updates")
+
+    flow_delete = flow_sub.add_parser("delete", help="Delete a flow")
+    flow_delete.add_argument("id", help="Flow ID")
+
+    flow_clone = flow_sub.add_parser("clone", help="Clone a flow")
+    flow_clone.add_argument("id", help="Flow ID")
+
+    flow_patch = flow_sub.add_parser("patch", help="Partial update (JSON Patch)")
+    flow_patch.add_argument("id", help="Flow ID")
+    flow_patch.add_argument("--data", help='JSON Patch array: [{"op":"replace","path":"/name","value":"new"}]')
+    flow_patch.add_argument("--file", help="Path to JSON Patch file")
+
+    flow_replconn = flow_sub.add_parser("replace-connection", help="Replace connection in flow")
+    flow_replconn.add_argument("id", help="Flow ID")
+    flow_replconn.add_argument("--data", help="Connection replacement JSON")
+    flow_replconn.add_argument("--file", help="Path to JSON file")
@@ -0,0 +1,225 @@
+"""`celigo_api.py health-digest` - generate health digest."""
+
+import argparse
+import json
+import sys
+from datetime import datetime, timedelta
+
+from celigo_core import CeligoAPIError, CeligoClient
+
+
+def _sync_job_warehouse(client: "CeligoClient", wh: "JobWarehouse", since: datetime,
+                        refresh: bool = False) -> dict:
+    """Incrementally sync flow jobs created since `since` into the local warehouse."""
+    def list_jobs(created_gte):
+        return client.iter_items("/jobs", {"type": "flow", "pageSize": 1000,
+                                           "createdAt_gte": created_gte})
+
+    try:
+        result = wh.sync(list_jobs, lambda job_id: client.get(f"/jobs/{job_id}"),
+                         since, refresh=refresh)
+    except CeligoAPIError as e:
+        print(f"Error: /v1/jobs failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Job warehouse: {result['fetched']} listed from {result['listed_from']}, "
+          f"{result['repolled']} re-polled ({wh.path})", file=sys.stderr)
+    return result
+
+
+def _live_health_stats(client: "CeligoClient", days: int, now: datetime) -> dict:
+    """Health digest aggregates from a full /jobs sweep of the window (no warehouse)."""
+    # Fetch all jobs (bypasses Celigo's delta tracking), every page of the window.
+    # Jobs created up to a day before the cutoff are fetched too, so a job that
+    # ended inside the window still counts; the exact filter is applied below.
+    print(f"Fetching all jobs from the last {days} days...", file=sys.stderr)
+    cutoff = (now - timedelta(days=days)).isoformat()
+    created_gte = (now - timedelta(days=days + 1)).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+    try:
+        jobs = [
+            j for j in client.iter_items("/jobs", {"pageSize": 1000, "createdAt_gte": created_gte})
+            if isinstance(j, dict) and (j.get('endedAt') or j.get('createdAt', '')) >= cutoff
+        ]
+    except CeligoAPIError as e:
+        print(f"Error: /v1/jobs failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # Accumulate stats (mirrors health_digest_hook.js v4 logic — flow-type jobs only)
+    stats = {
+        'totalFlowRuns': 0,
+        'totalErrors': 0,
+        'totalSuccesses': 0,
+        'totalOpenErrors': 0,
+        'totalResolved': 0,
+        'errorsByFlow': {},
+        'openErrorsByFlow': {},
+        'agingBuckets': {'under24h': 0, 'days1to3': 0, 'days3to7': 0, 'days7to14': 0, 'over14d': 0},
+        'earliest': None,
+        'latest': None,
+    }
+
+    for job in jobs:
+        # v4: skip export/import child jobs to avoid double-counting errors
+        if job.get('type') != 'flow':
+            continue
+        stats['totalFlowRuns'] += 1
+        stats['totalErrors'] += (job.get('numError') or 0)
+        stats['totalSuccesses'] += (job.get('numSuccess') or 0)
+        stats['totalOpenErrors'] += (job.get('numOpenError') or 0)
+        stats['totalResolved'] += (job.get('numResolved') or 0)
+
+        fid = job.get('_flowId') or 'unknown'
+
+        # Errors by flow
+        if fid not in stats['errorsByFlow']:
+            stats['errorsByFlow'][fid] = {'errors': 0, 'successes': 0}
+        stats['errorsByFlow'][fid]['errors'] += (job.get('numError') or 0)
+        stats['errorsByFlow'][fid]['successes'] += (job.get('numSuccess') or 0)
+
+        # Open errors by flow with aging
+        open_count = job.get('numOpenError') or 0
+        if open_count > 0:
+            if fid not in stats['openErrorsByFlow']:
+                stats['openErrorsByFlow'][fid] = {'open': 0, 'oldest': None, 'newest': None}
+            stats['openErrorsByFlow'][fid]['open'] += open_count
+
+            job_time = job.get('endedAt') or job.get('startedAt')
+            if job_time:
+                if not stats['openErrorsByFlow'][fid]['oldest'] or job_time < stats['openErrorsByFlow'][fid]['oldest']:
+                    stats['openErrorsByFlow'][fid]['oldest'] = job_time
+                if not stats['openErrorsByFlow'][fid]['newest'] or job_time > stats['openErrorsByFlow'][fid]['newest']:
+                    stats['openErrorsByFlow'][fid]['newest'] = job_time
+
+                # Age bucket
+                try:
+                    job_dt = datetime.fromisoformat(job_time.replace('Z', '+00:00'))
+                    age_hours = (now - job_dt).total_seconds() / 3600
+                    if age_hours < 24:
+                        stats['agingBuckets']['under24h'] += open_count
+                    elif age_hours < 72:
+                        stats['agingBuckets']['days1to3'] += open_count
+                    elif age_hours < 168:
+                        stats['agingBuckets']['days3to7'] += open_count
+                    elif age_hours < 336:
+                        stats['agingBuckets']['days7to14'] += open_count
+                    else:
+                        stats['agingBuckets']['over14d'] += open_count
+                except (ValueError, TypeError):
+                    pass
+
+        # Time range
+        ended = job.get('endedAt')
+        if ended:
+            if not stats['earliest'] or ended < stats['earliest']:
+                stats['earliest'] = ended
+            if not stats['latest'] or ended > stats['latest']:
+                stats['latest'] = ended
+
+    return stats
+
+
+def cmd_health_digest(args):
+    """
+    Generate a comprehensive health digest from all recent jobs.
+
+    Aggregates come from the local job warehouse (celigo_warehouse.py), synced
+    incrementally first; --no-warehouse sweeps /jobs live instead.
+    """
+    from datetime import timezone
+
+    # Loaded here, not at import: celigo_warehouse pulls in sqlite3 and concurrent.futures
+    from celigo_warehouse import JobWarehouse
+
+    client = CeligoClient(args.env)
+    now = datetime.now(timezone.utc)
+    days = args.days if hasattr(args, 'days') and args.days else 7
+
+    cutoff_dt = now - timedelta(days=days)
+    if getattr(args, 'no_warehouse', False):
+        stats = _live_health_stats(client, days, now)
+    else:
+        with JobWarehouse.for_api_key(client.api_key) as wh:
+            _sync_job_warehouse(client, wh, cutoff_dt - timedelta(days=1),
+                                refresh=getattr(args, 'refresh', False))
+            stats = wh.health_stats(cutoff_dt, now)
+
+    # Compute rates
+    total = stats['totalErrors'] + stats['totalSuccesses']
+    error_rate = f"{(stats['totalErrors'] / total * 100):.1f}%" if total > 0 else "0.0%"
+    resolution_rate = f"{(stats['totalResolved'] / stats['totalErrors'] * 100):.1f}%" if stats['totalErrors'] > 0 else "100.0%"
+
+    summary = {
+        'totalFlowRuns': stats['totalFlowRuns'],
+        'totalErrors': stats['totalErrors'],
+        'totalSuccesses': stats['totalSuccesses'],
+        'totalOpenErrors': stats['totalOpenErrors'],
+        'totalResolved': stats['totalResolved'],
+        'errorRate': error_rate,
+        'resolutionRate': resolution_rate,
+        'errorsByFlow': stats['errorsByFlow'],
+        'openErrorsByFlow': stats['openErrorsByFlow'],
+        'agingBuckets': stats['agingBuckets'],
+        'timeRange': f"{stats['earliest'] or 'N/A'} to {stats['latest'] or 'N/A'}",
+        'daysCovered': days,
+        'generatedAt': now.isoformat(),
+    }
+
+    if args.format == "json":
+        print(json.dumps(summary, indent=2))
+    else:
+        # Human-readable table output
+        print(f"Health Digest ({days}-day window)")
+        print(f"{'='*50}")
+        print(f"Time Range:       {summary['timeRange']}")
+        print(f"Total Flow Runs:  {summary['totalFlowRuns']}")
+        print(f"Total Errors:     {summary['totalErrors']}")
+        print(f"Total Successes:  {summary['totalSuccesses']}")
+        print(f"Error Rate:       {summary['errorRate']}")
+        print(f"Open Errors:      {summary['totalOpenErrors']}")
+        print(f"Resolved:         {summary['totalResolved']}")
+        print(f"Resolution Rate:  {summary['resolutionRate']}")
+        print()
+        print("Aging Buckets:")
+        for bucket, count in summary['agingBuckets'].items():
+            label = bucket.replace('under', '<').replace('days', '').replace('to', '-').replace('over', '>')
+            print(f"  {label:>10}: {count}")
+        print()
+        if summary['openErrorsByFlow']:
+            print("Open Errors by Flow:")
+            for fid, info in summary['openErrorsByFlow'].items():
+                print(f"  {fid}: {info['open']} open (oldest: {info.get('oldest', 'N/A')})")
+        else:
+            print("No open errors.")
+
+    # Trigger the Celigo flow (export now fetches full data, no delta tracking)
+    if hasattr(args, 'run') and args.run:
+        flow_id = getattr(args, 'flow_id', None) or "698b4a31ae386aee54914746"
+        from celigo_commands.flows import FlowsAPI
+        flows_api = FlowsAPI(client)
+        print("Triggering Celigo flow...", file=sys.stderr)
+        run_result = flows_api.run(flow_id)
+        if isinstance(run_result, list) and run_result:
+            job_id = run_result[0].get("_jobId")
+        elif isinstance(run_result, dict):
+            job_id = run_result.get("_jobId")
+        else:
+            job_id = None
+        print(f"Flow triggered. Job: {job_id}", file=sys.stderr)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `health-digest` actions to its resource parser."""
+    hd_sub = parser.add_subparsers(dest="action")
+
+    hd_gen = hd_sub.add_parser("generate", help="Generate full health digest (bypasses delta tracking)")
+    hd_gen.add_argument("--days", type=int, default=7, help="Number of days to analyze (default: 7)")
+    hd_gen.add_argument("--run", action="store_true",
+                         help="Trigger the Celigo AI Agent flow after generating summary")
+    hd_gen.add_argument("--flow-id", help="Flow ID (default: AI Test flow)")
+    hd_gen.add_argument("--refresh", action="store_true",
+                         help="Re-list every job in the window instead of syncing incrementally")
+    hd_gen.add_argument("--no-warehouse", action="store_true",
+                         help="Sweep /jobs live instead of querying the local job warehouse")
@@ -0,0 +1,125 @@
+"""`celigo_api.py iclients` - iClient (OAuth2 app) operations."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    ICLIENT_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class IClientsAPI:
+    """iClients (OAuth2 app) resource operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        """List all iClients."""
+        return self.client.get("/iclients")
+
+    def get(self, iclient_id: str) -> dict:
+        """Get an iClient."""
+        return self.client.get(f"/iclients/{iclient_id}")
+
+    def create(self, data: dict) -> dict:
+        """Create an iClient."""
+        return self.client.post("/iclients", data)
+
+    def update(self, iclient_id: str, data: dict) -> dict:
+        """Update an iClient (full-replace PUT)."""
+        return self.client.put(f"/iclients/{iclient_id}", data)
+
+    def patch(self, iclient_id: str, data: list) -> dict:
+        """Partial update iClient (JSON Patch RFC 6902)."""
+        return self.client.patch(f"/iclients/{iclient_id}", data)
+
+    def delete(self, iclient_id: str) -> dict:
+        """Delete an iClient."""
+        return self.client.delete(f"/iclients/{iclient_id}")
+
+    def dependencies(self, iclient_id: str) -> dict:
+        """Get iClient dependencies."""
+        return self.client.get(f"/iclients/{iclient_id}/dependencies")
+
+
+def cmd_iclients(args):
+    """Handle iClients subcommands."""
+    client = CeligoClient(args.env)
+    api = IClientsAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "name", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        print_result(api.create(data), args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, ICLIENT_READONLY_FIELDS)
+        print_result(api.update(args.id, merged), args.format)
+
+    elif args.action == "patch":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No patch data provided.", file=sys.stderr)
+            sys.exit(1)
+        patch_ops = data if isinstance(data, list) else [data]
+        print_result(api.patch(args.id, patch_ops), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+    elif args.action == "dependencies":
+        print_result(api.dependencies(args.id), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `iclients` actions to its resource parser."""
+    ic_sub = parser.add_subparsers(dest="action")
+
+    ic_sub.add_parser("list", help="List iClients")
+
+    ic_get = ic_sub.add_parser("get", help="Get iClient")
+    ic_get.add_argument("id", help="iClient ID")
+
+    ic_create = ic_sub.add_parser("create", help="Create iClient")
+    ic_create.add_argument("--data", help="Full JSON (inline)")
+    ic_create.add_argument("--file", help="Path to JSON file")
+
+    ic_update = ic_sub.add_parser("update", help="Update iClient")
+    ic_update.add_argument("id", help="iClient ID")
+    ic_update.add_argument("--data", help="Partial JSON (inline)")
+    ic_update.add_argument("--file", help="Path to JSON file")
+
+    ic_patch = ic_sub.add_parser("patch", help="Partial update (JSON Patch)")
+    ic_patch.add_argument("id", help="iClient ID")
+    ic_patch.add_argument("--data", help="JSON Patch array")
+    ic_patch.add_argument("--file", help="Path to JSON Patch file")
+
+    ic_delete = ic_sub.add_parser("delete", help="Delete iClient")
+    ic_delete.add_argument("id", help="iClient ID")
+
+    ic_deps = ic_sub.add_parser("dependencies", help="Get iClient dependencies")
+    ic_deps.add_argument("id", help="iClient ID")
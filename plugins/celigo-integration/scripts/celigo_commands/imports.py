@@ -0,0 +1,178 @@
+"""`celigo_api.py imports` - import operations."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    IMPORT_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class ImportsAPI:
+    """Imports resource operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self, page: int = 1, page_size: int = 100) -> list:
+        """List all imports."""
+        params = {"page": page, "pageSize": page_size}
+        return self.client.get("/imports", params)
+
+    def get(self, import_id: str) -> dict:
+        """Get single import."""
+        return self.client.get(f"/imports/{import_id}")
+
+    def audit(self, import_id: str) -> list:
+        """Get import audit log."""
+        return self.client.get(f"/imports/{import_id}/audit")
+
+    def dependencies(self, import_id: str) -> dict:
+        """Get import dependencies."""
+        return self.client.get(f"/imports/{import_id}/dependencies")
+
+    def create(self, data: dict) -> dict:
+        """Create a new import."""
+        return self.client.post("/imports", data)
+
+    def update(self, import_id: str, data: dict) -> dict:
+        """Update an existing import."""
+        return self.client.put(f"/imports/{import_id}", data)
+
+    def delete(self, import_id: str) -> dict:
+        """Delete an import."""
+        return self.client.delete(f"/imports/{import_id}")
+
+    def clone(self, import_id: str) -> dict:
+        """Clone an import."""
+        return self.client.post(f"/imports/{import_id}/clone")
+
+    def invoke(self, import_id: str, data: dict = None) -> dict:
+        """Invoke an import (run standalone)."""
+        return self.client.post(f"/imports/{import_id}/invoke", data)
+
+    def patch(self, import_id: str, data: list) -> dict:
+        """Partial update import (JSON Patch RFC 6902)."""
+        return self.client.patch(f"/imports/{import_id}", data)
+
+    def replace_connection(self, import_id: str, data: dict) -> dict:
+        """Replace connection in an import."""
+        return self.client.put(f"/imports/{import_id}/replaceConnection", data)
+
+
+def cmd_imports(args):
+    """Handle imports subcommands."""
+    client = CeligoClient(args.env)
+    api = ImportsAPI(client)
+
+    if args.action == "list":
+        data = api.list(page=args.page, page_size=args.page_size)
+        columns = ["_id", "name", "adaptorType", "_connectionId"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "audit":
+        print_result(api.audit(args.id), args.format)
+
+    elif args.action == "dependencies":
+        print_result(api.dependencies(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        result = api.create(data)
+        print_result(result, args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided. Use --data or --file",
+                  file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, IMPORT_READONLY_FIELDS)
+        result = api.update(args.id, merged)
+        print_result(result, args.format)
+
+    elif args.action == "delete":
+        result = api.delete(args.id)
+        print_result(result, args.format)
+
+    elif args.action == "clone":
+        print_result(api.clone(args.id), args.format)
+
+    elif args.action == "invoke":
+        data = _resolve_json_input(args) if hasattr(args, 'data') else None
+        print_result(api.invoke(args.id, data), args.format)
+
+    elif args.action == "patch":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No patch data provided.", file=sys.stderr)
+            sys.exit(1)
+        patch_ops = data if isinstance(data, list) else [data]
+        print_result(api.patch(args.id, patch_ops), args.format)
+
+    elif args.action == "replace-connection":
+        data = _resolve_json_input(args)
+        print_result(api.replace_connection(args.id, data), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `imports` actions to its resource parser."""
+    imp_sub = parser.add_subparsers(dest="action")
+
+    imp_list = imp_sub.add_parser("list", help="List imports")
+    imp_list.add_argument("--page", type=int, default=1)
+    imp_list.add_argument("--page-size", type=int, default=100)
+
+    imp_get = imp_sub.add_parser("get", help="Get import")
+    imp_get.add_argument("id", help="Import ID")
+
+    imp_audit = imp_sub.add_parser("audit", help="Get audit log")
+    imp_audit.add_argument("id", help="Import ID")
+
+    imp_deps = imp_sub.add_parser("dependencies", help="Get dependencies")
+    imp_deps.add_argument("id", help="Import ID")
+
+    imp_create = imp_sub.add_parser("create", help="Create a new import")
+    imp_create.add_argument("--data", help="Full import JSON (inline string)")
+    imp_create.add_argument("--file", help="Path to JSON file with import definition")
+
+    imp_update = imp_sub.add_parser("update", help="Update an import (fetch-merge-PUT)")
+    imp_update.add_argument("id", help="Import ID")
+    imp_update.add_argument("--data", help="Partial import JSON (inline string)")
+    imp_update.add_argument("--file", help="Path to JSON file with updates")
+
+    imp_delete = imp_sub.add_parser("delete", help="Delete an import")
+    imp_delete.add_argument("id", help="Import ID")
+
+    imp_clone = imp_sub.add_parser("clone", help="Clone an import")
+    imp_clone.add_argument("id", help="Import ID")
+
+    imp_invoke = imp_sub.add_parser("invoke", help="Invoke import (run standalone)")
+    imp_invoke.add_argument("id", help="Import ID")
+    imp_invoke.add_argument("--data", help="Invoke parameters JSON")
+    imp_invoke.add_argument("--file", help="Path to JSON file")
+
+    imp_patch = imp_sub.add_parser("patch", help="Partial update (JSON Patch)")
+    imp_patch.add_argument("id", help="Import ID")
+    imp_patch.add_argument("--data", help="JSON Patch array")
+    imp_patch.add_argument("--file", help="Path to JSON Patch file")
+
+    imp_replconn = imp_sub.add_parser("replace-connection", help="Replace connection")
+    imp_replconn.add_argument("id", help="Import ID")
+    imp_replconn.add_argument("--data", help="Connection replacement JSON")
+    imp_replconn.add_argument("--file", help="Path to JSON file")
@@ -0,0 +1,323 @@
+"""`celigo_api.py integrations` - integration operations."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    INTEGRATION_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class IntegrationsAPI:
+    """Integrations resource operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self, sandbox: bool = None) -> list:
+        """List all integrations."""
+        params = {}
+        if sandbox is not None:
+            params["sandbox"] = str(sandbox).lower()
+        return self.client.get("/integrations", params)
+
+    def get(self, integration_id: str) -> dict:
+        """Get single integration."""
+        return self.client.get(f"/integrations/{integration_id}")
+
+    def flows(self, integration_id: str) -> list:
+        """Get flows for integration."""
+        return self.client.get(f"/integrations/{integration_id}/flows")
+
+    def connections(self, integration_id: str) -> list:
+        """Get connections for integration."""
+        return self.client.get(f"/integrations/{integration_id}/connections")
+
+    def exports(self, integration_id: str) -> list:
+        """Get exports for integration."""
+        return self.client.get(f"/integrations/{integration_id}/exports")
+
+    def imports(self, integration_id: str) -> list:
+        """Get imports for integration."""
+        return self.client.get(f"/integrations/{integration_id}/imports")
+
+    def users(self, integration_id: str) -> list:
+        """Get users/shares for integration."""
+        return self.client.get(f"/integrations/{integration_id}/ashares")
+
+    def template(self, integration_id: str) -> dict:
+        """Get integration template download URL."""
+        return self.client.get(f"/integrations/{integration_id}/template")
+
+    def dependencies(self, integration_id: str) -> dict:
+        """Get integration dependencies."""
+        return self.client.get(f"/integrations/{integration_id}/dependencies")
+
+    def audit(self, integration_id: str, page: int = 1, page_size: int = 100) -> list:
+        """Get integration audit log."""
+        params = {"page": page, "pageSize": page_size}
+        return self.client.get(f"/integrations/{integration_id}/audit", params)
+
+    def errors(self, integration_id: str, occurred_gte: str = None,
+               occurred_lte: str = None, source: str = None) -> list:
+        """Get integration error summary."""
+        params = {}
+        if occurred_gte:
+            params["occurredAt_gte"] = occurred_gte
+        if occurred_lte:
+            params["occurredAt_lte"] = occurred_lte
+        if source:
+            params["source"] = source
+        return self.client.get_all(f"/integrations/{integration_id}/errors", params)
+
+    def create(self, data: dict) -> dict:
+        """Create a new integration."""
+        return self.client.post("/integrations", data)
+
+    def update(self, integration_id: str, data: dict) -> dict:
+        """Update an existing integration (full-replace PUT)."""
+        return self.client.put(f"/integrations/{integration_id}", data)
+
+    def delete(self, integration_id: str) -> dict:
+        """Delete an integration."""
+        return self.client.delete(f"/integrations/{integration_id}")
+
+    def register_connections(self, integration_id: str, data: dict) -> dict:
+        """Register connections to an integration."""
+        return self.client.put(f"/integrations/{integration_id}/connections/register", data)
+
+    def download_template(self, integration_id: str) -> dict:
+        """Download integration as installable template."""
+        return self.client.post(f"/integrations/{integration_id}/template")
+
+    def revisions_list(self, integration_id: str) -> list:
+        """List all ILM revisions for an integration."""
+        return self.client.get(f"/integrations/{integration_id}/revisions")
+
+    def revision_get(self, integration_id: str, revision_id: str) -> dict:
+        """Get a specific ILM revision."""
+        return self.client.get(f"/integrations/{integration_id}/revisions/{revision_id}")
+
+    def revision_diff(self, integration_id: str, revision_id: str) -> dict:
+        """Get diff envelope (before/after) for a revision."""
+        return self.client.get(f"/integrations/{integration_id}/revisions/{revision_id}/diff")
+
+    def revision_snapshot(self, integration_id: str, description: str = None) -> dict:
+        """Create a snapshot revision of the current integration state."""
+        data = {"type": "snapshot"}
+        if description:
+            data["description"] = description
+        return self.client.post(f"/integrations/{integration_id}/revisions", data)
+
+    def revision_pull(self, integration_id: str, description: str = None) -> dict:
+        """Pull remote changes into the integration (creates a pull revision)."""
+        data = {"type": "pull"}
+        if description:
+            data["description"] = description
+        return self.client.post(f"/integrations/{integration_id}/revisions", data)
+
+    def revision_apply(self, integration_id: str, revision_id: str) -> dict:
+        """Apply (revert to) a specific revision."""
+        return self.client.put(f"/integrations/{integration_id}/revisions/{revision_id}", data={})
+
+
+def cmd_integrations(args):
+    """Handle integrations subcommands."""
+    client = CeligoClient(args.env)
+    api = IntegrationsAPI(client)
+
+    if args.action == "list":
+        data = api.list(sandbox=args.sandbox if hasattr(args, 'sandbox') else None)
+        columns = ["_id", "name", "sandbox", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "flows":
+        data = api.flows(args.id)
+        columns = ["_id", "name", "disabled", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "connections":
+        data = api.connections(args.id)
+        columns = ["_id", "name", "type", "offline"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "exports":
+        data = api.exports(args.id)
+        columns = ["_id", "name", "adaptorType", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "imports":
+        data = api.imports(args.id)
+        columns = ["_id", "name", "adaptorType", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "users":
+        data = api.users(args.id)
+        print_result(data, args.format)
+
+    elif args.action == "template":
+        print_result(api.template(args.id), args.format)
+
+    elif args.action == "dependencies":
+        print_result(api.dependencies(args.id), args.format)
+
+    elif args.action == "audit":
+        data = api.audit(args.id, page=args.page, page_size=args.page_size)
+        print_result(data, args.format)
+
+    elif args.action == "errors":
+        data = api.errors(args.id, occurred_gte=args.since, occurred_lte=args.until,
+                          source=args.source)
+        columns = ["_flowId", "numError"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        if not data.get("name"):
+            print("Error: Integration name is required.", file=sys.stderr)
+            sys.exit(1)
+        print_result(api.create(data), args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, INTEGRATION_READONLY_FIELDS)
+        print_result(api.update(args.id, merged), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+    elif args.action == "register-connections":
+        data = _resolve_json_input(args)
+        print_result(api.register_connections(args.id, data), args.format)
+
+    elif args.action == "download-template":
+        print_result(api.download_template(args.id), args.format)
+
+    elif args.action == "revisions-list":
+        data = api.revisions_list(args.id)
+        columns = ["_id", "type", "description", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "revision-get":
+        print_result(api.revision_get(args.id, args.rev_id), args.format)
+
+    elif args.action == "revision-diff":
+        print_result(api.revision_diff(args.id, args.rev_id), args.format)
+
+    elif args.action == "revision-snapshot":
+        print_result(api.revision_snapshot(args.id, description=getattr(args, 'description', None)), args.format)
+
+    elif args.action == "revision-pull":
+        print_result(api.revision_pull(args.id, description=getattr(args, 'description', None)), args.format)
+
+    elif args.action == "revision-apply":
+        print_result(api.revision_apply(args.id, args.rev_id), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `integrations` actions to its resource parser."""
+    int_sub = parser.add_subparsers(dest="action")
+
+    int_list = int_sub.add_parser("list", help="List integrations")
+    int_list.add_argument("--sandbox", type=lambda x: x.lower() == 'true',
+                          help="Filter by sandbox status")
+
+    int_get = int_sub.add_parser("get", help="Get integration")
+    int_get.add_argument("id", help="Integration ID")
+
+    int_flows = int_sub.add_parser("flows", help="Get integration flows")
+    int_flows.add_argument("id", help="Integration ID")
+
+    int_conns = int_sub.add_parser("connections", help="Get integration connections")
+    int_conns.add_argument("id", help="Integration ID")
+
+    int_exports = int_sub.add_parser("exports", help="Get integration exports")
+    int_exports.add_argument("id", help="Integration ID")
+
+    int_imports = int_sub.add_parser("imports", help="Get integration imports")
+    int_imports.add_argument("id", help="Integration ID")
+
+    int_users = int_sub.add_parser("users", help="Get integration users")
+    int_users.add_argument("id", help="Integration ID")
+
+    int_template = int_sub.add_parser("template", help="Get integration template URL")
+    int_template.add_argument("id", help="Integration ID")
+
+    int_deps = int_sub.add_parser("dependencies", help="Get integration dependencies")
+    int_deps.add_argument("id", help="Integration ID")
+
+    int_audit = int_sub.add_parser("audit", help="Get integration audit log")
+    int_audit.add_argument("id", help="Integration ID")
+    int_audit.add_argument("--page", type=int, default=1)
+    int_audit.add_argument("--page-size", type=int, default=100)
+
+    int_errors = int_sub.add_parser("errors", help="Get integration error summary")
+    int_errors.add_argument("id", help="Integration ID")
+    int_errors.add_argument("--since", help="Occurred after (ISO 8601)")
+    int_errors.add_argument("--until", help="Occurred before (ISO 8601)")
+    int_errors.add_argument("--source", help="Error source filter")
+
+    int_create = int_sub.add_parser("create", help="Create an integration")
+    int_create.add_argument("--name", help="Integration name")
+    int_create.add_argument("--description", help="Description")
+    int_create.add_argument("--data", help="Full JSON (inline)")
+    int_create.add_argument("--file", help="Path to JSON file")
+
+    int_update = int_sub.add_parser("update", help="Update an integration")
+    int_update.add_argument("id", help="Integration ID")
+    int_update.add_argument("--name", help="New name")
+    int_update.add_argument("--description", help="New description")
+    int_update.add_argument("--data", help="Partial JSON (inline)")
+    int_update.add_argument("--file", help="Path to JSON file")
+
+    int_delete = int_sub.add_parser("delete", help="Delete an integration")
+    int_delete.add_argument("id", help="Integration ID")
+
+    int_regconn = int_sub.add_parser("register-connections", help="Register connections")
+    int_regconn.add_argument("id", help="Integration ID")
+    int_regconn.add_argument("--data", help="Connection registration JSON")
+    int_regconn.add_argument("--file", help="Path to JSON file")
+
+    int_dltpl = int_sub.add_parser("download-template", help="Download as installable template")
+    int_dltpl.add_argument("id", help="Integration ID")
+
+    int_revlist = int_sub.add_parser("revisions-list", help="List ILM revisions for an integration")
+    int_revlist.add_argument("id", help="Integration ID")
+
+    int_revget = int_sub.add_parser("revision-get", help="Get a specific ILM revision")
+    int_revget.add_argument("id", help="Integration ID")
+    int_revget.add_argument("rev_id", help="Revision ID")
+
+    int_revdiff = int_sub.add_parser("revision-diff", help="Get diff (before/after) for a revision")
+    int_revdiff.add_argument("id", help="Integration ID")
+    int_revdiff.add_argument("rev_id", help="Revision ID")
+
+    int_revsnap = int_sub.add_parser("revision-snapshot", help="Create a snapshot of current state")
+    int_revsnap.add_argument("id", help="Integration ID")
+    int_revsnap.add_argument("--description", help="Optional snapshot description")
+
+    int_revpull = int_sub.add_parser("revision-pull", help="Pull remote changes (create pull revision)")
+    int_revpull.add_argument("id", help="Integration ID")
+    int_revpull.add_argument("--description", help="Optional pull description")
+
+    int_revapply = int_sub.add_parser("revision-apply", help="Apply (revert to) a specific revision")
+    int_revapply.add_argument("id", help="Integration ID")
+    int_revapply.add_argument("rev_id", help="Revision ID to apply")
@@ -0,0 +1,106 @@
+"""`celigo_api.py jobs` - job operations."""
+
+import argparse
+
+from celigo_core import CeligoClient, print_result
+
+
+class JobsAPI:
+    """Jobs resource operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self, integration_id: str = None, flow_id: str = None,
+             export_id: str = None, flow_job_id: str = None,
+             status: str = None, job_type: str = None,
+             created_gte: str = None, created_lte: str = None,
+             flow_id_in: str = None) -> list:
+        """List jobs with filtering."""
+        params = {}
+        if integration_id:
+            params["integration_id"] = integration_id
+        if flow_id:
+            params["flow_id"] = flow_id
+        if export_id:
+            params["export_id"] = export_id
+        if flow_job_id:
+            params["flow_job_id"] = flow_job_id
+        if status:
+            params["status"] = status
+        if job_type:
+            params["type"] = job_type
+        if created_gte:
+            params["createdAt_gte"] = created_gte
+        if created_lte:
+            params["createdAt_lte"] = created_lte
+        if flow_id_in:
+            params["flow_id_in"] = flow_id_in
+        return self.client.get_all("/jobs", params)
+
+    def get(self, job_id: str) -> dict:
+        """Get single job."""
+        return self.client.get(f"/jobs/{job_id}")
+
+    def cancel(self, job_id: str) -> dict:
+        """Cancel a running flow job."""
+        # First verify it's a flow job
+        job = self.get(job_id)
+        if job.get("error"):
+            return job
+        if job.get("type") != "flow":
+            return {"error": True, "message": "Only flow jobs can be canceled"}
+        return self.client.delete(f"/jobs/{job_id}")
+
+
+def cmd_jobs(args):
+    """Handle jobs subcommands."""
+    client = CeligoClient(args.env)
+    api = JobsAPI(client)
+
+    if args.action == "list":
+        data = api.list(
+            integration_id=args.integration,
+            flow_id=args.flow,
+            export_id=args.export,
+            flow_job_id=args.flow_job,
+            status=args.status,
+            job_type=args.type,
+            created_gte=args.since,
+            created_lte=args.until,
+            flow_id_in=args.flow_ids
+        )
+        columns = ["_id", "type", "status", "numSuccess", "numError", "createdAt"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "cancel":
+        print_result(api.cancel(args.id), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `jobs` actions to its resource parser."""
+    job_sub = parser.add_subparsers(dest="action")
+
+    job_list = job_sub.add_parser("list", help="List jobs")
+    job_list.add_argument("--integration", help="Filter by integration ID")
+    job_list.add_argument("--flow", help="Filter by flow ID")
+    job_list.add_argument("--export", help="Filter by export ID")
+    job_list.add_argument("--flow-job", help="Filter by parent flow job ID")
+    job_list.add_argument("--status", choices=["queued", "running", "completed", "failed", "canceled"])
+    job_list.add_argument("--type", choices=["flow", "export", "import"])
+    job_list.add_argument("--since", help="Created after (ISO 8601)")
+    job_list.add_argument("--until", help="Created before (ISO 8601)")
+    job_list.add_argument("--flow-ids", help="Comma-separated flow IDs")
+
+    job_get = job_sub.add_parser("get", help="Get job")
+    job_get.add_argument("id", help="Job ID")
+
+    job_cancel = job_sub.add_parser("cancel", help="Cancel running job")
+    job_cancel.add_argument("id", help="Job ID (must be flow type)")
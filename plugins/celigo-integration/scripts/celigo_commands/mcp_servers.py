@@ -0,0 +1,120 @@
+"""`celigo_api.py mcp-servers` - celigo MCP Servers (expose Tools/APIs to AI agents)."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    MCPSERVER_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class McpServersAPI:
+    """Celigo MCP Servers — expose Tools and builder APIs to AI agents."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        return self.client.get("/mcpServers")
+
+    def get(self, server_id: str) -> dict:
+        return self.client.get(f"/mcpServers/{server_id}")
+
+    def create(self, data: dict) -> dict:
+        return self.client.post("/mcpServers", data)
+
+    def update(self, server_id: str, data: dict) -> dict:
+        return self.client.put(f"/mcpServers/{server_id}", data)
+
+    def delete(self, server_id: str) -> dict:
+        return self.client.delete(f"/mcpServers/{server_id}")
+
+    def start(self, server_id: str) -> dict:
+        return self.client.post(f"/mcpServers/{server_id}/start")
+
+    def stop(self, server_id: str) -> dict:
+        return self.client.post(f"/mcpServers/{server_id}/stop")
+
+    def status(self, server_id: str) -> dict:
+        return self.client.get(f"/mcpServers/{server_id}/status")
+
+
+def cmd_mcp_servers(args):
+    """Handle MCP Servers subcommands."""
+    client = CeligoClient(args.env)
+    api = McpServersAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "name", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        print_result(api.create(data), args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, MCPSERVER_READONLY_FIELDS)
+        print_result(api.update(args.id, merged), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+    elif args.action == "start":
+        print_result(api.start(args.id), args.format)
+
+    elif args.action == "stop":
+        print_result(api.stop(args.id), args.format)
+
+    elif args.action == "status":
+        print_result(api.status(args.id), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `mcp-servers` actions to its resource parser."""
+    mcp_sub = parser.add_subparsers(dest="action")
+
+    mcp_sub.add_parser("list", help="List MCP servers")
+
+    mcp_get = mcp_sub.add_parser("get", help="Get MCP server")
+    mcp_get.add_argument("id", help="Server ID")
+
+    mcp_create = mcp_sub.add_parser("create", help="Create MCP server")
+    mcp_create.add_argument("--data", help="Full JSON (inline)")
+    mcp_create.add_argument("--file", help="Path to JSON file")
+
+    mcp_update = mcp_sub.add_parser("update", help="Update MCP server (fetch-merge-PUT)")
+    mcp_update.add_argument("id", help="Server ID")
+    mcp_update.add_argument("--data", help="Partial JSON (inline)")
+    mcp_update.add_argument("--file", help="Path to JSON file")
+
+    mcp_delete = mcp_sub.add_parser("delete", help="Delete MCP server")
+    mcp_delete.add_argument("id", help="Server ID")
+
+    mcp_start = mcp_sub.add_parser("start", help="Start MCP server")
+    mcp_start.add_argument("id", help="Server ID")
+
+    mcp_stop = mcp_sub.add_parser("stop", help="Stop MCP server")
+    mcp_stop.add_argument("id", help="Server ID")
+
+    mcp_status = mcp_sub.add_parser("status", help="Get MCP server status")
+    mcp_status.add_argument("id", help="Server ID")
@@ -0,0 +1,97 @@
+"""`celigo_api.py notifications` - email notification subscription management."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    NOTIFICATION_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class NotificationsAPI:
+    """Per-resource, per-event email subscription management."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        return self.client.get("/notifications")
+
+    def get(self, notification_id: str) -> dict:
+        return self.client.get(f"/notifications/{notification_id}")
+
+    def create(self, data: dict) -> dict:
+        return self.client.post("/notifications", data)
+
+    def update(self, notification_id: str, data: dict) -> dict:
+        return self.client.put(f"/notifications/{notification_id}", data)
+
+    def delete(self, notification_id: str) -> dict:
+        return self.client.delete(f"/notifications/{notification_id}")
+
+
+def cmd_notifications(args):
+    """Handle Notifications subcommands."""
+    client = CeligoClient(args.env)
+    api = NotificationsAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "_resourceId", "_resourceType", "event", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        for required in ("_resourceId", "_resourceType", "event"):
+            if not data.get(required):
+                print(f"Error: '{required}' required in notification payload.", file=sys.stderr)
+                sys.exit(1)
+        print_result(api.create(data), args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, NOTIFICATION_READONLY_FIELDS)
+        print_result(api.update(args.id, merged), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `notifications` actions to its resource parser."""
+    notif_sub = parser.add_subparsers(dest="action")
+
+    notif_sub.add_parser("list", help="List notifications")
+
+    notif_get = notif_sub.add_parser("get", help="Get notification")
+    notif_get.add_argument("id", help="Notification ID")
+
+    notif_create = notif_sub.add_parser("create", help="Create notification (requires _resourceId, _resourceType, event)")
+    notif_create.add_argument("--data", help="Full JSON (inline)")
+    notif_create.add_argument("--file", help="Path to JSON file")
+
+    notif_update = notif_sub.add_parser("update", help="Update notification (fetch-merge-PUT)")
+    notif_update.add_argument("id", help="Notification ID")
+    notif_update.add_argument("--data", help="Partial JSON (inline)")
+    notif_update.add_argument("--file", help="Path to JSON file")
+
+    notif_delete = notif_sub.add_parser("delete", help="Delete notification")
+    notif_delete.add_argument("id", help="Notification ID")
@@ -0,0 +1,131 @@
+"""`celigo_api.py opa` - on-Premise Agent management."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    OPA_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class OpaAPI:
+    """On-Premise Agent management."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        return self.client.get("/agents")
+
+    def get(self, agent_id: str) -> dict:
+        return self.client.get(f"/agents/{agent_id}")
+
+    def create(self, data: dict) -> dict:
+        return self.client.post("/agents", data)
+
+    def update(self, agent_id: str, data: dict) -> dict:
+        return self.client.put(f"/agents/{agent_id}", data)
+
+    def delete(self, agent_id: str) -> dict:
+        return self.client.delete(f"/agents/{agent_id}")
+
+    def status(self, agent_id: str) -> dict:
+        return self.client.get(f"/agents/{agent_id}/status")
+
+    def restart(self, agent_id: str) -> dict:
+        return self.client.post(f"/agents/{agent_id}/restart")
+
+    def display_token(self, agent_id: str) -> dict:
+        """Display the current authentication token for an OPA."""
+        return self.client.get(f"/agents/{agent_id}/display-token")
+
+    def change_token(self, agent_id: str) -> dict:
+        """Rotate (regenerate) the authentication token for an OPA."""
+        return self.client.put(f"/agents/{agent_id}/change-token", data={})
+
+
+def cmd_opa(args):
+    """Handle OPA (On-Premise Agent) subcommands."""
+    client = CeligoClient(args.env)
+    api = OpaAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "name", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        print_result(api.create(data), args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, OPA_READONLY_FIELDS)
+        print_result(api.update(args.id, merged), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+    elif args.action == "status":
+        print_result(api.status(args.id), args.format)
+
+    elif args.action == "restart":
+        print_result(api.restart(args.id), args.format)
+
+    elif args.action == "display-token":
+        print_result(api.display_token(args.id), args.format)
+
+    elif args.action == "change-token":
+        print_result(api.change_token(args.id), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `opa` actions to its resource parser."""
+    opa_sub = parser.add_subparsers(dest="action")
+
+    opa_sub.add_parser("list", help="List OPAs")
+
+    opa_get = opa_sub.add_parser("get", help="Get OPA")
+    opa_get.add_argument("id", help="Agent ID")
+
+    opa_create = opa_sub.add_parser("create", help="Create OPA")
+    opa_create.add_argument("--data", help="Full JSON (inline)")
+    opa_create.add_argument("--file", help="Path to JSON file")
+
+    opa_update = opa_sub.add_parser("update", help="Update OPA (fetch-merge-PUT)")
+    opa_update.add_argument("id", help="Agent ID")
+    opa_update.add_argument("--data", help="Partial JSON (inline)")
+    opa_update.add_argument("--file", help="Path to JSON file")
+
+    opa_delete = opa_sub.add_parser("delete", help="Delete OPA")
+    opa_delete.add_argument("id", help="Agent ID")
+
+    opa_status = opa_sub.add_parser("status", help="Get OPA connection status")
+    opa_status.add_argument("id", help="Agent ID")
+
+    opa_restart = opa_sub.add_parser("restart", help="Restart OPA connection")
+    opa_restart.add_argument("id", help="Agent ID")
+
+    opa_disptoken = opa_sub.add_parser("display-token", help="Display current OPA auth token (outputs live bearer token)")
+    opa_disptoken.add_argument("id", help="Agent ID")
+
+    opa_chgtoken = opa_sub.add_parser("change-token", help="Rotate (regenerate) OPA auth token")
+    opa_chgtoken.add_argument("id", help="Agent ID")
@@ -0,0 +1,70 @@
+"""`celigo_api.py parsers` - stateless EDI parse/generate using file definitions."""
+
+import argparse
+import sys
+
+from celigo_core import CeligoClient, print_result, _resolve_json_input
+
+
+class ParsersGeneratorsAPI:
+    """Stateless EDI document parse/generate endpoints using file definitions."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def parse(self, data: dict) -> dict:
+        """Parse raw EDI/CSV/structured data using a file definition.
+
+        data must include _fileDefinitionId and the raw content to parse.
+        """
+        return self.client.post("/parsers", data)
+
+    def generate(self, data: dict) -> dict:
+        """Generate EDI output from structured data using a file definition.
+
+        data must include _fileDefinitionId and structured input records.
+        """
+        return self.client.post("/generators", data)
+
+
+def cmd_parsers(args):
+    """Handle stateless EDI parse/generate subcommands."""
+    client = CeligoClient(args.env)
+    api = ParsersGeneratorsAPI(client)
+
+    if args.action == "parse":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No input provided. Use --data or --file with {\"_fileDefinitionId\": ..., ...}",
+                  file=sys.stderr)
+            sys.exit(1)
+        print_result(api.parse(data), args.format)
+
+    elif args.action == "generate":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No input provided. Use --data or --file with {\"_fileDefinitionId\": ..., ...}",
+                  file=sys.stderr)
+            sys.exit(1)
+        print_result(api.generate(data), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `parsers` actions to its resource parser."""
+    pg_sub = parser.add_subparsers(dest="action")
+
+    pg_parse = pg_sub.add_parser("parse",
+                                 help="Parse raw EDI/CSV/structured data using a file definition")
+    pg_parse.add_argument("--data",
+                          help='JSON with _fileDefinitionId and raw content, e.g. {"_fileDefinitionId":"...","data":"..."}')
+    pg_parse.add_argument("--file", help="Path to JSON file")
+
+    pg_gen = pg_sub.add_parser("generate",
+                               help="Generate EDI output from structured data using a file definition")
+    pg_gen.add_argument("--data",
+                        help='JSON with _fileDefinitionId and structured records')
+    pg_gen.add_argument("--file", help="Path to JSON file")
@@ -0,0 +1,84 @@
+"""`celigo_api.py processors` - data processor operations."""
+
+import argparse
+import sys
+
+from celigo_core import CeligoClient, print_result, _resolve_json_input
+
+
+class ProcessorsAPI:
+    """Data processors for parsing and generating structured files."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def parse_xml(self, data: dict) -> dict:
+        """Parse XML data."""
+        return self.client.post("/processors/xmlParser", data)
+
+    def parse_csv(self, data: dict) -> dict:
+        """Parse CSV data."""
+        return self.client.post("/processors/csvParser", data)
+
+    def generate_csv(self, data: dict) -> dict:
+        """Generate CSV data."""
+        return self.client.post("/processors/csvDataGenerator", data)
+
+    def generate_structured(self, data: dict) -> dict:
+        """Generate structured file data."""
+        return self.client.post("/processors/structuredFileGenerator", data)
+
+    def parse_structured(self, data: dict) -> dict:
+        """Parse structured file data."""
+        return self.client.post("/processors/structuredFileParser", data)
+
+
+def cmd_processors(args):
+    """Handle processor subcommands."""
+    client = CeligoClient(args.env)
+    api = ProcessorsAPI(client)
+
+    data = _resolve_json_input(args)
+    if not data:
+        print("Error: No data provided. Use --data or --file", file=sys.stderr)
+        sys.exit(1)
+
+    if args.action == "parse-xml":
+        print_result(api.parse_xml(data), args.format)
+    elif args.action == "parse-csv":
+        print_result(api.parse_csv(data), args.format)
+    elif args.action == "generate-csv":
+        print_result(api.generate_csv(data), args.format)
+    elif args.action == "generate-structured":
+        print_result(api.generate_structured(data), args.format)
+    elif args.action == "parse-structured":
+        print_result(api.parse_structured(data), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `processors` actions to its resource parser."""
+    proc_sub = parser.add_subparsers(dest="action")
+
+    proc_px = proc_sub.add_parser("parse-xml", help="Parse XML data")
+    proc_px.add_argument("--data", help="XML parser config JSON")
+    proc_px.add_argument("--file", help="Path to JSON file")
+
+    proc_pc = proc_sub.add_parser("parse-csv", help="Parse CSV data")
+    proc_pc.add_argument("--data", help="CSV parser config JSON")
+    proc_pc.add_argument("--file", help="Path to JSON file")
+
+    proc_gc = proc_sub.add_parser("generate-csv", help="Generate CSV data")
+    proc_gc.add_argument("--data", help="CSV generator config JSON")
+    proc_gc.add_argument("--file", help="Path to JSON file")
+
+    proc_gs = proc_sub.add_parser("generate-structured", help="Generate structured file")
+    proc_gs.add_argument("--data", help="Structured file config JSON")
+    proc_gs.add_argument("--file", help="Path to JSON file")
+
+    proc_ps = proc_sub.add_parser("parse-structured", help="Parse structured file")
+    proc_ps.add_argument("--data", help="Structured file config JSON")
+    proc_ps.add_argument("--file", help="Path to JSON file")
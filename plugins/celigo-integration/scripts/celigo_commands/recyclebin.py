@@ -0,0 +1,75 @@
+"""`celigo_api.py recyclebin` - recycle bin operations."""
+
+import argparse
+
+from celigo_core import CeligoClient, print_result
+
+
+class RecycleBinAPI:
+    """Recycle bin operations (recycleBinTTL endpoints)."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self, resource_type: str = None) -> list:
+        """List recycled resources, optionally filtered by type."""
+        if resource_type:
+            return self.client.get(f"/recycleBinTTL/{resource_type}")
+        return self.client.get("/recycleBinTTL")
+
+    def get(self, resource_type: str, resource_id: str) -> dict:
+        """Get a specific recycled resource."""
+        return self.client.get(f"/recycleBinTTL/{resource_type}/{resource_id}")
+
+    def restore(self, resource_type: str, resource_id: str) -> dict:
+        """Restore a recycled resource."""
+        return self.client.post(f"/recycleBinTTL/{resource_type}/{resource_id}")
+
+    def delete(self, resource_type: str, resource_id: str) -> dict:
+        """Permanently delete a recycled resource."""
+        return self.client.delete(f"/recycleBinTTL/{resource_type}/{resource_id}")
+
+
+def cmd_recyclebin(args):
+    """Handle recycle bin subcommands."""
+    client = CeligoClient(args.env)
+    api = RecycleBinAPI(client)
+
+    if args.action == "list":
+        resource_type = getattr(args, 'resource_type', None)
+        data = api.list(resource_type)
+        columns = ["_id", "name", "type", "deletedAt"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.resource_type, args.id), args.format)
+
+    elif args.action == "restore":
+        print_result(api.restore(args.resource_type, args.id), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.resource_type, args.id), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `recyclebin` actions to its resource parser."""
+    rb_sub = parser.add_subparsers(dest="action")
+
+    rb_list = rb_sub.add_parser("list", help="List recycled resources")
+    rb_list.add_argument("--resource-type", help="Filter by type (flows/exports/imports/connections/scripts)")
+
+    rb_get = rb_sub.add_parser("get", help="Get recycled resource")
+    rb_get.add_argument("resource_type", help="Resource type")
+    rb_get.add_argument("id", help="Resource ID")
+
+    rb_restore = rb_sub.add_parser("restore", help="Restore recycled resource")
+    rb_restore.add_argument("resource_type", help="Resource type")
+    rb_restore.add_argument("id", help="Resource ID")
+
+    rb_delete = rb_sub.add_parser("delete", help="Permanently delete recycled resource")
+    rb_delete.add_argument("resource_type", help="Resource type")
+    rb_delete.add_argument("id", help="Resource ID")
@@ -0,0 +1,149 @@
+"""`celigo_api.py scripts` - script operations."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    SCRIPT_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+    _validate_code_file,
+)
+
+
+class ScriptsAPI:
+    """Scripts resource operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        """List all scripts."""
+        return self.client.get("/scripts")
+
+    def get(self, script_id: str) -> dict:
+        """Get single script."""
+        return self.client.get(f"/scripts/{script_id}")
+
+    def create(self, data: dict) -> dict:
+        """Create a new script."""
+        return self.client.post("/scripts", data)
+
+    def update(self, script_id: str, data: dict) -> dict:
+        """Update an existing script."""
+        return self.client.put(f"/scripts/{script_id}", data)
+
+    def delete(self, script_id: str) -> dict:
+        """Delete a script."""
+        return self.client.delete(f"/scripts/{script_id}")
+
+    def logs(self, script_id: str) -> list:
+        """Get script execution logs."""
+        return self.client.get(f"/scripts/{script_id}/logs")
+
+
+def cmd_scripts(args):
+    """Handle scripts subcommands."""
+    client = CeligoClient(args.env)
+    api = ScriptsAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "name", "function"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        # Support convenience flags for common fields
+        if not data:
+            data = {}
+        if getattr(args, "name", None):
+            data["name"] = args.name
+        if getattr(args, "function_type", None):
+            data["function"] = args.function_type
+        if getattr(args, "code_file", None):
+            try:
+                safe_path = _validate_code_file(args.code_file)
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
+            with open(safe_path, "r") as f:
+                data["content"] = f.read()
+        result = api.create(data)
+        print_result(result, args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            updates = {}
+        # Support convenience flags
+        if getattr(args, "name", None):
+            updates["name"] = args.name
+        if getattr(args, "code_file", None):
+            try:
+                safe_path = _validate_code_file(args.code_file)
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
+            with open(safe_path, "r") as f:
+                updates["content"] = f.read()
+        if not updates:
+            print("Error: No update data provided. Use --data, --file, --name, or --code-file",
+                  file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, SCRIPT_READONLY_FIELDS)
+        result = api.update(args.id, merged)
+        print_result(result, args.format)
+
+    elif args.action == "delete":
+        result = api.delete(args.id)
+        print_result(result, args.format)
+
+    elif args.action == "logs":
+        print_result(api.logs(args.id), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `scripts` actions to its resource parser."""
+    scr_sub = parser.add_subparsers(dest="action")
+
+    scr_list = scr_sub.add_parser("list", help="List scripts")
+
+    scr_get = scr_sub.add_parser("get", help="Get script")
+    scr_get.add_argument("id", help="Script ID")
+
+    scr_create = scr_sub.add_parser("create", help="Create a new script")
+    scr_create.add_argument("--name", help="Script name")
+    scr_create.add_argument("--function", dest="function_type",
+                            choices=["preSavePage", "preMap", "postMap",
+                                     "postSubmit", "postResponseMap", "postAggregate"],
+                            help="Hook function type")
+    scr_create.add_argument("--code-file", help="Path to JavaScript file with hook code")
+    scr_create.add_argument("--data", help="Full script JSON (inline string)")
+    scr_create.add_argument("--file", help="Path to JSON file with script definition")
+
+    scr_update = scr_sub.add_parser("update", help="Update a script (fetch-merge-PUT)")
+    scr_update.add_argument("id", help="Script ID")
+    scr_update.add_argument("--name", help="New script name")
+    scr_update.add_argument("--code-file", help="Path to JavaScript file with updated hook code")
+    scr_update.add_argument("--data", help="Partial script JSON (inline string)")
+    scr_update.add_argument("--file", help="Path to JSON file with updates")
+
+    scr_delete = scr_sub.add_parser("delete", help="Delete a script")
+    scr_delete.add_argument("id", help="Script ID")
+
+    scr_logs = scr_sub.add_parser("logs", help="Get script execution logs")
+    scr_logs.add_argument("id", help="Script ID")
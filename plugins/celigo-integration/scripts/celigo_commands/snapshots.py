@@ -0,0 +1,101 @@
+"""`celigo_api.py snapshots` - local integration snapshots and structural diff."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from celigo_core import CeligoClient, load_config, print_result
+from celigo_snapshot import KINDS, SnapshotStore, diff_snapshots, take_snapshot
+
+DIFF_VALUE_WIDTH = 60
+
+
+def _store(args) -> SnapshotStore:
+    return SnapshotStore(Path(args.store)) if args.store else SnapshotStore()
+
+
+def _short(value) -> str:
+    text = "" if value is None else json.dumps(value, sort_keys=True)
+    return text if len(text) <= DIFF_VALUE_WIDTH else text[:DIFF_VALUE_WIDTH - 3] + "..."
+
+
+def cmd_snapshots(args):
+    """Handle snapshots subcommands (see celigo_snapshot)."""
+    store = _store(args)
+
+    if args.action == "take":
+        client = CeligoClient(args.env)
+        env = args.env or load_config().get("defaults", {}).get("environment", "production")
+        try:
+            manifest = take_snapshot(client, store, args.id, env=env, name=args.name,
+                                     workers=args.workers)
+        except RuntimeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        counts = {kind: len(entries) for kind, entries in manifest["resources"].items()}
+        print(f"Snapshot {manifest['name']}: "
+              + ", ".join(f"{n} {kind}" for kind, n in counts.items() if n)
+              + f" ({manifest['blobs_written']} new blobs, {manifest['blobs_reused']} reused)",
+              file=sys.stderr)
+        print_result({"name": manifest["name"], "env": env, "integration": manifest["integration"]["name"],
+                      "taken_at": manifest["taken_at"], "store": str(store.root)}, args.format)
+
+    elif args.action == "list":
+        print_result(store.list(), args.format,
+                     ["name", "env", "integration", "taken_at", "resources"])
+
+    elif args.action == "diff":
+        try:
+            left, right = store.load(args.left), store.load(args.right)
+        except FileNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        result = diff_snapshots(store, left, right)
+        if args.kind:
+            result["resources"] = [r for r in result["resources"] if r["kind"] in args.kind]
+        rows = result["resources"]
+        print(f"{left['name']} -> {right['name']}: {result['unchanged']} unchanged, "
+              + ", ".join(f"{sum(r['status'] == s for r in rows)} {s}"
+                          for s in ("changed", "added", "removed")),
+              file=sys.stderr)
+        if args.summary_only:
+            summary = [{"kind": r["kind"], "name": r["name"], "status": r["status"],
+                        "fields": len(r["changes"])} for r in rows]
+            print_result(summary, args.format, ["kind", "name", "status", "fields"])
+        elif args.format == "json":
+            print_result(result, args.format)
+        else:
+            flat = [{"kind": r["kind"], "name": r["name"], "status": r["status"],
+                     "path": c["path"], "left": _short(c["left"]), "right": _short(c["right"])}
+                    for r in rows for c in (r["changes"] or [{"path": "", "left": None, "right": None}])]
+            print_result(flat, args.format, ["kind", "name", "status", "path", "left", "right"])
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `snapshots` actions to its resource parser."""
+    snap_sub = parser.add_subparsers(dest="action")
+
+    snap_take = snap_sub.add_parser("take", help="Snapshot an integration's flows, steps, connections, "
+                                                 "scripts and lookup caches")
+    snap_take.add_argument("id", help="Integration ID")
+    snap_take.add_argument("--name", help="Snapshot name (default: <integration>-<env>-<timestamp>)")
+    snap_take.add_argument("--workers", type=int, default=8, help="Concurrent API requests (default: 8)")
+    snap_take.add_argument("--store", help="Snapshot store directory "
+                                           "(default: ~/.cache/celigo-integration/snapshots)")
+
+    snap_list = snap_sub.add_parser("list", help="List stored snapshots")
+    snap_list.add_argument("--store", help="Snapshot store directory")
+
+    snap_diff = snap_sub.add_parser("diff", help="Compare two snapshots field by field")
+    snap_diff.add_argument("left", help="Snapshot name or manifest path")
+    snap_diff.add_argument("right", help="Snapshot name or manifest path")
+    snap_diff.add_argument("--kind", action="append", choices=KINDS,
+                           help="Only report this resource kind (repeatable)")
+    snap_diff.add_argument("--summary-only", action="store_true",
+                           help="One row per resource instead of one per field")
+    snap_diff.add_argument("--store", help="Snapshot store directory")
@@ -0,0 +1,112 @@
+"""`celigo_api.py state` - state API operations."""
+
+import argparse
+import sys
+from urllib.parse import quote
+
+from celigo_core import CeligoClient, print_result, _resolve_json_input
+
+
+class StateAPI:
+    """State API for persistent key-value storage."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        """List all state keys."""
+        return self.client.get("/state")
+
+    def get(self, key: str) -> dict:
+        """Get state value by key."""
+        return self.client.get(f"/state/{quote(key, safe='')}")
+
+    def set(self, key: str, data: dict) -> dict:
+        """Set state value for key."""
+        return self.client.put(f"/state/{quote(key, safe='')}", data)
+
+    def delete(self, key: str) -> dict:
+        """Delete a state key."""
+        return self.client.delete(f"/state/{quote(key, safe='')}")
+
+    def list_scoped(self, import_id: str) -> list:
+        """List import-scoped state keys."""
+        return self.client.get(f"/imports/{import_id}/state")
+
+    def get_scoped(self, import_id: str, key: str) -> dict:
+        """Get import-scoped state value."""
+        return self.client.get(f"/imports/{import_id}/state/{quote(key, safe='')}")
+
+    def set_scoped(self, import_id: str, key: str, data: dict) -> dict:
+        """Set import-scoped state value."""
+        return self.client.put(f"/imports/{import_id}/state/{quote(key, safe='')}", data)
+
+
+def cmd_state(args):
+    """Handle state API subcommands."""
+    client = CeligoClient(args.env)
+    api = StateAPI(client)
+
+    if args.action == "list":
+        print_result(api.list(), args.format)
+
+    elif args.action == "get":
+        print_result(api.get(args.key), args.format)
+
+    elif args.action == "set":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No data provided. Use --data or --file", file=sys.stderr)
+            sys.exit(1)
+        print_result(api.set(args.key, data), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.key), args.format)
+
+    elif args.action == "list-scoped":
+        print_result(api.list_scoped(args.import_id), args.format)
+
+    elif args.action == "get-scoped":
+        print_result(api.get_scoped(args.import_id, args.key), args.format)
+
+    elif args.action == "set-scoped":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No data provided. Use --data or --file", file=sys.stderr)
+            sys.exit(1)
+        print_result(api.set_scoped(args.import_id, args.key, data), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `state` actions to its resource parser."""
+    state_sub = parser.add_subparsers(dest="action")
+
+    state_sub.add_parser("list", help="List all state keys")
+
+    state_get = state_sub.add_parser("get", help="Get state value")
+    state_get.add_argument("key", help="State key")
+
+    state_set = state_sub.add_parser("set", help="Set state value")
+    state_set.add_argument("key", help="State key")
+    state_set.add_argument("--data", help="Value JSON (inline)")
+    state_set.add_argument("--file", help="Path to JSON file")
+
+    state_del = state_sub.add_parser("delete", help="Delete state key")
+    state_del.add_argument("key", help="State key")
+
+    state_list_scoped = state_sub.add_parser("list-scoped", help="List import-scoped state keys")
+    state_list_scoped.add_argument("--import", dest="import_id", required=True, help="Import ID")
+
+    state_get_scoped = state_sub.add_parser("get-scoped", help="Get import-scoped state")
+    state_get_scoped.add_argument("--import", dest="import_id", required=True, help="Import ID")
+    state_get_scoped.add_argument("key", help="State key")
+
+    state_set_scoped = state_sub.add_parser("set-scoped", help="Set import-scoped state")
+    state_set_scoped.add_argument("--import", dest="import_id", required=True, help="Import ID")
+    state_set_scoped.add_argument("key", help="State key")
+    state_set_scoped.add_argument("--data", help="Value JSON (inline)")
+    state_set_scoped.add_argument("--file", help="Path to JSON file")
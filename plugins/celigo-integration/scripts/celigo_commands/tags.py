@@ -0,0 +1,81 @@
+"""`celigo_api.py tags` - tag operations."""
+
+import argparse
+
+from celigo_core import CeligoClient, print_result
+
+
+class TagsAPI:
+    """Tags resource operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        """List all tags."""
+        return self.client.get("/tags")
+
+    def get(self, tag_id: str) -> dict:
+        """Get single tag."""
+        return self.client.get(f"/tags/{tag_id}")
+
+    def create(self, tag_name: str) -> dict:
+        """Create a new tag."""
+        return self.client.post("/tags", {"tag": tag_name})
+
+    def update(self, tag_id: str, tag_name: str, tag_tag_id: str) -> dict:
+        """Update a tag."""
+        return self.client.put(f"/tags/{tag_id}",
+                               {"_id": tag_id, "tag": tag_name, "tagId": tag_tag_id})
+
+    def delete(self, tag_id: str) -> dict:
+        """Delete a tag."""
+        return self.client.delete(f"/tags/{tag_id}")
+
+
+def cmd_tags(args):
+    """Handle tags subcommands."""
+    client = CeligoClient(args.env)
+    api = TagsAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "tag", "tagId"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "create":
+        print_result(api.create(args.name), args.format)
+
+    elif args.action == "update":
+        print_result(api.update(args.id, args.name, args.tag_id), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `tags` actions to its resource parser."""
+    tag_sub = parser.add_subparsers(dest="action")
+
+    tag_list = tag_sub.add_parser("list", help="List tags")
+
+    tag_get = tag_sub.add_parser("get", help="Get tag")
+    tag_get.add_argument("id", help="Tag ID")
+
+    tag_create = tag_sub.add_parser("create", help="Create tag")
+    tag_create.add_argument("name", help="Tag name")
+
+    tag_update = tag_sub.add_parser("update", help="Update tag")
+    tag_update.add_argument("id", help="Tag database ID (_id)")
+    tag_update.add_argument("name", help="New tag name")
+    tag_update.add_argument("tag_id", help="Tag public ID (tagId)")
+
+    tag_delete = tag_sub.add_parser("delete", help="Delete tag")
+    tag_delete.add_argument("id", help="Tag ID")
@@ -0,0 +1,55 @@
+"""`celigo_api.py templates` - template operations."""
+
+import argparse
+import sys
+
+from celigo_core import CeligoClient, print_result, _resolve_json_input
+
+
+class TemplatesAPI:
+    """Template resource operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        """List all templates."""
+        return self.client.get("/template")
+
+    def update(self, template_id: str, data: dict) -> dict:
+        """Update a template."""
+        return self.client.put(f"/template/{template_id}", data)
+
+
+def cmd_templates(args):
+    """Handle template subcommands."""
+    client = CeligoClient(args.env)
+    api = TemplatesAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "name", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "update":
+        data = _resolve_json_input(args)
+        if not data:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        print_result(api.update(args.id, data), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `templates` actions to its resource parser."""
+    tpl_sub = parser.add_subparsers(dest="action")
+
+    tpl_sub.add_parser("list", help="List all templates")
+
+    tpl_update = tpl_sub.add_parser("update", help="Update a template")
+    tpl_update.add_argument("id", help="Template ID")
+    tpl_update.add_argument("--data", help="Template update JSON")
+    tpl_update.add_argument("--file", help="Path to JSON file")
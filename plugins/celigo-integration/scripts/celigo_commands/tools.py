@@ -0,0 +1,114 @@
+"""`celigo_api.py tools` - celigo Tools (reusable processing units)."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    TOOL_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class ToolsAPI:
+    """Celigo Tools — reusable processing units."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        return self.client.get("/tools")
+
+    def get(self, tool_id: str) -> dict:
+        return self.client.get(f"/tools/{tool_id}")
+
+    def create(self, data: dict) -> dict:
+        return self.client.post("/tools", data)
+
+    def update(self, tool_id: str, data: dict) -> dict:
+        return self.client.put(f"/tools/{tool_id}", data)
+
+    def delete(self, tool_id: str) -> dict:
+        return self.client.delete(f"/tools/{tool_id}")
+
+    def invoke(self, tool_id: str, data: dict = None) -> dict:
+        return self.client.post(f"/tools/{tool_id}/invoke", data)
+
+    def dependencies(self, tool_id: str) -> dict:
+        return self.client.get(f"/tools/{tool_id}/dependencies")
+
+
+def cmd_tools(args):
+    """Handle Tools subcommands."""
+    client = CeligoClient(args.env)
+    api = ToolsAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "name", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        print_result(api.create(data), args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, TOOL_READONLY_FIELDS)
+        print_result(api.update(args.id, merged), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+    elif args.action == "invoke":
+        data = _resolve_json_input(args) if hasattr(args, 'data') and args.data else None
+        print_result(api.invoke(args.id, data), args.format)
+
+    elif args.action == "dependencies":
+        print_result(api.dependencies(args.id), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `tools` actions to its resource parser."""
+    tools_sub = parser.add_subparsers(dest="action")
+
+    tools_sub.add_parser("list", help="List tools")
+
+    tools_get = tools_sub.add_parser("get", help="Get tool")
+    tools_get.add_argument("id", help="Tool ID")
+
+    tools_create = tools_sub.add_parser("create", help="Create tool")
+    tools_create.add_argument("--data", help="Full JSON (inline)")
+    tools_create.add_argument("--file", help="Path to JSON file")
+
+    tools_update = tools_sub.add_parser("update", help="Update tool (fetch-merge-PUT)")
+    tools_update.add_argument("id", help="Tool ID")
+    tools_update.add_argument("--data", help="Partial JSON (inline)")
+    tools_update.add_argument("--file", help="Path to JSON file")
+
+    tools_delete = tools_sub.add_parser("delete", help="Delete tool")
+    tools_delete.add_argument("id", help="Tool ID")
+
+    tools_invoke = tools_sub.add_parser("invoke", help="Invoke tool")
+    tools_invoke.add_argument("id", help="Tool ID")
+    tools_invoke.add_argument("--data", help="Invocation payload JSON")
+    tools_invoke.add_argument("--file", help="Path to JSON file")
+
+    tools_deps = tools_sub.add_parser("dependencies", help="Get tool dependencies")
+    tools_deps.add_argument("id", help="Tool ID")
@@ -0,0 +1,91 @@
+"""`celigo_api.py trading-partners` - trading Partner Connectors (B2B onboarding templates)."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    TPC_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class TradingPartnerConnectorsAPI:
+    """B2B onboarding templates that bundle connection/export/import/ediProfile configurations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        return self.client.get("/tradingPartnerConnectors")
+
+    def get(self, connector_id: str) -> dict:
+        return self.client.get(f"/tradingPartnerConnectors/{connector_id}")
+
+    def create(self, data: dict) -> dict:
+        return self.client.post("/tradingPartnerConnectors", data)
+
+    def update(self, connector_id: str, data: dict) -> dict:
+        """Update a TPC (full-replace PUT — fetch-merge first)."""
+        return self.client.put(f"/tradingPartnerConnectors/{connector_id}", data)
+
+
+def cmd_trading_partners(args):
+    """Handle Trading Partner Connectors subcommands."""
+    client = CeligoClient(args.env)
+    api = TradingPartnerConnectorsAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        columns = ["_id", "name", "lastModified"]
+        print_result(data, args.format, columns)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "create":
+        data = _resolve_json_input(args)
+        # Resolve supportedBy name -> id if needed (pass-through; let API validate)
+        print_result(api.create(data), args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, TPC_READONLY_FIELDS)
+        print_result(api.update(args.id, merged), args.format)
+
+    else:
+        print(f"Error: Unknown action '{args.action}'. Trading Partner Connectors do not support delete via API.",
+              file=sys.stderr)
+        sys.exit(1)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `trading-partners` actions to its resource parser."""
+    tpc_sub = parser.add_subparsers(dest="action")
+
+    tpc_sub.add_parser("list", help="List trading partner connectors")
+
+    tpc_get = tpc_sub.add_parser("get", help="Get trading partner connector")
+    tpc_get.add_argument("id", help="Connector ID")
+
+    tpc_create = tpc_sub.add_parser("create", help="Create trading partner connector")
+    tpc_create.add_argument("--data", help="Full JSON (inline); include supportedBy array")
+    tpc_create.add_argument("--file", help="Path to JSON file")
+
+    tpc_update = tpc_sub.add_parser("update", help="Update trading partner connector (fetch-merge-PUT)")
+    tpc_update.add_argument("id", help="Connector ID")
+    tpc_update.add_argument("--data", help="Partial JSON (inline)")
+    tpc_update.add_argument("--file", help="Path to JSON file")
@@ -0,0 +1,154 @@
+"""`celigo_api.py users` - user operations."""
+
+import argparse
+import sys
+
+from celigo_core import (
+    USER_READONLY_FIELDS,
+    CeligoClient,
+    _merge_updates_for_put,
+    print_result,
+    _resolve_json_input,
+)
+
+
+class UsersAPI:
+    """Users/shares resource operations."""
+
+    def __init__(self, client: CeligoClient):
+        self.client = client
+
+    def list(self) -> list:
+        """List all users/shares."""
+        return self.client.get("/ashares")
+
+    def get(self, user_id: str) -> dict:
+        """Get single user/share."""
+        return self.client.get(f"/ashares/{user_id}")
+
+    def update(self, user_id: str, data: dict) -> dict:
+        """Update user permissions (full-replace PUT)."""
+        return self.client.put(f"/ashares/{user_id}", data)
+
+    def delete(self, user_id: str) -> dict:
+        """Remove a user."""
+        return self.client.delete(f"/ashares/{user_id}")
+
+    def disable(self, user_id: str) -> dict:
+        """Disable a user."""
+        return self.client.put(f"/ashares/{user_id}/disable")
+
+    def invite(self, data: dict) -> dict:
+        """Invite a user (POST /invite, not POST /ashares)."""
+        return self.client.post("/invite", data)
+
+    def invite_multiple(self, data: dict) -> dict:
+        """Invite multiple users at once."""
+        return self.client.post("/invite/multiple", data)
+
+    def reinvite(self, data: dict) -> dict:
+        """Reinvite a user."""
+        return self.client.post("/reinvite", data)
+
+    def sso_update(self, client_id: str, data: dict) -> dict:
+        """Update SSO client settings."""
+        return self.client.patch(f"/ssoclients/{client_id}", data)
+
+
+def cmd_users(args):
+    """Handle users subcommands."""
+    client = CeligoClient(args.env)
+    api = UsersAPI(client)
+
+    if args.action == "list":
+        data = api.list()
+        print_result(data, args.format)
+
+    elif args.action == "get":
+        print_result(api.get(args.id), args.format)
+
+    elif args.action == "update":
+        updates = _resolve_json_input(args)
+        if not updates:
+            print("Error: No update data provided.", file=sys.stderr)
+            sys.exit(1)
+        current = api.get(args.id)
+        if current.get("error"):
+            print_result(current, args.format)
+            return
+        merged = _merge_updates_for_put(current, updates, USER_READONLY_FIELDS)
+        print_result(api.update(args.id, merged), args.format)
+
+    elif args.action == "delete":
+        print_result(api.delete(args.id), args.format)
+
+    elif args.action == "disable":
+        print_result(api.disable(args.id), args.format)
+
+    elif args.action == "invite":
+        data = _resolve_json_input(args)
+        if not data.get("email"):
+            print("Error: --email is required for invite.", file=sys.stderr)
+            sys.exit(1)
+        print_result(api.invite(data), args.format)
+
+    elif args.action == "invite-multiple":
+        data = _resolve_json_input(args)
+        print_result(api.invite_multiple(data), args.format)
+
+    elif args.action == "reinvite":
+        data = _resolve_json_input(args)
+        if not data.get("email"):
+            print("Error: --email is required for reinvite.", file=sys.stderr)
+            sys.exit(1)
+        print_result(api.reinvite(data), args.format)
+
+    elif args.action == "sso-update":
+        data = _resolve_json_input(args)
+        print_result(api.sso_update(args.id, data), args.format)
+
+
+# =============================================================================
+# CLI Parser
+# =============================================================================
+
+def build_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the `users` actions to its resource parser."""
+    user_sub = parser.add_subparsers(dest="action")
+
+    user_list = user_sub.add_parser("list", help="List users")
+
+    user_get = user_sub.add_parser("get", help="Get user")
+    user_get.add_argument("id", help="User share ID")
+
+    user_update = user_sub.add_parser("update", help="Update user permissions")
+    user_update.add_argument("id", help="User share ID")
+    user_update.add_argument("--role", help="Access level (monitor/manage/administrator)")
+    user_update.add_argument("--data", help="Full update JSON")
+    user_update.add_argument("--file", help="Path to JSON file")
+
+    user_delete = user_sub.add_parser("delete", help="Remove user")
+    user_delete.add_argument("id", help="User share ID")
+
+    user_disable = user_sub.add_parser("disable", help="Disable user access")
+    user_disable.add_argument("id", help="User share ID")
+
+    user_invite = user_sub.add_parser("invite", help="Invite a user (POST /invite)")
+    user_invite.add_argument("--email", required=True, help="User email")
+    user_invite.add_argument("--role", help="Access level (monitor/manage/administrator)")
+    user_invite.add_argument("--data", help="Full invite JSON")
+    user_invite.add_argument("--file", help="Path to JSON file")
+
+    user_invite_multi = user_sub.add_parser("invite-multiple", help="Invite multiple users")
+    user_invite_multi.add_argument("--data", help="Bulk invite JSON")
+    user_invite_multi.add_argument("--file", help="Path to JSON file")
+
+    user_reinvite = user_sub.add_parser("reinvite", help="Reinvite a user")
+    user_reinvite.add_argument("--email", required=True, help="User email")
+    user_reinvite.add_argument("--data", help="Reinvite JSON")
+    user_reinvite.add_argument("--file", help="Path to JSON file")
+
+    user_sso = user_sub.add_parser("sso-update", help="Update SSO client (PATCH)")
+    user_sso.add_argument("id", help="SSO client ID")
+    user_sso.add_argument("--data", help="SSO update JSON")
+    user_sso.add_argument("--file", help="Path to JSON file")
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Shared core of the Celigo API CLI: configuration and authentication, the
+HTTP client, output formatting, and the JSON input/merge helpers used by the
+resource commands in celigo_commands/.
+
+Kept free of argparse and resource code so that importing it stays cheap;
+celigo_api.py loads only the command module for the resource being invoked.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+from urllib.parse import urlencode
+
+from celigo_paging import is_error, iter_pages, page_items
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+SCRIPT_DIR = Path(__file__).parent
+CONFIG_DIR = SCRIPT_DIR.parent / "config"
+CONFIG_FILE = CONFIG_DIR / "celigo_config.json"
+
+DEFAULT_TIMEOUT = 30
+MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 2
+MAX_JSON_SIZE = 1024 * 1024  # 1MB limit for --data payloads
+MAX_JSON_DEPTH = 20
+
+
+# =============================================================================
+# Configuration & Authentication
+# =============================================================================
+
+def load_config() -> dict:
+    """Load configuration from config file."""
+    if not CONFIG_FILE.exists():
+        print(f"Error: Configuration file not found at {CONFIG_FILE}", file=sys.stderr)
+        print("Run: cp config/celigo_config.template.json config/celigo_config.json", file=sys.stderr)
+        sys.exit(1)
+    with open(CONFIG_FILE) as f:
+        return json.load(f)
+
+
+def get_environment(config: dict, env_name: str = None) -> dict:
+    """Get environment configuration."""
+    env_name = env_name or config.get("defaults", {}).get("environment", "production")
+    if env_name not in config.get("environments", {}):
+        print(f"Error: Environment '{env_name}' not found.", file=sys.stderr)
+        print(f"Available: {list(config.get('environments', {}).keys())}", file=sys.stderr)
+        sys.exit(1)
+    return config["environments"][env_name]
+
+
+def get_api_credentials(env_name: str = None) -> tuple:
+    """Get API URL and key for specified environment."""
+    config = load_config()
+    env = get_environment(config, env_name)
+    api_url = env.get("api_url", "https://api.integrator.io/v1")
+    api_key = env.get("api_key", "")
+    if not api_key or api_key.startswith("YOUR_"):
+        print(f"Error: API key not configured for '{env.get('name', env_name)}'", file=sys.stderr)
+        sys.exit(1)
+    return api_url, api_key
+
+
+# =============================================================================
+# HTTP Client
+# =============================================================================
+
+class CeligoAPIError(Exception):
+    """A Celigo API error dict raised from a lazy iterator (CeligoClient.iter_items)."""
+
+    def __init__(self, result: dict):
+        super().__init__(result.get("message", "Celigo API error"))
+        self.result = result
+
+
+class CeligoClient:
+    """HTTP client for Celigo API with retry logic and error handling."""
+
+    def __init__(self, env_name: str = None):
+        self.api_url, self.api_key = get_api_credentials(env_name)
+        if not self.api_url.startswith("https://"):
+            raise ValueError(f"API URL must use HTTPS, got: {self.api_url}")
+        self.timeout = DEFAULT_TIMEOUT
+
+    def _url(self, endpoint: str, params: dict = None) -> str:
+        url = f"{self.api_url}{endpoint}"
+        if params:
+            # Filter out None values
+            params = {k: v for k, v in params.items() if v is not None}
+            if params:
+                url += ("&" if "?" in url else "?") + urlencode(params)
+        return url
+
+    def _send(self, method: str, url: str, data: dict = None) -> Tuple[Any, Dict[str, str]]:
+        """Send a request with retry logic; returns (parsed body, response headers)."""
+        # urllib.request pulls in http.client, ssl and email; import on first request
+        from urllib.error import HTTPError, URLError
+        from urllib.request import Request, urlopen
+
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+
+        body = json.dumps(data).encode() if data else None
+
+        for attempt in range(MAX_RETRIES):
+            try:
+                req = Request(url, data=body, headers=headers, method=method)
+                with urlopen(req, timeout=self.timeout) as response:
+                    resp_headers = {k.lower(): v for k, v in response.headers.items()}
+                    content = response.read().decode()
+                    if not content:
+                        return {}, resp_headers
+                    return json.loads(content), resp_headers
+            except HTTPError as e:
+                if e.code == 429:  # Rate limited
+                    wait = RETRY_BACKOFF_BASE ** attempt * 60
+                    print(f"Rate limited. Waiting {wait}s...", file=sys.stderr)
+                    time.sleep(wait)
+                    continue
+                elif e.code == 204:  # No content (successful delete)
+                    return {"success": True, "status": 204}, {}
+                error_body = e.read().decode() if e.fp else ""
+                return {
+                    "error": True,
+                    "status": e.code,
+                    "message": e.reason,
+                    "details": error_body
+                }, {}
+            except URLError as e:
+                if attempt < MAX_RETRIES - 1:
+                    time.sleep(RETRY_BACKOFF_BASE ** attempt)
+                    continue
+                return {"error": True, "message": str(e.reason)}, {}
+            except Exception as e:
+                return {"error": True, "message": str(e)}, {}
+
+        return {"error": True, "message": "Max retries exceeded"}, {}
+
+    def _make_request(self, method: str, endpoint: str, data: dict = None,
+                      params: dict = None) -> dict:
+        """Make HTTP request with retry logic."""
+        return self._send(method, self._url(endpoint, params), data)[0]
+
+    def iter_pages(self, endpoint: str, params: dict = None,
+                   prefetch: bool = True) -> Iterator[Any]:
+        """Yield each page of a list endpoint, following Link rel="next" (see celigo_paging)."""
+        return iter_pages(lambda url: self._send("GET", url), self._url(endpoint, params),
+                          prefetch=prefetch)
+
+    def iter_items(self, endpoint: str, params: dict = None,
+                   prefetch: bool = True) -> Iterator[Any]:
+        """Lazily yield items across all pages; raises CeligoAPIError if a page fails."""
+        for page in self.iter_pages(endpoint, params, prefetch):
+            if is_error(page):
+                raise CeligoAPIError(page)
+            yield from page_items(page)
+
+    def get_all(self, endpoint: str, params: dict = None) -> Any:
+        """
+        GET every page of a list endpoint.
+
+        List responses come back as one list. Paged dict responses (errors
+        endpoints) come back as the first page with its item list extended by
+        the later pages. An error on any page returns that error dict.
+        """
+        first = None
+        items: list = []
+        for page in self.iter_pages(endpoint, params):
+            if is_error(page):
+                return page
+            if first is None:
+                first = page
+            items.extend(page_items(page))
+        if isinstance(first, dict):
+            merged = dict(first)
+            merged.pop("nextPageURL", None)
+            for key, value in first.items():
+                if isinstance(value, list):
+                    merged[key] = items
+                    break
+            return merged
+        return items
+
+    def get(self, endpoint: str, params: dict = None) -> dict:
+        return self._make_request("GET", endpoint, params=params)
+
+    def post(self, endpoint: str, data: dict = None) -> dict:
+        return self._make_request("POST", endpoint, data=data)
+
+    def put(self, endpoint: str, data: dict = None) -> dict:
+        return self._make_request("PUT", endpoint, data=data)
+
+    def patch(self, endpoint: str, data: dict = None) -> dict:
+        return self._make_request("PATCH", endpoint, data=data)
+
+    def delete(self, endpoint: str, data: dict = None, params: dict = None) -> dict:
+        return self._make_request("DELETE", endpoint, data=data, params=params)
+
+
+# =============================================================================
+# Output Formatting
+# =============================================================================
+
+def format_table(data: List[dict], columns: List[str] = None, headers: List[str] = None) -> str:
+    """Format data as ASCII table."""
+    if not data:
+        return "No data found."
+
+    if isinstance(data, dict):
+        if data.get("error"):
+            return f"Error: {data.get('message', 'Unknown error')}\n{data.get('details', '')}"
+        data = [data]
+
+    # Auto-detect columns if not specified
+    if not columns:
+        columns = list(data[0].keys()) if data else []
+
+    # Use headers or column names
+    if not headers:
+        headers = columns
+
+    # Calculate column widths
+    widths = [len(h) for h in headers]
+    for row in data:
+        for i, col in enumerate(columns):
+            val = str(row.get(col, ""))[:50]  # Truncate long values
+            widths[i] = max(widths[i], len(val))
+
+    # Build table
+    lines = []
+    # Header
+    header_line = " | ".join(h.ljust(widths[i]) for i, h in enumerate(headers))
+    lines.append(header_line)
+    lines.append("-+-".join("-" * w for w in widths))
+
+    # Rows
+    for row in data:
+        values = [str(row.get(col, ""))[:50].ljust(widths[i]) for i, col in enumerate(columns)]
+        lines.append(" | ".join(values))
+
+    return "\n".join(lines)
+
+
+def format_output(data: Any, fmt: str = "table", columns: List[str] = None,
+                  headers: List[str] = None) -> str:
+    """Format output based on requested format."""
+    if fmt == "json":
+        return json.dumps(data, indent=2, default=str)
+    elif fmt == "table":
+        if isinstance(data, list):
+            return format_table(data, columns, headers)
+        elif isinstance(data, dict):
+            if data.get("error"):
+                return f"Error: {data.get('message', 'Unknown error')}\n{data.get('details', '')}"
+            # Single object - format as key-value pairs
+            lines = []
+            for k, v in data.items():
+                if isinstance(v, (dict, list)):
+                    v = json.dumps(v, default=str)
+                lines.append(f"{k}: {v}")
+            return "\n".join(lines)
+    return str(data)
+
+
+def print_result(data: Any, fmt: str = "table", columns: List[str] = None,
+                 headers: List[str] = None):
+    """Print formatted result."""
+    print(format_output(data, fmt, columns, headers))
+
+
+# =============================================================================
+# Shared Input & Update Helpers
+# =============================================================================
+
+# Read-only fields to strip before PUT requests (Celigo PUT is full-replace)
+FLOW_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt", "lastExecutedAt"])
+EXPORT_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+IMPORT_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+SCRIPT_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+CONNECTION_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+INTEGRATION_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+LOOKUPCACHE_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+USER_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+FILEDEFINITION_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+ICLIENT_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+CONNECTOR_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+EDIPROFILE_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+TOOL_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+BUILDERAPI_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+MCPSERVER_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+NOTIFICATION_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+OPA_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+TPC_READONLY_FIELDS = frozenset(["_id", "lastModified", "createdAt"])
+# fileType is immutable post-create on EDI profiles; enforced client-side in cmd_edi
+EDIPROFILE_IMMUTABLE_FIELDS = frozenset(["fileType"])
+# EDI formats requiring documentType + globalId validation on file definitions
+EDI_FORMATS = frozenset(["x12", "edifact"])
+
+
+def _merge_updates_for_put(current: dict, updates: dict, readonly_fields: frozenset) -> dict:
+    """Merge updates into current state for Celigo PUT (full-replace) request."""
+    merged = current.copy()
+    for field in readonly_fields:
+        merged.pop(field, None)
+    merged.update(updates)
+    # Strip readonly fields from updates overlay too — user-supplied --data must not re-inject them
+    for field in readonly_fields:
+        merged.pop(field, None)
+    return merged
+
+
+def _safe_json_parse(json_string: str) -> dict:
+    """Parse JSON with size and depth limits."""
+    if len(json_string) > MAX_JSON_SIZE:
+        raise ValueError(f"JSON payload too large: {len(json_string)} bytes (max {MAX_JSON_SIZE})")
+
+    def _check_depth(obj: Any, depth: int = 0) -> None:
+        if depth > MAX_JSON_DEPTH:
+            raise ValueError(f"JSON nesting too deep (max {MAX_JSON_DEPTH})")
+        if isinstance(obj, dict):
+            for v in obj.values():
+                _check_depth(v, depth + 1)
+        elif isinstance(obj, list):
+            for item in obj:
+                _check_depth(item, depth + 1)
+
+    data = json.loads(json_string)
+    _check_depth(data)
+    return data
+
+
+def _validate_code_file(file_path: str) -> Path:
+    """Validate code file path: must exist, must be .js or .json."""
+    path = Path(file_path).resolve()
+    if not path.is_file():
+        raise ValueError(f"Not a file: {file_path}")
+    if path.suffix not in ('.js', '.json'):
+        raise ValueError(f"Invalid file type '{path.suffix}' — only .js and .json allowed")
+    return path
+
+
+def _resolve_json_input(args) -> dict:
+    """Resolve JSON data from --data, --file, or individual convenience flags."""
+    data = {}
+
+    if hasattr(args, 'file') and args.file:
+        try:
+            with open(args.file) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            print(f"Error: File not found: {args.file}", file=sys.stderr)
+            sys.exit(1)
+        except json.JSONDecodeError as e:
+            print(f"Error: Invalid JSON in file: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if hasattr(args, 'data') and args.data:
+        try:
+            data.update(_safe_json_parse(args.data))
+        except (json.JSONDecodeError, ValueError) as e:
+            print(f"Error: Invalid JSON in --data: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if hasattr(args, 'name') and args.name is not None:
+        data["name"] = args.name
+    if hasattr(args, 'description') and args.description is not None:
+        data["description"] = args.description
+    if hasattr(args, 'integration') and args.integration is not None:
+        data["_integrationId"] = args.integration
+    if hasattr(args, 'disabled') and args.disabled is not None:
+        data["disabled"] = args.disabled
+    if hasattr(args, 'schedule') and args.schedule is not None:
+        data["schedule"] = args.schedule
+    if hasattr(args, 'timezone') and args.timezone is not None:
+        data["timezone"] = args.timezone
+    if hasattr(args, 'email') and args.email is not None:
+        data["email"] = args.email
+    if hasattr(args, 'role') and args.role is not None:
+        data["accessLevel"] = args.role
+    if hasattr(args, 'key') and args.key is not None:
+        data["key"] = args.key
+
+    return data
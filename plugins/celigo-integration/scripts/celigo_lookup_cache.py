@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Streaming export, import and diff for Celigo lookup caches.
+
+getData returns entries in key order, one page at a time, with the last key
+of a page as the next page's start_after_key. Export streams those pages to
+JSONL ({"key": ..., "value": ...} per line) while the next page is already
+being fetched. Import sends the JSONL back through chunked data_update
+calls, several in flight at once. Diff merge-joins two key-ordered streams
+(caches, environments or JSONL exports), so neither side is held in memory.
+
+Used by `celigo_api.py caches export|import|diff`:
+    python3 celigo_api.py --env sandbox caches export <cache_id> -o xref.jsonl
+    python3 celigo_api.py --env production caches import <cache_id> -i xref.jsonl
+    python3 celigo_api.py caches diff sandbox:<cache_id> production:<cache_id>
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from celigo_paging import is_error
+
+DEFAULT_PAGE_SIZE = 1000   # getData maximum
+DEFAULT_BATCH_SIZE = 500   # entries per data_update request
+DEFAULT_WORKERS = 4
+
+
+def iter_entries(caches_api, cache_id: str, page_size: int = DEFAULT_PAGE_SIZE,
+                 starts_with: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yield every {key, value} entry of a cache in key order, prefetching the next page."""
+    def fetch(after):
+        page = caches_api.data(cache_id, starts_with=starts_with, page_size=page_size,
+                               start_after_key=after)
+        if is_error(page):
+            raise RuntimeError(f"getData on cache {cache_id} failed: "
+                               f"{page.get('message')} {page.get('details', '')}".strip())
+        return page
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        page = fetch(None)
+        while True:
+            entries = page.get("data") or []
+            more = bool(entries) and bool(page.get("nextPageURL"))
+            pending = pool.submit(fetch, entries[-1]["key"]) if more else None
+            yield from entries
+            if not pending:
+                return
+            page = pending.result()
+
+
+def read_jsonl(fp: TextIO) -> Iterator[Dict[str, Any]]:
+    for n, line in enumerate(fp, 1):
+        line = line.strip()
+        if not line:
+            continue
+        entry = json.loads(line)
+        if not isinstance(entry, dict) or "key" not in entry:
+            raise ValueError(f"line {n}: expected an object with a \"key\" field")
+        yield entry
+
+
+def write_jsonl(entries: Iterable[Dict[str, Any]], fp: TextIO) -> int:
+    count = 0
+    for entry in entries:
+        fp.write(json.dumps({"key": entry["key"], "value": entry.get("value")},
+                            separators=(",", ":"), sort_keys=True) + "\n")
+        count += 1
+    return count
+
+
+def _batches(entries: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    it = iter(entries)
+    while True:
+        batch = list(islice(it, max(1, size)))
+        if not batch:
+            return
+        yield batch
+
+
+def import_entries(caches_api, cache_id: str, entries: Iterable[Dict[str, Any]],
+                   batch_size: int = DEFAULT_BATCH_SIZE, workers: int = DEFAULT_WORKERS,
+                   on_result: Optional[Callable[[dict], None]] = None) -> List[Dict[str, Any]]:
+    """
+    Upsert entries with data_update in batches, `workers` requests in flight.
+    Entries are read lazily; at most 2 x workers batches are held at once.
+    Returns one result per batch: {batch, first_key, last_key, size, ok, message}.
+    """
+    def send(n, batch):
+        resp = caches_api.data_update(cache_id, {"data": [
+            {"key": e["key"], "value": e.get("value")} for e in batch]})
+        ok = not is_error(resp)
+        row = {"batch": n, "first_key": batch[0]["key"], "last_key": batch[-1]["key"],
+               "size": len(batch), "ok": ok,
+               "message": "" if ok else str(resp.get("message") or resp.get("details") or "")}
+        return row
+
+    results = []
+    workers = max(1, workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = []
+        for n, batch in enumerate(_batches(entries, batch_size), 1):
+            pending.append(pool.submit(send, n, batch))
+            if len(pending) >= 2 * workers:
+                row = pending.pop(0).result()
+                results.append(row)
+                if on_result:
+                    on_result(row)
+        for future in pending:
+            row = future.result()
+            results.append(row)
+            if on_result:
+                on_result(row)
+    return results
+
+
+def _ordered(entries: Iterable[Dict[str, Any]], side: str) -> Iterator[Dict[str, Any]]:
+    last = None
+    for entry in entries:
+        key = str(entry["key"])
+        if last is not None and key <= last:
+            raise ValueError(f"{side} is not in ascending key order at {key!r} (after {last!r}); "
+                             "diff needs key-ordered input such as a caches export")
+        last = key
+        yield entry
+
+
+def diff_entries(left: Iterable[Dict[str, Any]],
+                 right: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Merge-join two key-ordered entry streams. Yields
+    {key, status: "only_left"|"only_right"|"changed", left, right}
+    for every key that differs; identical entries are skipped.
+    """
+    lit, rit = _ordered(left, "left"), _ordered(right, "right")
+    lcur, rcur = next(lit, None), next(rit, None)
+    while lcur is not None or rcur is not None:
+        lkey = str(lcur["key"]) if lcur is not None else None
+        rkey = str(rcur["key"]) if rcur is not None else None
+        if rkey is None or (lkey is not None and lkey < rkey):
+            yield {"key": lcur["key"], "status": "only_left", "left": lcur.get("value"), "right": None}
+            lcur = next(lit, None)
+        elif lkey is None or rkey < lkey:
+            yield {"key": rcur["key"], "status": "only_right", "left": None, "right": rcur.get("value")}
+            rcur = next(rit, None)
+        else:
+            if lcur.get("value") != rcur.get("value"):
+                yield {"key": lcur["key"], "status": "changed",
+                       "left": lcur.get("value"), "right": rcur.get("value")}
+            lcur, rcur = next(lit, None), next(rit, None)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Celigo list pagination shared by celigo_api.py and edi_audit.py.
+
+Celigo caps list responses (e.g. /jobs at pageSize, max 1000) and points to
+the next page with a `Link: <url>; rel="next"` response header. The errors
+endpoints return {"errors": [...], "nextPageURL": "..."} instead. Both are
+followed here. While the caller works through one page, the next one is
+already being fetched on a background thread.
+
+Usage:
+    from celigo_paging import iter_pages, page_items
+    for page in iter_pages(fetch, url):     # fetch(url) -> (body, headers)
+        for item in page_items(page):
+            ...
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+Fetch = Callable[[str], Tuple[Any, Dict[str, str]]]
+
+MAX_PAGES = 1000  # safety stop for a server that keeps returning rel="next"
+
+_LINK_RE = re.compile(r'<([^>]*)>\s*((?:;\s*[^;,]+)*)')
+_REL_RE = re.compile(r'rel\s*=\s*"?([^";]+)"?', re.IGNORECASE)
+
+
+def parse_next_link(link_header: Optional[str]) -> Optional[str]:
+    """URL of the rel="next" entry in an RFC 8288 Link header, if any."""
+    if not link_header:
+        return None
+    for m in _LINK_RE.finditer(link_header):
+        rel = _REL_RE.search(m.group(2) or '')
+        if rel and 'next' in rel.group(1).lower().split():
+            return m.group(1).strip()
+    return None
+
+
+def next_page_url(body: Any, headers: Optional[Dict[str, str]]) -> Optional[str]:
+    """Next page from the Link header, else from a nextPageURL body field."""
+    headers = headers or {}
+    link = headers.get('link') or headers.get('Link')
+    url = parse_next_link(link)
+    if url:
+        return url
+    if isinstance(body, dict) and body.get('nextPageURL'):
+        return str(body['nextPageURL'])
+    return None
+
+
+def is_error(body: Any) -> bool:
+    return isinstance(body, dict) and bool(body.get('error'))
+
+
+def page_items(body: Any) -> List[Any]:
+    """Items of one page: the body itself if it is a list, else its first list field."""
+    if isinstance(body, list):
+        return body
+    if isinstance(body, dict) and not is_error(body):
+        for value in body.values():
+            if isinstance(value, list):
+                return value
+        return [body] if body else []
+    return []
+
+
+def iter_pages(fetch: Fetch, url: str, prefetch: bool = True,
+               max_pages: int = MAX_PAGES) -> Iterator[Any]:
+    """
+    Yield each page body from url onwards, following next links.
+
+    An error body is yielded and ends the iteration. Next links must stay on
+    the origin of url (the bearer token is sent with every request) and may be
+    relative. With prefetch, page n+1 is requested before page n is yielded.
+    """
+    from concurrent.futures import ThreadPoolExecutor  # only needed once a listing is paged
+
+    origin = urlsplit(url)[:2]
+    seen = {url}
+    pool = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        current = fetch(url)
+        for _ in range(max_pages):
+            body, headers = current
+            nxt = None if is_error(body) else next_page_url(body, headers)
+            if nxt:
+                nxt = urljoin(url, nxt)
+                if urlsplit(nxt)[:2] != origin:
+                    raise ValueError(f"Refusing to follow next link to another host: {nxt}")
+                if nxt in seen:
+                    nxt = None  # server repeated a page link; stop rather than loop
+            future = pool.submit(fetch, nxt) if (nxt and pool) else None
+            yield body
+            if not nxt:
+                return
+            seen.add(nxt)
+            current = future.result() if future else fetch(nxt)
+    finally:
+        if pool:
+            pool.shutdown(wait=True)
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Integration snapshots in a local content-addressed store, and structural diff.
+
+A snapshot is the graph behind one integration: the integration itself, its
+flows, every export and import the flows use, and the connections, scripts
+and lookup caches those reference. Documents are fetched concurrently, in
+three rounds (integration-level lists, step documents the lists missed,
+referenced connections/scripts/lookup caches), instead of one call per
+resource.
+
+Each document is normalized before it is stored: `_id` and timestamps are
+dropped and references to other snapshot resources become "@kind:name", so
+the same flow in sandbox and production produces the same blob. Blobs are
+stored once under their SHA-256; a manifest maps kind -> name -> {_id, blob}.
+Diffing two manifests skips every pair whose blob hashes match and compares
+the rest field by field.
+
+    ~/.cache/celigo-integration/snapshots/blobs/ab/ab12...json
+    ~/.cache/celigo-integration/snapshots/manifests/<name>.json
+
+Used by `celigo_api.py snapshots take|list|diff`:
+    python3 celigo_api.py --env sandbox snapshots take <integration_id> --name buckle-sbx
+    python3 celigo_api.py --env production snapshots take <integration_id> --name buckle-prd
+    python3 celigo_api.py snapshots diff buckle-sbx buckle-prd
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from celigo_bulk_errors import flow_steps
+from celigo_paging import is_error
+
+CACHE_DIR = Path.home() / ".cache" / "celigo-integration"
+DEFAULT_WORKERS = 8
+
+KINDS = ("integration", "flow", "export", "import", "connection", "script", "lookupcache")
+ENDPOINTS = {"integration": "/integrations", "flow": "/flows", "export": "/exports",
+             "import": "/imports", "connection": "/connections", "script": "/scripts",
+             "lookupcache": "/lookupcaches"}
+# Top-level fields that change without a configuration change.
+VOLATILE_FIELDS = frozenset(["_id", "lastModified", "createdAt", "lastExecutedAt",
+                             "debugDate", "debugUntil", "offline"])
+# Reference fields (any depth) by lower-cased suffix -> kind of the referenced document,
+# e.g. _connectionId, _borrowConcurrencyFromConnectionId, hooks.preMap._scriptId.
+_REF_SUFFIXES = (("connectionid", "connection"), ("scriptid", "script"),
+                 ("lookupcacheid", "lookupcache"), ("exportid", "export"),
+                 ("importid", "import"))
+
+Docs = Dict[str, Dict[str, dict]]  # kind -> _id -> document
+
+
+def _ref_kind(key: str) -> Optional[str]:
+    key = key.lower()
+    for suffix, kind in _REF_SUFFIXES:
+        if key.endswith(suffix):
+            return kind
+    return None
+
+
+def references(doc: Any) -> Iterator[Tuple[str, str]]:
+    """(kind, _id) for every connection/script/lookup cache/export/import reference in doc."""
+    if isinstance(doc, dict):
+        for key, value in doc.items():
+            kind = _ref_kind(key)
+            if kind and isinstance(value, str) and value:
+                yield kind, value
+            else:
+                yield from references(value)
+    elif isinstance(doc, list):
+        for item in doc:
+            yield from references(item)
+
+
+# =============================================================================
+# Collection
+# =============================================================================
+
+def collect(client, integration_id: str, workers: int = DEFAULT_WORKERS) -> Docs:
+    """Fetch an integration's resource graph concurrently; raises RuntimeError on any API error."""
+    docs: Docs = {kind: {} for kind in KINDS}
+
+    def fetch(call):
+        method, endpoint = call
+        result = (client.get_all if method == "list" else client.get)(endpoint)
+        if is_error(result):
+            raise RuntimeError(f"GET {endpoint} failed: {result.get('message')} "
+                               f"{result.get('details', '')}".strip())
+        return call, result
+
+    def run(calls, pool):
+        for (method, endpoint), result in pool.map(fetch, calls):
+            if method == "list":
+                kind = endpoint.rsplit("/", 1)[1][:-1]  # /integrations/x/flows -> flow
+                for doc in result or []:
+                    docs[kind].setdefault(doc["_id"], doc)
+            else:
+                kind = next(k for k, prefix in ENDPOINTS.items() if endpoint.startswith(prefix + "/"))
+                docs[kind][result.get("_id") or endpoint.rsplit("/", 1)[1]] = result
+
+    base = f"/integrations/{integration_id}"
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        run([("get", base)] + [("list", f"{base}/{kind}s")
+                               for kind in ("flow", "export", "import", "connection")], pool)
+
+        # Flow steps shared with other integrations are not in the integration lists.
+        missing = {(kind, step_id) for flow in docs["flow"].values()
+                   for step_id, kind in flow_steps(flow) if step_id not in docs[kind]}
+        run([("get", f"{ENDPOINTS[kind]}/{rid}") for kind, rid in sorted(missing)], pool)
+
+        refs = {ref for source in ("flow", "export", "import", "connection")
+                for doc in docs[source].values() for ref in references(doc)}
+        run([("get", f"{ENDPOINTS[kind]}/{rid}") for kind, rid in sorted(refs)
+             if rid not in docs[kind]], pool)
+    return docs
+
+
+# =============================================================================
+# Normalization
+# =============================================================================
+
+def resource_names(docs: Docs) -> Dict[str, Tuple[str, str]]:
+    """_id -> (kind, unique name); duplicate names get "#2", "#3"... in _id order."""
+    names = {}
+    for kind in KINDS:
+        seen: Dict[str, int] = {}
+        for rid in sorted(docs.get(kind, {})):
+            base = str(docs[kind][rid].get("name") or rid)
+            seen[base] = seen.get(base, 0) + 1
+            names[rid] = (kind, base if seen[base] == 1 else f"{base}#{seen[base]}")
+    return names
+
+
+def normalize(doc: dict, names: Dict[str, Tuple[str, str]]) -> dict:
+    """Drop volatile fields and rewrite references to snapshot resources as "@kind:name"."""
+    def rewrite(value):
+        if isinstance(value, dict):
+            return {k: rewrite(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [rewrite(v) for v in value]
+        if isinstance(value, str) and value in names:
+            kind, name = names[value]
+            return "@integration" if kind == "integration" else f"@{kind}:{name}"
+        return value
+
+    return rewrite({k: v for k, v in doc.items() if k not in VOLATILE_FIELDS})
+
+
+def canonical(doc: Any) -> bytes:
+    return json.dumps(doc, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+class SnapshotStore:
+    """Content-addressed blobs plus named manifests under one directory."""
+
+    def __init__(self, root: Path = CACHE_DIR / "snapshots"):
+        self.root = Path(root)
+        self.blobs = self.root / "blobs"
+        self.manifests = self.root / "manifests"
+
+    def _write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blobs / digest[:2] / f"{digest}.json"
+
+    def put_blob(self, doc: Any) -> Tuple[str, bool]:
+        """Store doc under its SHA-256; returns (digest, written) - False if it was already there."""
+        data = canonical(doc)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if path.exists():
+            return digest, False
+        self._write(path, data)
+        return digest, True
+
+    def get_blob(self, digest: str) -> Any:
+        with open(self._blob_path(digest), encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, manifest: dict) -> Path:
+        path = self.manifests / f"{manifest['name']}.json"
+        self._write(path, json.dumps(manifest, indent=2, sort_keys=True).encode())
+        return path
+
+    def load(self, ref: str) -> dict:
+        """Manifest by snapshot name or by path to a manifest file."""
+        path = Path(ref) if ref.endswith(".json") else self.manifests / f"{ref}.json"
+        if not path.is_file():
+            raise FileNotFoundError(f"No snapshot {ref!r} in {self.manifests}")
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def list(self) -> List[dict]:
+        rows = []
+        for path in sorted(self.manifests.glob("*.json")) if self.manifests.is_dir() else []:
+            with open(path, encoding="utf-8") as f:
+                m = json.load(f)
+            rows.append({"name": m["name"], "env": m.get("env"), "integration": m["integration"]["name"],
+                         "_integrationId": m["integration"]["_id"], "taken_at": m["taken_at"],
+                         "resources": sum(len(v) for v in m["resources"].values())})
+        return sorted(rows, key=lambda r: r["taken_at"])
+
+
+_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def take_snapshot(client, store: SnapshotStore, integration_id: str, env: Optional[str] = None,
+                  name: Optional[str] = None, workers: int = DEFAULT_WORKERS) -> dict:
+    """Collect, normalize and store an integration; returns the saved manifest (plus blob counts)."""
+    docs = collect(client, integration_id, workers)
+    names = resource_names(docs)
+    integration = docs["integration"].get(integration_id) or {"name": integration_id}
+    taken_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if not name:
+        name = f"{integration.get('name') or integration_id}-{env or 'default'}-{taken_at}"
+    name = _NAME_RE.sub("-", name).strip("-")
+
+    resources: Dict[str, Dict[str, dict]] = {kind: {} for kind in KINDS}
+    written = reused = 0
+    for kind in KINDS:
+        for rid, doc in docs[kind].items():
+            digest, new = store.put_blob(normalize(doc, names))
+            written, reused = written + new, reused + (not new)
+            resources[kind][names[rid][1]] = {"_id": rid, "blob": digest}
+
+    manifest = {"name": name, "env": env, "taken_at": taken_at,
+                "integration": {"_id": integration_id, "name": integration.get("name")},
+                "resources": resources}
+    store.save(manifest)
+    return dict(manifest, blobs_written=written, blobs_reused=reused)
+
+
+# =============================================================================
+# Diff
+# =============================================================================
+
+def diff_docs(left: Any, right: Any, path: str = "") -> List[Dict[str, Any]]:
+    """Field-level differences: [{path, left, right}] (missing side is None)."""
+    if isinstance(left, dict) and isinstance(right, dict):
+        changes = []
+        for key in sorted(set(left) | set(right)):
+            sub = f"{path}.{key}" if path else key
+            if key not in left:
+                changes.append({"path": sub, "left": None, "right": right[key]})
+            elif key not in right:
+                changes.append({"path": sub, "left": left[key], "right": None})
+            else:
+                changes.extend(diff_docs(left[key], right[key], sub))
+        return changes
+    if isinstance(left, list) and isinstance(right, list) and left != right:
+        changes = []
+        for i in range(max(len(left), len(right))):
+            lv = left[i] if i < len(left) else None
+            rv = right[i] if i < len(right) else None
+            changes.extend(diff_docs(lv, rv, f"{path}[{i}]"))
+        return changes
+    return [] if left == right else [{"path": path, "left": left, "right": right}]
+
+
+def _pair(lres: Dict[str, dict], rres: Dict[str, dict]) -> Iterator[Tuple[str, Optional[dict], Optional[dict]]]:
+    """Pair entries by _id (same environment, survives renames), then by name."""
+    by_id = {e["_id"]: n for n, e in rres.items()}
+    matched_right = set()
+    unmatched_left = []
+    for name, entry in lres.items():
+        rname = by_id.get(entry["_id"])
+        if rname is not None:
+            matched_right.add(rname)
+            yield (name if name == rname else f"{name} -> {rname}"), entry, rres[rname]
+        else:
+            unmatched_left.append(name)
+    for name in unmatched_left:
+        if name in rres and name not in matched_right:
+            matched_right.add(name)
+            yield name, lres[name], rres[name]
+        else:
+            yield name, lres[name], None
+    for name in rres:
+        if name not in matched_right:
+            yield name, None, rres[name]
+
+
+def diff_snapshots(store: SnapshotStore, left: dict, right: dict,
+                   load: Optional[Callable[[str], Any]] = None) -> Dict[str, Any]:
+    """
+    Compare two manifests. Pairs with the same blob are counted as unchanged
+    without being read; the rest are loaded and diffed field by field.
+    Returns {unchanged, resources: [{kind, name, status, changes}]}.
+    """
+    load = load or store.get_blob
+    unchanged = 0
+    rows = []
+    for kind in KINDS:
+        pairs = _pair(left["resources"].get(kind, {}), right["resources"].get(kind, {}))
+        for name, lentry, rentry in sorted(pairs, key=lambda p: p[0]):
+            if lentry and rentry and lentry["blob"] == rentry["blob"]:
+                unchanged += 1
+                continue
+            if lentry and rentry:
+                changes = diff_docs(load(lentry["blob"]), load(rentry["blob"]))
+                status = "changed"
+            else:
+                changes = []
+                status = "removed" if lentry else "added"
+            rows.append({"kind": kind, "name": name, "status": status, "changes": changes})
+    return {"unchanged": unchanged, "resources": rows}
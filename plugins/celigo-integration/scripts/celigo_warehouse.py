@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Local Celigo job warehouse (SQLite) for health digests and EDI reports.
+
+Flow jobs are stored by `_id` and synced incrementally: each sync lists only
+jobs created since the previous sync (minus a settle window, so recently
+finished jobs pick up their final and resolved-error counts), then re-polls
+older jobs that were still queued or running. A 30-day digest after a 7-day
+one backfills just the missing days; everything after that is an indexed
+local query.
+
+One database per Celigo API key (accounts and sandbox share the API URL):
+    ~/.cache/celigo-integration/jobs-<key digest>.sqlite
+
+Usage:
+    from celigo_warehouse import JobWarehouse
+    with JobWarehouse.for_api_key(api_key) as wh:
+        wh.sync(list_jobs, get_job, since_dt)   # list_jobs(created_gte) -> jobs
+        stats = wh.health_stats(since_dt)
+"""
+
+import hashlib
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+CACHE_DIR = Path.home() / ".cache" / "celigo-integration"
+
+# Jobs created this long before the last sync are listed again on the next one:
+# open/resolved error counts keep moving for a while after a job ends.
+SETTLE_WINDOW = timedelta(hours=24)
+# Job states that are re-polled by id until they finish.
+ACTIVE_STATUSES = ("queued", "running")
+DEFAULT_REPOLL_WORKERS = 8
+
+_JOB_COLUMNS = (
+    "_id", "type", "status", "_flowId", "_integrationId", "createdAt", "startedAt",
+    "endedAt", "numError", "numSuccess", "numOpenError", "numResolved", "numPagesGenerated",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    _id TEXT PRIMARY KEY,
+    type TEXT,
+    status TEXT,
+    _flowId TEXT,
+    _integrationId TEXT,
+    createdAt TEXT,
+    startedAt TEXT,
+    endedAt TEXT,
+    numError INTEGER NOT NULL DEFAULT 0,
+    numSuccess INTEGER NOT NULL DEFAULT 0,
+    numOpenError INTEGER NOT NULL DEFAULT 0,
+    numResolved INTEGER NOT NULL DEFAULT 0,
+    numPagesGenerated INTEGER NOT NULL DEFAULT 0,
+    doc TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_type_ended ON jobs (type, endedAt);
+CREATE INDEX IF NOT EXISTS jobs_integration_created ON jobs (_integrationId, createdAt);
+CREATE INDEX IF NOT EXISTS jobs_flow_created ON jobs (_flowId, createdAt);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def celigo_ts(dt: datetime) -> str:
+    """Celigo's timestamp format (also what the warehouse compares against)."""
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _job_row(job: dict) -> tuple:
+    row = []
+    for col in _JOB_COLUMNS:
+        value = job.get(col)
+        if col.startswith("num"):
+            value = value or 0
+        row.append(value)
+    row.append(json.dumps(job, separators=(",", ":")))
+    return tuple(row)
+
+
+class JobWarehouse:
+    """SQLite store of Celigo flow jobs with incremental sync."""
+
+    def __init__(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(str(path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+
+    @classmethod
+    def for_api_key(cls, api_key: str, cache_dir: Path = CACHE_DIR) -> "JobWarehouse":
+        digest = hashlib.sha256(api_key.encode()).hexdigest()[:12]
+        return cls(Path(cache_dir) / f"jobs-{digest}.sqlite")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -- sync ----------------------------------------------------------------
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def upsert(self, jobs: Iterable[dict]) -> int:
+        rows = [_job_row(j) for j in jobs if isinstance(j, dict) and j.get("_id")]
+        placeholders = ", ".join("?" * (len(_JOB_COLUMNS) + 1))
+        self.conn.executemany(
+            f"INSERT OR REPLACE INTO jobs ({', '.join(_JOB_COLUMNS)}, doc) VALUES ({placeholders})",
+            rows)
+        return len(rows)
+
+    def sync(self, list_jobs: Callable[[str], Iterable[dict]],
+             get_job: Callable[[str], Any], since: datetime,
+             now: Optional[datetime] = None, refresh: bool = False,
+             workers: int = DEFAULT_REPOLL_WORKERS) -> Dict[str, Any]:
+        """
+        Bring the warehouse up to date for jobs created on or after `since`.
+
+        list_jobs(created_gte) lists jobs created at or after a Celigo
+        timestamp (all pages); get_job(job_id) fetches one job, returning an
+        error dict on failure. `refresh` relists the whole window.
+        """
+        now = now or datetime.now(timezone.utc)
+        since_ts = celigo_ts(since)
+        synced = self._meta("jobs_synced_at")
+        covered = self._meta("jobs_covered_since")
+
+        full = refresh or not synced or not covered or since_ts < covered
+        if full:
+            created_gte = since_ts
+            new_covered = since_ts if not covered else min(since_ts, covered)
+        else:
+            settle_from = celigo_ts(datetime.fromisoformat(synced.replace("Z", "+00:00"))
+                                    - SETTLE_WINDOW)
+            created_gte = max(since_ts, settle_from)
+            # Listing from later than settle_from leaves a gap before it.
+            new_covered = covered if created_gte == settle_from else created_gte
+
+        fetched = self.upsert(list_jobs(created_gte))
+
+        marks = ", ".join("?" * len(ACTIVE_STATUSES))
+        stale = [r[0] for r in self.conn.execute(
+            f"SELECT _id FROM jobs WHERE createdAt < ? "
+            f"AND (status IN ({marks}) OR endedAt IS NULL)",
+            (created_gte, *ACTIVE_STATUSES))]
+        repolled = 0
+        if stale:
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+                polled = list(pool.map(get_job, stale))
+            fresh = [j for j in polled if isinstance(j, dict) and j.get("_id")]
+            repolled = self.upsert(fresh)
+            gone = [jid for jid, j in zip(stale, polled)
+                    if isinstance(j, dict) and j.get("error") and j.get("status") == 404]
+            self.conn.executemany("DELETE FROM jobs WHERE _id = ?", [(g,) for g in gone])
+
+        self._set_meta("jobs_synced_at", celigo_ts(now))
+        self._set_meta("jobs_covered_since", new_covered)
+        self.conn.commit()
+        return {"listed_from": created_gte, "fetched": fetched, "repolled": repolled,
+                "full": full}
+
+    # -- queries -------------------------------------------------------------
+
+    def jobs(self, since: datetime, until: Optional[datetime] = None,
+             integration_id: Optional[str] = None, status: Optional[str] = None,
+             job_type: str = "flow") -> List[dict]:
+        """Stored jobs created in [since, until), as the API returned them."""
+        sql = "SELECT doc FROM jobs WHERE type = ? AND createdAt >= ?"
+        args: list = [job_type, celigo_ts(since)]
+        if until:
+            sql += " AND createdAt < ?"
+            args.append(celigo_ts(until))
+        if integration_id:
+            sql += " AND _integrationId = ?"
+            args.append(integration_id)
+        if status:
+            sql += " AND status = ?"
+            args.append(status)
+        return [json.loads(r[0]) for r in self.conn.execute(sql + " ORDER BY createdAt", args)]
+
+    def health_stats(self, cutoff: datetime, now: Optional[datetime] = None) -> dict:
+        """
+        Health digest aggregates for flow jobs that ended (or, still running,
+        were created) at or after cutoff. Same shape as health_digest_hook.js v4.
+        """
+        now = now or datetime.now(timezone.utc)
+        window = "type = 'flow' AND COALESCE(endedAt, createdAt) >= ?"
+        args = (celigo_ts(cutoff),)
+
+        totals = self.conn.execute(
+            "SELECT COUNT(*) AS runs, COALESCE(SUM(numError), 0) AS errors, "
+            "COALESCE(SUM(numSuccess), 0) AS successes, "
+            "COALESCE(SUM(numOpenError), 0) AS open_errors, "
+            "COALESCE(SUM(numResolved), 0) AS resolved, "
+            "MIN(endedAt) AS earliest, MAX(endedAt) AS latest "
+            f"FROM jobs WHERE {window}", args).fetchone()
+
+        errors_by_flow = {}
+        open_by_flow = {}
+        for r in self.conn.execute(
+                "SELECT COALESCE(_flowId, 'unknown') AS fid, SUM(numError) AS errors, "
+                "SUM(numSuccess) AS successes, SUM(numOpenError) AS open, "
+                "MIN(CASE WHEN numOpenError > 0 THEN COALESCE(endedAt, startedAt) END) AS oldest, "
+                "MAX(CASE WHEN numOpenError > 0 THEN COALESCE(endedAt, startedAt) END) AS newest "
+                f"FROM jobs WHERE {window} GROUP BY fid", args):
+            errors_by_flow[r["fid"]] = {"errors": r["errors"], "successes": r["successes"]}
+            if r["open"] > 0:
+                open_by_flow[r["fid"]] = {"open": r["open"], "oldest": r["oldest"],
+                                          "newest": r["newest"]}
+
+        aging = self.conn.execute(
+            "SELECT "
+            "COALESCE(SUM(CASE WHEN age < 24 THEN n END), 0), "
+            "COALESCE(SUM(CASE WHEN age >= 24 AND age < 72 THEN n END), 0), "
+            "COALESCE(SUM(CASE WHEN age >= 72 AND age < 168 THEN n END), 0), "
+            "COALESCE(SUM(CASE WHEN age >= 168 AND age < 336 THEN n END), 0), "
+            "COALESCE(SUM(CASE WHEN age >= 336 THEN n END), 0) "
+            "FROM (SELECT numOpenError AS n, "
+            "(julianday(?) - julianday(COALESCE(endedAt, startedAt))) * 24 AS age "
+            f"FROM jobs WHERE {window} AND numOpenError > 0 "
+            "AND COALESCE(endedAt, startedAt) IS NOT NULL)",
+            (celigo_ts(now),) + args).fetchone()
+
+        return {
+            "totalFlowRuns": totals["runs"],
+            "totalErrors": totals["errors"],
+            "totalSuccesses": totals["successes"],
+            "totalOpenErrors": totals["open_errors"],
+            "totalResolved": totals["resolved"],
+            "errorsByFlow": errors_by_flow,
+            "openErrorsByFlow": open_by_flow,
+            "agingBuckets": dict(zip(
+                ("under24h", "days1to3", "days3to7", "days7to14", "over14d"), aging)),
+            "earliest": totals["earliest"],
+            "latest": totals["latest"],
+        }
+
+    def flow_volume(self, since: datetime, until: Optional[datetime] = None) -> Dict[str, dict]:
+        """Per-flow job/document/error totals for flow jobs created in [since, until)."""
+        sql = ("SELECT _flowId, COUNT(*) AS jobs, SUM(numPagesGenerated) AS docs, "
+               "SUM(numSuccess) AS successes, SUM(numError) AS errors, "
+               "MAX(COALESCE(endedAt, createdAt)) AS last_run "
+               "FROM jobs WHERE type = 'flow' AND createdAt >= ?")
+        args: list = [celigo_ts(since)]
+        if until:
+            sql += " AND createdAt < ?"
+            args.append(celigo_ts(until))
+        return {r["_flowId"]: dict(r) for r in self.conn.execute(sql + " GROUP BY _flowId", args)
+                if r["_flowId"]}
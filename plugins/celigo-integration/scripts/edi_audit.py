@@ -20,7 +20,16 @@ Usage:
     python3 edi_audit.py [--since 24h|today|yesterday] [--until now|today]
                          [--partner NAME] [--direction inbound|outbound|both]
                          [--tz America/Chicago] [--json-only]
-                         [--exit-nonzero-on-mismatch]
+                         [--exit-nonzero-on-mismatch] [--workers N]
+                         [--warehouse]
+
+Data collection runs concurrently: the NS summary, Celigo flow discovery,
+per-integration job lists and NS detail queries share one bounded thread pool
+(--workers). A 429 from either service pauses every request to that host.
+With --warehouse, Celigo jobs are synced into the local job warehouse
+(celigo_warehouse.py) and read from there instead of listed per integration.
+The per-doc-type matching is edi_reconcile.py, shared with the n8n edi-ops
+tools.
 
 Exit codes:
     0  No mismatches (or --exit-nonzero-on-mismatch not set)
@@ -33,14 +42,20 @@ import json
 import os
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlsplit
 from urllib.request import Request, urlopen
 
+from celigo_paging import is_error, iter_pages
+from celigo_warehouse import JobWarehouse
+from edi_reconcile import INBOUND_TYPES, Reconciler, po_from_externalid, reconcile_counts
+
 try:
     from zoneinfo import ZoneInfo
 except ImportError:
@@ -63,6 +78,7 @@ NS_ENVIRONMENT = "production"
 
 DEFAULT_TIMEOUT = 30
 MAX_RETRIES = 3
+DEFAULT_WORKERS = 8  # concurrent Celigo/NS requests during data collection
 DEFAULT_TZ = "America/Chicago"
 
 # EDI doc type code → tuple of NS custrecord_twx_edi_type internal IDs.
@@ -113,9 +129,6 @@ NS_DOC_TYPE_MAP = {
     "864": (7,),   # Text Message (inbound) — Boot Barn, Shoe Carnival
 }
 
-INBOUND_TYPES = frozenset(["850", "812", "820", "824", "852", "860", "864"])
-OUTBOUND_TYPES = frozenset(["810", "846", "855", "856"])
-
 # NS trading partner field value for Celigo-integrated partners.
 # Partners with int=3 are on TrueCommerce and must be excluded from this audit.
 NS_CELIGO_INT = 6
@@ -134,9 +147,6 @@ _EDI_FLOW_RE = re.compile(
 # Integration name prefix for EDI integrations (matches "EDI - " and "EDI | ")
 _EDI_INTEGRATION_RE = re.compile(r"^EDI\s*[-|]\s*", re.IGNORECASE)
 
-# Regex to extract PO number from NS externalid: HIST_{PO}_{PARTNER}_00
-_EXTERNALID_RE = re.compile(r"^HIST_(?P<po>.+?)_[^_]+_\d+$")
-
 
 # ---------------------------------------------------------------------------
 # Utilities
@@ -224,27 +234,74 @@ def _ns_date(dt: datetime) -> str:
 # HTTP helpers
 # ---------------------------------------------------------------------------
 
-def _http_get(url: str, headers: dict = None, timeout: int = DEFAULT_TIMEOUT) -> dict:
+class _Backoff:
+    """429 backoff shared by all request threads talking to one host."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self) -> None:
+        while True:
+            with self._lock:
+                delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def trip(self, seconds: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+_BACKOFFS: dict = {}
+_BACKOFFS_LOCK = threading.Lock()
+
+
+def _backoff_for(url: str) -> _Backoff:
+    host = urlsplit(url).netloc
+    with _BACKOFFS_LOCK:
+        if host not in _BACKOFFS:
+            _BACKOFFS[host] = _Backoff()
+        return _BACKOFFS[host]
+
+
+def _throttle_delay(e: HTTPError, attempt: int) -> float:
+    retry_after = e.headers.get("Retry-After") if e.headers else None
+    if retry_after and retry_after.strip().isdigit():
+        return float(retry_after)
+    return 2 ** attempt * 10
+
+def _http_get_page(url: str, headers: dict = None,
+                   timeout: int = DEFAULT_TIMEOUT) -> tuple:
+    """GET url; returns (body, lowercased response headers)."""
     headers = headers or {}
+    backoff = _backoff_for(url)
     for attempt in range(MAX_RETRIES):
+        backoff.wait()
         try:
             req = Request(url, headers=headers)
             with urlopen(req, timeout=timeout) as r:
                 body = r.read().decode()
-                return json.loads(body) if body.strip() else []
+                resp_headers = {k.lower(): v for k, v in r.headers.items()}
+                return (json.loads(body) if body.strip() else []), resp_headers
         except HTTPError as e:
             if e.code == 429 and attempt < MAX_RETRIES - 1:
-                time.sleep(2 ** attempt * 10)
+                backoff.trip(_throttle_delay(e, attempt))
                 continue
             body = e.read().decode() if e.fp else ""
-            return {"error": True, "status": e.code, "message": e.reason, "details": body}
+            return {"error": True, "status": e.code, "message": e.reason, "details": body}, {}
         except URLError as e:
             if attempt < MAX_RETRIES - 1:
                 time.sleep(2 ** attempt)
                 continue
             print(f"Fatal: HTTP request failed: {e.reason}", file=sys.stderr)
             sys.exit(2)
-    return {"error": True, "message": "Max retries exceeded"}
+    return {"error": True, "message": "Max retries exceeded"}, {}
+
+
+def _http_get(url: str, headers: dict = None, timeout: int = DEFAULT_TIMEOUT) -> dict:
+    return _http_get_page(url, headers, timeout)[0]
 
 
 def _http_post(url: str, payload: dict, headers: dict = None,
@@ -252,14 +309,16 @@ def _http_post(url: str, payload: dict, headers: dict = None,
     headers = headers or {}
     headers["Content-Type"] = "application/json"
     body = json.dumps(payload).encode()
+    backoff = _backoff_for(url)
     for attempt in range(MAX_RETRIES):
+        backoff.wait()
         try:
             req = Request(url, data=body, headers=headers, method="POST")
             with urlopen(req, timeout=timeout) as r:
                 return json.loads(r.read().decode())
         except HTTPError as e:
             if e.code == 429 and attempt < MAX_RETRIES - 1:
-                time.sleep(2 ** attempt * 10)
+                backoff.trip(_throttle_delay(e, attempt))
                 continue
             body_err = e.read().decode() if e.fp else ""
             return {"error": True, "status": e.code, "message": e.reason, "details": body_err}
@@ -307,12 +366,19 @@ def _celigo_get(api_url: str, api_key: str, endpoint: str,
         if params:
             url += "?" + urlencode(params)
     headers = {"Authorization": f"Bearer {api_key}", "Accept": "application/json"}
-    result = _http_get(url, headers)
-    if isinstance(result, dict) and result.get("error"):
-        print(f"Fatal: Celigo API error on {endpoint}: {result.get('message')}",
-              file=sys.stderr)
-        sys.exit(2)
-    return result if isinstance(result, list) else [result]
+    # Follows Link rel="next" (e.g. /jobs beyond pageSize); the next page is
+    # fetched while the current one is being collected.
+    items = []
+    for page in iter_pages(lambda u: _http_get_page(u, headers), url):
+        if is_error(page):
+            print(f"Fatal: Celigo API error on {endpoint}: {page.get('message')}",
+                  file=sys.stderr)
+            sys.exit(2)
+        if isinstance(page, list):
+            items.extend(page)
+        else:
+            items.append(page)
+    return items
 
 
 # ---------------------------------------------------------------------------
@@ -448,10 +514,7 @@ def _ns_edi_history_outbound(doc_type_ids: tuple, since_dt: datetime,
 
 
 def _extract_po_from_externalid(externalid: str) -> Optional[str]:
-    if not externalid:
-        return None
-    m = _EXTERNALID_RE.match(externalid)
-    return m.group("po") if m else None
+    return po_from_externalid(externalid)
 
 
 # ---------------------------------------------------------------------------
@@ -459,26 +522,29 @@ def _extract_po_from_externalid(externalid: str) -> Optional[str]:
 # ---------------------------------------------------------------------------
 
 def _get_edi_flows(api_url: str, api_key: str,
-                   partner_filter: Optional[str] = None) -> list:
+                   partner_filter: Optional[str] = None,
+                   pool: Optional[ThreadPoolExecutor] = None) -> list:
     """
     Return all enabled production EDI flows, parsed for partner/doc-type/direction.
 
     Flow naming convention: "PartnerName - 850 IB - Description"
     Integration naming convention: "EDI - PartnerName" (sandbox=False for production)
+
+    With a pool, the per-integration flow lists are fetched concurrently.
     """
     all_ints = _celigo_get(api_url, api_key, "/integrations")
+    # Skip sandbox (non-production) integrations; only "EDI - ..." or "EDI | ..."
+    edi_ints = [i for i in all_ints
+                if i.get("sandbox") is not True
+                and _EDI_INTEGRATION_RE.match(i.get("name", ""))]
+
+    def _flows(intg):
+        return _celigo_get(api_url, api_key, f"/integrations/{intg['_id']}/flows")
+
+    flow_lists = pool.map(_flows, edi_ints) if pool else map(_flows, edi_ints)
     result = []
-    for intg in all_ints:
+    for intg, flows in zip(edi_ints, flow_lists):
         name = intg.get("name", "")
-        # Skip sandbox (non-production) integrations
-        if intg.get("sandbox") is True:
-            continue
-        # Only process integrations named "EDI - ..." or "EDI | ..."
-        if not _EDI_INTEGRATION_RE.match(name):
-            continue
-
-        # List flows within this integration
-        flows = _celigo_get(api_url, api_key, f"/integrations/{intg['_id']}/flows")
         for flow in flows:
             # Skip disabled flows
             if flow.get("disabled"):
@@ -507,6 +573,18 @@ def _get_edi_flows(api_url: str, api_key: str,
     return result
 
 
+def _sync_job_warehouse(api_url: str, api_key: str, since_dt: datetime) -> None:
+    """Incrementally sync flow jobs created since since_dt into the local warehouse."""
+    headers = {"Authorization": f"Bearer {api_key}", "Accept": "application/json"}
+
+    def list_jobs(created_gte: str) -> list:
+        return _celigo_get(api_url, api_key, "/jobs", {
+            "type": "flow", "createdAt_gte": created_gte, "pageSize": 1000})
+
+    with JobWarehouse.for_api_key(api_key) as wh:
+        wh.sync(list_jobs, lambda job_id: _http_get(f"{api_url}/jobs/{job_id}", headers), since_dt)
+
+
 def _get_jobs_for_integration(api_url: str, api_key: str,
                               integration_id: str, since_iso: str,
                               until_iso: str) -> list:
@@ -531,115 +609,35 @@ def _reconcile_inbound(celigo_docs: int, ns_rows: list,
     Compare Celigo EDI document count (numPagesGenerated) against NS EDI History rows.
     Flags NS processing failures, 850s without linked SOs, and Celigo-only activity.
     """
-    mismatches = []
-    ns_success_rows = [r for r in ns_rows if str(r.get("status", "")) == "2"]
-    ns_error_rows = [r for r in ns_rows if str(r.get("status", "")) != "2"]
-
-    # NS processing failures
-    for row in ns_error_rows:
-        mismatches.append({
-            "bucket": "ns_status_error",
-            "type": "ns_processing_failed",
-            "doc_type": doc_type,
-            "ns_id": row.get("id"),
-            "externalid": row.get("externalid"),
-            "ns_status": row.get("status"),
-            "created": row.get("created"),
-        })
-
-    # For 850: flag POs that landed in NS but have no linked SO
-    if doc_type == "850":
-        for row in ns_success_rows:
-            if not row.get("transaction_id"):
-                mismatches.append({
-                    "bucket": "ns_status_error",
-                    "type": "pos_without_order",
-                    "doc_type": doc_type,
-                    "ns_id": row.get("id"),
-                    "externalid": row.get("externalid"),
-                    "created": row.get("created"),
-                })
-
-    # Celigo processed EDI docs but NS has nothing in the window
-    if celigo_docs > 0 and len(ns_rows) == 0:
-        mismatches.append({
-            "bucket": "celigo_success_ns_missing",
-            "type": "no_ns_records",
-            "doc_type": doc_type,
-            "celigo_docs": celigo_docs,
-            "ns_record_count": 0,
-            "note": f"Celigo processed {celigo_docs} EDI doc(s) but NS has no {doc_type} history in window",
-        })
-
-    return mismatches
+    r = Reconciler(doc_type, "inbound")
+    r.add_counts(docs=celigo_docs)
+    r.add_ns(ns_rows)
+    return r.mismatches()
 
 
 def _reconcile_outbound(celigo_docs: int, ns_rows: list,
-                        doc_type: str) -> list:
+                        doc_type: str, celigo_jobs: int = 0) -> list:
     """
     For outbound, NS is the source of truth for sent records.
     Flags when NS shows sent documents but Celigo had no activity.
     """
-    mismatches = []
-    ns_count = len(ns_rows)
-
-    if ns_count > 0 and celigo_docs == 0:
-        mismatches.append({
-            "bucket": "ns_sent_celigo_missing",
-            "type": "no_celigo_activity",
-            "doc_type": doc_type,
-            "ns_sent_count": ns_count,
-            "celigo_docs": 0,
-            "note": f"NS has {ns_count} sent {doc_type} record(s) but Celigo had no activity",
-        })
-
-    return mismatches
+    r = Reconciler(doc_type, "outbound")
+    r.add_counts(jobs=celigo_jobs, docs=celigo_docs)
+    r.add_ns(ns_rows)
+    return r.mismatches()
 
 
 # ---------------------------------------------------------------------------
-# Main audit runner
+# Concurrent data collection
 # ---------------------------------------------------------------------------
 
-def run_audit(since: str, until: Optional[str], direction: str,
-              partner_filter: Optional[str], env_name: Optional[str],
-              tz_name: str = DEFAULT_TZ) -> dict:
-    since_dt = _parse_since(since, tz_name)
-    until_dt = _parse_until(until, tz_name)
-    since_iso = _iso(since_dt)
-    until_iso = _iso(until_dt)
-
-    api_url, api_key = _get_celigo_creds(env_name)
-
-    _EMPTY = {
-        "audit_window": {
-            "since": since_iso,
-            "until": until_iso,
-            "since_local": _format_local(since_dt, tz_name),
-            "until_local": _format_local(until_dt, tz_name),
-            "tz": tz_name,
-        },
-        "direction": direction,
-        "partner_filter": partner_filter,
-        "flows_scanned": 0,
-        "total_mismatches": 0,
-        "buckets": {
-            "celigo_success_ns_missing": [],
-            "ns_sent_celigo_missing": [],
-            "ns_status_error": [],
-        },
-    }
-
-    # --- Step 1: NS is the source of truth — one aggregated query for all doc types ---
-    # This tells us exactly what was exchanged in the window without touching Celigo flows.
-    # ns_rev_map: type_id_str → doc_type (supports multiple type_ids per doc type)
+def _merge_ns_summary(ns_agg_raw: dict) -> dict:
+    """Fold {type_id_str: counts} into {doc_type_code: counts} (multi type_id doc types)."""
     ns_rev_map = {}
     for dt_code, type_ids in NS_DOC_TYPE_MAP.items():
         for tid in type_ids:
             ns_rev_map[str(tid)] = dt_code
-    ns_agg_raw = _ns_edi_summary(since_dt, until_dt)  # {type_id_str: {total, ok, err}}
-
-    # Merge multi-type_id doc types (e.g. 855 uses both type_id=4 and type_id=7)
-    ns_agg: dict = {}  # {doc_type_code: {total, ok, err}}
+    ns_agg: dict = {}
     for type_id_str, counts in ns_agg_raw.items():
         dt_code = ns_rev_map.get(type_id_str)
         if not dt_code:
@@ -649,29 +647,11 @@ def run_audit(since: str, until: Optional[str], direction: str,
         ns_agg[dt_code]["total"] += counts["total"]
         ns_agg[dt_code]["ok"] += counts["ok"]
         ns_agg[dt_code]["err"] += counts["err"]
+    return ns_agg
 
-    # --- Step 2: Celigo flow discovery (needed for cross-validation) ---
-    # Only enumerate flows — jobs are fetched per-integration below.
-    edi_flows = _get_edi_flows(api_url, api_key, partner_filter)
-    if not edi_flows and not ns_agg:
-        _EMPTY["summary"] = "No EDI activity found in NS and no matching production flows."
-        return _EMPTY
 
-    # Group flows by integration to minimise Celigo API calls
-    intg_flows: dict = {}
-    for flow in edi_flows:
-        intg_flows.setdefault(flow["_integrationId"], []).append(flow)
-
-    jobs_by_flow: dict = {}   # _flowId -> [job, ...]
-    for intg_id in intg_flows:
-        intg_jobs = _get_jobs_for_integration(api_url, api_key, intg_id,
-                                              since_iso, until_iso)
-        for job in intg_jobs:
-            fid = job.get("_flowId")
-            if fid:
-                jobs_by_flow.setdefault(fid, []).append(job)
-
-    # --- Step 3: Aggregate Celigo activity per doc_type ---
+def _aggregate_celigo(edi_flows: list, jobs_by_flow: dict, direction: str) -> tuple:
+    """Celigo activity per doc_type: ({doc_type: counts + direction}, flows scanned)."""
     celigo_by_doctype: dict = {}
     scanned = 0
     for flow in edi_flows:
@@ -705,40 +685,148 @@ def run_audit(since: str, until: Optional[str], direction: str,
         celigo_by_doctype[dt]["flow_count"] += 1
         celigo_by_doctype[dt]["job_count"] += len(flow_jobs)
         celigo_by_doctype[dt]["active_job_count"] += flow_active
+    return celigo_by_doctype, scanned
+
+
+def _doc_type_direction(dt: str, celigo_by_doctype: dict) -> str:
+    """
+    "IB" or "OB". Celigo flows are the ground truth when present (e.g. 856 is
+    OB for us even though the spec allows both directions); otherwise fall
+    back to the type classification.
+    """
+    if dt in celigo_by_doctype:
+        return celigo_by_doctype[dt]["direction"]
+    return "IB" if dt in INBOUND_TYPES else "OB"
+
+
+def _needs_ns_rows(dt: str, ns_counts: dict) -> bool:
+    return dt == "850" or ns_counts.get("err", 0) > 0
+
+
+def _collect(api_url: str, api_key: str, since_dt: datetime, until_dt: datetime,
+             since_iso: str, until_iso: str, direction: str,
+             partner_filter: Optional[str], workers: int,
+             warehouse: bool = False) -> Optional[dict]:
+    """
+    Fetch everything the reconciliation needs, with at most `workers` requests
+    in flight. The NS summary runs alongside Celigo flow discovery; job lists
+    and NS detail queries are then issued together. With warehouse, one job
+    warehouse sync replaces the per-integration job lists. Returns None when
+    neither side has anything to audit.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        ns_future = pool.submit(_ns_edi_summary, since_dt, until_dt)
+        sync_future = (pool.submit(_sync_job_warehouse, api_url, api_key, since_dt)
+                       if warehouse else None)
+        edi_flows = _get_edi_flows(api_url, api_key, partner_filter, pool)
+
+        intg_ids = list(dict.fromkeys(f["_integrationId"] for f in edi_flows))
+        job_futures = [] if warehouse else [
+            pool.submit(_get_jobs_for_integration, api_url, api_key,
+                        intg_id, since_iso, until_iso)
+            for intg_id in intg_ids]
+
+        ns_agg = _merge_ns_summary(ns_future.result())
+        if not edi_flows and not ns_agg:
+            return None
+
+        # Directions come from the flows alone, so the detail queries need not
+        # wait for the job lists.
+        flow_dirs, _ = _aggregate_celigo(edi_flows, {}, direction)
+        row_futures = {}
+        for dt in sorted(set(flow_dirs) | set(ns_agg)):
+            is_inbound = _doc_type_direction(dt, flow_dirs) == "IB"
+            if (direction == "inbound" and not is_inbound) or \
+                    (direction == "outbound" and is_inbound):
+                continue
+            type_ids = NS_DOC_TYPE_MAP.get(dt)
+            if not type_ids or not _needs_ns_rows(dt, ns_agg.get(dt, {})):
+                continue
+            fetch = _ns_edi_history_inbound if is_inbound else _ns_edi_history_outbound
+            row_futures[dt] = pool.submit(fetch, type_ids, since_dt, until_dt)
+
+        job_lists = [f.result() for f in job_futures]
+        if sync_future:
+            sync_future.result()
+            with JobWarehouse.for_api_key(api_key) as wh:
+                job_lists = [wh.jobs(since_dt, until_dt, integration_id=intg_id,
+                                     status="completed")
+                             for intg_id in intg_ids]
+
+        jobs_by_flow: dict = {}   # _flowId -> [job, ...]
+        for intg_jobs in job_lists:
+            for job in intg_jobs:
+                fid = job.get("_flowId")
+                if fid:
+                    jobs_by_flow.setdefault(fid, []).append(job)
+        ns_rows = {dt: f.result() for dt, f in row_futures.items()}
+
+    celigo_by_doctype, scanned = _aggregate_celigo(edi_flows, jobs_by_flow, direction)
+    return {
+        "ns_agg": ns_agg,
+        "celigo_by_doctype": celigo_by_doctype,
+        "scanned": scanned,
+        "ns_rows": ns_rows,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Main audit runner
+# ---------------------------------------------------------------------------
+
+def run_audit(since: str, until: Optional[str], direction: str,
+              partner_filter: Optional[str], env_name: Optional[str],
+              tz_name: str = DEFAULT_TZ, workers: int = DEFAULT_WORKERS,
+              warehouse: bool = False) -> dict:
+    since_dt = _parse_since(since, tz_name)
+    until_dt = _parse_until(until, tz_name)
+    since_iso = _iso(since_dt)
+    until_iso = _iso(until_dt)
+
+    api_url, api_key = _get_celigo_creds(env_name)
+
+    _EMPTY = {
+        "audit_window": {
+            "since": since_iso,
+            "until": until_iso,
+            "since_local": _format_local(since_dt, tz_name),
+            "until_local": _format_local(until_dt, tz_name),
+            "tz": tz_name,
+        },
+        "direction": direction,
+        "partner_filter": partner_filter,
+        "flows_scanned": 0,
+        "total_mismatches": 0,
+        "buckets": {
+            "celigo_success_ns_missing": [],
+            "ns_sent_celigo_missing": [],
+            "ns_status_error": [],
+        },
+    }
+
+    # --- Steps 1-3: collect NS and Celigo data concurrently, aggregate per doc_type ---
+    data = _collect(api_url, api_key, since_dt, until_dt, since_iso, until_iso,
+                    direction, partner_filter, workers, warehouse)
+    if data is None:
+        _EMPTY["summary"] = "No EDI activity found in NS and no matching production flows."
+        return _EMPTY
+    ns_agg = data["ns_agg"]
+    celigo_by_doctype = data["celigo_by_doctype"]
+    scanned = data["scanned"]
+    ns_rows_by_dt = data["ns_rows"]
 
     # --- Step 4: Build combined doc-type set (NS activity + Celigo activity) ---
     # Include doc types seen in NS even if no Celigo flows matched (and vice versa).
     # ns_agg is now keyed by doc_type directly (merged from multiple type_ids).
     all_doc_types = set(celigo_by_doctype.keys()) | set(ns_agg.keys())
 
-    # --- Step 5: For 850 (needs per-row SO-link check) and types with NS errors,
-    #             fetch individual rows; otherwise use aggregated counts ---
-    ns_rows_cache: dict = {}  # dt -> list of NS rows (fetched on demand)
-
-    def _get_ns_rows(dt: str, inbound: bool) -> list:
-        if dt not in ns_rows_cache:
-            type_ids = NS_DOC_TYPE_MAP.get(dt)
-            if not type_ids:
-                ns_rows_cache[dt] = []
-            elif inbound:
-                ns_rows_cache[dt] = _ns_edi_history_inbound(type_ids, since_dt, until_dt)
-            else:
-                ns_rows_cache[dt] = _ns_edi_history_outbound(type_ids, since_dt, until_dt)
-        return ns_rows_cache[dt]
-
     # --- Step 6: Reconcile per doc_type ---
     all_mismatches = []
     doc_type_summary = {}
     for dt in sorted(all_doc_types):
         ns_counts = ns_agg.get(dt, {"total": 0, "ok": 0, "err": 0})
 
-        # Direction: use actual flow data when available; fall back to type classification.
-        # Celigo flows are the ground truth (e.g. 856 is OB for us even though the spec
-        # allows both directions).
-        if dt in celigo_by_doctype:
-            actual_dir = celigo_by_doctype[dt]["direction"]   # "IB" or "OB"
-        else:
-            actual_dir = "IB" if dt in INBOUND_TYPES else "OB"
+        actual_dir = _doc_type_direction(dt, celigo_by_doctype)
         is_inbound = actual_dir == "IB"
         dir_label = "inbound" if is_inbound else "outbound"
 
@@ -751,35 +839,20 @@ def run_audit(since: str, until: Optional[str], direction: str,
         if direction == "outbound" and is_inbound:
             continue
 
-        # Fetch per-row detail only when needed for deep reconciliation:
+        # Per-row detail (prefetched by _collect) only where deep reconciliation needs it:
         #   - 850: check each row's transaction_id (SO-link audit)
         #   - any type with NS errors: surface the individual failed rows
-        if dt == "850" or ns_counts["err"] > 0:
-            ns_rows = _get_ns_rows(dt, is_inbound)
+        if _needs_ns_rows(dt, ns_counts):
+            ns_rows = ns_rows_by_dt.get(dt, [])
             mismatches = (_reconcile_inbound(activity["num_docs"], ns_rows, dt)
                           if is_inbound
-                          else _reconcile_outbound(activity["num_docs"], ns_rows, dt))
+                          else _reconcile_outbound(activity["num_docs"], ns_rows, dt,
+                                                   activity["job_count"]))
         else:
             # Use aggregate counts only — no per-row fetch needed
-            mismatches = []
-            if is_inbound and activity["num_docs"] > 0 and ns_counts["total"] == 0:
-                mismatches.append({
-                    "bucket": "celigo_success_ns_missing",
-                    "type": "no_ns_records",
-                    "doc_type": dt,
-                    "celigo_docs": activity["num_docs"],
-                    "ns_record_count": 0,
-                    "note": f"Celigo processed {activity['num_docs']} EDI doc(s) but NS has no {dt} history in window",
-                })
-            elif not is_inbound and ns_counts["ok"] > 0 and activity["job_count"] == 0:
-                mismatches.append({
-                    "bucket": "ns_sent_celigo_missing",
-                    "type": "no_celigo_activity",
-                    "doc_type": dt,
-                    "ns_sent_count": ns_counts["ok"],
-                    "celigo_docs": 0,
-                    "note": f"NS has {ns_counts['ok']} sent {dt} record(s) but Celigo ran 0 jobs",
-                })
+            mismatches = reconcile_counts(dt, dir_label, activity["num_docs"],
+                                          activity["job_count"], ns_counts["total"],
+                                          ns_counts["ok"])
 
         all_mismatches.extend(mismatches)
         doc_type_summary[dt] = {
@@ -892,6 +965,10 @@ def _build_parser() -> argparse.ArgumentParser:
                    help="Emit only JSON output; suppress human-readable summary")
     p.add_argument("--exit-nonzero-on-mismatch", action="store_true",
                    help="Exit with code 1 when mismatches are found (useful in CI)")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                   help="Concurrent Celigo/NetSuite requests during data collection")
+    p.add_argument("--warehouse", action="store_true",
+                   help="Read Celigo jobs from the local job warehouse (synced incrementally)")
     return p
 
 
@@ -906,6 +983,8 @@ def main():
         partner_filter=args.partner,
         env_name=args.env,
         tz_name=args.tz,
+        workers=args.workers,
+        warehouse=args.warehouse,
     )
 
     print(json.dumps(result, indent=2))
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+EDI Reconciliation Engine
+
+Matches Celigo EDI activity against NetSuite EDI History
+(customrecord_twx_edi_history) for one doc type. This is the one
+implementation behind edi_audit.py and the n8n edi-ops tools, which call it
+over HTTP (see `serve`).
+
+Both sides are consumed as streams, a page or a row at a time:
+
+  Celigo    flow jobs (counted: numPagesGenerated = EDI documents) and/or
+            keyed documents carrying a PO number or external ID
+            (key / po_number / po / externalid)
+  NetSuite  EDI History rows (id, externalid, status, transaction_id, created),
+            keyed by the PO parsed from externalid (HIST_{PO}_{PARTNER}_NN)
+
+Keyed records are matched with a symmetric hash join: each arriving key
+probes the other side's table of unmatched keys and is either paired off or
+parked. Memory holds only the unmatched keys, matching is O(1) per row, and
+either side may arrive first, in any page size. Row-level NS checks (status
+errors, 850s without a linked Sales Order) are made as rows stream past.
+
+Mismatch buckets (same as edi_audit.py):
+  celigo_success_ns_missing   inbound: Celigo processed it, NS has no record
+  ns_sent_celigo_missing      outbound: NS shows it sent, Celigo has no activity
+  ns_status_error             NS processing failed / 850 without Sales Order
+
+Usage:
+    python3 edi_reconcile.py match --doc-type 850 --celigo jobs.jsonl --netsuite ns.json
+    python3 edi_reconcile.py serve [--host 127.0.0.1] [--port 8787]
+
+Input files are a JSON array or JSON Lines (one record, or one page array,
+per line; read incrementally). "-" reads stdin.
+
+HTTP (serve):
+    POST /reconcile   {"doc_type": "850", "direction": "inbound" (optional),
+                       "celigo": [...], "netsuite": [...]}  -> result JSON
+    GET  /health
+    When EDI_RECONCILE_TOKEN is set, requests must send it as X-API-Key.
+
+Exit codes (match):
+    0  No mismatches (or --exit-nonzero-on-mismatch not set)
+    1  Mismatches found (when --exit-nonzero-on-mismatch is set)
+    2  Bad input
+"""
+
+import argparse
+import hmac
+import json
+import os
+import re
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional
+
+INBOUND_TYPES = frozenset(["850", "812", "820", "824", "852", "860", "864"])
+OUTBOUND_TYPES = frozenset(["810", "846", "855", "856"])
+
+# PO number inside an NS externalid: HIST_{PO}_{PARTNER}_00
+_EXTERNALID_RE = re.compile(r"^HIST_(?P<po>.+?)_[^_]+_\d+$")
+
+# Fields that carry a match key on a Celigo document, in order of preference
+CELIGO_KEY_FIELDS = ("key", "po_number", "po", "externalid")
+
+DEFAULT_PORT = 8787
+MAX_BODY_BYTES = 256 * 1024 * 1024
+
+
+# ---------------------------------------------------------------------------
+# Keys
+# ---------------------------------------------------------------------------
+
+def po_from_externalid(externalid: Optional[str]) -> Optional[str]:
+    if not externalid:
+        return None
+    m = _EXTERNALID_RE.match(externalid)
+    return m.group("po") if m else None
+
+
+def _norm(value) -> Optional[str]:
+    text = str(value).strip().upper() if value is not None else ""
+    return text or None
+
+
+def ns_key(row: dict) -> Optional[str]:
+    """PO number from externalid, else the externalid itself."""
+    externalid = row.get("externalid")
+    return _norm(po_from_externalid(externalid) or externalid)
+
+
+def celigo_key(record: dict) -> Optional[str]:
+    """Match key of a keyed Celigo document; None for a plain flow job."""
+    for field in CELIGO_KEY_FIELDS:
+        value = record.get(field)
+        if value:
+            return _norm(po_from_externalid(value) or value) if field == "externalid" else _norm(value)
+    return None
+
+
+def default_direction(doc_type: str) -> str:
+    return "outbound" if str(doc_type) in OUTBOUND_TYPES else "inbound"
+
+
+def _ns_ok(row: dict) -> bool:
+    return str(row.get("status", "")) == "2"
+
+
+# ---------------------------------------------------------------------------
+# Count-only reconciliation
+# ---------------------------------------------------------------------------
+
+def reconcile_counts(doc_type: str, direction: str, celigo_docs: int, celigo_jobs: int,
+                     ns_total: int, ns_ok: int) -> List[dict]:
+    """
+    Mismatches that aggregate counts alone can show: inbound documents Celigo
+    processed with no NS history at all, or outbound records NS sent with no
+    Celigo activity at all.
+    """
+    if direction == "inbound":
+        if celigo_docs > 0 and ns_total == 0:
+            return [{
+                "bucket": "celigo_success_ns_missing",
+                "type": "no_ns_records",
+                "doc_type": doc_type,
+                "celigo_docs": celigo_docs,
+                "ns_record_count": 0,
+                "note": f"Celigo processed {celigo_docs} EDI doc(s) but NS has no {doc_type} history in window",
+            }]
+    elif ns_ok > 0 and celigo_docs == 0 and celigo_jobs == 0:
+        return [{
+            "bucket": "ns_sent_celigo_missing",
+            "type": "no_celigo_activity",
+            "doc_type": doc_type,
+            "ns_sent_count": ns_ok,
+            "celigo_docs": 0,
+            "note": f"NS has {ns_ok} sent {doc_type} record(s) but Celigo had no activity",
+        }]
+    return []
+
+
+# ---------------------------------------------------------------------------
+# Streaming matcher
+# ---------------------------------------------------------------------------
+
+class Reconciler:
+    """
+    Reconcile one doc type. Feed pages with add_celigo()/add_ns() in any
+    order, then call result().
+    """
+
+    def __init__(self, doc_type: str, direction: Optional[str] = None):
+        self.doc_type = str(doc_type)
+        self.direction = direction or default_direction(self.doc_type)
+        if self.direction not in ("inbound", "outbound"):
+            raise ValueError(f"direction must be inbound or outbound, not {direction!r}")
+        self.celigo = {"jobs": 0, "docs": 0, "job_errors": 0, "keyed_docs": 0}
+        self.netsuite = {"records": 0, "ok": 0, "failed": 0,
+                         "with_transaction": 0, "without_transaction": 0}
+        self.matched = 0
+        self._row_mismatches: List[dict] = []
+        # key -> unmatched records (compact), one per occurrence
+        self._celigo_open: Dict[str, List[dict]] = {}
+        self._ns_open: Dict[str, List[dict]] = {}
+
+    def _join(self, key: str, record: dict, probe: Dict[str, List[dict]],
+              park: Dict[str, List[dict]]) -> None:
+        waiting = probe.get(key)
+        if waiting:
+            waiting.pop()
+            if not waiting:
+                del probe[key]
+            self.matched += 1
+        else:
+            park.setdefault(key, []).append(record)
+
+    def add_counts(self, jobs: int = 0, docs: int = 0, job_errors: int = 0) -> None:
+        """Celigo activity already aggregated elsewhere (no per-job records)."""
+        self.celigo["jobs"] += jobs
+        self.celigo["docs"] += docs
+        self.celigo["job_errors"] += job_errors
+
+    def add_celigo(self, records: Iterable[dict]) -> None:
+        for rec in records:
+            key = celigo_key(rec)
+            if key is None:
+                self.add_counts(1, rec.get("numPagesGenerated") or 0, rec.get("numError") or 0)
+                continue
+            self.celigo["keyed_docs"] += 1
+            self._join(key, {"po": key, "_flowId": rec.get("_flowId")},
+                       self._ns_open, self._celigo_open)
+
+    def add_ns(self, rows: Iterable[dict]) -> None:
+        is_850 = self.doc_type == "850"
+        for row in rows:
+            ok = _ns_ok(row)
+            has_txn = bool(row.get("transaction_id"))
+            ns = self.netsuite
+            ns["records"] += 1
+            ns["ok" if ok else "failed"] += 1
+            ns["with_transaction"] += has_txn
+            ns["without_transaction"] += ok and not has_txn
+            key = ns_key(row)
+
+            if not ok:
+                self._row_mismatches.append({
+                    "bucket": "ns_status_error",
+                    "type": "ns_processing_failed",
+                    "doc_type": self.doc_type,
+                    "ns_id": row.get("id"),
+                    "externalid": row.get("externalid"),
+                    "po": key,
+                    "ns_status": row.get("status"),
+                    "created": row.get("created"),
+                })
+            elif is_850 and not has_txn:
+                # PO landed in NS but no Sales Order was linked
+                self._row_mismatches.append({
+                    "bucket": "ns_status_error",
+                    "type": "pos_without_order",
+                    "doc_type": self.doc_type,
+                    "ns_id": row.get("id"),
+                    "externalid": row.get("externalid"),
+                    "po": key,
+                    "created": row.get("created"),
+                })
+
+            if key is not None:
+                self._join(key, {"po": key, "ns_id": row.get("id"), "externalid": row.get("externalid"),
+                                 "ok": ok, "created": row.get("created")},
+                           self._celigo_open, self._ns_open)
+
+    def mismatches(self) -> List[dict]:
+        found = list(self._row_mismatches)
+        if not self.celigo["keyed_docs"]:
+            found += reconcile_counts(self.doc_type, self.direction, self.celigo["docs"],
+                                      self.celigo["jobs"], self.netsuite["records"],
+                                      self.netsuite["ok"])
+        elif self.direction == "inbound":
+            for recs in self._celigo_open.values():
+                for rec in recs:
+                    found.append({
+                        "bucket": "celigo_success_ns_missing",
+                        "type": "po_missing_in_ns",
+                        "doc_type": self.doc_type,
+                        "po": rec["po"],
+                        "_flowId": rec["_flowId"],
+                    })
+        else:
+            for recs in self._ns_open.values():
+                for rec in recs:
+                    if rec["ok"]:
+                        found.append({
+                            "bucket": "ns_sent_celigo_missing",
+                            "type": "not_sent_by_celigo",
+                            "doc_type": self.doc_type,
+                            "po": rec["po"],
+                            "ns_id": rec["ns_id"],
+                            "externalid": rec["externalid"],
+                            "created": rec["created"],
+                        })
+        return found
+
+    def result(self) -> dict:
+        mismatches = self.mismatches()
+        return {
+            "doc_type": self.doc_type,
+            "direction": self.direction,
+            "celigo": dict(self.celigo),
+            "netsuite": dict(self.netsuite),
+            "matched": self.matched,
+            "total_mismatches": len(mismatches),
+            "mismatches": mismatches,
+        }
+
+
+def reconcile(doc_type: str, celigo: Iterable[dict], netsuite: Iterable[dict],
+              direction: Optional[str] = None) -> dict:
+    """One-shot reconcile of two record streams."""
+    r = Reconciler(doc_type, direction)
+    r.add_ns(netsuite)
+    r.add_celigo(celigo)
+    return r.result()
+
+
+# ---------------------------------------------------------------------------
+# HTTP endpoint (n8n edi-ops tools)
+# ---------------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "edi-reconcile/1"
+
+    def _send(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _authorized(self) -> bool:
+        token = os.environ.get("EDI_RECONCILE_TOKEN", "")
+        return not token or hmac.compare_digest(self.headers.get("X-API-Key", ""), token)
+
+    def do_GET(self):
+        if self.path.split("?")[0] == "/health":
+            self._send(200, {"status": "ok"})
+        else:
+            self._send(404, {"error": "Not found"})
+
+    def do_POST(self):
+        if self.path.split("?")[0] != "/reconcile":
+            return self._send(404, {"error": "Not found"})
+        if not self._authorized():
+            return self._send(401, {"error": "Invalid or missing X-API-Key"})
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            return self._send(413, {"error": "Request body too large"})
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(body, dict) or not body.get("doc_type"):
+                raise ValueError("Body must be an object with doc_type, celigo and netsuite")
+            result = reconcile(body["doc_type"], body.get("celigo") or [],
+                               body.get("netsuite") or [], body.get("direction"))
+        except (ValueError, TypeError, AttributeError) as e:
+            return self._send(400, {"error": str(e)})
+        self._send(200, result)
+
+    def log_message(self, fmt, *args):
+        sys.stderr.write(f"{self.address_string()} {fmt % args}\n")
+
+
+def serve(host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> None:
+    httpd = ThreadingHTTPServer((host, port), _Handler)
+    print(f"EDI reconcile endpoint on http://{host}:{httpd.server_port}/reconcile", file=sys.stderr)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+
+
+# ---------------------------------------------------------------------------
+# CLI entry point
+# ---------------------------------------------------------------------------
+
+def iter_records(path: str) -> Iterator[dict]:
+    """Records from a JSON array or JSON Lines file ("-" = stdin); page arrays are flattened."""
+    f = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        if first == "[":
+            items = json.loads(first + f.read())
+            for item in items:
+                yield from (item if isinstance(item, list) else [item])
+            return
+        for line in chain([first + f.readline()], f) if first else ():
+            line = line.strip()
+            if line:
+                item = json.loads(line)
+                yield from (item if isinstance(item, list) else [item])
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def _print_human_summary(result: dict) -> None:
+    c, ns = result["celigo"], result["netsuite"]
+    print(f"{result['doc_type']} {result['direction']}: "
+          f"Celigo {c['jobs']} job(s) / {c['docs']} doc(s) / {c['keyed_docs']} keyed, "
+          f"NS {ns['records']} record(s) ({ns['ok']} ok, {ns['failed']} failed), "
+          f"{result['matched']} matched")
+    for m in result["mismatches"]:
+        print(f"  - [{m['bucket']}] {m['type']} — {m.get('po') or m.get('note', '')}")
+    if not result["mismatches"]:
+        print("✓ Reconciles cleanly.")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Reconcile Celigo EDI activity against NetSuite EDI History")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    m = sub.add_parser("match", help="Reconcile two record files")
+    m.add_argument("--doc-type", required=True, help="EDI doc type code (850, 810, 856, ...)")
+    m.add_argument("--direction", choices=["inbound", "outbound"],
+                   help="Default: inbound unless the doc type is outbound (810/846/855/856)")
+    m.add_argument("--celigo", required=True, help="Celigo jobs/documents (JSON or JSON Lines, - for stdin)")
+    m.add_argument("--netsuite", required=True, help="NS EDI History rows (JSON or JSON Lines)")
+    m.add_argument("--json-only", action="store_true", help="Suppress the human-readable summary")
+    m.add_argument("--exit-nonzero-on-mismatch", action="store_true",
+                   help="Exit with code 1 when mismatches are found")
+
+    s = sub.add_parser("serve", help="Serve POST /reconcile for the n8n edi-ops tools")
+    s.add_argument("--host", default="127.0.0.1")
+    s.add_argument("--port", type=int, default=DEFAULT_PORT)
+    return p
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if args.command == "serve":
+        serve(args.host, args.port)
+        return 0
+
+    try:
+        r = Reconciler(args.doc_type, args.direction)
+        r.add_ns(iter_records(args.netsuite))
+        r.add_celigo(iter_records(args.celigo))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    result = r.result()
+    print(json.dumps(result, indent=2))
+    if not args.json_only:
+        print()
+        _print_human_summary(result)
+    return 1 if args.exit_nonzero_on_mismatch and result["total_mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""Tests for celigo_api.py lazy resource loading."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS = Path(__file__).parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+import celigo_api
+from celigo_commands import COMMANDS
+
+
+class TestResourceFromArgv:
+    @pytest.mark.parametrize("argv, expected", [
+        (["flows", "list"], "flows"),
+        (["--env", "sandbox", "-f", "json", "errors", "bulk"], "errors"),
+        (["-e", "flows", "caches", "export", "c1"], "caches"),
+        (["--env=sandbox", "jobs", "list"], "jobs"),
+        (["--help"], None),
+        ([], None),
+    ])
+    def test_skips_global_options(self, argv, expected):
+        assert celigo_api._resource_from_argv(argv) == expected
+
+
+class TestLazyParser:
+    def test_only_invoked_resource_is_imported(self):
+        code = ("import sys, celigo_api; celigo_api.create_parser(['errors']); "
+                "print(sorted(m for m in sys.modules if m.startswith('celigo_commands.')))")
+        out = subprocess.run([sys.executable, "-c", code], cwd=SCRIPTS,
+                             capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "['celigo_commands.errors']"
+
+    def test_full_parser_builds_every_resource(self):
+        parser = celigo_api.create_parser()
+        for resource in COMMANDS:
+            with pytest.raises(SystemExit) as exc:
+                parser.parse_args([resource, "--no-such-flag"])
+            assert exc.value.code == 2
+        args = parser.parse_args(["-f", "json", "caches", "export", "c1"])
+        assert (args.resource, args.action, args.id) == ("caches", "export", "c1")
+
+    def test_moved_names_still_importable(self):
+        from celigo_api import CeligoClient, FlowsAPI, cmd_edi
+        assert CeligoClient.__module__ == "celigo_core"
+        assert FlowsAPI.__module__ == "celigo_commands.flows"
+        assert cmd_edi.__module__ == "celigo_commands.edi"
+        with pytest.raises(AttributeError):
+            celigo_api.no_such_name
@@ -0,0 +1,77 @@
+"""Tests for celigo_bulk_errors.py"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from celigo_bulk_errors import BulkErrors, flow_steps
+
+FLOW = {
+    "_id": "f1",
+    "pageGenerators": [{"_exportId": "e1"}],
+    "pageProcessors": [{"type": "export", "_exportId": "e2"}, {"type": "import", "_importId": "i1"}],
+    "routers": [{"branches": [{"pageProcessors": [{"type": "import", "_importId": "i2"}]}]}],
+}
+
+
+def _errors(n, code="500", prefix="x"):
+    return [{"errorId": f"{prefix}{k}", "retryDataKey": f"rdk-{prefix}{k}", "code": code}
+            for k in range(n)]
+
+
+def _bulk(batch_size=2):
+    client = MagicMock()
+    client.get.return_value = FLOW
+    client.get_all.return_value = [{"_id": "int1", "name": "EDI - Buckle"},
+                                   {"_id": "int2", "name": "EDI - Other"}]
+    api = MagicMock()
+    api.integration_summary.return_value = [{"_flowId": "f1", "numError": 5},
+                                            {"_flowId": "f2", "numError": 0}]
+    api.list_export.side_effect = lambda fid, sid, **kw: (
+        {"errors": _errors(3, prefix=sid)} if sid == "e1" else {"errors": []})
+    api.list_import.side_effect = lambda fid, sid, **kw: (
+        {"errors": _errors(1, code="429", prefix=sid) + [{"errorId": "norkd", "code": "429"}]}
+        if sid == "i1" else {"errors": []})
+    api.retry_export.return_value = {}
+    api.retry_import.return_value = {"error": True, "message": "boom"}
+    return BulkErrors(client, api, workers=4, rate=0, batch_size=batch_size), client, api
+
+
+class TestFlowSteps:
+    def test_generators_processors_and_routers(self):
+        assert flow_steps(FLOW) == [("e1", "export"), ("e2", "export"),
+                                    ("i1", "import"), ("i2", "import")]
+
+
+class TestBulkErrors:
+    def test_partner_scope_skips_clean_flows(self):
+        bulk, _, api = _bulk()
+        assert bulk.flows_in_scope(partner="buckle") == ["f1"]
+        api.integration_summary.assert_called_once()
+
+    def test_open_errors_with_code_filter(self):
+        bulk, _, _ = _bulk()
+        steps = bulk.open_errors(["f1"], codes=["429"])
+        assert [(s["step"], s["open"], len(s["errors"])) for s in steps] == [("e1", 3, 0), ("i1", 2, 2)]
+
+    def test_retry_batches_and_results(self):
+        bulk, _, api = _bulk(batch_size=2)
+        batches = bulk.plan(bulk.open_errors(["f1"]), "retry")
+        # e1: 3 keys → 2 batches; i1: one error has no retry data key → 1 batch
+        assert [(b["step"], b["batch"], len(b["keys"])) for b in batches] == [
+            ("e1", 1, 2), ("e1", 2, 1), ("i1", 1, 1)]
+
+        seen = []
+        results = bulk.apply(batches, on_result=seen.append)
+        assert [r["ok"] for r in results] == [True, True, False]
+        assert results[2]["message"] == "boom"
+        assert len(seen) == 3
+        api.retry_export.assert_any_call("f1", "e1", ["rdk-e10", "rdk-e11"])
+
+    def test_resolve_uses_error_ids(self):
+        bulk, _, api = _bulk(batch_size=10)
+        batches = bulk.plan(bulk.open_errors(["f1"], codes=["429"]), "resolve")
+        assert batches[0]["keys"] == ["i10", "norkd"]
+        bulk.apply(batches)
+        api.resolve_import.assert_called_once_with("f1", "i1", ["i10", "norkd"])
@@ -0,0 +1,90 @@
+"""Tests for celigo_lookup_cache.py"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from celigo_lookup_cache import (diff_entries, import_entries, iter_entries, read_jsonl,
+                                 write_jsonl)
+
+
+class FakeCaches:
+    """getData/data_update over an in-memory sorted cache."""
+
+    def __init__(self, entries):
+        self.store = dict(entries)
+        self.calls = []
+        self.updates = []
+
+    def data(self, cache_id, keys=None, starts_with=None, page_size=None, start_after_key=None):
+        self.calls.append(start_after_key)
+        keys = sorted(k for k in self.store if start_after_key is None or k > start_after_key)
+        page = keys[:page_size]
+        body = {"data": [{"key": k, "value": self.store[k]} for k in page]}
+        if len(keys) > page_size:
+            body["nextPageURL"] = f"/lookupcaches/{cache_id}/getData?start_after_key={page[-1]}"
+        return body
+
+    def data_update(self, cache_id, data):
+        self.updates.append([e["key"] for e in data["data"]])
+        if any(e["key"] == "bad" for e in data["data"]):
+            return {"error": True, "message": "invalid"}
+        for e in data["data"]:
+            self.store[e["key"]] = e["value"]
+        return {"success": True}
+
+
+ENTRIES = {f"K{n:03d}": {"id": n} for n in range(7)}
+
+
+class TestExport:
+    def test_pages_through_start_after_key(self):
+        api = FakeCaches(ENTRIES)
+        entries = list(iter_entries(api, "c1", page_size=3))
+        assert [e["key"] for e in entries] == sorted(ENTRIES)
+        assert api.calls == [None, "K002", "K005"]
+
+    def test_jsonl_round_trip(self):
+        buf = io.StringIO()
+        assert write_jsonl(iter_entries(FakeCaches(ENTRIES), "c1", page_size=4), buf) == 7
+        buf.seek(0)
+        assert {e["key"]: e["value"] for e in read_jsonl(buf)} == ENTRIES
+
+    def test_error_page_raises(self):
+        api = FakeCaches(ENTRIES)
+        api.data = lambda *a, **kw: {"error": True, "message": "Forbidden"}
+        with pytest.raises(RuntimeError):
+            list(iter_entries(api, "c1"))
+
+
+class TestImport:
+    def test_batches_and_failures(self):
+        api = FakeCaches({})
+        entries = [{"key": k, "value": v} for k, v in ENTRIES.items()] + [{"key": "bad", "value": 1}]
+        results = import_entries(api, "c1", iter(entries), batch_size=3, workers=2)
+        assert [(r["batch"], r["size"], r["ok"]) for r in results] == [
+            (1, 3, True), (2, 3, True), (3, 2, False)]
+        assert results[2]["message"] == "invalid"
+        assert set(api.store) == set(ENTRIES) - {"K006"}
+
+
+class TestDiff:
+    def test_merge_join(self):
+        left = [{"key": "a", "value": 1}, {"key": "b", "value": 2}, {"key": "d", "value": 4}]
+        right = [{"key": "b", "value": 2}, {"key": "c", "value": 3}, {"key": "d", "value": 5}]
+        assert [(d["key"], d["status"]) for d in diff_entries(left, right)] == [
+            ("a", "only_left"), ("c", "only_right"), ("d", "changed")]
+
+    def test_unordered_input_rejected(self):
+        with pytest.raises(ValueError):
+            list(diff_entries([{"key": "b"}, {"key": "a"}], []))
+
+    def test_diff_between_caches(self):
+        changed = dict(ENTRIES, K003={"id": 99})
+        del changed["K000"]
+        diffs = list(diff_entries(iter_entries(FakeCaches(ENTRIES), "c1", page_size=2),
+                                  iter_entries(FakeCaches(changed), "c2", page_size=5)))
+        assert [(d["key"], d["status"]) for d in diffs] == [("K000", "only_left"), ("K003", "changed")]
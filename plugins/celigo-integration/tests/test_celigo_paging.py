@@ -0,0 +1,76 @@
+"""Tests for celigo_paging.py"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from celigo_paging import iter_pages, page_items, parse_next_link
+
+BASE = "https://api.integrator.io/v1"
+
+
+def _fetcher(pages):
+    """fetch(url) over a {url: (body, headers)} map, recording calls."""
+    calls = []
+
+    def fetch(url):
+        calls.append(url)
+        return pages[url]
+
+    return fetch, calls
+
+
+class TestParseNextLink:
+    def test_next_among_several(self):
+        header = f'<{BASE}/jobs?page=1>; rel="prev", <{BASE}/jobs?page=3>; rel="next"'
+        assert parse_next_link(header) == f"{BASE}/jobs?page=3"
+
+    def test_unquoted_rel(self):
+        assert parse_next_link("</jobs?page=2>; rel=next") == "/jobs?page=2"
+
+    def test_no_next(self):
+        assert parse_next_link(f'<{BASE}/jobs?page=1>; rel="prev"') is None
+        assert parse_next_link(None) is None
+
+
+class TestIterPages:
+    def test_follows_link_header(self):
+        fetch, calls = _fetcher({
+            f"{BASE}/jobs": ([{"_id": 1}], {"link": '</v1/jobs?p=2>; rel="next"'}),
+            f"{BASE}/jobs?p=2": ([{"_id": 2}], {}),
+        })
+        items = [i for page in iter_pages(fetch, f"{BASE}/jobs") for i in page_items(page)]
+        assert items == [{"_id": 1}, {"_id": 2}]
+        assert calls == [f"{BASE}/jobs", f"{BASE}/jobs?p=2"]
+
+    def test_follows_next_page_url_field(self):
+        fetch, _ = _fetcher({
+            f"{BASE}/errors": ({"errors": [1], "nextPageURL": f"{BASE}/errors?p=2"}, {}),
+            f"{BASE}/errors?p=2": ({"errors": [2]}, {}),
+        })
+        pages = list(iter_pages(fetch, f"{BASE}/errors", prefetch=False))
+        assert [page_items(p) for p in pages] == [[1], [2]]
+
+    def test_error_page_ends_iteration(self):
+        fetch, calls = _fetcher({
+            f"{BASE}/jobs": ({"error": True, "status": 401}, {"link": '</v1/jobs?p=2>; rel="next"'}),
+        })
+        pages = list(iter_pages(fetch, f"{BASE}/jobs"))
+        assert pages == [{"error": True, "status": 401}]
+        assert calls == [f"{BASE}/jobs"]
+
+    def test_repeated_link_stops(self):
+        fetch, calls = _fetcher({
+            f"{BASE}/jobs": ([1], {"link": f'<{BASE}/jobs>; rel="next"'}),
+        })
+        assert list(iter_pages(fetch, f"{BASE}/jobs")) == [[1]]
+        assert calls == [f"{BASE}/jobs"]
+
+    def test_refuses_other_host(self):
+        fetch, _ = _fetcher({
+            f"{BASE}/jobs": ([1], {"link": '<https://evil.example/jobs>; rel="next"'}),
+        })
+        with pytest.raises(ValueError):
+            list(iter_pages(fetch, f"{BASE}/jobs"))
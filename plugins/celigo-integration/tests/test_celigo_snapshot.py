@@ -0,0 +1,116 @@
+"""Tests for celigo_snapshot.py"""
+
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from celigo_snapshot import (SnapshotStore, collect, diff_docs, diff_snapshots, references,
+                             take_snapshot)
+
+
+def _graph(p):
+    """One integration in an environment whose ids all start with prefix p."""
+    return {
+        f"/integrations/{p}int": {"_id": f"{p}int", "name": "EDI - Buckle", "lastModified": p},
+        f"/integrations/{p}int/flows": [{
+            "_id": f"{p}f1", "name": "850 Inbound", "_integrationId": f"{p}int",
+            "lastExecutedAt": p,
+            "pageGenerators": [{"_exportId": f"{p}e1"}],
+            "pageProcessors": [{"type": "import", "_importId": f"{p}i1"},
+                               {"type": "export", "_exportId": f"{p}shared"}],
+        }],
+        f"/integrations/{p}int/exports": [{"_id": f"{p}e1", "name": "Get 850s",
+                                           "_connectionId": f"{p}c1"}],
+        f"/integrations/{p}int/imports": [{
+            "_id": f"{p}i1", "name": "Create SO", "_connectionId": f"{p}c2",
+            "hooks": {"preMap": {"function": "preMap", "_scriptId": f"{p}s1"}},
+            "mapping": {"lookups": [{"name": "xref", "_lookupCacheId": f"{p}lc1"}]},
+        }],
+        f"/integrations/{p}int/connections": [{"_id": f"{p}c1", "name": "SPS FTP", "offline": False}],
+        f"/exports/{p}shared": {"_id": f"{p}shared", "name": "Shared lookup"},
+        f"/connections/{p}c2": {"_id": f"{p}c2", "name": "NetSuite"},
+        f"/scripts/{p}s1": {"_id": f"{p}s1", "name": "preMap", "content": "function preMap() {}"},
+        f"/lookupcaches/{p}lc1": {"_id": f"{p}lc1", "name": "Item xref"},
+    }
+
+
+class FakeClient:
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+
+    def get(self, endpoint):
+        self.calls.append(endpoint)
+        return copy.deepcopy(self.routes.get(endpoint, {"error": True, "status": 404,
+                                                        "message": "Not Found"}))
+
+    get_all = get
+
+
+class TestCollect:
+    def test_collects_lists_shared_steps_and_references(self):
+        client = FakeClient(_graph("sbx"))
+        docs = collect(client, "sbxint", workers=4)
+        assert {k: sorted(v) for k, v in docs.items() if v} == {
+            "integration": ["sbxint"], "flow": ["sbxf1"], "export": ["sbxe1", "sbxshared"],
+            "import": ["sbxi1"], "connection": ["sbxc1", "sbxc2"], "script": ["sbxs1"],
+            "lookupcache": ["sbxlc1"]}
+        assert len(client.calls) == len(set(client.calls)) == 9
+
+    def test_api_error_raises(self):
+        routes = _graph("sbx")
+        del routes["/scripts/sbxs1"]
+        with pytest.raises(RuntimeError, match="/scripts/sbxs1"):
+            collect(FakeClient(routes), "sbxint")
+
+    def test_references(self):
+        doc = {"_connectionId": "c", "x": [{"_borrowConcurrencyFromConnectionId": "c2"}]}
+        assert sorted(references(doc)) == [("connection", "c"), ("connection", "c2")]
+
+
+class TestSnapshotDiff:
+    def test_environments_with_same_config_share_blobs(self, tmp_path):
+        store = SnapshotStore(tmp_path)
+        sbx = take_snapshot(FakeClient(_graph("sbx")), store, "sbxint", env="sandbox", name="sbx")
+        prd = take_snapshot(FakeClient(_graph("prd")), store, "prdint", env="production", name="prd")
+        assert sbx["blobs_written"] == 9 and prd["blobs_written"] == 0 and prd["blobs_reused"] == 9
+        assert prd["resources"]["flow"]["850 Inbound"]["_id"] == "prdf1"
+        result = diff_snapshots(store, store.load("sbx"), store.load("prd"))
+        assert result == {"unchanged": 9, "resources": []}
+
+    def test_changed_added_removed(self, tmp_path):
+        store = SnapshotStore(tmp_path)
+        take_snapshot(FakeClient(_graph("sbx")), store, "sbxint", name="before")
+        routes = _graph("sbx")
+        routes["/scripts/sbxs1"]["content"] = "function preMap(o) { return o; }"
+        routes["/integrations/sbxint/exports"].append({"_id": "sbxe2", "name": "Get 856s"})
+        routes["/lookupcaches/sbxlc1"]["name"] = "Item xref v2"
+        take_snapshot(FakeClient(routes), store, "sbxint", name="after")
+
+        loaded = []
+
+        def load(digest):
+            loaded.append(digest)
+            return store.get_blob(digest)
+
+        result = diff_snapshots(store, store.load("before"), store.load("after"), load=load)
+        rows = [(r["kind"], r["name"], r["status"], [c["path"] for c in r["changes"]])
+                for r in result["resources"]]
+        assert rows == [
+            ("export", "Get 856s", "added", []),
+            # The import refers to the renamed cache by name, so it changes too.
+            ("import", "Create SO", "changed", ["mapping.lookups[0]._lookupCacheId"]),
+            ("script", "preMap", "changed", ["content"]),
+            ("lookupcache", "Item xref -> Item xref v2", "changed", ["name"]),
+        ]
+        assert result["unchanged"] == 6
+        assert len(loaded) == 6  # only the three changed pairs are read
+
+    def test_diff_docs_paths(self):
+        assert diff_docs({"a": [1, {"b": 2}], "c": 1}, {"a": [1, {"b": 3}, 4]}) == [
+            {"path": "a[1].b", "left": 2, "right": 3},
+            {"path": "a[2]", "left": None, "right": 4},
+            {"path": "c", "left": 1, "right": None}]
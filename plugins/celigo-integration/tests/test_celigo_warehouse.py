@@ -0,0 +1,109 @@
+"""Tests for celigo_warehouse.py"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from celigo_warehouse import JobWarehouse, celigo_ts
+
+NOW = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+
+def _job(jid, hours_ago, flow="f1", status="completed", **counts):
+    created = NOW - timedelta(hours=hours_ago)
+    job = {"_id": jid, "type": "flow", "status": status, "_flowId": flow,
+           "_integrationId": "int1", "createdAt": celigo_ts(created),
+           "startedAt": celigo_ts(created)}
+    if status not in ("queued", "running"):
+        job["endedAt"] = celigo_ts(created + timedelta(minutes=5))
+    job.update(counts)
+    return job
+
+
+class FakeCeligo:
+    def __init__(self, jobs):
+        self.jobs = {j["_id"]: j for j in jobs}
+        self.listed = []
+        self.polled = []
+
+    def list_jobs(self, created_gte):
+        self.listed.append(created_gte)
+        return [j for j in self.jobs.values() if j["createdAt"] >= created_gte]
+
+    def get_job(self, job_id):
+        self.polled.append(job_id)
+        return self.jobs.get(job_id) or {"error": True, "status": 404}
+
+
+@pytest.fixture
+def wh(tmp_path):
+    with JobWarehouse(tmp_path / "jobs.sqlite") as w:
+        yield w
+
+
+class TestSync:
+    def test_incremental_after_first_sync(self, wh):
+        api = FakeCeligo([_job("a", 100), _job("b", 2)])
+        first = wh.sync(api.list_jobs, api.get_job, NOW - timedelta(days=7), now=NOW)
+        assert first["full"] and first["fetched"] == 2
+
+        later = NOW + timedelta(hours=6)
+        second = wh.sync(api.list_jobs, api.get_job, NOW - timedelta(days=7), now=later)
+        assert not second["full"]
+        # Only the settle window before the previous sync is listed again
+        assert api.listed[-1] == celigo_ts(NOW - timedelta(hours=24))
+        assert second["fetched"] == 1
+
+    def test_wider_window_backfills(self, wh):
+        api = FakeCeligo([_job("old", 24 * 20), _job("new", 2)])
+        wh.sync(api.list_jobs, api.get_job, NOW - timedelta(days=7), now=NOW)
+        assert [j["_id"] for j in wh.jobs(NOW - timedelta(days=30))] == ["new"]
+
+        result = wh.sync(api.list_jobs, api.get_job, NOW - timedelta(days=30), now=NOW)
+        assert result["full"]
+        assert [j["_id"] for j in wh.jobs(NOW - timedelta(days=30))] == ["old", "new"]
+
+    def test_running_jobs_repolled(self, wh):
+        api = FakeCeligo([_job("r", 72, status="running"), _job("gone", 72, status="queued")])
+        wh.sync(api.list_jobs, api.get_job, NOW - timedelta(days=7), now=NOW)
+
+        api.jobs["r"] = _job("r", 72, numSuccess=3)
+        del api.jobs["gone"]
+        result = wh.sync(api.list_jobs, api.get_job, NOW - timedelta(days=7),
+                         now=NOW + timedelta(hours=1))
+        assert sorted(api.polled) == ["gone", "r"]
+        assert result["repolled"] == 1
+        jobs = wh.jobs(NOW - timedelta(days=7))
+        assert [(j["_id"], j["status"], j["numSuccess"]) for j in jobs] == [("r", "completed", 3)]
+
+
+class TestQueries:
+    def test_health_stats(self, wh):
+        api = FakeCeligo([
+            _job("a", 2, numError=2, numSuccess=8, numOpenError=2),
+            _job("b", 50, numError=1, numSuccess=1, numOpenError=1, numResolved=0),
+            _job("c", 30, flow="f2", numSuccess=5),
+            _job("x", 24 * 10, numError=9),  # outside the 7-day window
+        ])
+        wh.sync(api.list_jobs, api.get_job, NOW - timedelta(days=30), now=NOW)
+        stats = wh.health_stats(NOW - timedelta(days=7), NOW)
+
+        assert stats["totalFlowRuns"] == 3
+        assert stats["totalErrors"] == 3
+        assert stats["totalSuccesses"] == 14
+        assert stats["totalOpenErrors"] == 3
+        assert stats["errorsByFlow"]["f1"] == {"errors": 3, "successes": 9}
+        assert stats["openErrorsByFlow"]["f1"]["open"] == 3
+        assert "f2" not in stats["openErrorsByFlow"]
+        assert stats["agingBuckets"] == {"under24h": 2, "days1to3": 1, "days3to7": 0,
+                                         "days7to14": 0, "over14d": 0}
+
+    def test_jobs_filters(self, wh):
+        api = FakeCeligo([_job("a", 2), _job("b", 3, status="failed")])
+        wh.sync(api.list_jobs, api.get_job, NOW - timedelta(days=1), now=NOW)
+        jobs = wh.jobs(NOW - timedelta(days=1), NOW, integration_id="int1", status="completed")
+        assert [j["_id"] for j in jobs] == ["a"]
+        assert wh.flow_volume(NOW - timedelta(days=1))["f1"]["jobs"] == 2
@@ -188,3 +188,44 @@ class TestRunAuditIntegration:
 
         result = run_audit("24h", None, "both", "UNKNOWN_PARTNER", None)
         assert result["integrations_scanned"] == 0
+
+
+class TestConcurrentCollection:
+    """Data collection fans out over a thread pool; results match the serial path."""
+
+    FLOWS = [
+        {"_id": "f1", "_integrationId": "int1", "doc_type": "850", "direction": "IB"},
+        {"_id": "f2", "_integrationId": "int2", "doc_type": "810", "direction": "OB"},
+    ]
+
+    @patch("edi_audit._ns_edi_history_outbound")
+    @patch("edi_audit._ns_edi_history_inbound")
+    @patch("edi_audit._ns_edi_summary")
+    @patch("edi_audit._get_jobs_for_integration")
+    @patch("edi_audit._get_edi_flows")
+    @patch("edi_audit._get_celigo_creds")
+    def test_detail_rows_fetched_only_where_needed(self, mock_creds, mock_flows, mock_jobs,
+                                                    mock_summary, mock_in, mock_out):
+        from edi_audit import run_audit
+        mock_creds.return_value = ("https://api.integrator.io/v1", "testkey")
+        mock_flows.return_value = self.FLOWS
+        mock_jobs.side_effect = lambda u, k, iid, s, e: [
+            {"_flowId": "f1" if iid == "int1" else "f2", "numPagesGenerated": 1}]
+        mock_summary.return_value = {"3": {"total": 1, "ok": 1, "err": 0},
+                                     "1": {"total": 1, "ok": 1, "err": 0}}
+        mock_in.return_value = [{"id": "1", "externalid": "HIST_PO1_ACME_00",
+                                 "status": "2", "transaction_id": "SO1"}]
+
+        for workers in (1, 4):
+            result = run_audit("24h", None, "both", None, None, workers=workers)
+            assert result["total_mismatches"] == 0
+            assert result["doc_type_summary"]["850"]["celigo_jobs"] == 1
+            assert result["doc_type_summary"]["810"]["celigo_docs"] == 1
+        assert mock_jobs.call_count == 4
+        mock_out.assert_not_called()  # 810 has no NS errors → aggregate counts only
+
+    def test_backoff_shared_per_host(self):
+        from edi_audit import _backoff_for
+        a = _backoff_for("https://api.integrator.io/v1/jobs")
+        assert a is _backoff_for("https://api.integrator.io/v1/flows")
+        assert a is not _backoff_for("https://nsapi.twistedx.tech/api/suiteapi")
@@ -0,0 +1,101 @@
+"""Tests for edi_reconcile.py"""
+
+import json
+import sys
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from edi_reconcile import Reconciler, _Handler, iter_records, ns_key, reconcile
+
+
+def _ns(po, status="2", txn="SO1", rid=None):
+    return {"id": rid or po, "externalid": f"HIST_{po}_ACME_00", "status": status,
+            "transaction_id": txn, "created": "2026-01-01"}
+
+
+class TestKeys:
+    def test_ns_key_from_externalid(self):
+        assert ns_key({"externalid": "HIST_po-1_ACME_00"}) == "PO-1"
+        assert ns_key({"externalid": "INV77"}) == "INV77"
+        assert ns_key({}) is None
+
+
+class TestReconciler:
+    def test_job_counts_only(self):
+        result = reconcile("850", [{"numPagesGenerated": 2, "numError": 1}],
+                           [_ns("A"), _ns("B", status="6", txn=None), _ns("C", txn=None)])
+        assert result["celigo"] == {"jobs": 1, "docs": 2, "job_errors": 1, "keyed_docs": 0}
+        assert result["netsuite"] == {"records": 3, "ok": 2, "failed": 1,
+                                      "with_transaction": 1, "without_transaction": 1}
+        assert [(m["type"], m["po"]) for m in result["mismatches"]] == [
+            ("ns_processing_failed", "B"), ("pos_without_order", "C")]
+
+    def test_inbound_no_ns_records(self):
+        result = reconcile("850", [{"numPagesGenerated": 3}], [])
+        assert [m["type"] for m in result["mismatches"]] == ["no_ns_records"]
+
+    def test_keyed_hash_join_any_order(self):
+        r = Reconciler("850")
+        r.add_celigo([{"po_number": "a"}, {"po_number": "B"}])
+        r.add_ns([_ns("A")])
+        r.add_celigo([{"externalid": "HIST_C_ACME_00"}, {"po": "D"}])
+        r.add_ns([_ns("C"), _ns("E")])
+        result = r.result()
+        assert result["matched"] == 2
+        assert [(m["type"], m["po"]) for m in result["mismatches"]] == [
+            ("po_missing_in_ns", "B"), ("po_missing_in_ns", "D")]
+        assert r._ns_open.keys() == {"E"}  # only unmatched keys are held
+
+    def test_duplicate_keys_pair_one_to_one(self):
+        result = reconcile("850", [{"po": "A"}, {"po": "A"}], [_ns("A", rid="1")])
+        assert result["matched"] == 1 and result["total_mismatches"] == 1
+
+    def test_outbound_keyed_and_counts(self):
+        keyed = reconcile("810", [{"key": "INV1"}], [
+            {"id": "1", "externalid": "INV1", "status": "2"},
+            {"id": "2", "externalid": "INV2", "status": "2"}])
+        assert [(m["bucket"], m["po"]) for m in keyed["mismatches"]] == [
+            ("ns_sent_celigo_missing", "INV2")]
+        counted = reconcile("810", [], [{"id": "1", "status": "2"}])
+        assert [m["type"] for m in counted["mismatches"]] == ["no_celigo_activity"]
+        assert reconcile("810", [{"numPagesGenerated": 0}], [{"id": "1", "status": "2"}])[
+            "total_mismatches"] == 0
+
+
+class TestIO:
+    def test_iter_records_json_and_jsonl_pages(self, tmp_path):
+        arr = tmp_path / "a.json"
+        arr.write_text(json.dumps([{"po": "A"}, [{"po": "B"}]]))
+        lines = tmp_path / "b.jsonl"
+        lines.write_text('\n{"po": "A"}\n[{"po": "B"}, {"po": "C"}]\n')
+        assert [r["po"] for r in iter_records(str(arr))] == ["A", "B"]
+        assert [r["po"] for r in iter_records(str(lines))] == ["A", "B", "C"]
+
+    def test_http_endpoint(self, monkeypatch):
+        monkeypatch.setenv("EDI_RECONCILE_TOKEN", "secret")
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{httpd.server_port}/reconcile"
+        body = json.dumps({"doc_type": "850", "celigo": [{"po": "A"}],
+                           "netsuite": [_ns("A")]}).encode()
+
+        def post(headers):
+            req = urllib.request.Request(url, data=body, method="POST",
+                                         headers={"Content-Type": "application/json", **headers})
+            try:
+                with urllib.request.urlopen(req, timeout=5) as resp:
+                    return resp.status, json.loads(resp.read())
+            except urllib.error.HTTPError as e:
+                return e.code, json.loads(e.read())
+
+        try:
+            assert post({})[0] == 401
+            status, result = post({"X-API-Key": "secret"})
+            assert status == 200 and result["matched"] == 1 and result["total_mismatches"] == 0
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
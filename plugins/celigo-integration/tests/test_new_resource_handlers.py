@@ -162,7 +162,7 @@ class TestOpaAPI:
 # ---------------------------------------------------------------------------
 
 class TestEdiFileTypeGuard:
-    @patch("celigo_api.CeligoClient")
+    @patch("celigo_commands.edi.CeligoClient")
     def test_update_rejects_fileType_mutation(self, MockClient):
         from celigo_api import cmd_edi
         args = _args(action="update", id="ep1",
@@ -171,7 +171,7 @@ class TestEdiFileTypeGuard:
             cmd_edi(args)
         assert exc.value.code == 1
 
-    @patch("celigo_api.CeligoClient")
+    @patch("celigo_commands.edi.CeligoClient")
     def test_update_allows_non_immutable_fields(self, MockClient):
         from celigo_api import cmd_edi, EDIAPI
         mock_instance = MockClient.return_value
@@ -192,7 +192,7 @@ class TestEdiFileTypeGuard:
 # ---------------------------------------------------------------------------
 
 class TestFileDefinitionsEdiValidation:
-    @patch("celigo_api.CeligoClient")
+    @patch("celigo_commands.filedefinitions.CeligoClient")
     def test_create_x12_requires_documentType(self, MockClient):
         from celigo_api import cmd_filedefinitions
         mock_instance = MockClient.return_value
@@ -203,7 +203,7 @@ class TestFileDefinitionsEdiValidation:
             cmd_filedefinitions(args)
         assert exc.value.code == 1
 
-    @patch("celigo_api.CeligoClient")
+    @patch("celigo_commands.filedefinitions.CeligoClient")
     def test_create_x12_requires_globalId(self, MockClient):
         from celigo_api import cmd_filedefinitions
         mock_instance = MockClient.return_value
@@ -214,7 +214,7 @@ class TestFileDefinitionsEdiValidation:
             cmd_filedefinitions(args)
         assert exc.value.code == 1
 
-    @patch("celigo_api.CeligoClient")
+    @patch("celigo_commands.filedefinitions.CeligoClient")
     def test_create_delimited_no_edi_fields_required(self, MockClient):
         from celigo_api import cmd_filedefinitions
         mock_instance = MockClient.return_value
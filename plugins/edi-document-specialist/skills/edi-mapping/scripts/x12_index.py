@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+X12 Archive Indexer
+
+Tokenizes raw X12 interchange files and indexes every transaction set by
+trading partner, doc type, control number and PO number, so finding one PO
+in a year of archived EDI is an indexed SQLite lookup instead of a grep.
+
+Parsing: each file is memory-mapped. Delimiters are read from each ISA
+header (element separator = 4th byte, component separator and segment
+terminator follow ISA16), and the ISA/GS/ST envelopes are split in one pass.
+A compiled regex skips to the segments that matter (GS, ST, SE, GE, IEA and
+the PO-bearing BEG/BAK/BCH/BIG/PRF), so line-item segments are never split
+in Python. Files are parsed in a process pool and written by one SQLite
+writer. Unchanged files (same size and mtime) are skipped on re-index.
+
+PO number sources:
+  850 BEG03   855 BAK03   860 BCH03   810 BIG04   856 PRF01 (one per order)
+
+Index (one SQLite file, default ~/.cache/edi-document-specialist/x12_index.sqlite):
+  files   path, size, mtime
+  docs    file, byte offset/length, sender/receiver (ISA06/ISA08),
+          ISA13, GS01/GS04/GS06, ST01/ST02
+  pos     PO number -> doc
+
+Usage:
+  python3 x12_index.py index /archive/edi [/more/paths ...] [--workers 8]
+  python3 x12_index.py find --po 4500012345
+  python3 x12_index.py find --partner 0079221110000 --doc-type 856 --since 2026-01-01
+  python3 x12_index.py find --control 000012345 --show
+  python3 x12_index.py parse interchange.edi
+  python3 x12_index.py stats
+"""
+
+import argparse
+import json
+import mmap
+import os
+import re
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+CACHE_DIR = Path.home() / ".cache" / "edi-document-specialist"
+DEFAULT_DB = CACHE_DIR / "x12_index.sqlite"
+DEFAULT_WORKERS = os.cpu_count() or 4
+
+# Segment tag -> index of the PO number among its elements (BEG03 -> 2)
+PO_ELEMENTS = {b"BEG": 2, b"BAK": 2, b"BCH": 2, b"BIG": 3, b"PRF": 0}
+_TAGS = (b"GS", b"ST", b"SE", b"GE", b"IEA") + tuple(PO_ELEMENTS)
+
+_DOC_COLUMNS = ("offset", "length", "sender", "receiver", "isa_control", "functional_id",
+                "gs_control", "doc_date", "doc_type", "st_control")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    docs INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    sender TEXT,
+    receiver TEXT,
+    isa_control TEXT,
+    functional_id TEXT,
+    gs_control TEXT,
+    doc_date TEXT,
+    doc_type TEXT,
+    st_control TEXT
+);
+CREATE INDEX IF NOT EXISTS docs_file ON docs (file_id);
+CREATE INDEX IF NOT EXISTS docs_sender ON docs (sender, doc_date);
+CREATE INDEX IF NOT EXISTS docs_receiver ON docs (receiver, doc_date);
+CREATE INDEX IF NOT EXISTS docs_type_date ON docs (doc_type, doc_date);
+CREATE INDEX IF NOT EXISTS docs_isa ON docs (isa_control);
+CREATE INDEX IF NOT EXISTS docs_gs ON docs (gs_control);
+CREATE INDEX IF NOT EXISTS docs_st ON docs (st_control);
+CREATE TABLE IF NOT EXISTS pos (
+    po TEXT NOT NULL,
+    doc_id INTEGER NOT NULL REFERENCES docs(id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS pos_po ON pos (po);
+CREATE INDEX IF NOT EXISTS pos_doc ON pos (doc_id);
+"""
+
+
+# =============================================================================
+# Tokenizer
+# =============================================================================
+
+class Delimiters(NamedTuple):
+    """Separators of one interchange, as read from its ISA header."""
+    element: bytes
+    component: bytes
+    segment: bytes
+
+
+def read_isa(buf, start: int) -> Optional[Tuple[Delimiters, List[bytes], int]]:
+    """
+    Parse the ISA segment at `start`: (delimiters, ISA elements, index of its
+    segment terminator). Counts element separators rather than assuming the
+    fixed 106-byte layout, so unpadded ISA headers from some VANs still work.
+    """
+    if buf[start:start + 3] != b"ISA" or len(buf) < start + 4:
+        return None
+    element = buf[start + 3:start + 4]
+    pos = start + 3  # separator before ISA01
+    for _ in range(15):  # ... up to the one before ISA16
+        pos = buf.find(element, pos + 1)
+        if pos < 0:
+            return None
+    # ISA16 is the one-byte component separator; the segment terminator follows it
+    component = buf[pos + 1:pos + 2]
+    terminator = pos + 2
+    segment = buf[terminator:terminator + 1]
+    if not component or not segment:
+        return None
+    fields = bytes(buf[start:terminator]).split(element)
+    return Delimiters(element, component, segment), fields, terminator
+
+
+@lru_cache(maxsize=16)
+def _segment_re(delims: Delimiters) -> "re.Pattern":
+    e, s = re.escape(delims.element), re.escape(delims.segment)
+    tags = b"|".join(_TAGS)
+    # A terminator, optional line breaks, then one of the tags we index. The
+    # terminator belongs to the previous segment, so matches never overlap.
+    return re.compile(s + rb"[\r\n]*(" + tags + rb")" + e + rb"([^" + s + rb"]*)")
+
+
+def _text(value: bytes) -> str:
+    return value.strip().decode("latin-1")
+
+
+def scan(buf) -> Iterable[tuple]:
+    """
+    Yield one tuple per transaction set in an X12 buffer (bytes or mmap), in
+    _DOC_COLUMNS order plus a tuple of PO numbers.
+    """
+    pos = buf.find(b"ISA")
+    while pos >= 0:
+        isa = read_isa(buf, pos)
+        if isa is None:
+            pos = buf.find(b"ISA", pos + 3)
+            continue
+        delims, isa_fields, pos = isa
+        sender = _text(isa_fields[6]) if len(isa_fields) > 6 else ""
+        receiver = _text(isa_fields[8]) if len(isa_fields) > 8 else ""
+        isa_control = _text(isa_fields[13]) if len(isa_fields) > 13 else ""
+        gs: List[bytes] = []
+        doc = None
+        pos_numbers: List[str] = []
+        element = delims.element
+        end = len(buf)
+        for m in _segment_re(delims).finditer(buf, pos):
+            tag = m.group(1)
+            if tag in PO_ELEMENTS:
+                if doc is not None:
+                    elems = m.group(2).split(element)
+                    idx = PO_ELEMENTS[tag]
+                    if idx < len(elems) and elems[idx].strip():
+                        pos_numbers.append(_text(elems[idx]).upper())
+            elif tag == b"ST":
+                elems = m.group(2).split(element)
+                doc = [m.start(1), _text(elems[0]), _text(elems[1]) if len(elems) > 1 else ""]
+                pos_numbers = []
+            elif tag == b"SE":
+                if doc is not None:
+                    offset, doc_type, st_control = doc
+                    yield (offset, m.end() + 1 - offset, sender, receiver, isa_control,
+                           _text(gs[0]) if gs else "", _text(gs[5]) if len(gs) > 5 else "",
+                           _text(gs[3]) if len(gs) > 3 else "", doc_type, st_control,
+                           tuple(dict.fromkeys(pos_numbers)))
+                doc = None
+            elif tag == b"GS":
+                gs = m.group(2).split(element)
+            elif tag == b"GE":
+                gs = []
+            else:  # IEA
+                end = m.end()
+                break
+        pos = buf.find(b"ISA", end) if end < len(buf) else -1
+
+
+def parse_file(path: str) -> Tuple[str, int, int, Optional[list], Optional[str]]:
+    """(path, size, mtime_ns, docs or None if not X12, error). Runs in pool workers."""
+    try:
+        st = os.stat(path)
+        if st.st_size == 0:
+            return path, 0, st.st_mtime_ns, None, None
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            head = mm[:1024].lstrip(b"\xef\xbb\xbf \t\r\n")
+            if not head.startswith(b"ISA"):
+                return path, st.st_size, st.st_mtime_ns, None, None
+            return path, st.st_size, st.st_mtime_ns, list(scan(mm)), None
+    except (OSError, ValueError) as e:
+        return path, 0, 0, None, str(e)
+
+
+def read_segments(path: str, offset: int, length: int) -> List[str]:
+    """Segments of one indexed transaction set, one string each."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        isa = read_isa(mm, mm.rfind(b"ISA", 0, offset))
+        raw = mm[offset:offset + length]
+    terminator = isa[0].segment if isa else b"~"
+    return [_text(s) for s in raw.split(terminator) if s.strip()]
+
+
+# =============================================================================
+# Index
+# =============================================================================
+
+class X12Index:
+    """SQLite index of transaction sets across archive files."""
+
+    def __init__(self, path: Path = DEFAULT_DB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _known(self) -> Dict[str, Tuple[int, int]]:
+        return {r["path"]: (r["size"], r["mtime_ns"])
+                for r in self.conn.execute("SELECT path, size, mtime_ns FROM files")}
+
+    def _store(self, path: str, size: int, mtime_ns: int, docs: list) -> None:
+        self.conn.execute("DELETE FROM files WHERE path = ?", (path,))
+        file_id = self.conn.execute(
+            "INSERT INTO files (path, size, mtime_ns, docs) VALUES (?, ?, ?, ?)",
+            (path, size, mtime_ns, len(docs))).lastrowid
+        po_rows = []
+        for doc in docs:
+            doc_id = self.conn.execute(
+                f"INSERT INTO docs (file_id, {', '.join(_DOC_COLUMNS)}) "
+                f"VALUES (?{', ?' * len(_DOC_COLUMNS)})", (file_id,) + doc[:-1]).lastrowid
+            po_rows.extend((po, doc_id) for po in doc[-1])
+        self.conn.executemany("INSERT INTO pos (po, doc_id) VALUES (?, ?)", po_rows)
+
+    def index(self, paths: Iterable[str], workers: int = DEFAULT_WORKERS,
+              full: bool = False) -> Dict[str, int]:
+        """Parse new/changed files in a process pool and store them. Returns counts."""
+        known = {} if full else self._known()
+        todo = []
+        stats = {"files": 0, "skipped": 0, "unchanged": 0, "docs": 0, "errors": 0}
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                stats["errors"] += 1
+                continue
+            if known.get(path) == (st.st_size, st.st_mtime_ns):
+                stats["unchanged"] += 1
+            else:
+                todo.append(path)
+
+        if workers > 1 and len(todo) > 1:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            results = pool.map(parse_file, todo, chunksize=max(1, len(todo) // (workers * 8)))
+        else:
+            pool, results = None, map(parse_file, todo)
+        try:
+            with self.conn:
+                for n, (path, size, mtime_ns, docs, error) in enumerate(results, 1):
+                    if error:
+                        print(f"  {path}: {error}", file=sys.stderr)
+                        stats["errors"] += 1
+                    elif docs is None:  # remembered with no docs, so not re-read next time
+                        self._store(path, size, mtime_ns, [])
+                        stats["skipped"] += 1
+                    else:
+                        self._store(path, size, mtime_ns, docs)
+                        stats["files"] += 1
+                        stats["docs"] += len(docs)
+                    if n % 1000 == 0:
+                        print(f"  {n}/{len(todo)} files", file=sys.stderr)
+        finally:
+            if pool:
+                pool.shutdown()
+        return stats
+
+    def prune(self) -> int:
+        """Drop files that no longer exist."""
+        gone = [(p,) for p in self._known() if not os.path.exists(p)]
+        with self.conn:
+            self.conn.executemany("DELETE FROM files WHERE path = ?", gone)
+        return len(gone)
+
+    def find(self, po: Optional[str] = None, partner: Optional[str] = None,
+             doc_type: Optional[str] = None, control: Optional[str] = None,
+             since: Optional[str] = None, until: Optional[str] = None,
+             limit: int = 100) -> List[dict]:
+        """Transaction sets matching every given filter (dates as CCYYMMDD)."""
+        where, params = [], []
+        if po:
+            where.append("d.id IN (SELECT doc_id FROM pos WHERE po = ?)")
+            params.append(po.strip().upper())
+        if partner:
+            where.append("(d.sender = ? OR d.receiver = ?)")
+            params += [partner, partner]
+        if doc_type:
+            where.append("d.doc_type = ?")
+            params.append(doc_type)
+        if control:
+            where.append("(d.isa_control = ? OR d.gs_control = ? OR d.st_control = ?)")
+            params += [control] * 3
+        if since:
+            where.append("d.doc_date >= ?")
+            params.append(since)
+        if until:
+            where.append("d.doc_date <= ?")
+            params.append(until)
+        sql = ("SELECT f.path, d.*, (SELECT group_concat(po, ',') FROM pos WHERE doc_id = d.id) AS pos "
+               "FROM docs d JOIN files f ON f.id = d.file_id"
+               + (" WHERE " + " AND ".join(where) if where else "")
+               + " ORDER BY d.doc_date DESC, d.id DESC LIMIT ?")
+        rows = self.conn.execute(sql, params + [limit]).fetchall()
+        return [{k: r[k] for k in r.keys() if k not in ("id", "file_id")} for r in rows]
+
+    def stats(self) -> dict:
+        def one(sql):
+            return self.conn.execute(sql).fetchone()[0]
+
+        return {
+            "db": str(self.path),
+            "files": one("SELECT COUNT(*) FROM files WHERE docs > 0"),
+            "docs": one("SELECT COUNT(*) FROM docs"),
+            "po_numbers": one("SELECT COUNT(DISTINCT po) FROM pos"),
+            "by_doc_type": dict(self.conn.execute(
+                "SELECT doc_type, COUNT(*) FROM docs GROUP BY doc_type ORDER BY doc_type").fetchall()),
+            "date_range": list(self.conn.execute("SELECT MIN(doc_date), MAX(doc_date) FROM docs").fetchone()),
+        }
+
+
+def iter_files(paths: Iterable[str], pattern: str = "*") -> Iterable[str]:
+    """Files under the given files/directories (recursive), as absolute paths."""
+    for p in map(Path, paths):
+        if p.is_dir():
+            for f in sorted(p.rglob(pattern)):
+                if f.is_file():
+                    yield str(f.resolve())
+        elif p.is_file():
+            yield str(p.resolve())
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _date(value: str) -> str:
+    """YYYY-MM-DD or CCYYMMDD -> CCYYMMDD (the GS04 format)."""
+    digits = value.replace("-", "")
+    if not re.fullmatch(r"\d{8}", digits):
+        raise argparse.ArgumentTypeError(f"invalid date {value!r} (use YYYY-MM-DD)")
+    return digits
+
+
+def _print_table(rows: List[dict], columns: List[str]) -> None:
+    if not rows:
+        print("No results")
+        return
+    widths = {c: max(len(c), *(len(str(r.get(c) or "")) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    print("  ".join("-" * widths[c] for c in columns))
+    for r in rows:
+        print("  ".join(str(r.get(c) or "").ljust(widths[c]) for c in columns))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Index and search raw X12 EDI archives",
+                                     formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     epilog=__doc__.split("Usage:")[1])
+    parser.add_argument("--db", default=str(DEFAULT_DB), help=f"Index file (default: {DEFAULT_DB})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_index = sub.add_parser("index", help="Index new or changed files under the given paths")
+    p_index.add_argument("paths", nargs="+", help="Files or directories (recursive)")
+    p_index.add_argument("--glob", default="*", help="File name pattern inside directories (default: all)")
+    p_index.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                         help="Parser processes (default: CPU count)")
+    p_index.add_argument("--full", action="store_true", help="Re-parse files even if unchanged")
+    p_index.add_argument("--prune", action="store_true", help="Drop indexed files that no longer exist")
+
+    p_find = sub.add_parser("find", help="Look up transaction sets")
+    p_find.add_argument("--po", help="PO number (BEG03/BAK03/BCH03/BIG04/PRF01)")
+    p_find.add_argument("--partner", help="Sender or receiver ID (ISA06/ISA08)")
+    p_find.add_argument("--doc-type", help="Transaction set ID (ST01), e.g. 850")
+    p_find.add_argument("--control", help="ISA13, GS06 or ST02 control number")
+    p_find.add_argument("--since", type=_date, help="GS04 date on or after (YYYY-MM-DD)")
+    p_find.add_argument("--until", type=_date, help="GS04 date on or before (YYYY-MM-DD)")
+    p_find.add_argument("--limit", type=int, default=100)
+    p_find.add_argument("--show", action="store_true", help="Print each transaction set's segments")
+    p_find.add_argument("--format", choices=["table", "json"], default="table")
+
+    p_parse = sub.add_parser("parse", help="Print the envelopes of one file without indexing it")
+    p_parse.add_argument("file")
+
+    sub.add_parser("stats", help="Index summary")
+    args = parser.parse_args()
+
+    if args.command == "parse":
+        path, _, _, docs, error = parse_file(args.file)
+        if error or docs is None:
+            print(f"Error: {error or 'not an X12 interchange (no leading ISA)'}", file=sys.stderr)
+            return 1
+        print(json.dumps([dict(zip(_DOC_COLUMNS + ("pos",), d)) for d in docs], indent=2))
+        return 0
+
+    with X12Index(Path(args.db)) as idx:
+        if args.command == "index":
+            if args.prune:
+                print(f"Pruned {idx.prune()} missing file(s)", file=sys.stderr)
+            stats = idx.index(iter_files(args.paths, args.glob), workers=args.workers, full=args.full)
+            print(f"Indexed {stats['docs']} transaction set(s) from {stats['files']} file(s); "
+                  f"{stats['unchanged']} unchanged, {stats['skipped']} not X12, {stats['errors']} error(s)")
+            return 1 if stats["errors"] else 0
+
+        if args.command == "stats":
+            print(json.dumps(idx.stats(), indent=2))
+            return 0
+
+        if not any([args.po, args.partner, args.doc_type, args.control, args.since, args.until]):
+            parser.error("find needs at least one filter")
+        rows = idx.find(args.po, args.partner, args.doc_type, args.control,
+                        args.since, args.until, args.limit)
+        if args.show:
+            for r in rows:
+                r["segments"] = read_segments(r["path"], r["offset"], r["length"])
+        if args.format == "json":
+            print(json.dumps(rows, indent=2))
+            return 0
+        _print_table(rows, ["doc_date", "doc_type", "sender", "receiver", "isa_control",
+                            "st_control", "pos", "path"])
+        for r in rows if args.show else []:
+            print(f"\n# {r['doc_type']} {r['st_control']} ({r['path']} @ {r['offset']})")
+            print("\n".join(r["segments"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
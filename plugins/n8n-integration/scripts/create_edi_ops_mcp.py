@@ -25,6 +25,14 @@ NetSuite field names (from customrecord_twx_edi_history):
   Partner link: h.custrecord_twx_eth_edi_tp → customrecord_twx_edi_tp.id
   Partner name: tp.name
 
+Reconciliation (850/856/810) is not done in JavaScript: the tools fetch the
+Celigo jobs and NS EDI History rows and POST them to the shared engine
+(celigo-integration/scripts/edi_reconcile.py serve), the same code edi_audit.py
+runs. EDI_RECONCILE_URL must be set when generating the workflow: it is the
+address of that endpoint as seen from the n8n host. If the endpoint requires a
+token, set EDI_RECONCILE_TOKEN in the n8n server's environment; the tools read
+it at run time through $env, so it never lands in the workflow JSON.
+
 Usage:
     python3 create_edi_ops_mcp.py              # Create Wave 1 (all 7 tools)
     python3 create_edi_ops_mcp.py --dry-run    # Print workflow JSON only
@@ -53,6 +61,10 @@ NS_GATEWAY_URL = "https://nsapi.twistedx.tech/api/suiteapi"
 NS_ACCOUNT = "twistedx"
 NS_ENVIRONMENT = "production"
 
+# Shared reconciliation endpoint (edi_reconcile.py serve), reachable from n8n.
+# No default: a localhost URL would point at the n8n host, not the engine.
+RECONCILE_URL = os.environ.get("EDI_RECONCILE_URL", "").rstrip("/")
+
 # Workflow config
 WORKFLOW_NAME = "EDI Ops MCP: Wave 1 (7 tools)"
 MCP_PATH = "edi-ops"
@@ -247,6 +259,7 @@ def _js_aggregate_celigo_jobs(doc_code):
     Uses _flowId (not flow_id) and ISO date comparison (not epoch ms)."""
     return f"""
 let totalJobs = 0, totalSuccess = 0, totalError = 0, flowsDisabled = 0;
+const celigoJobs = [];
 const flowsChecked = matchingFlows.length;
 matchingFlows.forEach(f => {{ if (f.disabled) flowsDisabled++; }});
 // Fetch all flow jobs in parallel (_flowId is the correct param; flow_id is ignored by Celigo)
@@ -265,6 +278,7 @@ allJobResults.forEach(jobs => {{
     const d = (j.startedAt || j.createdAt || '').slice(0, 10);
     return d >= startDate && d <= endDate;
   }}).forEach(j => {{
+    celigoJobs.push(j);
     totalJobs++;
     totalSuccess += (j.numSuccess || 0);
     totalError += (j.numError || 0);
@@ -273,24 +287,42 @@ allJobResults.forEach(jobs => {{
 """.strip()
 
 
-def _js_query_ns(doc_code, ns_type_id, return_count_only=True):
-    """Returns JS fragment to query NetSuite EDI TH. Sets nsCount/nsError."""
-    count_select = "COUNT(*) AS cnt" if return_count_only else "h.id, h.created, tp.name AS partner"
+def _js_reconcile(doc_code, ns_type_id, direction):
+    """Returns JS fragment that fetches the partner's NS EDI TH rows for the window and
+    reconciles them with celigoJobs through the shared engine (edi_reconcile.py).
+    Sets nsCount/nsError for the NS query and recon/reconError for the engine call,
+    so a reconcile outage still reports the NS count."""
     return f"""
-let nsCount = null, nsError = null;
+let recon = null, nsCount = null, nsError = null, reconError = null;
 const safePName = partnerName.replace(/'/g, "''").toUpperCase();
-const nsSql = `SELECT {count_select} FROM customrecord_twx_edi_history h LEFT JOIN customrecord_twx_edi_tp tp ON h.custrecord_twx_eth_edi_tp = tp.id WHERE h.custrecord_twx_edi_type = {ns_type_id} AND UPPER(tp.name) LIKE '%${{safePName}}%' AND h.created >= TO_DATE('${{startDate}}', 'YYYY-MM-DD') AND h.created < TO_DATE('${{endDate}}', 'YYYY-MM-DD') + 1`;
+const nsSql = `SELECT h.id, h.externalid, h.custrecord_twx_edi_history_status AS status, h.custrecord_twx_edi_history_transaction AS transaction_id, h.created FROM customrecord_twx_edi_history h LEFT JOIN customrecord_twx_edi_tp tp ON h.custrecord_twx_eth_edi_tp = tp.id WHERE h.custrecord_twx_edi_type = {ns_type_id} AND UPPER(tp.name) LIKE '%${{safePName}}%' AND h.created >= TO_DATE('${{startDate}}', 'YYYY-MM-DD') AND h.created < TO_DATE('${{endDate}}', 'YYYY-MM-DD') + 1 ORDER BY h.created DESC`;
 try {{
   const nsResp = await this.helpers.httpRequest({{
     method: 'POST', url: '{NS_GATEWAY_URL}',
     headers: {{'Content-Type': 'application/json'}},
     body: JSON.stringify({{action: 'queryRun', procedure: 'queryRun', query: nsSql,
-      params: [], returnAllRows: false,
+      params: [], returnAllRows: true,
       netsuiteAccount: '{NS_ACCOUNT}', netsuiteEnvironment: '{NS_ENVIRONMENT}'}})
   }});
   if (nsResp && nsResp.success) {{
-    const recs = (nsResp.data || {{}}).records || [];
-    {"nsCount = recs.length > 0 ? parseInt(recs[0].cnt || recs[0].CNT || 0, 10) : 0;" if return_count_only else "nsCount = recs.length;"}
+    // SuiteQL may return upper-case column names
+    const nsRows = ((nsResp.data || {{}}).records || []).map(r => ({{
+      id: r.id || r.ID, externalid: r.externalid || r.EXTERNALID, status: r.status || r.STATUS,
+      transaction_id: r.transaction_id || r.TRANSACTION_ID, created: r.created || r.CREATED,
+    }}));
+    nsCount = nsRows.length;
+    // Token comes from the n8n server environment, never from the workflow JSON
+    const reconToken = (typeof $env !== 'undefined' && $env.EDI_RECONCILE_TOKEN) || '';
+    const reconHeaders = {{'Content-Type': 'application/json'}};
+    if (reconToken) reconHeaders['X-API-Key'] = reconToken;
+    try {{
+      recon = await this.helpers.httpRequest({{
+        method: 'POST', url: '{RECONCILE_URL}/reconcile',
+        headers: reconHeaders,
+        body: JSON.stringify({{doc_type: '{doc_code}', direction: '{direction}', celigo: celigoJobs, netsuite: nsRows}}),
+      }});
+      if (typeof recon === 'string') recon = JSON.parse(recon);
+    }} catch(e) {{ recon = null; reconError = e.message; }}
   }} else {{
     nsError = nsResp && nsResp.error ? JSON.stringify(nsResp.error) : 'NS query failed';
   }}
@@ -298,58 +330,26 @@ try {{
 """.strip()
 
 
-def _js_query_ns_850():
-    """NS query for 850 POs: validates every received PO has a linked Sales Order.
-    Uses status=2 (success) to distinguish NS processing failures from SO-creation gaps.
-    externalid format: HIST_{PO_number}_{PARTNER}_00 — PO number extractable from it."""
-    return f"""
-let ns850 = null, nsError = null;
-const safePName = partnerName.replace(/'/g, "''").toUpperCase();
-// Count query: break down by status and SO presence
-const ns850Sql = `SELECT COUNT(*) AS total_received, SUM(CASE WHEN custrecord_twx_edi_history_status = 2 THEN 1 ELSE 0 END) AS ns_success, SUM(CASE WHEN custrecord_twx_edi_history_status != 2 THEN 1 ELSE 0 END) AS ns_failed, SUM(CASE WHEN custrecord_twx_edi_history_transaction IS NOT NULL THEN 1 ELSE 0 END) AS orders_created, SUM(CASE WHEN custrecord_twx_edi_history_status = 2 AND custrecord_twx_edi_history_transaction IS NULL THEN 1 ELSE 0 END) AS pos_without_order FROM customrecord_twx_edi_history h LEFT JOIN customrecord_twx_edi_tp tp ON h.custrecord_twx_eth_edi_tp = tp.id WHERE h.custrecord_twx_edi_type = 3 AND UPPER(tp.name) LIKE '%${{safePName}}%' AND h.created >= TO_DATE('${{startDate}}', 'YYYY-MM-DD') AND h.created < TO_DATE('${{endDate}}', 'YYYY-MM-DD') + 1`;
-try {{
-  const nsResp = await this.helpers.httpRequest({{
-    method: 'POST', url: '{NS_GATEWAY_URL}',
-    headers: {{'Content-Type': 'application/json'}},
-    body: JSON.stringify({{action: 'queryRun', procedure: 'queryRun', query: ns850Sql,
-      params: [], returnAllRows: false,
-      netsuiteAccount: '{NS_ACCOUNT}', netsuiteEnvironment: '{NS_ENVIRONMENT}'}})
-  }});
-  if (nsResp && nsResp.success) {{
-    const r = ((nsResp.data || {{}}).records || [])[0] || {{}};
-    ns850 = {{
-      pos_received: parseInt(r.total_received || r.TOTAL_RECEIVED || 0, 10),
-      ns_processing_ok: parseInt(r.ns_success || r.NS_SUCCESS || 0, 10),
-      ns_processing_failed: parseInt(r.ns_failed || r.NS_FAILED || 0, 10),
-      orders_created: parseInt(r.orders_created || r.ORDERS_CREATED || 0, 10),
-      pos_without_order: parseInt(r.pos_without_order || r.POS_WITHOUT_ORDER || 0, 10),
-    }};
-    // If any failures exist, fetch the specific PO numbers (up to 20)
-    if (ns850.ns_processing_failed > 0 || ns850.pos_without_order > 0) {{
-      const detailSql = `SELECT h.externalid, h.created, h.custrecord_twx_edi_history_status FROM customrecord_twx_edi_history h LEFT JOIN customrecord_twx_edi_tp tp ON h.custrecord_twx_eth_edi_tp = tp.id WHERE h.custrecord_twx_edi_type = 3 AND UPPER(tp.name) LIKE '%${{safePName}}%' AND h.created >= TO_DATE('${{startDate}}', 'YYYY-MM-DD') AND h.created < TO_DATE('${{endDate}}', 'YYYY-MM-DD') + 1 AND (h.custrecord_twx_edi_history_status != 2 OR h.custrecord_twx_edi_history_transaction IS NULL) ORDER BY h.created DESC FETCH FIRST 20 ROWS ONLY`;
-      try {{
-        const detailResp = await this.helpers.httpRequest({{
-          method: 'POST', url: '{NS_GATEWAY_URL}',
-          headers: {{'Content-Type': 'application/json'}},
-          body: JSON.stringify({{action: 'queryRun', procedure: 'queryRun', query: detailSql,
-            params: [], returnAllRows: false,
-            netsuiteAccount: '{NS_ACCOUNT}', netsuiteEnvironment: '{NS_ENVIRONMENT}'}})
-        }});
-        if (detailResp && detailResp.success) {{
-          // externalid = HIST_{{PO_number}}_{{PARTNER}}_00 — extract the PO number
-          ns850.failed_pos = ((detailResp.data || {{}}).records || []).map(r => {{
-            const eid = r.externalid || r.EXTERNALID || '';
-            const poNum = eid.replace(/^HIST_/, '').split('_')[0];
-            const status = parseInt(r.custrecord_twx_edi_history_status || r.CUSTRECORD_TWX_EDI_HISTORY_STATUS || 0);
-            return {{ po_number: poNum, date: r.created || r.CREATED, reason: status === 2 ? 'no_sales_order_created' : `ns_processing_failed_status_${{status}}` }};
-          }});
-        }}
-      }} catch(e) {{ /* detail query failed, continue without it */ }}
-    }}
-  }} else {{
-    nsError = nsResp && nsResp.error ? JSON.stringify(nsResp.error) : 'NS query failed';
-  }}
-}} catch(e) {{ nsError = e.message; }}
+_JS_NS_850_FROM_RECON = """
+let ns850 = null;
+if (recon) {
+  const n = recon.netsuite;
+  ns850 = {
+    pos_received: n.records,
+    ns_processing_ok: n.ok,
+    ns_processing_failed: n.failed,
+    orders_created: n.with_transaction,
+    pos_without_order: n.without_transaction,
+  };
+  // Row-level findings from the engine, newest first (up to 20)
+  const failed = recon.mismatches.filter(m => m.bucket === 'ns_status_error');
+  if (failed.length > 0) {
+    ns850.failed_pos = failed.slice(0, 20).map(m => ({
+      po_number: m.po, date: m.created,
+      reason: m.type === 'pos_without_order' ? 'no_sales_order_created' : `ns_processing_failed_status_${m.ns_status}`,
+    }));
+  }
+}
 """.strip()
 
 
@@ -379,6 +379,8 @@ if (totalError > 0) result.ALERT_celigo_errors = `${{totalError}} job errors in
 result.celigo = {{flows_checked: flowsChecked, flows_disabled: flowsDisabled, jobs_ran: totalJobs, job_errors: totalError,
   note: 'records_succeeded counts line items processed, not document count'}};
 result.netsuite = nsCount !== null ? {{transactions_found: nsCount}} : {{unavailable: true, reason: nsError}};
+if (recon && recon.total_mismatches > 0) result.ALERT_reconciliation = recon.mismatches.slice(0, 20);
+if (reconError) result.reconciliation = {{unavailable: true, reason: reconError}};
 {discrepancy_block}
 return JSON.stringify(result);
 """.strip()
@@ -428,6 +430,10 @@ if (ns850 !== null) {{
       ? `All ${{ns850.pos_received}} PO(s) received in NetSuite were processed and have linked Sales Orders`
       : `Issues detected — see ALERT fields above. ${{ns850.orders_created}}/${{ns850.pos_received}} received POs have Sales Orders.`,
   }};
+}} else if (nsCount !== null) {{
+  // NS answered but the reconcile engine did not: report the raw count only
+  result.netsuite = {{pos_received: nsCount}};
+  result.reconciliation = {{unavailable: true, reason: reconError}};
 }} else {{
   result.netsuite = {{unavailable: true, reason: nsError}};
 }}
@@ -437,7 +443,8 @@ return JSON.stringify(result);
 _js_850_body = f"""
 {_js_validate_and_find_flows('850', ['IB', 'INB'])}
 {_js_aggregate_celigo_jobs('850')}
-{_js_query_ns_850()}
+{_js_reconcile('850', 3, 'inbound')}
+{_JS_NS_850_FROM_RECON}
 {_JS_BUILD_RESULT_850}
 """.strip()
 
@@ -495,12 +502,14 @@ if (jobsWithinSla + jobsExceededSla > 0) {{
   if (jobsExceededSla > 0) result.ALERT_sla = `${{jobsExceededSla}} job(s) exceeded ${{asnSlaHours}}-hour SLA`;
 }}
 result.netsuite = nsCount !== null ? {{asns_sent: nsCount}} : {{unavailable: true, reason: nsError}};
+if (recon && recon.total_mismatches > 0) result.ALERT_reconciliation = recon.mismatches.slice(0, 20);
+if (reconError) result.reconciliation = {{unavailable: true, reason: reconError}};
 return JSON.stringify(result);
 """.strip()
 
 JS_CHECK_ASN_COMPLIANCE = f"""
 try {{
-  {chr(10).join('  ' + line for line in (_js_validate_and_find_flows('856', ['OB', 'OUT']) + chr(10) + _js_aggregate_celigo_jobs('856') + chr(10) + _JS_ASN_SLA_BLOCK + chr(10) + _js_query_ns('856', 5, return_count_only=True) + chr(10) + _JS_ASN_RESULT).splitlines())}
+  {chr(10).join('  ' + line for line in (_js_validate_and_find_flows('856', ['OB', 'OUT']) + chr(10) + _js_aggregate_celigo_jobs('856') + chr(10) + _JS_ASN_SLA_BLOCK + chr(10) + _js_reconcile('856', 5, 'outbound') + chr(10) + _JS_ASN_RESULT).splitlines())}
 }} catch(e) {{ return JSON.stringify({{error: e.message}}); }}
 """.strip()
 
@@ -509,7 +518,7 @@ try {{
 
 JS_CHECK_INVOICE_TRANSMISSION = f"""
 try {{
-{chr(10).join('  ' + line for line in (_js_validate_and_find_flows('810', ['OB', 'OUT']) + chr(10) + _js_aggregate_celigo_jobs('810') + chr(10) + _js_query_ns('810', 1, return_count_only=True) + chr(10) + _js_build_result('810 - Invoice', show_discrepancy=False)).splitlines())}
+{chr(10).join('  ' + line for line in (_js_validate_and_find_flows('810', ['OB', 'OUT']) + chr(10) + _js_aggregate_celigo_jobs('810') + chr(10) + _js_reconcile('810', 1, 'outbound') + chr(10) + _js_build_result('810 - Invoice', show_discrepancy=False)).splitlines())}
 }} catch(e) {{ return JSON.stringify({{error: e.message}}); }}
 """.strip()
 
@@ -903,6 +912,11 @@ def main():
     parser.add_argument("--name", default=WORKFLOW_NAME, help="Workflow name")
     args = parser.parse_args()
 
+    if not RECONCILE_URL:
+        print("ERROR: EDI_RECONCILE_URL is not set. Point it at edi_reconcile.py serve "
+              "as reachable from the n8n host (e.g. http://edi-tools.internal:8787).", file=sys.stderr)
+        sys.exit(1)
+
     if args.wave == 0:
         tool_nodes = build_wave0()
         wf_name = "EDI Ops MCP: Wave 0 (2 tools)"
@@ -1,105 +1,44 @@
 #!/usr/bin/env python3
 """
 Add data sources to CRE2 profiles that are missing them.
+
+Data sources are created concurrently through cre2_upsert.run_upserts.
 """
 
 import sys
 import os
-import json
-import urllib.request
-import time
 
-# NetSuite API Gateway endpoint — override with NETSUITE_GATEWAY_URL env var
+script_dir = os.path.dirname(os.path.abspath(__file__))
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+from cre2_upsert import (  # noqa: E402
+    DEFAULT_UPSERT_WORKERS,
+    data_source_index,
+    data_source_job,
+    data_source_key,
+    lookup_data_sources,
+    profile_index,
+    run_upserts,
+)
+
 _gw_base = os.environ.get('NETSUITE_GATEWAY_URL', 'https://nsapi.twistedx.tech').rstrip('/')
-GATEWAY_URL = f'{_gw_base}/api/suiteapi'
-_API_KEY = os.environ.get('NETSUITE_API_KEY', '')
-if not _API_KEY and 'nsapi.twistedx.tech' in _gw_base:
+if not os.environ.get('NETSUITE_API_KEY') and 'nsapi.twistedx.tech' in _gw_base:
     print("Warning: NETSUITE_API_KEY not set — requests to prod gateway will fail with 401", file=sys.stderr)
 
-DATA_SOURCE_QUERY = """SELECT h.id, h.name, h.custrecord_twx_edi_history_json AS edi_json, h.custrecord_twx_eth_edi_tp AS trading_partner, h.custrecord_twx_edi_type AS doc_type, h.custrecord_twx_edi_history_status AS status, h.created AS created_date, tp.custrecord_twx_edi_tp_logo AS tp_logo_id, tp.name AS tp_name FROM customrecord_twx_edi_history h LEFT JOIN customrecord_twx_edi_tp tp ON h.custrecord_twx_eth_edi_tp = tp.id WHERE h.id = ${record.id}"""
-
-
-def execute_query(query, account='twistedx', environment='sandbox2'):
-    payload = {
-        'action': 'queryRun',
-        'procedure': 'queryRun',
-        'query': query,
-        'params': [],
-        'returnAllRows': True,
-        'netsuiteAccount': account,
-        'netsuiteEnvironment': environment
-    }
-    data = json.dumps(payload).encode('utf-8')
-    req = urllib.request.Request(
-        GATEWAY_URL,
-        data=data,
-        headers={
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-        }
-    )
-    with urllib.request.urlopen(req, timeout=60) as response:
-        result = json.loads(response.read().decode('utf-8'))
-        return result.get('data', {}).get('records', [])
-
-
-def create_data_source(profile_id, account='twistedx', environment='sandbox2'):
-    payload = {
-        'action': 'execute',
-        'procedure': 'twxUpsertRecord',
-        'type': 'customrecord_pri_cre2_query',
-        'id': 0,
-        'fields': {
-            'name': 'edi',
-            'custrecord_pri_cre2q_parent': profile_id,
-            'custrecord_pri_cre2q_query': DATA_SOURCE_QUERY,
-            'custrecord_pri_cre2q_paged': False,
-            'custrecord_pri_cre2q_single_record_json': False
-        },
-        'netsuiteAccount': account,
-        'netsuiteEnvironment': environment
-    }
-    try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-            }
-        )
-        with urllib.request.urlopen(req, timeout=60) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            if result.get('success'):
-                return {'success': True, 'id': result.get('data', {}).get('id')}
-            return {'success': False, 'error': result.get('error', 'Unknown')}
-    except Exception as e:
-        return {'success': False, 'error': str(e)}
-
 
 def main():
     account = 'twistedx'
     environment = 'sandbox2'
 
-    # Get profiles with data sources
-    with_ds = set(
-        r['profile_id'] for r in execute_query(
-            "SELECT DISTINCT custrecord_pri_cre2q_parent as profile_id FROM customrecord_pri_cre2_query",
-            account, environment
-        )
-    )
+    # Get profiles with data sources (any name counts)
+    with_ds = data_source_index(account, environment)
+    parents = {key.split('/', 1)[0] for key in with_ds}
 
     # Get all EDI profiles
-    profiles = execute_query(
-        "SELECT id, name FROM customrecord_pri_cre2_profile WHERE name LIKE 'TWX-EDI-%' AND isinactive = 'F' ORDER BY name",
-        account, environment
-    )
+    profiles = sorted(profile_index(account, environment).items())
 
     # Find profiles without data sources
-    missing = [(p['id'], p['name']) for p in profiles if p['id'] not in with_ds]
+    missing = [(pid, pname) for pname, pid in profiles if str(pid) not in parents]
 
     print(f"Profiles missing data sources: {len(missing)}")
     print()
@@ -108,22 +47,26 @@ def main():
         print("All profiles have data sources!")
         return
 
-    created = 0
-    failed = 0
+    names = {data_source_key(pid): pname for pid, pname in missing}
+    done = 0
 
-    for i, (pid, pname) in enumerate(missing, 1):
-        result = create_data_source(pid, account, environment)
-        if result.get('success'):
-            print(f"  ✓ {pname} → DS ID: {result.get('id')}")
-            created += 1
+    def show(result):
+        nonlocal done
+        done += 1
+        pname = names[result['key']]
+        if result['success']:
+            print(f"  ✓ {pname} → DS ID: {result['id']}")
         else:
-            print(f"  ✗ {pname} → Error: {result.get('error')}")
-            failed += 1
+            print(f"  ✗ {pname} → Error: {result['error']}")
+        if done % 20 == 0:
+            print(f"\n  Progress: {done}/{len(missing)} ({100*done//len(missing)}%)\n")
 
-        time.sleep(0.15)
+    results = run_upserts(
+        [data_source_job(pid) for pid, _ in missing], account, environment,
+        existing=with_ds, lookup=lookup_data_sources, workers=DEFAULT_UPSERT_WORKERS, on_result=show)
 
-        if i % 20 == 0:
-            print(f"\n  Progress: {i}/{len(missing)} ({100*i//len(missing)}%)\n")
+    created = sum(1 for r in results if r['success'])
+    failed = len(results) - created
 
     print("\n" + "=" * 60)
     print(f"Created: {created}")
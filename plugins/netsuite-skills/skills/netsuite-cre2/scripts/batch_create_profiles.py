@@ -15,6 +15,7 @@ Options:
     --partner PARTNER   Create profiles only for specified partner code
     --doctype DOCTYPE   Create profiles only for specified document type (810, 850, etc.)
     --skip-existing     Skip if profile name already exists (default behavior)
+    --workers N         Profiles/data sources created at once (default: 6)
     --list-partners     List all active partners and exit
     --list-doctypes     List document type configurations and exit
 
@@ -35,17 +36,26 @@ Examples:
 import sys
 import os
 import json
-import urllib.request
-import urllib.error
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-import time
+from typing import Dict, List, Any
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+from cre2_upsert import (  # noqa: E402
+    DEFAULT_UPSERT_WORKERS,
+    data_source_index,
+    data_source_job,
+    data_source_key,
+    lookup_data_sources,
+    lookup_profiles,
+    profile_index,
+    profile_job,
+    run_upserts,
+)
 
-# NetSuite API Gateway endpoint — override with NETSUITE_GATEWAY_URL env var
 _gw_base = os.environ.get('NETSUITE_GATEWAY_URL', 'https://nsapi.twistedx.tech').rstrip('/')
-GATEWAY_URL = f'{_gw_base}/api/suiteapi'
-_API_KEY = os.environ.get('NETSUITE_API_KEY', '')
-if not _API_KEY and 'nsapi.twistedx.tech' in _gw_base:
+if not os.environ.get('NETSUITE_API_KEY') and 'nsapi.twistedx.tech' in _gw_base:
     print("Warning: NETSUITE_API_KEY not set — requests to prod gateway will fail with 401", file=sys.stderr)
 
 # Account aliases
@@ -61,16 +71,7 @@ ENV_ALIASES = {
     'sb2': 'sandbox2', 'sandbox2': 'sandbox2'
 }
 
-# CRE2 Profile Configuration
-# Record type ID for customrecord_twx_edi_history
-RECORD_TYPE_ID = 2288
-
-# JS Override (Data Extractor) - shared across all profiles
-JS_OVERRIDE_ID = 52794157
-
-# Data source query - same for all profiles
-# Fetches EDI JSON and trading partner info for the current record
-DATA_SOURCE_QUERY = """SELECT h.id, h.name, h.custrecord_twx_edi_history_json AS edi_json, h.custrecord_twx_eth_edi_tp AS trading_partner, h.custrecord_twx_edi_type AS doc_type, h.custrecord_twx_edi_history_status AS status, h.created AS created_date, tp.custrecord_twx_edi_tp_logo AS tp_logo_id, tp.name AS tp_name FROM customrecord_twx_edi_history h LEFT JOIN customrecord_twx_edi_tp tp ON h.custrecord_twx_eth_edi_tp = tp.id WHERE h.id = ${record.id}"""
+# Profile record type, JS override and data source query: see cre2_upsert.py
 
 # Document Type Configurations (Default/Generic Templates)
 DOCUMENT_TYPES = {
@@ -256,160 +257,69 @@ def get_active_partners(config: Dict[str, Any]) -> List[Dict[str, Any]]:
 
 def get_existing_profiles(account: str, environment: str) -> Dict[str, int]:
     """Query existing CRE2 profiles and return name -> id mapping."""
-    query = "SELECT id, name FROM customrecord_pri_cre2_profile WHERE name LIKE 'TWX-EDI-%' AND isinactive = 'F'"
-
-    payload = {
-        'action': 'queryRun',
-        'procedure': 'queryRun',
-        'query': query,
-        'params': [],
-        'returnAllRows': True,
-        'netsuiteAccount': resolve_account(account),
-        'netsuiteEnvironment': resolve_environment(environment)
-    }
-
     try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-            }
-        )
-
-        with urllib.request.urlopen(req, timeout=60) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            if result.get('success'):
-                records = result.get('data', {}).get('records', [])
-                return {r['name']: r['id'] for r in records}
+        return profile_index(account, environment)
     except Exception as e:
         print(f"Warning: Could not fetch existing profiles: {e}")
-
     return {}
 
 
-def create_profile(
-    profile_name: str,
-    template_id: int,
-    file_name: str,
+def create_profiles(
+    specs: List[Dict[str, Any]],
+    existing: Dict[str, int],
     account: str = DEFAULT_ACCOUNT,
-    environment: str = DEFAULT_ENVIRONMENT
-) -> Dict[str, Any]:
-    """Create a CRE2 profile using twxUpsertRecord."""
-
-    payload = {
-        'action': 'execute',
-        'procedure': 'twxUpsertRecord',
-        'type': 'customrecord_pri_cre2_profile',
-        'id': 0,  # 0 = create new
-        'fields': {
-            'name': profile_name,
-            'custrecord_pri_cre2_rectype': RECORD_TYPE_ID,
-            'custrecord_pri_cre2_recname': 'record',
-            'custrecord_pri_cre2_gen_file_tmpl_doc': template_id,
-            'custrecord_pri_cre2_js_override': JS_OVERRIDE_ID,
-            'custrecord_pri_cre2_gen_file_name': file_name,
-            'custrecord_pri_cre2_gen_file_public': True,
-            'isinactive': False
-        },
-        'netsuiteAccount': resolve_account(account),
-        'netsuiteEnvironment': resolve_environment(environment)
-    }
+    environment: str = DEFAULT_ENVIRONMENT,
+    workers: int = DEFAULT_UPSERT_WORKERS
+) -> List[Dict[str, Any]]:
+    """
+    Create profiles (specs: name, template_id, file_name) concurrently.
 
-    try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-            }
-        )
-
-        with urllib.request.urlopen(req, timeout=60) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            if result.get('success'):
-                return {
-                    'success': True,
-                    'id': result.get('data', {}).get('id'),
-                    'name': profile_name
-                }
-            else:
-                return {
-                    'success': False,
-                    'error': result.get('error', 'Unknown error'),
-                    'name': profile_name
-                }
+    Names already in existing are not sent; a create that times out is
+    checked by name before it is retried. Results are in spec order.
+    """
+    jobs = [profile_job(s['name'], s['template_id'], s['file_name']) for s in specs]
 
-    except Exception as e:
-        return {
-            'success': False,
-            'error': str(e),
-            'name': profile_name
-        }
+    def show(r: Dict[str, Any]) -> None:
+        if r['status'] == 'existing':
+            print(f"  SKIP: {r['key']} (already exists)")
+        elif r['success']:
+            note = ' (confirmed after retry)' if r['status'] == 'reconciled' else ''
+            print(f"  ✓ Created: {r['key']} (ID: {r['id']}){note}")
+        else:
+            print(f"  ✗ FAILED: {r['key']} - {r['error']}")
+
+    return run_upserts(jobs, account, environment, existing=existing, lookup=lookup_profiles,
+                       workers=workers, on_result=show)
 
 
-def create_data_source(
-    profile_id: int,
+def create_data_sources(
+    profiles: Dict[str, Any],
     account: str = DEFAULT_ACCOUNT,
-    environment: str = DEFAULT_ENVIRONMENT
-) -> Dict[str, Any]:
-    """Create a data source (query) record for a CRE2 profile."""
-
-    payload = {
-        'action': 'execute',
-        'procedure': 'twxUpsertRecord',
-        'type': 'customrecord_pri_cre2_query',
-        'id': 0,  # 0 = create new
-        'fields': {
-            'name': 'edi',
-            'custrecord_pri_cre2q_parent': profile_id,
-            'custrecord_pri_cre2q_query': DATA_SOURCE_QUERY,
-            'custrecord_pri_cre2q_paged': False,
-            'custrecord_pri_cre2q_single_record_json': False
-        },
-        'netsuiteAccount': resolve_account(account),
-        'netsuiteEnvironment': resolve_environment(environment)
-    }
+    environment: str = DEFAULT_ENVIRONMENT,
+    workers: int = DEFAULT_UPSERT_WORKERS
+) -> List[Dict[str, Any]]:
+    """
+    Create the 'edi' data source for each profile ({name: id}) that lacks one.
 
+    Profiles that already have it are skipped, so re-running after a partial
+    failure only fills the gaps.
+    """
     try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-            }
-        )
-
-        with urllib.request.urlopen(req, timeout=60) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            if result.get('success'):
-                return {
-                    'success': True,
-                    'id': result.get('data', {}).get('id'),
-                    'profile_id': profile_id
-                }
-            else:
-                return {
-                    'success': False,
-                    'error': result.get('error', 'Unknown error'),
-                    'profile_id': profile_id
-                }
-
+        existing = data_source_index(account, environment)
     except Exception as e:
-        return {
-            'success': False,
-            'error': str(e),
-            'profile_id': profile_id
-        }
+        print(f"Warning: Could not fetch existing data sources: {e}")
+        existing = {}
+    names = {data_source_key(pid): name for name, pid in profiles.items()}
+    jobs = [data_source_job(pid) for pid in profiles.values()]
+
+    def show(r: Dict[str, Any]) -> None:
+        if r['status'] in ('created', 'reconciled'):
+            print(f"    + Data source created for {names[r['key']]} (ID: {r['id']})")
+        elif not r['success']:
+            print(f"    ! Data source failed for {names[r['key']]}: {r['error']}")
+
+    return run_upserts(jobs, account, environment, existing=existing, lookup=lookup_data_sources,
+                       workers=workers, on_result=show)
 
 
 def print_usage():
@@ -436,6 +346,8 @@ def main():
                         help='Create profiles only for specified document type')
     parser.add_argument('--skip-existing', action='store_true', default=True,
                         help='Skip profiles that already exist (default)')
+    parser.add_argument('--workers', '-w', type=int, default=DEFAULT_UPSERT_WORKERS,
+                        help=f'Upserts in flight at once (default: {DEFAULT_UPSERT_WORKERS}; 1 = sequential)')
     parser.add_argument('--list-partners', action='store_true',
                         help='List all active partners and exit')
     parser.add_argument('--list-doctypes', action='store_true',
@@ -508,66 +420,35 @@ def main():
     existing = get_existing_profiles(args.account, args.env)
     print(f"Found {len(existing)} existing EDI profiles")
 
-    # Create profiles
-    created = 0
-    skipped = 0
-    failed = 0
-    errors = []
-
-    print("\nCreating profiles...\n")
-
-    for i, partner in enumerate(partners, 1):
-        for doc_code, doc_cfg in doc_types.items():
-            profile_name = f"TWX-EDI-{doc_code}-{partner['code']}-PDF"
-
-            # Skip if already exists
-            if profile_name in existing:
-                print(f"  SKIP: {profile_name} (already exists)")
-                skipped += 1
-                continue
-
-            # Get template ID (partner-specific if available, else default)
-            template_id = get_template_id(partner['code'], doc_code)
-
-            # Create profile
-            result = create_profile(
-                profile_name=profile_name,
-                template_id=template_id,
-                file_name=doc_cfg['file_name'],
-                account=args.account,
-                environment=args.env
-            )
-
-            if result.get('success'):
-                profile_id = result.get('id')
-                print(f"  ✓ Created: {profile_name} (ID: {profile_id})")
-
-                # Create data source for the profile
-                ds_result = create_data_source(
-                    profile_id=profile_id,
-                    account=args.account,
-                    environment=args.env
-                )
-                if ds_result.get('success'):
-                    print(f"    + Data source created (ID: {ds_result.get('id')})")
-                else:
-                    print(f"    ! Data source failed: {ds_result.get('error')}")
-
-                created += 1
-            else:
-                print(f"  ✗ FAILED: {profile_name} - {result.get('error')}")
-                failed += 1
-                errors.append({
-                    'name': profile_name,
-                    'error': result.get('error')
-                })
-
-            # Small delay to avoid rate limiting
-            time.sleep(0.2)
-
-        # Progress indicator
-        pct = (i / len(partners)) * 100
-        print(f"\n  Progress: {i}/{len(partners)} partners ({pct:.0f}%)\n")
+    specs = [
+        {
+            'name': f"TWX-EDI-{doc_code}-{partner['code']}-PDF",
+            'template_id': get_template_id(partner['code'], doc_code),
+            'file_name': doc_cfg['file_name'],
+        }
+        for partner in partners
+        for doc_code, doc_cfg in doc_types.items()
+    ]
+
+    print(f"\nCreating profiles ({args.workers} at a time)...\n")
+    results = create_profiles(specs, existing, args.account, args.env, args.workers)
+
+    created = sum(1 for r in results if r['status'] in ('created', 'reconciled'))
+    skipped = sum(1 for r in results if r['status'] == 'existing')
+    failed = sum(1 for r in results if not r['success'])
+    errors = [{'name': r['key'], 'error': r['error']} for r in results if not r['success']]
+
+    # Every profile in scope that exists now gets a data source if it lacks one,
+    # including profiles skipped here whose data source failed on an earlier run
+    profiles = {r['key']: r['id'] for r in results if r['success'] and r['id']}
+    ds_failed = 0
+    if profiles:
+        print("\nCreating data sources...\n")
+        ds_results = create_data_sources(profiles, args.account, args.env, args.workers)
+        ds_names = {data_source_key(pid): name for name, pid in profiles.items()}
+        ds_failed = sum(1 for r in ds_results if not r['success'])
+        errors += [{'name': f"{ds_names[r['key']]} (data source)", 'error': r['error']}
+                   for r in ds_results if not r['success']]
 
     # Summary
     print("\n" + "=" * 60)
@@ -577,13 +458,14 @@ def main():
     print(f"Skipped: {skipped}")
     print(f"Failed:  {failed}")
     print(f"Total:   {created + skipped + failed}")
+    print(f"Data source failures: {ds_failed}")
 
     if errors:
         print("\nErrors:")
         for err in errors:
             print(f"  - {err['name']}: {err['error']}")
 
-    sys.exit(0 if failed == 0 else 1)
+    sys.exit(0 if failed == 0 and ds_failed == 0 else 1)
 
 
 if __name__ == '__main__':
@@ -22,6 +22,11 @@ import urllib.error
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+script_dir = os.path.dirname(os.path.abspath(__file__))
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+from cre2_upsert import DEFAULT_UPSERT_WORKERS, profile_template_job, run_upserts  # noqa: E402
+
 # NetSuite API Gateway endpoint — override with NETSUITE_GATEWAY_URL env var
 _gw_base = os.environ.get('NETSUITE_GATEWAY_URL', 'https://nsapi.twistedx.tech').rstrip('/')
 GATEWAY_URL = f'{_gw_base}/api/suiteapi'
@@ -189,39 +194,6 @@ def upload_file(content: str, filename: str, folder_id: int, account: str, envir
         return {'success': False, 'error': str(e)}
 
 
-def update_profile_template(profile_id: int, template_id: int, account: str, environment: str) -> bool:
-    """Update a CRE2 profile to use a specific template."""
-    payload = {
-        'action': 'execute',
-        'procedure': 'twxUpsertRecord',
-        'type': 'customrecord_pri_cre2_profile',
-        'id': profile_id,
-        'fields': {
-            'custrecord_pri_cre2_gen_file_tmpl_doc': template_id
-        },
-        'netsuiteAccount': resolve_account(account),
-        'netsuiteEnvironment': resolve_environment(environment)
-    }
-
-    try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-            }
-        )
-        with urllib.request.urlopen(req, timeout=60) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            return result.get('success', False)
-    except Exception as e:
-        print(f"Error updating profile {profile_id}: {e}")
-        return False
-
-
 def customize_template(base_content: str, partner: str, doc_type: str) -> str:
     """Customize template header for a specific partner."""
     doc_desc = DOC_TYPE_DESCRIPTIONS.get(doc_type, doc_type)
@@ -284,6 +256,8 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Preview without making changes')
     parser.add_argument('--partner', help='Process single partner only')
     parser.add_argument('--doc-type', help='Process single document type only (810, 850, etc.)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_UPSERT_WORKERS,
+                        help=f'Profile updates in flight at once (default: {DEFAULT_UPSERT_WORKERS})')
     args = parser.parse_args()
 
     account = args.account
@@ -404,23 +378,25 @@ def main():
     print(f"Failed: {failed}")
     print(f"{'='*70}\n")
 
-    # Now update profiles to use their specific templates
+    # Now update profiles to use their specific templates (concurrent upserts)
     print("Updating profiles with template assignments...\n")
 
+    jobs = []
     for profile_name, template_id in template_map.items():
         if profile_name not in existing_profiles:
             print(f"  {profile_name}: Profile not found - SKIPPED")
             continue
+        jobs.append(profile_template_job(profile_name, existing_profiles[profile_name], template_id))
 
-        profile_id = existing_profiles[profile_name]
-        if update_profile_template(profile_id, template_id, account, environment):
-            print(f"  {profile_name} (ID: {profile_id}) → Template: {template_id}")
-            updated += 1
+    def show(r: Dict[str, Any]) -> None:
+        if r['success']:
+            print(f"  {r['key']} (ID: {r['id']}) → Template: {template_map[r['key']]}")
         else:
-            print(f"  {profile_name}: Update FAILED")
-            failed += 1
+            print(f"  {r['key']}: Update FAILED - {r['error']}")
 
-        time.sleep(0.1)
+    results = run_upserts(jobs, account, environment, workers=args.workers, on_result=show)
+    updated = sum(1 for r in results if r['success'])
+    failed += len(results) - updated
 
     print(f"\n{'='*70}")
     print("PROFILE UPDATE COMPLETE")
@@ -3,31 +3,39 @@
 Batch Test CRE2 Profiles - Phase 3 & 4 of Implementation Plan
 
 Phase 3: Find test records for each partner/document type combination
-Phase 4: Test each profile with render_pdf.py
+Phase 4: Render every profile concurrently via cre2_matrix (optionally
+         verifying each PDF); unchanged profiles reuse cached results
 
 Usage:
   python3 batch_test_profiles.py --env sb2 --dry-run
   python3 batch_test_profiles.py --env sb2
   python3 batch_test_profiles.py --env sb2 --partner ROCKY --doc-type 810
+  python3 batch_test_profiles.py --env sb2 --doc-type 850 --verify --parallel 6
 """
 
 import sys
 import os
 import json
-import time
-import urllib.request
-import urllib.error
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# NetSuite API Gateway endpoint — override with NETSUITE_GATEWAY_URL env var
+# NetSuite API Gateway — override with NETSUITE_GATEWAY_URL env var
 _gw_base = os.environ.get('NETSUITE_GATEWAY_URL', 'https://nsapi.twistedx.tech').rstrip('/')
-GATEWAY_URL = f'{_gw_base}/api/suiteapi'
 _API_KEY = os.environ.get('NETSUITE_API_KEY', '')
 if not _API_KEY and 'nsapi.twistedx.tech' in _gw_base:
     print("Warning: NETSUITE_API_KEY not set — requests to prod gateway will fail with 401", file=sys.stderr)
 
+# Pooled gateway client shared with the netsuite-suiteql skill
+_SUITEQL_SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'netsuite-suiteql', 'scripts')
+if _SUITEQL_SCRIPTS not in sys.path:
+    sys.path.insert(0, _SUITEQL_SCRIPTS)
+from netsuite_gateway import get_client  # noqa: E402
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+from cre2_matrix import DEFAULT_EXTRACT_WORKERS, run_matrix  # noqa: E402
+
 # Account/Environment aliases
 ACCOUNT_ALIASES = {
     'twx': 'twistedx', 'twisted': 'twistedx', 'twistedx': 'twistedx',
@@ -74,6 +82,12 @@ ACCOUNT_IDS = {
 DEFAULT_ACCOUNT = 'twistedx'
 DEFAULT_ENVIRONMENT = 'sandbox2'
 
+# Local result-cache TTLs (seconds) for the reference lookups every run repeats,
+# used only with --cache-lookups. --refresh re-fetches them.
+PROFILE_LIST_TTL = 15 * 60          # new profiles appear during batch_create sessions
+TRADING_PARTNER_TTL = 24 * 60 * 60  # partner records rarely change
+TEST_RECORD_TTL = 60 * 60           # any recent history record works as a render target
+
 
 def resolve_account(account: str) -> str:
     return ACCOUNT_ALIASES.get(account.lower(), account.lower())
@@ -83,75 +97,23 @@ def resolve_environment(environment: str) -> str:
     return ENV_ALIASES.get(environment.lower(), environment.lower())
 
 
-def execute_query(query: str, account: str = DEFAULT_ACCOUNT, environment: str = DEFAULT_ENVIRONMENT) -> List[Dict]:
-    """Execute a SuiteQL query."""
-    payload = {
-        'action': 'queryRun',
-        'procedure': 'queryRun',
-        'query': query,
-        'params': [],
-        'returnAllRows': True,
-        'netsuiteAccount': resolve_account(account),
-        'netsuiteEnvironment': resolve_environment(environment)
-    }
-
-    try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-            }
-        )
-        with urllib.request.urlopen(req, timeout=60) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            return result.get('data', {}).get('records', [])
-    except Exception as e:
-        print(f"Query error: {e}")
+def execute_query(query: str, account: str = DEFAULT_ACCOUNT, environment: str = DEFAULT_ENVIRONMENT,
+                  cache_ttl: Optional[float] = None, refresh: bool = False) -> List[Dict]:
+    """Execute a SuiteQL query (served from the local result cache when cache_ttl is set)."""
+    result = get_client().query(query, None, resolve_account(account), resolve_environment(environment),
+                                return_all_rows=True, timeout=60, cache_ttl=cache_ttl, refresh=refresh)
+    if result['error']:
+        print(f"Query error: {result['error']}")
         return []
+    return result['records']
 
 
-def render_pdf(profile_id: int, record_id: int, account: str, environment: str) -> Dict:
-    """Call cre2Render to generate a PDF."""
-    payload = {
-        'action': 'cre2Render',
-        'procedure': 'cre2Render',
-        'profileId': str(profile_id),
-        'recordId': str(record_id),
-        'netsuiteAccount': resolve_account(account),
-        'netsuiteEnvironment': resolve_environment(environment)
-    }
-
-    try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-            }
-        )
-
-        with urllib.request.urlopen(req, timeout=120) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            return result
-
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8') if e.fp else str(e)
-        try:
-            return json.loads(error_body)
-        except:
-            return {'success': False, 'error': {'message': f"HTTP {e.code}: {error_body}"}}
-    except Exception as e:
-        return {'success': False, 'error': {'message': str(e)}}
+def _cache_ttl(ttl: float, use_cache: bool) -> Optional[float]:
+    return ttl if use_cache else None
 
 
-def get_all_profiles(account: str, environment: str) -> Dict[str, Dict]:
+def get_all_profiles(account: str, environment: str, use_cache: bool = False,
+                     refresh: bool = False) -> Dict[str, Dict]:
     """Get all TWX-EDI profiles with their IDs and template IDs."""
     profiles = execute_query("""
         SELECT id, name, custrecord_pri_cre2_gen_file_tmpl_doc as template_id
@@ -159,7 +121,7 @@ def get_all_profiles(account: str, environment: str) -> Dict[str, Dict]:
         WHERE name LIKE 'TWX-EDI-%'
           AND isinactive = 'F'
         ORDER BY name
-    """, account, environment)
+    """, account, environment, _cache_ttl(PROFILE_LIST_TTL, use_cache), refresh)
 
     result = {}
     for p in profiles:
@@ -179,22 +141,24 @@ def get_all_profiles(account: str, environment: str) -> Dict[str, Dict]:
     return result
 
 
-def get_trading_partners(account: str, environment: str) -> Dict[str, int]:
+def get_trading_partners(account: str, environment: str, use_cache: bool = False,
+                         refresh: bool = False) -> Dict[str, int]:
     """Get trading partner codes and their internal IDs."""
     partners = execute_query("""
         SELECT id, custrecord_twx_edi_tp_code as code, name
         FROM customrecord_twx_edi_tp
         WHERE isinactive = 'F'
-    """, account, environment)
+    """, account, environment, _cache_ttl(TRADING_PARTNER_TTL, use_cache), refresh)
 
     return {p['code']: p['id'] for p in partners if p.get('code')}
 
 
-def get_trading_partner_name_map(account: str, environment: str) -> Dict[int, str]:
+def get_trading_partner_name_map(account: str, environment: str, use_cache: bool = False,
+                                 refresh: bool = False) -> Dict[int, str]:
     """Get trading partner ID to name mapping."""
     partners = execute_query("""
         SELECT id, name FROM customrecord_twx_edi_tp
-    """, account, environment)
+    """, account, environment, _cache_ttl(TRADING_PARTNER_TTL, use_cache), refresh)
     return {p['id']: p['name'] for p in partners}
 
 
@@ -235,13 +199,14 @@ def normalize_partner_code(name: str) -> str:
     return name_to_code.get(normalized, name.upper().replace(' ', '').replace('-', '').replace('&', ''))
 
 
-def find_test_records(account: str, environment: str) -> Dict[Tuple[str, str], int]:
+def find_test_records(account: str, environment: str, use_cache: bool = False,
+                      refresh: bool = False) -> Dict[Tuple[str, str], int]:
     """
     Find test records for each partner/doc_type combination.
     Returns dict of (partner_code, doc_type) -> record_id
     """
     # Get partner name mapping
-    partner_names = get_trading_partner_name_map(account, environment)
+    partner_names = get_trading_partner_name_map(account, environment, use_cache, refresh)
 
     # Get all EDI history records with JSON data
     records = execute_query("""
@@ -252,7 +217,7 @@ def find_test_records(account: str, environment: str) -> Dict[Tuple[str, str], i
         FROM customrecord_twx_edi_history h
         WHERE h.custrecord_twx_edi_history_json IS NOT NULL
         ORDER BY h.id DESC
-    """, account, environment)
+    """, account, environment, _cache_ttl(TEST_RECORD_TTL, use_cache), refresh)
 
     # Reverse map doc type IDs to codes
     id_to_code = {v: k for k, v in DOC_TYPE_IDS.items()}
@@ -276,53 +241,19 @@ def find_test_records(account: str, environment: str) -> Dict[Tuple[str, str], i
     return result
 
 
-def test_single_profile(profile: Dict, test_records: Dict, fallback_records: Dict, account: str, environment: str) -> Dict:
-    """Test a single profile and return results."""
-    profile_id = profile['id']
-    profile_name = profile['name']
-    partner = profile['partner']
-    doc_type = profile['doc_type']
-
-    # Find matching test record
-    key = (partner, doc_type)
-    record_id = test_records.get(key)
-    used_fallback = False
-
-    if not record_id:
-        # Try with a fallback record for this doc type
-        record_id = fallback_records.get(doc_type)
-        used_fallback = True
-
-    if not record_id:
-        return {
-            'profile_id': profile_id,
-            'profile_name': profile_name,
-            'status': 'SKIPPED',
-            'reason': f'No test record found for {partner}/{doc_type}'
-        }
+def pick_test_record(profile: Dict, test_records: Dict, fallback_records: Dict) -> Optional[int]:
+    """The partner's own record for this doc type, else the doc type's fallback record."""
+    return (test_records.get((profile['partner'], profile['doc_type']))
+            or fallback_records.get(profile['doc_type']))
 
-    # Render PDF
-    result = render_pdf(profile_id, record_id, account, environment)
 
-    if result.get('success'):
-        return {
-            'profile_id': profile_id,
-            'profile_name': profile_name,
-            'record_id': record_id,
-            'status': 'SUCCESS',
-            'file_id': result.get('data', {}).get('fileId'),
-            'file_name': result.get('data', {}).get('fileName'),
-            'pdf_url': result.get('data', {}).get('pdfUrl')
-        }
-    else:
-        error_msg = result.get('error', {}).get('message', 'Unknown error')
-        return {
-            'profile_id': profile_id,
-            'profile_name': profile_name,
-            'record_id': record_id,
-            'status': 'FAILED',
-            'error': error_msg
-        }
+def _skipped(profile: Dict) -> Dict:
+    return {
+        'profile_id': profile['id'],
+        'profile_name': profile['name'],
+        'status': 'SKIPPED',
+        'reason': f"No test record found for {profile['partner']}/{profile['doc_type']}"
+    }
 
 
 def main():
@@ -334,9 +265,21 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Preview without testing')
     parser.add_argument('--partner', help='Test single partner only')
     parser.add_argument('--doc-type', help='Test single document type only (810, 850, etc.)')
-    parser.add_argument('--parallel', type=int, default=5, help='Number of parallel tests')
+    parser.add_argument('--parallel', type=int, default=5, help='Number of renders in flight at once')
+    parser.add_argument('--verify', action='store_true',
+                        help='Download each PDF and run verify_pdf checks (needs pdfplumber or PyPDF2)')
+    parser.add_argument('--extract-workers', type=int, default=DEFAULT_EXTRACT_WORKERS,
+                        help=f'Processes for PDF text extraction (default: {DEFAULT_EXTRACT_WORKERS})')
     parser.add_argument('--output', help='Output file for results (JSON)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Re-fetch profiles, partners and test records instead of using the local cache')
+    parser.add_argument('--cache-lookups', action='store_true',
+                        help='Serve profile, partner and test-record lookups from the local query cache')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Do not use cached render results (also overrides --cache-lookups)')
     args = parser.parse_args()
+    use_cache = not args.no_cache
+    lookup_cache = args.cache_lookups and use_cache
 
     account = args.account
     environment = args.env
@@ -352,7 +295,7 @@ def main():
 
     # Phase 3: Find test records
     print("Phase 3: Finding test records...")
-    test_records = find_test_records(account, environment)
+    test_records = find_test_records(account, environment, lookup_cache, args.refresh)
     print(f"  Found {len(test_records)} partner/doc-type combinations with test data\n")
 
     # Show distribution
@@ -384,7 +327,7 @@ def main():
 
     # Get all profiles
     print("Loading profiles...")
-    profiles = get_all_profiles(account, environment)
+    profiles = get_all_profiles(account, environment, lookup_cache, args.refresh)
     print(f"  Found {len(profiles)} profiles\n")
 
     # Filter if requested
@@ -422,30 +365,67 @@ def main():
         'details': []
     }
 
-    # Test profiles with progress tracking
-    completed = 0
+    # Profiles without any usable test record are skipped up front
+    to_render = []
     for profile in filtered_profiles:
-        result = test_single_profile(profile, test_records, fallback_records, account, environment)
-        results['details'].append(result)
-
-        status = result['status']
-        if status == 'SUCCESS':
-            results['success'] += 1
-            symbol = '✓'
-        elif status == 'FAILED':
-            results['failed'] += 1
-            symbol = '✗'
+        record_id = pick_test_record(profile, test_records, fallback_records)
+        if record_id:
+            to_render.append((profile, record_id))
         else:
+            result = _skipped(profile)
+            results['details'].append(result)
             results['skipped'] += 1
-            symbol = '○'
-
-        completed += 1
-        print(f"  [{completed:3}/{len(filtered_profiles)}] {symbol} {result['profile_name']}")
-
-        if status == 'FAILED':
-            print(f"           Error: {result.get('error', 'Unknown')}")
+            print(f"  [skip] ○ {result['profile_name']}: {result['reason']}")
+
+    completed = [0]
+
+    def report(index: int, r: Dict[str, Any]) -> None:
+        profile = to_render[index][0]
+        completed[0] += 1
+        symbol = '✓' if r['status'] == 'SUCCESS' else '✗'
+        verify = r.get('verify')
+        suffix = ' (cached)' if r['cached'] else ''
+        if verify:
+            suffix += f"  verify {verify['status']}"
+        print(f"  [{completed[0]:3}/{len(to_render)}] {symbol} {profile['name']}{suffix}", flush=True)
+        if r['status'] == 'FAILED':
+            print(f"           Error: {r.get('error', 'Unknown')}")
+        elif verify and verify['status'] in ('FAIL', 'ERROR'):
+            print(f"           Verify: {verify.get('error') or ', '.join(i['category'] for i in verify['issues'])}")
+
+    matrix_results = run_matrix(
+        [(profile['id'], record_id, profile['name']) for profile, record_id in to_render],
+        resolve_account(account), resolve_environment(environment),
+        verify=args.verify,
+        render_concurrency=args.parallel,
+        extract_workers=args.extract_workers,
+        use_cache=use_cache,
+        refresh=args.refresh,
+        on_result=report,
+    )
+
+    for (profile, record_id), r in zip(to_render, matrix_results):
+        detail = {
+            'profile_id': profile['id'],
+            'profile_name': profile['name'],
+            'record_id': record_id,
+            'status': r['status'],
+            'cached': r['cached'],
+        }
+        if r['status'] == 'SUCCESS':
+            detail.update(file_id=r.get('file_id'), file_name=r.get('file_name'), pdf_url=r.get('pdf_url'))
+            if r.get('verify'):
+                detail['verify'] = r['verify']
+            results['success'] += 1
+        else:
+            detail['error'] = r.get('error')
+            results['failed'] += 1
+        results['details'].append(detail)
 
-        time.sleep(0.3)  # Rate limiting
+    if args.verify:
+        results['verify_failed'] = sum(1 for d in results['details']
+                                       if d.get('verify', {}).get('status') in ('FAIL', 'ERROR'))
+        results['verify_warned'] = sum(1 for d in results['details'] if d.get('verify', {}).get('status') == 'WARN')
 
     # Summary
     print(f"\n{'='*70}")
@@ -455,6 +435,8 @@ def main():
     print(f"Success: {results['success']}")
     print(f"Failed: {results['failed']}")
     print(f"Skipped: {results['skipped']}")
+    if args.verify:
+        print(f"Verify FAIL: {results['verify_failed']}  WARN: {results['verify_warned']}")
     print(f"{'='*70}\n")
 
     # Save results
@@ -464,7 +446,7 @@ def main():
     print(f"Results saved to: {output_file}")
 
     # Return exit code based on results
-    if results['failed'] > 0:
+    if results['failed'] > 0 or results.get('verify_failed'):
         sys.exit(1)
     sys.exit(0)
 
@@ -6,10 +6,15 @@ Renders both statements (via statementRender and cre2Render procedures),
 downloads the PDFs, extracts text, and compares key data points to validate
 that the CRE2 statement matches the native NetSuite statement.
 
+Both renders and both downloads run concurrently. Extracted text and parsed
+fields are cached per file (see statement_text.py), and --compare-sample runs
+customers in parallel (--workers).
+
 Usage:
     python3 compare_statements.py --customer-id 7258 --env sb2
     python3 compare_statements.py -c 7258 -e sb2 --consolidate
     python3 compare_statements.py -c 7258 -e prod --consolidate --verbose
+    python3 compare_statements.py --compare-sample 20 --env prod --workers 6
 
 Requirements:
     pip install pdfplumber
@@ -17,22 +22,32 @@ Requirements:
 
 import sys
 import os
-import re
-import json
+import io
 import base64
 import argparse
 import tempfile
 import datetime
 import calendar
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from typing import Optional, Dict, Any, List, Tuple
 
+_SUITEQL_SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'netsuite-suiteql', 'scripts')
+if _SUITEQL_SCRIPTS not in sys.path:
+    sys.path.insert(0, _SUITEQL_SCRIPTS)
+from netsuite_gateway import get_client, ttl_from_env  # noqa: E402
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+from statement_text import StatementTextCache, load_statement  # noqa: E402
+
 # ---------------------------------------------------------------------------
 # Shared config (mirrors render_pdf.py)
 # ---------------------------------------------------------------------------
 
 # NetSuite API Gateway endpoint — override with NETSUITE_GATEWAY_URL env var
 _gw_base = os.environ.get('NETSUITE_GATEWAY_URL', 'https://nsapi.twistedx.tech').rstrip('/')
-GATEWAY_URL = f'{_gw_base}/api/suiteapi'
 _API_KEY = os.environ.get('NETSUITE_API_KEY', '')
 if not _API_KEY and 'nsapi.twistedx.tech' in _gw_base:
     print("Warning: NETSUITE_API_KEY not set — requests to prod gateway will fail with 401", file=sys.stderr)
@@ -59,6 +74,9 @@ DEFAULT_ENVIRONMENT = 'sandbox2'
 # CRE2 profile ID for Customer Statement Portrait
 CRE2_PROFILE_ID = '16'
 
+# Customers compared at once by --compare-sample (each runs 2 renders + 2 downloads)
+DEFAULT_COMPARE_WORKERS = 4
+
 
 def resolve_account(a: str) -> str:
     return ACCOUNT_ALIASES.get(a.lower(), a.lower())
@@ -79,9 +97,6 @@ def _render_native(
     open_transactions_only: bool = True,
 ) -> Dict[str, Any]:
     """Render native NS statement via statementRender procedure."""
-    import urllib.request
-    import urllib.error
-
     payload: Dict[str, Any] = {
         'action': 'statementRender',
         'procedure': 'statementRender',
@@ -97,14 +112,7 @@ def _render_native(
     if start_date:
         payload['startDate'] = start_date
 
-    data = json.dumps(payload).encode('utf-8')
-    req = urllib.request.Request(
-        GATEWAY_URL, data=data,
-        headers={'Content-Type': 'application/json', 'Accept': 'application/json',
-                 **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})}
-    )
-    with urllib.request.urlopen(req, timeout=90) as resp:
-        return json.loads(resp.read().decode('utf-8'))
+    return get_client().call(payload, timeout=90)
 
 
 def _render_cre2(
@@ -115,8 +123,6 @@ def _render_cre2(
     profile_id: str = CRE2_PROFILE_ID,
 ) -> Dict[str, Any]:
     """Render CRE2 statement via cre2Render procedure."""
-    import urllib.request
-
     parms: Dict[str, Any] = {
         'consolidateStatements': consolidate,
         'openTransactionsOnly': str(open_transactions_only).lower(),
@@ -136,14 +142,7 @@ def _render_cre2(
         'netsuiteEnvironment': resolve_environment(environment)
     }
 
-    data = json.dumps(payload).encode('utf-8')
-    req = urllib.request.Request(
-        GATEWAY_URL, data=data,
-        headers={'Content-Type': 'application/json', 'Accept': 'application/json',
-                 **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})}
-    )
-    with urllib.request.urlopen(req, timeout=90) as resp:
-        return json.loads(resp.read().decode('utf-8'))
+    return get_client().call(payload, timeout=90)
 
 
 # ---------------------------------------------------------------------------
@@ -152,8 +151,6 @@ def _render_cre2(
 
 def _download_pdf_bytes(file_id: int, account: str, environment: str) -> bytes:
     """Download PDF bytes from NetSuite File Cabinet via gateway fileGet."""
-    import urllib.request
-
     payload = {
         'action': 'fileGet',
         'procedure': 'fileGet',
@@ -161,14 +158,7 @@ def _download_pdf_bytes(file_id: int, account: str, environment: str) -> bytes:
         'netsuiteAccount': resolve_account(account),
         'netsuiteEnvironment': resolve_environment(environment)
     }
-    data = json.dumps(payload).encode('utf-8')
-    req = urllib.request.Request(
-        GATEWAY_URL, data=data,
-        headers={'Content-Type': 'application/json', 'Accept': 'application/json',
-                 **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})}
-    )
-    with urllib.request.urlopen(req, timeout=60) as resp:
-        result = json.loads(resp.read().decode('utf-8'))
+    result = get_client().call(payload, timeout=60)
 
     # Response structure: result['data']['file']['content']
     file_data = (result.get('data') or {}).get('file') or {}
@@ -191,192 +181,13 @@ def _download_pdf_bytes(file_id: int, account: str, environment: str) -> bytes:
 
 
 # ---------------------------------------------------------------------------
-# Step 3: Extract text from PDF bytes
-# ---------------------------------------------------------------------------
-
-def _extract_text(pdf_bytes: bytes) -> str:
-    """Extract all text from PDF bytes using pdfplumber."""
-    try:
-        import pdfplumber
-        import io
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            pages = [page.extract_text() or '' for page in pdf.pages]
-            return '\n'.join(pages)
-    except ImportError:
-        raise RuntimeError("pdfplumber is required: pip install pdfplumber")
-
-
-# ---------------------------------------------------------------------------
-# Step 4: Parse key data from extracted text
+# Step 3/4: Extract text and parse key data (statement_text.py)
 # ---------------------------------------------------------------------------
 
-def _find_amounts(text: str) -> List[float]:
-    """Find all dollar amounts in text, return as floats."""
-    amounts = []
-    for match in re.finditer(r'\$\s*([\d,]+(?:\.\d{2})?)', text):
-        try:
-            amounts.append(float(match.group(1).replace(',', '')))
-        except ValueError:
-            pass
-    return amounts
-
-
-def _parse_single_amount(s: str) -> Optional[float]:
-    """Parse a single amount token: ($123.45), ($66.5), $-123.45, $123.45, or bare 123.45.
-
-    Accepts 1-2 decimal digits to handle native PDFs that emit ($66.5) instead of ($66.50).
-    """
-    s = s.strip()
-    m = re.match(r'^\(\$?([\d,]+(?:\.\d{1,2})?)\)$', s)
-    if m:
-        return -float(m.group(1).replace(',', ''))
-    m = re.match(r'^\$?-([\d,]+(?:\.\d{1,2})?)$', s)
-    if m:
-        return -float(m.group(1).replace(',', ''))
-    m = re.match(r'^\$?([\d,]+(?:\.\d{1,2})?)$', s)
-    if m:
-        return float(m.group(1).replace(',', ''))
-    return None
-
-
-def _parse_amount_due(text: str) -> Optional[float]:
-    """Extract the 'Amount Due' / total balance from statement text.
-
-    Handles positive amounts ($X.XX), parenthesized credits (($X.XX)), and
-    negative amounts ($-X.XX).  Matches only when the amount token is on the
-    SAME LINE as the label — avoids false matches from the aging-table header
-    row whose column values appear on the following line.
-    """
-    # Match label + amount token on the SAME LINE only (use [^\S\n]* to avoid crossing newlines).
-    # Handles: ($X.XX) credit notation, $-X.XX negative, $X.XX positive.
-    amt_tok = r'(?:\(\$?[\d,]+(?:\.\d{2})?\)|\$[^\S\n]*-?[\d,]+(?:\.\d{2})?)'
-    m = re.search(
-        r'(?:Amount Due|Total Amount Due|Balance Due|Total Due)[^\S\n]*' + amt_tok,
-        text, re.IGNORECASE
-    )
-    if m:
-        raw = re.search(amt_tok, m.group(0), re.IGNORECASE)
-        if raw:
-            return _parse_single_amount(raw.group(0))
-    return None
-
-
-def _parse_balance_forward(text: str) -> Optional[float]:
-    """Extract Balance Forward amount."""
-    m = re.search(r'Balance Forward\s*\$?\s*([\d,]+(?:\.\d{2})?)', text, re.IGNORECASE)
-    if m:
-        try:
-            return float(m.group(1).replace(',', ''))
-        except ValueError:
-            pass
-    return None
-
-
-def _parse_transaction_ids(text: str) -> List[str]:
-    """Extract transaction IDs (INV/CM/SO numbers) from statement text.
-
-    Only counts IDs that appear on lines also containing at least one dollar amount.
-    This prevents phantom IDs extracted from hyperlink text or annotation URIs
-    (e.g. NetSuite internal file IDs embedded in clickable links) from being counted
-    as real statement rows.  Real transactions always show a balance amount; phantom
-    link text does not.
-    """
-    ids = set()
-    tran_pat = re.compile(r'\b((?:INV|CM|CR|SO|PO|BILL|PMT)\d{4,})\b', re.IGNORECASE)
-    amt_pat  = re.compile(r'\(\$?[\d,]+(?:\.\d{2})?\)|\$-?[\d,]+(?:\.\d{2})?')
-    for line in text.splitlines():
-        m = tran_pat.search(line)
-        if m and amt_pat.search(line):
-            ids.add(m.group(1).upper())
-    return sorted(ids)
-
-
-def _parse_transaction_amounts(text: str, source: str) -> Dict[str, Dict[str, Optional[float]]]:
-    """Extract per-transaction original and remaining balance amounts.
-
-    Native PDF columns: ... Credit | Applied | Remaining
-      tokens[0] = original invoice/credit amount (the "Credit" column in native)
-      tokens[-1] = remaining balance
-
-    CRE2 PDF columns: ... Invoice | Credit | Discount | Applied | Remain.
-      tokens[0] = original invoice/credit amount
-      tokens[-1] = remaining balance
-
-    Both sources expose the same two key values at token positions [0] and [-1].
-    When only one token is present (no amounts on line), both are set to None.
-
-    Accepts 1-2 decimal digits in amount tokens (some native PDFs emit e.g. ($66.5)).
-
-    Returns dict: {tranid.upper(): {'invoice': amount, 'remaining': amount}}
-    """
-    result: Dict[str, Dict[str, Optional[float]]] = {}
-    tran_pat = re.compile(r'\b((?:INV|CM|CR|SO|PO|BILL|PMT)\d{4,})\b', re.IGNORECASE)
-    # Allow 1-2 decimal digits; require $ prefix for non-parenthesized amounts
-    amt_pat = re.compile(r'\(\$?[\d,]+(?:\.\d{1,2})?\)|\$-?[\d,]+(?:\.\d{1,2})?')
-
-    for line in text.splitlines():
-        m_tran = tran_pat.search(line)
-        if not m_tran:
-            continue
-        tranid = m_tran.group(1).upper()
-        tokens = amt_pat.findall(line)
-        if not tokens:
-            result[tranid] = {'invoice': None, 'remaining': None}
-            continue
-        invoice   = _parse_single_amount(tokens[0])
-        remaining = _parse_single_amount(tokens[-1])
-        result[tranid] = {'invoice': invoice, 'remaining': remaining}
-
-    return result
-
-
-def _parse_aging(text: str) -> Dict[str, Optional[float]]:
-    """Extract aging buckets from statement text.
-
-    Both native and CRE2 PDFs use a two-row table format:
-      Header: Current  1-30 Days  31-60 Days  61-90 Days  Over 90  Amount Due
-      Values: $4,063.29  ($118.75)  ($97.37)  $0.00  $0.00  $3,847.17
-
-    Negatives appear as ($118.75) in native or $-118.75 in CRE2.
-    """
-    buckets: Dict[str, Optional[float]] = {
-        'current': None, '1-30': None, '31-60': None, '61-90': None, '90+': None, 'total': None
-    }
-
-    # Find the aging table header line (must contain "Current" AND "1-30" AND "31-60")
-    # then parse the values from the immediately following line.
-    header_m = re.search(
-        r'^(.*Current.*1[- ]30.*31[- ]60.*)\n(.*)',
-        text, re.IGNORECASE | re.MULTILINE
-    )
-    if header_m:
-        values_line = header_m.group(2)
-        # Extract all amount tokens from the values line
-        # Handles: ($118.75)  $-118.75  $4,063.29
-        tokens = re.findall(r'\(\$?[\d,]+(?:\.\d{2})?\)|\$?-?[\d,]+\.\d{2}', values_line)
-        amounts = [a for t in tokens if (a := _parse_single_amount(t)) is not None]
-        keys = ['current', '1-30', '31-60', '61-90', '90+', 'total']
-        for i, k in enumerate(keys):
-            if i < len(amounts):
-                buckets[k] = amounts[i]
-        return buckets
-
-    # Fallback: inline patterns (for non-table formats)
-    patterns = {
-        'current':  r'Current\s*\$\s*([\d,]+(?:\.\d{2})?)',
-        '1-30':     r'1[- ]30\s*Days?\s*\$\s*([\d,]+(?:\.\d{2})?)',
-        '31-60':    r'31[- ]60\s*Days?\s*\$\s*([\d,]+(?:\.\d{2})?)',
-        '61-90':    r'61[- ]90\s*Days?\s*\$\s*([\d,]+(?:\.\d{2})?)',
-        '90+':      r'(?:Over 90|90\+|91\+)\s*Days?\s*\$\s*([\d,]+(?:\.\d{2})?)',
-        'total':    r'(?:Total|Aging Total)\s*\$\s*([\d,]+(?:\.\d{2})?)'
-    }
-    for key, pat in patterns.items():
-        m = re.search(pat, text, re.IGNORECASE)
-        if m:
-            v = _parse_single_amount(m.group(1))
-            if v is not None:
-                buckets[key] = v
-    return buckets
+def _load_pdf(file_id: Any, account: str, environment: str,
+              cache: Optional[StatementTextCache], pool: Optional[Executor]) -> Dict[str, Any]:
+    """Download one statement PDF, then extract and parse it (or take both from the text cache)."""
+    return load_statement(file_id, _download_pdf_bytes(file_id, account, environment), cache, pool)
 
 
 # ---------------------------------------------------------------------------
@@ -474,11 +285,17 @@ def compare(
     verbose: bool = False,
     profile_id: str = CRE2_PROFILE_ID,
     output=None,
+    use_cache: bool = True,
+    extract_pool: Optional[Executor] = None,
 ) -> bool:
     """
     Render both statements, compare them, and print a report.
     Returns True if all checks PASS (or WARN), False if any FAIL.
 
+    The two renders run concurrently, as do the two download+extract steps.
+    extract_pool (a ProcessPoolExecutor) moves pdfplumber off this process;
+    use_cache=False ignores the statement text cache.
+
     Defaults:
       statement_date        — today if not provided
       start_date            — one calendar month prior to statement_date if not
@@ -501,10 +318,18 @@ def compare(
         start_date = None
 
     print(f"\nRendering native statement for customer {customer_id}...", file=out)
-    try:
-        native_result = _render_native(
-            customer_id, account, environment, statement_date, start_date, consolidate,
+    print(f"Rendering CRE2 statement (profile {profile_id}) for customer {customer_id}...", file=out)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        native_future = pool.submit(
+            _render_native, customer_id, account, environment, statement_date, start_date, consolidate,
             open_transactions_only=open_transactions_only)
+        cre2_future = pool.submit(
+            _render_cre2, customer_id, account, environment, statement_date, start_date, consolidate,
+            open_transactions_only=open_transactions_only,
+            profile_id=profile_id)
+
+    try:
+        native_result = native_future.result()
     except Exception as e:
         print(f"FAIL  Native statement render failed: {e}", file=out)
         return False
@@ -518,12 +343,8 @@ def compare(
     native_url     = native_result['data'].get('pdfUrl', '')
     print(f"      Native → fileId={native_file_id}", file=out)
 
-    print(f"Rendering CRE2 statement (profile {profile_id}) for customer {customer_id}...", file=out)
     try:
-        cre2_result = _render_cre2(
-            customer_id, account, environment, statement_date, start_date, consolidate,
-            open_transactions_only=open_transactions_only,
-            profile_id=profile_id)
+        cre2_result = cre2_future.result()
     except Exception as e:
         print(f"FAIL  CRE2 statement render failed: {e}", file=out)
         return False
@@ -536,34 +357,38 @@ def compare(
     cre2_file_id = cre2_result['data']['fileId']
     print(f"      CRE2  → fileId={cre2_file_id}", file=out)
 
-    # Download PDFs
-    print("Downloading PDFs...", file=out)
-    native_bytes = _download_pdf_bytes(native_file_id, account, environment)
-    cre2_bytes   = _download_pdf_bytes(cre2_file_id,   account, environment)
-
-    # Extract text
-    print("Extracting text...", file=out)
-    native_text = _extract_text(native_bytes)
-    cre2_text   = _extract_text(cre2_bytes)
+    # Download PDFs and extract text (both at once; cached text skips pdfplumber)
+    print("Downloading PDFs and extracting text...", file=out)
+    cache = StatementTextCache() if use_cache else None
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        native_doc, cre2_doc = pool.map(
+            lambda file_id: _load_pdf(file_id, account, environment, cache, extract_pool),
+            (native_file_id, cre2_file_id))
+    native_text = native_doc['text']
+    cre2_text   = cre2_doc['text']
 
     if verbose:
+        print(f"      Text cache: native={'hit' if native_doc['cached'] else 'miss'}  "
+              f"CRE2={'hit' if cre2_doc['cached'] else 'miss'}", file=out)
         print("\n--- Native text (first 500 chars) ---", file=out)
         print(native_text[:500], file=out)
         print("\n--- CRE2 text (first 500 chars) ---", file=out)
         print(cre2_text[:500], file=out)
         print(file=out)
 
-    # Parse
-    native_amount_due   = _parse_amount_due(native_text)
-    cre2_amount_due     = _parse_amount_due(cre2_text)
-    native_bf           = _parse_balance_forward(native_text)
-    cre2_bf             = _parse_balance_forward(cre2_text)
-    native_tran_ids     = _parse_transaction_ids(native_text)
-    cre2_tran_ids       = _parse_transaction_ids(cre2_text)
-    native_aging        = _parse_aging(native_text)
-    cre2_aging          = _parse_aging(cre2_text)
-    native_tran_amts    = _parse_transaction_amounts(native_text, 'native')
-    cre2_tran_amts      = _parse_transaction_amounts(cre2_text, 'cre2')
+    # Parsed in one pass per statement by statement_text.parse_statement()
+    native_fields = native_doc['fields']
+    cre2_fields   = cre2_doc['fields']
+    native_amount_due   = native_fields['amount_due']
+    cre2_amount_due     = cre2_fields['amount_due']
+    native_bf           = native_fields['balance_forward']
+    cre2_bf             = cre2_fields['balance_forward']
+    native_tran_ids     = native_fields['transaction_ids']
+    cre2_tran_ids       = cre2_fields['transaction_ids']
+    native_aging        = native_fields['aging']
+    cre2_aging          = cre2_fields['aging']
+    native_tran_amts    = native_fields['transaction_amounts']
+    cre2_tran_amts      = cre2_fields['transaction_amounts']
 
     # Print report
     _print_header(customer_id, account, environment, statement_date, start_date, consolidate,
@@ -787,37 +612,16 @@ def compare(
 # Batch compare helpers
 # ---------------------------------------------------------------------------
 
-def _suiteql(query: str, account: str, environment: str) -> List[Dict]:
-    """Execute a SuiteQL query via the API gateway and return a list of records."""
-    import urllib.request
-    import urllib.error
-
-    payload = {
-        'action': 'queryRun',
-        'procedure': 'queryRun',
-        'query': query,
-        'params': [],
-        'returnAllRows': False,
-        'netsuiteAccount': resolve_account(account),
-        'netsuiteEnvironment': resolve_environment(environment),
-    }
-    try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL, data=data,
-            headers={'Content-Type': 'application/json', 'Accept': 'application/json',
-                     **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})}
-        )
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            result = json.loads(resp.read().decode('utf-8'))
-            if result.get('success') and result.get('data'):
-                return result['data'].get('records', [])
-            return []
-    except Exception:
+def _suiteql(query: str, account: str, environment: str, cache_ttl: Optional[float] = None) -> List[Dict]:
+    """Execute a SuiteQL query via the API gateway (local result cache when cache_ttl is set)."""
+    result = get_client().query(query, account=account, environment=environment, timeout=30, cache_ttl=cache_ttl)
+    if result.get('error'):
         return []
+    return result.get('records') or []
 
 
-def _discover_compare_sample(n: int, account: str, environment: str) -> List[Tuple[str, str, bool, bool, bool]]:
+def _discover_compare_sample(n: int, account: str, environment: str,
+                             cache_ttl: Optional[float] = None) -> List[Tuple[str, str, bool, bool, bool]]:
     """Return up to n (customer_id, category, consolidate, use_start_date, open_txn_only) tuples.
 
     Covers 10 categories to exercise all combinations of the three key parameters:
@@ -846,7 +650,7 @@ def _discover_compare_sample(n: int, account: str, environment: str) -> List[Tup
         f"SELECT DISTINCT csr.entity AS cid FROM CustomerSubsidiaryRelationship csr "
         f"WHERE csr.balance > 0 AND csr.entity IN {_TOP_LEVEL} "
         f"FETCH FIRST {per_cat} ROWS ONLY",
-        account, environment,
+        account, environment, cache_ttl,
     ):
         if r.get('cid'):
             candidates.append((str(r['cid']), 'positive_balance', False, True, True))
@@ -855,7 +659,7 @@ def _discover_compare_sample(n: int, account: str, environment: str) -> List[Tup
         f"SELECT DISTINCT csr.entity AS cid FROM CustomerSubsidiaryRelationship csr "
         f"WHERE csr.balance < 0 AND csr.entity IN {_TOP_LEVEL} "
         f"FETCH FIRST {per_cat} ROWS ONLY",
-        account, environment,
+        account, environment, cache_ttl,
     ):
         if r.get('cid'):
             candidates.append((str(r['cid']), 'credit_balance', False, True, True))
@@ -864,13 +668,13 @@ def _discover_compare_sample(n: int, account: str, environment: str) -> List[Tup
         f"SELECT DISTINCT t.entity AS cid FROM Transaction t "
         f"WHERE t.type = 'CustInvc' AND t.foreignamountunpaid > 0 "
         f"AND t.entity IN {_TOP_LEVEL} FETCH FIRST 500 ROWS ONLY",
-        account, environment,
+        account, environment, cache_ttl,
     ) if r.get('cid')}
     cred_ids = {str(r['cid']) for r in _suiteql(
         f"SELECT DISTINCT t.entity AS cid FROM Transaction t "
         f"WHERE t.type = 'CustCred' AND t.status NOT IN ('CustCred:B','CustCred:V') "
         f"AND t.entity IN {_TOP_LEVEL} FETCH FIRST 500 ROWS ONLY",
-        account, environment,
+        account, environment, cache_ttl,
     ) if r.get('cid')}
     for cid in sorted(inv_ids & cred_ids)[:per_cat]:
         candidates.append((cid, 'mixed_inv_credits', False, True, True))
@@ -880,7 +684,7 @@ def _discover_compare_sample(n: int, account: str, environment: str) -> List[Tup
         f"WHERE t.type = 'CustInvc' AND t.foreignamountunpaid > 0 "
         f"AND t.foreignamountunpaid < t.foreigntotal "
         f"AND t.entity IN {_TOP_LEVEL} FETCH FIRST {per_cat} ROWS ONLY",
-        account, environment,
+        account, environment, cache_ttl,
     ):
         if r.get('cid'):
             candidates.append((str(r['cid']), 'partial_payment', False, True, True))
@@ -890,7 +694,7 @@ def _discover_compare_sample(n: int, account: str, environment: str) -> List[Tup
         f"SELECT DISTINCT csr.entity AS cid FROM CustomerSubsidiaryRelationship csr "
         f"WHERE csr.balance > 0 AND csr.entity IN {_TOP_LEVEL} "
         f"FETCH FIRST {per_cat} ROWS ONLY",
-        account, environment,
+        account, environment, cache_ttl,
     ):
         if r.get('cid'):
             candidates.append((str(r['cid']), 'no_startdate', False, False, True))
@@ -900,7 +704,7 @@ def _discover_compare_sample(n: int, account: str, environment: str) -> List[Tup
         f"SELECT DISTINCT csr.entity AS cid FROM CustomerSubsidiaryRelationship csr "
         f"WHERE csr.balance > 0 AND csr.entity IN {_TOP_LEVEL} "
         f"FETCH FIRST {per_cat} ROWS ONLY",
-        account, environment,
+        account, environment, cache_ttl,
     ):
         if r.get('cid'):
             candidates.append((str(r['cid']), 'all_transactions_startdate', False, True, False))
@@ -910,7 +714,7 @@ def _discover_compare_sample(n: int, account: str, environment: str) -> List[Tup
         f"SELECT DISTINCT csr.entity AS cid FROM CustomerSubsidiaryRelationship csr "
         f"WHERE csr.balance > 0 AND csr.entity IN {_TOP_LEVEL} "
         f"FETCH FIRST {per_cat} ROWS ONLY",
-        account, environment,
+        account, environment, cache_ttl,
     ):
         if r.get('cid'):
             candidates.append((str(r['cid']), 'all_transactions_no_startdate', False, False, False))
@@ -919,7 +723,7 @@ def _discover_compare_sample(n: int, account: str, environment: str) -> List[Tup
     for r in _suiteql(
         f"SELECT DISTINCT c.id AS cid FROM customer c "
         f"WHERE c.id IN {_PARENT} FETCH FIRST {per_cat} ROWS ONLY",
-        account, environment,
+        account, environment, cache_ttl,
     ):
         if r.get('cid'):
             candidates.append((str(r['cid']), 'parent_non_consol', False, False, True))
@@ -928,7 +732,7 @@ def _discover_compare_sample(n: int, account: str, environment: str) -> List[Tup
     for r in _suiteql(
         f"SELECT DISTINCT c.id AS cid FROM customer c "
         f"WHERE c.id IN {_PARENT} FETCH FIRST {per_cat} ROWS ONLY",
-        account, environment,
+        account, environment, cache_ttl,
     ):
         if r.get('cid'):
             candidates.append((str(r['cid']), 'parent_consolidated', True, False, True))
@@ -937,7 +741,7 @@ def _discover_compare_sample(n: int, account: str, environment: str) -> List[Tup
     for r in _suiteql(
         f"SELECT DISTINCT c.id AS cid FROM customer c "
         f"WHERE c.id IN {_PARENT} FETCH FIRST {per_cat} ROWS ONLY",
-        account, environment,
+        account, environment, cache_ttl,
     ):
         if r.get('cid'):
             candidates.append((str(r['cid']), 'parent_consol_startdate', True, True, True))
@@ -946,7 +750,7 @@ def _discover_compare_sample(n: int, account: str, environment: str) -> List[Tup
     for r in _suiteql(
         f"SELECT DISTINCT c.id AS cid FROM customer c "
         f"WHERE c.id IN {_PARENT} FETCH FIRST {per_cat} ROWS ONLY",
-        account, environment,
+        account, environment, cache_ttl,
     ):
         if r.get('cid'):
             candidates.append((str(r['cid']), 'parent_consol_all_txns', True, False, False))
@@ -964,6 +768,45 @@ def _discover_compare_sample(n: int, account: str, environment: str) -> List[Tup
     return sample
 
 
+def _compare_entry(entry: Tuple[str, str, bool, bool, bool], account: str, environment: str,
+                   statement_date: Optional[str], start_date: Optional[str], verbose: bool,
+                   profile_id: str, use_cache: bool, extract_pool: Optional[Executor],
+                   output=None) -> bool:
+    """compare() one sample entry under its batch banner; errors count as a FAIL for that customer."""
+    out = output if output is not None else sys.stdout
+    cid, cat, consolidate, use_start_date, open_txn_only = entry
+    sep = '=' * 70
+    print(f"\n{sep}", file=out)
+    flags = f"consolidated={consolidate}  startDate={'yes' if use_start_date else 'no'}  openTxnOnly={open_txn_only}"
+    print(f"Customer {cid}  [{cat}]  {flags}", file=out)
+    print(sep, file=out)
+    try:
+        return compare(
+            customer_id=cid,
+            account=account,
+            environment=environment,
+            statement_date=statement_date,
+            start_date=start_date,
+            consolidate=consolidate,
+            use_start_date=use_start_date,
+            open_transactions_only=open_txn_only,
+            verbose=verbose,
+            profile_id=profile_id,
+            output=out,
+            use_cache=use_cache,
+            extract_pool=extract_pool,
+        )
+    except Exception as e:
+        print(f"FAIL  Comparison failed: {e}", file=out)
+        return False
+
+
+def _process_context():
+    # forkserver/spawn: forking while gateway threads hold the pool's locks can deadlock
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
 def compare_batch(
     n: int,
     account: str = DEFAULT_ACCOUNT,
@@ -972,15 +815,24 @@ def compare_batch(
     start_date: Optional[str] = None,
     verbose: bool = False,
     profile_id: str = CRE2_PROFILE_ID,
+    workers: int = DEFAULT_COMPARE_WORKERS,
+    use_cache: bool = True,
+    lookup_cache_ttl: Optional[float] = None,
 ) -> bool:
     """Run compare() for a sample of n customers across all parameter categories.
 
     Each entry in the sample carries its own (consolidate, use_start_date,
     open_transactions_only) settings so the full combination matrix is covered
     automatically.  Returns True if all comparisons pass, False if any fail.
+
+    With workers > 1, customers are compared concurrently; each report is
+    buffered and printed whole when that customer finishes, and PDF text
+    extraction shares one process pool.  The summary keeps sample order.
+    lookup_cache_ttl reuses the sample-discovery queries from the local
+    SuiteQL result cache (off when None).
     """
     print(f"\nDiscovering {n} sample customers for batch comparison...")
-    sample = _discover_compare_sample(n, account, environment)
+    sample = _discover_compare_sample(n, account, environment, lookup_cache_ttl)
     if not sample:
         print("FAIL  No customers discovered — is the API gateway running?", file=sys.stderr)
         return False
@@ -988,27 +840,25 @@ def compare_batch(
     print(f"Found {len(sample)} customer(s): "
           + ', '.join(f"{cid}({cat})" for cid, cat, *_ in sample))
 
-    results: List[Tuple[str, str, bool]] = []
-    for entry in sample:
-        cid, cat, consolidate, use_start_date, open_txn_only = entry
-        sep = '=' * 70
-        print(f"\n{sep}")
-        flags = f"consolidated={consolidate}  startDate={'yes' if use_start_date else 'no'}  openTxnOnly={open_txn_only}"
-        print(f"Customer {cid}  [{cat}]  {flags}")
-        print(sep)
-        ok = compare(
-            customer_id=cid,
-            account=account,
-            environment=environment,
-            statement_date=statement_date,
-            start_date=start_date,
-            consolidate=consolidate,
-            use_start_date=use_start_date,
-            open_transactions_only=open_txn_only,
-            verbose=verbose,
-            profile_id=profile_id,
-        )
-        results.append((cid, cat, ok))
+    workers = max(1, min(workers, len(sample)))
+    common = (account, environment, statement_date, start_date, verbose, profile_id, use_cache)
+    outcomes: List[bool] = [False] * len(sample)
+    if workers == 1:
+        for i, entry in enumerate(sample):
+            outcomes[i] = _compare_entry(entry, *common, None)
+    else:
+        print(f"Comparing with {workers} workers...")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_process_context()) as extract_pool, \
+                ThreadPoolExecutor(max_workers=workers) as pool:
+            buffers = [io.StringIO() for _ in sample]
+            futures = {pool.submit(_compare_entry, entry, *common, extract_pool, buffers[i]): i
+                       for i, entry in enumerate(sample)}
+            for future in as_completed(futures):
+                i = futures[future]
+                outcomes[i] = future.result()
+                print(buffers[i].getvalue(), end='', flush=True)
+
+    results = [(cid, cat, ok) for (cid, cat, *_), ok in zip(sample, outcomes)]
 
     # Summary table
     sep = '=' * 70
@@ -1045,6 +895,7 @@ Examples:
   python3 compare_statements.py -c 7258 -e prod --all-transactions
   python3 compare_statements.py -c 7258 -e prod --no-start-date
   python3 compare_statements.py --compare-sample 10 --env prod
+  python3 compare_statements.py --compare-sample 20 --env prod --workers 6
         """
     )
 
@@ -1065,6 +916,13 @@ Examples:
                         help='Include fully-paid invoices/credits (openTransactionsOnly=false)')
     parser.add_argument('--verbose',        '-v', action='store_true', help='Show PDF text excerpts and transaction details')
     parser.add_argument('--profile-id',     default=CRE2_PROFILE_ID, help=f'CRE2 profile ID (default: {CRE2_PROFILE_ID})')
+    parser.add_argument('--workers',        '-w', type=int, default=DEFAULT_COMPARE_WORKERS,
+                        help=f'Customers compared at once with --compare-sample (default: {DEFAULT_COMPARE_WORKERS})')
+    parser.add_argument('--no-cache',       action='store_true',
+                        help='Re-extract PDF text instead of using the statement text cache')
+    parser.add_argument('--cache-ttl',      type=float, default=ttl_from_env(), metavar='SECONDS',
+                        help='Reuse --compare-sample customer lookups from the local query cache for this '
+                             'many seconds (default: NETSUITE_QUERY_CACHE_TTL, else off)')
 
     args = parser.parse_args()
 
@@ -1080,6 +938,9 @@ Examples:
             start_date=args.start_date,
             verbose=args.verbose,
             profile_id=args.profile_id,
+            workers=args.workers,
+            use_cache=not args.no_cache,
+            lookup_cache_ttl=args.cache_ttl,
         )
     elif args.customer_id is not None:
         ok = compare(
@@ -1093,6 +954,7 @@ Examples:
             use_start_date=use_start_date,
             open_transactions_only=open_transactions_only,
             verbose=args.verbose,
+            use_cache=not args.no_cache,
         )
     else:
         print("error: one of --customer-id/-c or --compare-sample/-n is required",
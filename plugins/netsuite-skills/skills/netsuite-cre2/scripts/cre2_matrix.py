@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Concurrent render/verify runner for CRE2 profile:record test matrices.
+
+Shared by render_test_matrix.py and batch_test_profiles.py. For each
+(profile_id, record_id, label) case:
+
+  1. render   cre2Render through the pooled gateway client; an asyncio
+              semaphore bounds how many renders NetSuite works on at once
+  2. download fileGet of the rendered PDF (only when verifying)
+  3. verify   text extraction + verify_pdf.analyze_pdf_content in a process
+              pool, so pdfplumber never blocks the render queue
+
+Results are cached per (account, environment, profile, record, template
+version). The template version is a digest of the profile's lastmodified,
+its template and JS hook files' lastmodifieddate, and the newest data source
+change, so re-running a matrix only re-renders profiles whose template side
+changed. Only successful results are cached.
+
+Usage (from another script):
+    from cre2_matrix import run_matrix
+    results = run_matrix([('16', '9425522', 'Runnings')], 'twistedx', 'sandbox2', verify=True)
+
+Cache location: ~/.cache/netsuite-skills/cre2-matrix/ (override with CRE2_MATRIX_CACHE)
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+
+# Pooled gateway client shared with the netsuite-suiteql skill
+_SUITEQL_SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'netsuite-suiteql', 'scripts')
+if _SUITEQL_SCRIPTS not in sys.path:
+    sys.path.insert(0, _SUITEQL_SCRIPTS)
+from netsuite_gateway import AsyncGatewayClient, GatewayError, get_client  # noqa: E402
+
+import verify_pdf  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+DEFAULT_RENDER_CONCURRENCY = 4   # renders NetSuite runs at once; CRE2 renders are governance-heavy
+DEFAULT_EXTRACT_WORKERS = max(1, min(4, os.cpu_count() or 1))
+RENDER_TIMEOUT = 120
+DOWNLOAD_TIMEOUT = 60
+RESULT_CACHE_VERSION = 1
+CACHE_ENV = 'CRE2_MATRIX_CACHE'
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'netsuite-skills' / 'cre2-matrix'
+
+MODIFIED_FORMAT = 'YYYY-MM-DD HH24:MI:SS'
+IN_CHUNK = 900  # stay under the 1000-item IN list limit
+
+Case = Tuple[str, str, str]  # (profile_id, record_id, label)
+
+ACCOUNT_IDS = {
+    'twistedx': {
+        'production': '4138030',
+        'sandbox': '4138030-sb1',
+        'sandbox2': '4138030-sb2'
+    },
+    'dutyman': {
+        'production': '3611820',
+        'sandbox': '3611820-sb1',
+        'sandbox2': '3611820-sb2'
+    }
+}
+
+
+def full_pdf_url(pdf_url: str, account: str, environment: str) -> str:
+    """Absolute NetSuite URL for a relative pdfUrl from cre2Render."""
+    if not pdf_url or not pdf_url.startswith('/'):
+        return pdf_url or ''
+    account_id = ACCOUNT_IDS.get(account, {}).get(environment)
+    return f"https://{account_id}.app.netsuite.com{pdf_url}" if account_id else pdf_url
+
+
+# ---------------------------------------------------------------------------
+# Template versions and result cache
+# ---------------------------------------------------------------------------
+
+def template_versions(profile_ids: Sequence[str], account: str, environment: str) -> Dict[str, str]:
+    """
+    {profile_id: version digest} covering the profile record, its template and
+    JS hook files, and its data sources. Profiles the lookup misses are absent
+    (and therefore never served from cache).
+    """
+    ids = sorted({str(p) for p in profile_ids if str(p).isdigit()}, key=int)
+    statements = []
+    for i in range(0, len(ids), IN_CHUNK):
+        id_list = ', '.join(ids[i:i + IN_CHUNK])
+        statements.append(f"""
+            SELECT p.id AS profile_id,
+                   TO_CHAR(p.lastmodified, '{MODIFIED_FORMAT}') AS profile_modified,
+                   p.custrecord_pri_cre2_gen_file_tmpl_doc AS template_id,
+                   TO_CHAR(t.lastmodifieddate, '{MODIFIED_FORMAT}') AS template_modified,
+                   p.custrecord_pri_cre2_js_override AS js_hook_id,
+                   TO_CHAR(j.lastmodifieddate, '{MODIFIED_FORMAT}') AS js_modified
+            FROM customrecord_pri_cre2_profile p
+            LEFT JOIN file t ON t.id = p.custrecord_pri_cre2_gen_file_tmpl_doc
+            LEFT JOIN file j ON j.id = p.custrecord_pri_cre2_js_override
+            WHERE p.id IN ({id_list})
+        """)
+        statements.append(f"""
+            SELECT q.custrecord_pri_cre2q_parent AS profile_id,
+                   TO_CHAR(MAX(q.lastmodified), '{MODIFIED_FORMAT}') AS datasource_modified,
+                   COUNT(*) AS datasource_count
+            FROM customrecord_pri_cre2_query q
+            WHERE q.custrecord_pri_cre2q_parent IN ({id_list})
+            GROUP BY q.custrecord_pri_cre2q_parent
+        """)
+    if not statements:
+        return {}
+
+    results = get_client().query_many(statements, account, environment, return_all_rows=True)
+    if any(r['error'] for r in results):
+        return {}
+
+    parts: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        for row in result['records']:
+            parts.setdefault(str(row['profile_id']), {}).update(
+                {k: v for k, v in row.items() if k != 'links'})
+    return {pid: hashlib.sha1(json.dumps(fields, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+            for pid, fields in parts.items() if 'profile_modified' in fields}
+
+
+class MatrixResultCache:
+    """One JSON file per result at <dir>/<key[:2]>/<key>.json."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.dir = Path(directory or os.environ.get(CACHE_ENV) or DEFAULT_CACHE_DIR).expanduser()
+
+    @staticmethod
+    def key(account: str, environment: str, profile_id: str, record_id: str,
+            version: str, verify: bool) -> str:
+        raw = json.dumps([RESULT_CACHE_VERSION, account, environment, str(profile_id), str(record_id),
+                          version, verify])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.dir / key[:2] / f'{key}.json'
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.part')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(dict(result, cached_at=time.time()), f)
+        os.replace(tmp, path)
+
+
+# ---------------------------------------------------------------------------
+# Workers
+# ---------------------------------------------------------------------------
+
+def _decode_pdf(content_b64: str) -> bytes:
+    """fileGet content is base64(base64(pdf)) from the gateway; tolerate a single layer."""
+    first_decoded = base64.b64decode(content_b64)
+    try:
+        return base64.b64decode(first_decoded.decode('utf-8'), validate=True)
+    except Exception:
+        return first_decoded
+
+
+def extract_and_analyze(pdf_bytes: bytes) -> Dict[str, Any]:
+    """Process-pool worker: PDF text extraction plus verify_pdf.analyze_pdf_content."""
+    ok, text = verify_pdf.extract_text_from_pdf(io.BytesIO(pdf_bytes))
+    if not ok:
+        return {'status': 'ERROR', 'error': text}
+    analysis = verify_pdf.analyze_pdf_content(text)
+    return {
+        'status': analysis['status'],
+        'issue_count': analysis['issue_count'],
+        'warning_count': analysis['warning_count'],
+        'issues': analysis['issues'],
+        'warnings': analysis['warnings'],
+        'word_count': len(text.split()),
+        'text_sha1': hashlib.sha1(text.encode('utf-8')).hexdigest(),
+    }
+
+
+def _error_message(result: Dict[str, Any]) -> str:
+    error = result.get('error')
+    if isinstance(error, dict):
+        return error.get('message') or 'Unknown error'
+    return str(error or 'Unknown error')
+
+
+def case_passed(result: Dict[str, Any]) -> bool:
+    """Rendered, and (when verified) the PDF check did not fail."""
+    verify = result.get('verify')
+    return result['status'] == 'SUCCESS' and not (verify and verify['status'] in ('FAIL', 'ERROR'))
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+class _Runner:
+    def __init__(self, account: str, environment: str, verify: bool, render_concurrency: int,
+                 pool: Optional[ProcessPoolExecutor], cache: Optional[MatrixResultCache],
+                 versions: Dict[str, str], refresh: bool,
+                 on_result: Optional[Callable[[int, Dict[str, Any]], None]]):
+        self.account = account
+        self.environment = environment
+        self.verify = verify
+        self.gateway = AsyncGatewayClient()
+        self.render_slots = asyncio.Semaphore(render_concurrency)
+        self.pool = pool
+        self.cache = cache
+        self.versions = versions
+        self.refresh = refresh
+        self.on_result = on_result
+
+    async def _call(self, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        try:
+            return await self.gateway.call(payload, timeout=timeout)
+        except GatewayError as e:
+            try:
+                return json.loads(e.body)
+            except ValueError:
+                return {'success': False, 'error': {'message': str(e)}}
+        except Exception as e:
+            return {'success': False, 'error': {'message': str(e)}}
+
+    async def _verify(self, file_id: Any) -> Dict[str, Any]:
+        if self.pool is None:
+            return {'status': 'ERROR', 'error': 'No PDF library installed. Install with: pip install pdfplumber'}
+        fetched = await self._call({
+            'action': 'fileGet',
+            'procedure': 'fileGet',
+            'id': str(file_id),
+            'netsuiteAccount': self.account,
+            'netsuiteEnvironment': self.environment
+        }, DOWNLOAD_TIMEOUT)
+        content = ((fetched.get('data') or {}).get('file') or {}).get('content')
+        if not content:
+            return {'status': 'ERROR', 'error': f"fileGet {file_id}: {_error_message(fetched)}"}
+        pdf_bytes = _decode_pdf(content)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.pool, extract_and_analyze, pdf_bytes)
+        except Exception as e:
+            return {'status': 'ERROR', 'error': f"extraction failed: {e}"}
+
+    async def run_case(self, index: int, case: Case) -> Dict[str, Any]:
+        profile_id, record_id, label = str(case[0]), str(case[1]), case[2]
+        started = time.monotonic()
+        base = {'index': index, 'label': label, 'profile_id': profile_id, 'record_id': record_id}
+        version = self.versions.get(profile_id)
+        key = None
+        if self.cache and version:
+            key = self.cache.key(self.account, self.environment, profile_id, record_id, version, self.verify)
+            cached = None if self.refresh else self.cache.get(key)
+            if cached:
+                result = dict(cached, **base, cached=True, elapsed=0.0)
+                return self._done(index, result)
+
+        async with self.render_slots:
+            rendered = await self._call({
+                'action': 'cre2Render',
+                'procedure': 'cre2Render',
+                'profileId': profile_id,
+                'recordId': record_id,
+                'netsuiteAccount': self.account,
+                'netsuiteEnvironment': self.environment
+            }, RENDER_TIMEOUT)
+
+        if not rendered.get('success'):
+            result = dict(base, status='FAILED', error=_error_message(rendered), cached=False)
+            result['elapsed'] = round(time.monotonic() - started, 2)
+            return self._done(index, result)
+
+        data = rendered.get('data') or {}
+        result = dict(
+            base,
+            status='SUCCESS',
+            file_id=data.get('fileId'),
+            file_name=data.get('fileName'),
+            pdf_url=data.get('pdfUrl'),
+            full_url=full_pdf_url(data.get('pdfUrl', ''), self.account, self.environment),
+            duration=rendered.get('duration'),
+            template_version=version,
+            cached=False,
+        )
+        if self.verify:
+            result['verify'] = (await self._verify(data['fileId']) if data.get('fileId')
+                                else {'status': 'ERROR', 'error': 'cre2Render returned no fileId'})
+        result['elapsed'] = round(time.monotonic() - started, 2)
+        if key and case_passed(result):
+            self.cache.put(key, {k: v for k, v in result.items()
+                                 if k not in ('index', 'label', 'cached', 'elapsed')})
+        return self._done(index, result)
+
+    def _done(self, index: int, result: Dict[str, Any]) -> Dict[str, Any]:
+        if self.on_result:
+            self.on_result(index, result)
+        return result
+
+    async def run(self, cases: Sequence[Case]) -> List[Dict[str, Any]]:
+        return list(await asyncio.gather(*(self.run_case(i, c) for i, c in enumerate(cases))))
+
+
+def _process_context():
+    # forkserver/spawn: forking while render threads hold the gateway pool's locks can deadlock
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def run_matrix(cases: Sequence[Case], account: str, environment: str,
+               verify: bool = False,
+               render_concurrency: int = DEFAULT_RENDER_CONCURRENCY,
+               extract_workers: int = DEFAULT_EXTRACT_WORKERS,
+               use_cache: bool = True, refresh: bool = False,
+               cache_dir: Optional[str] = None,
+               on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+    """
+    Render (and optionally verify) every case concurrently. account/environment
+    must already be resolved. on_result(index, result) fires as each case
+    finishes; the returned list is in input order.
+
+    Each result has index, label, profile_id, record_id, status
+    (SUCCESS/FAILED), cached and elapsed; successes add file_id, file_name,
+    pdf_url, full_url, duration and template_version, failures add error, and
+    verified cases add verify (status PASS/WARN/FAIL/ERROR with issue and
+    warning details).
+    """
+    if not cases:
+        return []
+    cache = MatrixResultCache(cache_dir) if use_cache else None
+    versions = template_versions([c[0] for c in cases], account, environment) if cache else {}
+
+    pool = (ProcessPoolExecutor(max_workers=max(1, extract_workers), mp_context=_process_context())
+            if verify and verify_pdf.PDF_LIBRARY else None)
+    try:
+        runner = _Runner(account, environment, verify, max(1, render_concurrency), pool, cache,
+                         versions, refresh, on_result)
+        return asyncio.run(runner.run(cases))
+    finally:
+        if pool:
+            pool.shutdown()
+
+
+def summarize(results: Sequence[Dict[str, Any]]) -> Dict[str, int]:
+    """Counts for a summary line: rendered, failed, verify FAIL/WARN, cached."""
+    return {
+        'total': len(results),
+        'passed': sum(1 for r in results if case_passed(r)),
+        'render_failed': sum(1 for r in results if r['status'] == 'FAILED'),
+        'verify_failed': sum(1 for r in results if r.get('verify') and r['verify']['status'] in ('FAIL', 'ERROR')),
+        'verify_warned': sum(1 for r in results if r.get('verify') and r['verify']['status'] == 'WARN'),
+        'cached': sum(1 for r in results if r.get('cached')),
+    }
@@ -15,8 +15,6 @@ Commands:
 import sys
 import os
 import json
-import urllib.request
-import urllib.error
 from typing import Optional, Dict, Any, List
 
 # NetSuite API Gateway endpoint — override with NETSUITE_GATEWAY_URL env var
@@ -26,6 +24,12 @@ _API_KEY = os.environ.get('NETSUITE_API_KEY', '')
 if not _API_KEY and 'nsapi.twistedx.tech' in _gw_base:
     print("Warning: NETSUITE_API_KEY not set — requests to prod gateway will fail with 401", file=sys.stderr)
 
+# Pooled gateway client shared with the netsuite-suiteql skill
+_SUITEQL_SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'netsuite-suiteql', 'scripts')
+if _SUITEQL_SCRIPTS not in sys.path:
+    sys.path.insert(0, _SUITEQL_SCRIPTS)
+from netsuite_gateway import get_client  # noqa: E402
+
 # Environment aliases
 ENV_ALIASES = {
     'prod': 'production',
@@ -66,29 +70,17 @@ def execute_query(
     }
 
     try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-            }
-        )
-
-        with urllib.request.urlopen(req, timeout=60) as response:
-            result = json.loads(response.read().decode('utf-8'))
-
-            records = []
-            if result.get('success') and result.get('data'):
-                records = result.get('data', {}).get('records', [])
-
-            return {
-                'records': records,
-                'count': len(records),
-                'error': result.get('error') if not result.get('success') else None
-            }
+        result = get_client().call(payload, timeout=60)
+
+        records = []
+        if result.get('success') and result.get('data'):
+            records = result.get('data', {}).get('records', [])
+
+        return {
+            'records': records,
+            'count': len(records),
+            'error': result.get('error') if not result.get('success') else None
+        }
 
     except Exception as e:
         return {'error': str(e), 'records': [], 'count': 0}
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Concurrent twxUpsertRecord pipeline for CRE2 profiles and data sources.
+
+Shared by batch_create_profiles.py, add_data_sources.py and
+batch_create_templates.py. The gateway has no multi-record upsert procedure,
+so bulk mode keeps one record per call and runs the calls concurrently over
+the pooled gateway client instead of one at a time with a sleep between them.
+
+Every job carries an idempotency key, its natural key in NetSuite:
+
+  profile      profile name                       (TWX-EDI-850-ROCKY-PDF)
+  data source  <profile id>/<data source name>    (635/edi)
+
+Creates whose key is already in the existing-record index are not sent.
+A create is only retried after a lookup by key confirms it did not land,
+because a timeout or 5xx can arrive after NetSuite saved the record.
+Updates (record_id != 0) are retried as-is. NetSuite-level errors
+(success: false) are not retried.
+
+Usage (from another script):
+    from cre2_upsert import profile_index, lookup_profiles, profile_job, run_upserts
+    existing = profile_index('twistedx', 'sandbox2')
+    jobs = [profile_job('TWX-EDI-850-ROCKY-PDF', 52794801, 'EDI_850_${record.id}.pdf')]
+    results = run_upserts(jobs, 'twistedx', 'sandbox2', existing=existing, lookup=lookup_profiles)
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Pooled gateway client shared with the netsuite-suiteql skill
+_SUITEQL_SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'netsuite-suiteql', 'scripts')
+if _SUITEQL_SCRIPTS not in sys.path:
+    sys.path.insert(0, _SUITEQL_SCRIPTS)
+from netsuite_gateway import GatewayClient, GatewayError, get_client, resolve_account, resolve_environment  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+DEFAULT_UPSERT_WORKERS = 6   # twxUpsertRecord calls in flight at once
+DEFAULT_MAX_ATTEMPTS = 3
+UPSERT_TIMEOUT = 60
+BACKOFF_BASE = 1.0           # seconds; attempt n sleeps uniform(0, min(cap, base * 2**n))
+BACKOFF_CAP = 15.0
+IN_CHUNK = 900               # stay under the 1000-item IN list limit
+
+PROFILE_TYPE = 'customrecord_pri_cre2_profile'
+DATA_SOURCE_TYPE = 'customrecord_pri_cre2_query'
+
+# Record type ID for customrecord_twx_edi_history
+EDI_HISTORY_RECORD_TYPE_ID = 2288
+
+# JS Override (Data Extractor) - shared across all EDI profiles
+JS_OVERRIDE_ID = 52794157
+
+# Data source query - same for all EDI profiles
+# Fetches EDI JSON and trading partner info for the current record
+DATA_SOURCE_QUERY = """SELECT h.id, h.name, h.custrecord_twx_edi_history_json AS edi_json, h.custrecord_twx_eth_edi_tp AS trading_partner, h.custrecord_twx_edi_type AS doc_type, h.custrecord_twx_edi_history_status AS status, h.created AS created_date, tp.custrecord_twx_edi_tp_logo AS tp_logo_id, tp.name AS tp_name FROM customrecord_twx_edi_history h LEFT JOIN customrecord_twx_edi_tp tp ON h.custrecord_twx_eth_edi_tp = tp.id WHERE h.id = ${record.id}"""
+
+# Gateway failures after which a create may or may not have been saved
+_AMBIGUOUS_STATUSES = frozenset({None, 408, 429, 500, 502, 503, 504})
+
+Lookup = Callable[[Sequence[str], str, str], Dict[str, Any]]
+
+
+@dataclass
+class UpsertJob:
+    """One twxUpsertRecord call. record_id 0 creates; key is the idempotency key."""
+    key: str
+    record_type: str
+    fields: Dict[str, Any]
+    record_id: Any = 0
+
+
+# ---------------------------------------------------------------------------
+# CRE2 jobs and existing-record indexes
+# ---------------------------------------------------------------------------
+
+def profile_job(name: str, template_id: int, file_name: str) -> UpsertJob:
+    """Create job for an EDI PDF profile (customrecord_twx_edi_history, shared data extractor)."""
+    return UpsertJob(name, PROFILE_TYPE, {
+        'name': name,
+        'custrecord_pri_cre2_rectype': EDI_HISTORY_RECORD_TYPE_ID,
+        'custrecord_pri_cre2_recname': 'record',
+        'custrecord_pri_cre2_gen_file_tmpl_doc': template_id,
+        'custrecord_pri_cre2_js_override': JS_OVERRIDE_ID,
+        'custrecord_pri_cre2_gen_file_name': file_name,
+        'custrecord_pri_cre2_gen_file_public': True,
+        'isinactive': False,
+    })
+
+
+def profile_template_job(name: str, profile_id: Any, template_id: int) -> UpsertJob:
+    """Update job pointing an existing profile at a template file."""
+    return UpsertJob(name, PROFILE_TYPE, {'custrecord_pri_cre2_gen_file_tmpl_doc': template_id}, profile_id)
+
+
+def data_source_key(profile_id: Any, name: str = 'edi') -> str:
+    return f"{profile_id}/{name}"
+
+
+def data_source_job(profile_id: Any, name: str = 'edi', query: str = DATA_SOURCE_QUERY) -> UpsertJob:
+    """Create job for a profile's SuiteQL data source."""
+    return UpsertJob(data_source_key(profile_id, name), DATA_SOURCE_TYPE, {
+        'name': name,
+        'custrecord_pri_cre2q_parent': profile_id,
+        'custrecord_pri_cre2q_query': query,
+        'custrecord_pri_cre2q_paged': False,
+        'custrecord_pri_cre2q_single_record_json': False,
+    })
+
+
+def _records(sql: str, account: str, environment: str) -> List[Dict[str, Any]]:
+    result = get_client().query(sql, account=account, environment=environment, return_all_rows=True, timeout=60)
+    if result.get('error'):
+        raise GatewayError(f"Lookup query failed: {result['error']}")
+    return result.get('records') or []
+
+
+def _quoted(values: Sequence[Any]) -> List[str]:
+    return ["'" + str(v).replace("'", "''") + "'" for v in values]
+
+
+def profile_index(account: str, environment: str, prefix: str = 'TWX-EDI-') -> Dict[str, Any]:
+    """{name: id} for active profiles whose name starts with prefix."""
+    rows = _records(
+        f"SELECT id, name FROM {PROFILE_TYPE} WHERE name LIKE {_quoted([prefix + '%'])[0]} AND isinactive = 'F'",
+        account, environment)
+    return {r['name']: r['id'] for r in rows}
+
+
+def lookup_profiles(names: Sequence[str], account: str, environment: str) -> Dict[str, Any]:
+    """{name: id} for the given profile names that exist (active or not)."""
+    found: Dict[str, Any] = {}
+    names = list(names)
+    for i in range(0, len(names), IN_CHUNK):
+        in_list = ', '.join(_quoted(names[i:i + IN_CHUNK]))
+        for r in _records(f"SELECT id, name FROM {PROFILE_TYPE} WHERE name IN ({in_list})", account, environment):
+            found[r['name']] = r['id']
+    return found
+
+
+def data_source_index(account: str, environment: str) -> Dict[str, Any]:
+    """{'<profile id>/<name>': id} for every CRE2 data source."""
+    rows = _records(
+        f"SELECT id, name, custrecord_pri_cre2q_parent AS profile_id FROM {DATA_SOURCE_TYPE}",
+        account, environment)
+    return {data_source_key(r['profile_id'], r['name']): r['id'] for r in rows}
+
+
+def lookup_data_sources(keys: Sequence[str], account: str, environment: str) -> Dict[str, Any]:
+    """{'<profile id>/<name>': id} for the given data source keys that exist."""
+    wanted = set(keys)
+    parents = sorted({k.split('/', 1)[0] for k in wanted})
+    found: Dict[str, Any] = {}
+    for i in range(0, len(parents), IN_CHUNK):
+        in_list = ', '.join(_quoted(parents[i:i + IN_CHUNK]))
+        rows = _records(
+            f"SELECT id, name, custrecord_pri_cre2q_parent AS profile_id FROM {DATA_SOURCE_TYPE} "
+            f"WHERE custrecord_pri_cre2q_parent IN ({in_list})",
+            account, environment)
+        for r in rows:
+            key = data_source_key(r['profile_id'], r['name'])
+            if key in wanted:
+                found[key] = r['id']
+    return found
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+def _backoff(attempt: int) -> float:
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+
+def _error_message(err: Any) -> str:
+    if isinstance(err, dict):
+        return err.get('message') or str(err)
+    return str(err or 'Unknown error')
+
+
+def _upsert(client: GatewayClient, job: UpsertJob, account: str, environment: str,
+            lookup: Optional[Lookup], max_attempts: int) -> Dict[str, Any]:
+    payload = {
+        'action': 'execute',
+        'procedure': 'twxUpsertRecord',
+        'type': job.record_type,
+        'id': job.record_id,
+        'fields': job.fields,
+        'netsuiteAccount': account,
+        'netsuiteEnvironment': environment,
+    }
+    creating = not job.record_id
+    base = {'key': job.key, 'record_type': job.record_type}
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            result = client.call(payload, timeout=UPSERT_TIMEOUT)
+        except GatewayError as e:
+            if e.status not in _AMBIGUOUS_STATUSES or attempt >= max_attempts:
+                return {**base, 'success': False, 'status': 'failed', 'id': None,
+                        'error': str(e), 'attempts': attempt}
+            error = str(e)
+        else:
+            if result.get('success'):
+                return {**base, 'success': True, 'status': 'created' if creating else 'updated',
+                        'id': (result.get('data') or {}).get('id') or job.record_id or None,
+                        'error': None, 'attempts': attempt}
+            return {**base, 'success': False, 'status': 'failed', 'id': None,
+                    'error': _error_message(result.get('error')), 'attempts': attempt}
+
+        if creating and lookup is not None:
+            try:
+                landed = lookup([job.key], account, environment).get(job.key)
+            except GatewayError as e:
+                return {**base, 'success': False, 'status': 'failed', 'id': None,
+                        'error': f"{error}; reconcile lookup failed: {e}", 'attempts': attempt}
+            if landed:
+                return {**base, 'success': True, 'status': 'reconciled', 'id': landed,
+                        'error': None, 'attempts': attempt}
+        elif creating:
+            # Without a lookup a retry could create a duplicate
+            return {**base, 'success': False, 'status': 'failed', 'id': None,
+                    'error': error, 'attempts': attempt}
+        time.sleep(_backoff(attempt - 1))
+
+
+def run_upserts(
+    jobs: Sequence[UpsertJob],
+    account: str,
+    environment: str,
+    existing: Optional[Dict[str, Any]] = None,
+    lookup: Optional[Lookup] = None,
+    workers: int = DEFAULT_UPSERT_WORKERS,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run twxUpsertRecord jobs concurrently; results come back in job order.
+
+    Create jobs whose key is in existing (or repeats an earlier job's key) are
+    reported as 'existing' without a call. lookup(keys, account, environment)
+    -> {key: id} lets an ambiguous create failure be reconciled instead of
+    re-sent. on_result is called (serialised) as each job finishes.
+
+    Each result: key, record_type, success, status (created, updated,
+    existing, reconciled, failed), id, error, attempts.
+    """
+    acct = resolve_account(account)
+    env = resolve_environment(environment)
+    existing = existing or {}
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+    lock = threading.Lock()
+
+    def report(i: int, result: Dict[str, Any]) -> None:
+        results[i] = result
+        if on_result is not None:
+            with lock:
+                on_result(result)
+
+    pending = []
+    seen = set()
+    for i, job in enumerate(jobs):
+        if not job.record_id and (job.key in existing or job.key in seen):
+            report(i, {'key': job.key, 'record_type': job.record_type, 'success': True, 'status': 'existing',
+                       'id': existing.get(job.key), 'error': None, 'attempts': 0})
+            continue
+        seen.add(job.key)
+        pending.append(i)
+
+    if pending:
+        workers = max(1, min(workers, len(pending)))
+        # Retries are done here (with reconciliation), never blindly by the transport
+        with GatewayClient(pool_size=workers, max_retries=0, timeout=UPSERT_TIMEOUT) as client:
+            def run(i: int) -> None:
+                report(i, _upsert(client, jobs[i], acct, env, lookup, max_attempts))
+
+            if workers == 1:
+                for i in pending:
+                    run(i)
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    list(pool.map(run, pending))
+
+    # Later duplicates of a key share the id of the job that ran
+    ids = {r['key']: r['id'] for r in results if r and r['status'] != 'existing'}
+    for r in results:
+        if r and r['status'] == 'existing' and r['id'] is None:
+            r['id'] = ids.get(r['key'])
+    return results  # type: ignore[return-value]
@@ -5,10 +5,16 @@ Render CRE2 PDFs for a test matrix of profile:record pairs.
 Batch-renders multiple PDFs and reports success/failure for each.
 Useful for verifying template changes across multiple trading partners.
 
+Renders run concurrently through cre2_matrix (bounded render queue); with
+--verify each PDF is downloaded and checked by verify_pdf in a process pool.
+Results are cached per profile template version and record, so unchanged
+profiles are not re-rendered (--refresh forces, --no-cache disables).
+
 Usage:
     python3 render_test_matrix.py --records "16:9425522,721:9415784,617:9415483" --env sb2
     python3 render_test_matrix.py --records "16:9425522" --env sb2 --open-browser
     python3 render_test_matrix.py --doc-type 850 --env sb2  # Uses built-in test matrix
+    python3 render_test_matrix.py --doc-type 850 --env sb2 --verify --concurrency 6
 
 Built-in test matrix (3 DPI tiers per doc type):
     850: Runnings (200 DPI), Amazon (2000 DPI), Cavenders (2000 DPI)
@@ -16,29 +22,22 @@ Built-in test matrix (3 DPI tiers per doc type):
 
 import sys
 import os
-import json
 import argparse
 import webbrowser
-import urllib.request
-import urllib.error
 from typing import List, Tuple, Dict, Any
 
+script_dir = os.path.dirname(os.path.abspath(__file__))
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+
+from cre2_matrix import DEFAULT_RENDER_CONCURRENCY, DEFAULT_EXTRACT_WORKERS, run_matrix, case_passed  # noqa: E402
+
 # NetSuite API Gateway endpoint — override with NETSUITE_GATEWAY_URL env var
 _gw_base = os.environ.get('NETSUITE_GATEWAY_URL', 'https://nsapi.twistedx.tech').rstrip('/')
-GATEWAY_URL = f'{_gw_base}/api/suiteapi'
 _API_KEY = os.environ.get('NETSUITE_API_KEY', '')
 if not _API_KEY and 'nsapi.twistedx.tech' in _gw_base:
     print("Warning: NETSUITE_API_KEY not set — requests to prod gateway will fail with 401", file=sys.stderr)
 
-# Account/environment config (shared with render_pdf.py)
-ACCOUNT_IDS = {
-    'twistedx': {
-        'production': '4138030',
-        'sandbox': '4138030-sb1',
-        'sandbox2': '4138030-sb2'
-    }
-}
-
 ENV_ALIASES = {
     'prod': 'production', 'production': 'production',
     'sb1': 'sandbox', 'sandbox': 'sandbox',
@@ -65,58 +64,6 @@ def resolve_env(env: str) -> str:
     return ENV_ALIASES.get(env.lower(), env.lower())
 
 
-def get_base_url(env: str) -> str:
-    account_id = ACCOUNT_IDS.get('twistedx', {}).get(resolve_env(env))
-    if account_id:
-        return f"https://{account_id}.app.netsuite.com"
-    return None
-
-
-def render_single(profile_id: str, record_id: str, env: str) -> Dict[str, Any]:
-    """Render a single PDF and return the result."""
-    payload = {
-        'action': 'cre2Render',
-        'procedure': 'cre2Render',
-        'profileId': profile_id,
-        'recordId': record_id,
-        'netsuiteAccount': 'twistedx',
-        'netsuiteEnvironment': resolve_env(env)
-    }
-
-    try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-            }
-        )
-
-        with urllib.request.urlopen(req, timeout=120) as response:
-            result = json.loads(response.read().decode('utf-8'))
-
-            if result.get('success') and result.get('data', {}).get('pdfUrl'):
-                pdf_url = result['data']['pdfUrl']
-                if pdf_url.startswith('/'):
-                    base_url = get_base_url(env)
-                    if base_url:
-                        result['data']['fullPdfUrl'] = f"{base_url}{pdf_url}"
-
-            return result
-
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8') if e.fp else str(e)
-        try:
-            return json.loads(error_body)
-        except json.JSONDecodeError:
-            return {'success': False, 'error': {'message': f"HTTP {e.code}: {error_body}"}}
-    except Exception as e:
-        return {'success': False, 'error': {'message': str(e)}}
-
-
 def parse_records(records_str: str) -> List[Tuple[str, str, str]]:
     """Parse 'profile:record,profile:record' into list of (profile, record, label)."""
     pairs = []
@@ -139,6 +86,7 @@ Examples:
   python3 render_test_matrix.py --records "16:9425522,721:9415784,617:9415483" --env sb2
   python3 render_test_matrix.py --doc-type 850 --env sb2
   python3 render_test_matrix.py --doc-type 850 --env sb2 --open-browser
+  python3 render_test_matrix.py --doc-type 850 --env sb2 --verify
         """
     )
 
@@ -152,6 +100,15 @@ Examples:
                        help='NetSuite environment (default: sandbox2)')
     parser.add_argument('--open-browser', '-o', action='store_true',
                        help='Open each successful PDF in browser')
+    parser.add_argument('--verify', '-v', action='store_true',
+                       help='Download each PDF and run verify_pdf checks (needs pdfplumber or PyPDF2)')
+    parser.add_argument('--concurrency', '-c', type=int, default=DEFAULT_RENDER_CONCURRENCY,
+                       help=f'Renders in flight at once (default: {DEFAULT_RENDER_CONCURRENCY})')
+    parser.add_argument('--extract-workers', type=int, default=DEFAULT_EXTRACT_WORKERS,
+                       help=f'Processes for PDF text extraction (default: {DEFAULT_EXTRACT_WORKERS})')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Re-render even when a cached result matches the template version')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write cached results')
 
     args = parser.parse_args()
 
@@ -166,39 +123,54 @@ Examples:
         print("Error: No valid test records", file=sys.stderr)
         sys.exit(1)
 
-    # Render each
-    results = []
+    # Render all (concurrently), reporting each as it completes
     print(f"\n{'='*70}")
     print(f"CRE2 Test Matrix - {len(matrix)} renders")
     print(f"Environment: {args.env}")
     print(f"{'='*70}\n")
 
-    for i, (profile_id, record_id, label) in enumerate(matrix, 1):
-        print(f"[{i}/{len(matrix)}] Rendering {label} (profile={profile_id}, record={record_id})...", end=' ', flush=True)
-
-        result = render_single(profile_id, record_id, args.env)
-        success = result.get('success', False)
-
-        if success:
-            duration = result.get('duration', '?')
-            file_name = result.get('data', {}).get('fileName', '?')
-            full_url = result.get('data', {}).get('fullPdfUrl', '')
-            print(f"✅ {file_name} ({duration}ms)")
-
-            if args.open_browser and full_url:
-                webbrowser.open(full_url)
+    done = [0]
+
+    def report(index: int, r: Dict[str, Any]) -> None:
+        done[0] += 1
+        prefix = f"[{done[0]}/{len(matrix)}] {r['label']} (profile={r['profile_id']}, record={r['record_id']})"
+        if r['status'] != 'SUCCESS':
+            print(f"{prefix} ❌ {r['error']}")
+            return
+        source = 'cached' if r['cached'] else f"{r.get('duration', '?')}ms"
+        line = f"{prefix} ✅ {r.get('file_name', '?')} ({source})"
+        verify = r.get('verify')
+        if verify:
+            icon = {'PASS': '✅', 'WARN': '⚠️'}.get(verify['status'], '❌')
+            detail = verify.get('error') or f"{verify['issue_count']} issues, {verify['warning_count']} warnings"
+            line += f"  verify {icon} {verify['status']} ({detail})"
+        print(line, flush=True)
+        if args.open_browser and r.get('full_url'):
+            webbrowser.open(r['full_url'])
+
+    matrix_results = run_matrix(
+        matrix, 'twistedx', resolve_env(args.env),
+        verify=args.verify,
+        render_concurrency=args.concurrency,
+        extract_workers=args.extract_workers,
+        use_cache=not args.no_cache,
+        refresh=args.refresh,
+        on_result=report,
+    )
 
-            results.append({
-                'label': label, 'profile': profile_id, 'record': record_id,
-                'success': True, 'url': full_url, 'duration': duration
-            })
+    results = []
+    for r in matrix_results:
+        entry = {'label': r['label'], 'profile': r['profile_id'], 'record': r['record_id'],
+                 'success': case_passed(r)}
+        if r['status'] == 'SUCCESS':
+            entry.update(url=r.get('full_url', ''), duration=r.get('duration'))
+            if not entry['success']:
+                verify = r['verify']
+                entry['error'] = verify.get('error') or 'verify FAIL: ' + ', '.join(
+                    i['category'] for i in verify.get('issues', []))
         else:
-            error_msg = result.get('error', {}).get('message', 'Unknown error')
-            print(f"❌ {error_msg}")
-            results.append({
-                'label': label, 'profile': profile_id, 'record': record_id,
-                'success': False, 'error': error_msg
-            })
+            entry['error'] = r['error']
+        results.append(entry)
 
     # Summary
     passed = sum(1 for r in results if r['success'])
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Statement PDF text extraction, caching and single-pass field parsing.
+
+Used by compare_statements.py. A statement PDF is extracted once (pdfplumber,
+optionally in a process pool), cached by file ID and content hash, and parsed
+by parse_statement() in one walk over its lines. The walk yields every field
+compare() needs: amount due, balance forward, transaction IDs, per-transaction
+amounts and aging buckets. Each rule matches the regexes the per-field parsers
+in compare_statements used, so results are unchanged.
+
+Cache location: ~/.cache/netsuite-skills/statement-text/ (override with
+CRE2_STATEMENT_TEXT_CACHE). Entries are gzipped JSON named
+<sha256>-<file_id>-v<EXTRACTOR_VERSION>.json.gz; bump EXTRACTOR_VERSION when
+extraction or parsing changes.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+EXTRACTOR_VERSION = 1
+CACHE_ENV = 'CRE2_STATEMENT_TEXT_CACHE'
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'netsuite-skills' / 'statement-text'
+
+AGING_KEYS = ['current', '1-30', '31-60', '61-90', '90+', 'total']
+
+# ---------------------------------------------------------------------------
+# Patterns
+# ---------------------------------------------------------------------------
+
+_TRAN_ID_RE = re.compile(r'\b((?:INV|CM|CR|SO|PO|BILL|PMT)\d{4,})\b', re.IGNORECASE)
+# A transaction row shows at least one balance amount (rules out IDs in link text)
+_ROW_AMOUNT_RE = re.compile(r'\(\$?[\d,]+(?:\.\d{2})?\)|\$-?[\d,]+(?:\.\d{2})?')
+# Row amount columns; 1-2 decimals because some native PDFs emit ($66.5)
+_TRAN_AMOUNT_RE = re.compile(r'\(\$?[\d,]+(?:\.\d{1,2})?\)|\$-?[\d,]+(?:\.\d{1,2})?')
+
+_AMOUNT_TOKEN = r'(?:\(\$?[\d,]+(?:\.\d{2})?\)|\$[^\S\n]*-?[\d,]+(?:\.\d{2})?)'
+_AMOUNT_TOKEN_RE = re.compile(_AMOUNT_TOKEN, re.IGNORECASE)
+_AMOUNT_DUE_RE = re.compile(
+    r'(?:Amount Due|Total Amount Due|Balance Due|Total Due)[^\S\n]*' + _AMOUNT_TOKEN, re.IGNORECASE)
+_BALANCE_FORWARD_RE = re.compile(r'Balance Forward\s*\$?\s*([\d,]+(?:\.\d{2})?)', re.IGNORECASE)
+
+_AGING_HEADER_RE = re.compile(r'Current.*1[- ]30.*31[- ]60', re.IGNORECASE)
+_AGING_VALUE_RE = re.compile(r'\(\$?[\d,]+(?:\.\d{2})?\)|\$?-?[\d,]+\.\d{2}')
+_AGING_INLINE_RES = {
+    'current': re.compile(r'Current\s*\$\s*([\d,]+(?:\.\d{2})?)', re.IGNORECASE),
+    '1-30':    re.compile(r'1[- ]30\s*Days?\s*\$\s*([\d,]+(?:\.\d{2})?)', re.IGNORECASE),
+    '31-60':   re.compile(r'31[- ]60\s*Days?\s*\$\s*([\d,]+(?:\.\d{2})?)', re.IGNORECASE),
+    '61-90':   re.compile(r'61[- ]90\s*Days?\s*\$\s*([\d,]+(?:\.\d{2})?)', re.IGNORECASE),
+    '90+':     re.compile(r'(?:Over 90|90\+|91\+)\s*Days?\s*\$\s*([\d,]+(?:\.\d{2})?)', re.IGNORECASE),
+    'total':   re.compile(r'(?:Total|Aging Total)\s*\$\s*([\d,]+(?:\.\d{2})?)', re.IGNORECASE),
+}
+
+_PAREN_AMOUNT_RE = re.compile(r'^\(\$?([\d,]+(?:\.\d{1,2})?)\)$')
+_NEGATIVE_AMOUNT_RE = re.compile(r'^\$?-([\d,]+(?:\.\d{1,2})?)$')
+_PLAIN_AMOUNT_RE = re.compile(r'^\$?([\d,]+(?:\.\d{1,2})?)$')
+
+# Line boundaries str.splitlines() honours besides '\n' (rare in pdfplumber output)
+_OTHER_BREAKS_RE = re.compile('[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
+
+def parse_amount(s: str) -> Optional[float]:
+    """Parse a single amount token: ($123.45), ($66.5), $-123.45, $123.45, or bare 123.45.
+
+    Returns None for anything else, including digitless tokens such as "$,,".
+    """
+    s = s.strip()
+    for pattern, sign in ((_PAREN_AMOUNT_RE, -1), (_NEGATIVE_AMOUNT_RE, -1), (_PLAIN_AMOUNT_RE, 1)):
+        m = pattern.match(s)
+        if m:
+            try:
+                return sign * float(m.group(1).replace(',', ''))
+            except ValueError:
+                return None
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Single-pass parser
+# ---------------------------------------------------------------------------
+
+def parse_statement(text: str) -> Dict[str, Any]:
+    """
+    All comparison fields from one statement's text:
+      amount_due, balance_forward   float or None
+      transaction_ids               sorted IDs on lines that also carry an amount
+      transaction_amounts           {tranid: {'invoice': x, 'remaining': y}} (last row wins)
+      aging                         {bucket: float or None} for AGING_KEYS
+
+    Amount Due must share a line with its label (the aging header row has
+    its values on the next line); Balance Forward may wrap, so its regex runs
+    once from the first line that mentions it. Transaction IDs only count on
+    rows that show an amount, which drops IDs from hyperlink text. A row's
+    first amount is the original document amount and its last the remaining
+    balance in both the native and CRE2 layouts. Aging values come from the
+    line after the "Current ... 1-30 ... 31-60" header; negatives appear as
+    ($118.75) in native and $-118.75 in CRE2.
+    """
+    lines = text.split('\n')
+    split_rows = _OTHER_BREAKS_RE.search(text) is not None
+
+    amount_due: Optional[float] = None
+    due_found = False
+    balance_forward: Optional[float] = None
+    bf_seen = False
+    aging_values: Optional[str] = None
+    tran_ids = set()
+    tran_amounts: Dict[str, Dict[str, Optional[float]]] = {}
+
+    offset = 0
+    last = len(lines) - 1
+    for i, line in enumerate(lines):
+        lower = line.lower()
+
+        if not due_found and 'due' in lower:
+            m = _AMOUNT_DUE_RE.search(line)
+            if m:
+                due_found = True
+                raw = _AMOUNT_TOKEN_RE.search(m.group(0))
+                if raw:
+                    amount_due = parse_amount(raw.group(0))
+
+        if not bf_seen and 'balance forward' in lower:
+            bf_seen = True
+            m = _BALANCE_FORWARD_RE.search(text, offset)
+            if m:
+                try:
+                    balance_forward = float(m.group(1).replace(',', ''))
+                except ValueError:
+                    pass
+
+        if aging_values is None and i < last and 'current' in lower and _AGING_HEADER_RE.search(line):
+            aging_values = lines[i + 1]
+
+        for row in (line.splitlines() if split_rows else (line,)):
+            m = _TRAN_ID_RE.search(row)
+            if not m:
+                continue
+            tranid = m.group(1).upper()
+            if _ROW_AMOUNT_RE.search(row):
+                tran_ids.add(tranid)
+            tokens = _TRAN_AMOUNT_RE.findall(row)
+            if tokens:
+                tran_amounts[tranid] = {'invoice': parse_amount(tokens[0]), 'remaining': parse_amount(tokens[-1])}
+            else:
+                tran_amounts[tranid] = {'invoice': None, 'remaining': None}
+
+        offset += len(line) + 1
+
+    return {
+        'amount_due': amount_due,
+        'balance_forward': balance_forward,
+        'transaction_ids': sorted(tran_ids),
+        'transaction_amounts': tran_amounts,
+        'aging': _aging(text, aging_values),
+    }
+
+
+def _aging(text: str, values_line: Optional[str]) -> Dict[str, Optional[float]]:
+    """Aging buckets from the value row under the table header, else inline label patterns."""
+    buckets: Dict[str, Optional[float]] = {k: None for k in AGING_KEYS}
+    if values_line is not None:
+        amounts = [a for t in _AGING_VALUE_RE.findall(values_line) if (a := parse_amount(t)) is not None]
+        for key, amount in zip(AGING_KEYS, amounts):
+            buckets[key] = amount
+        return buckets
+
+    for key, pattern in _AGING_INLINE_RES.items():
+        m = pattern.search(text)
+        if m:
+            v = parse_amount(m.group(1))
+            if v is not None:
+                buckets[key] = v
+    return buckets
+
+
+# ---------------------------------------------------------------------------
+# Extraction and cache
+# ---------------------------------------------------------------------------
+
+def extract_pages(pdf_bytes: bytes) -> List[str]:
+    """Text of each page (pdfplumber). Top-level so it can run in a process pool."""
+    try:
+        import pdfplumber
+    except ImportError:
+        raise RuntimeError("pdfplumber is required: pip install pdfplumber")
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        return [page.extract_text() or '' for page in pdf.pages]
+
+
+class StatementTextCache:
+    """Extracted pages and parsed fields per (file ID, PDF sha256)."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.dir = Path(directory or os.environ.get(CACHE_ENV) or DEFAULT_CACHE_DIR).expanduser()
+
+    def _path(self, file_id: Any, digest: str) -> Path:
+        return self.dir / digest[:2] / f'{digest}-{file_id}-v{EXTRACTOR_VERSION}.json.gz'
+
+    def get(self, file_id: Any, digest: str) -> Optional[Dict[str, Any]]:
+        try:
+            with gzip.open(self._path(file_id, digest), 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError, EOFError):
+            return None
+
+    def put(self, file_id: Any, digest: str, entry: Dict[str, Any]) -> None:
+        path = self._path(file_id, digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + '.part')
+        with gzip.open(tmp, 'wt', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+
+
+def load_statement(file_id: Any, pdf_bytes: bytes, cache: Optional[StatementTextCache] = None,
+                   pool: Optional[Executor] = None) -> Dict[str, Any]:
+    """
+    {'text', 'fields', 'cached'} for one downloaded statement PDF. Extraction
+    runs in pool when given; a cache hit skips extraction and parsing.
+    """
+    digest = hashlib.sha256(pdf_bytes).hexdigest()
+    entry = cache.get(file_id, digest) if cache else None
+    if entry:
+        return {'text': '\n'.join(entry['pages']), 'fields': entry['fields'], 'cached': True}
+
+    pages = pool.submit(extract_pages, pdf_bytes).result() if pool else extract_pages(pdf_bytes)
+    text = '\n'.join(pages)
+    fields = parse_statement(text)
+    if cache:
+        cache.put(file_id, digest, {'pages': pages, 'fields': fields})
+    return {'text': text, 'fields': fields, 'cached': False}
@@ -27,7 +27,7 @@ import tempfile
 import re
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Union, BinaryIO
 
 # Try to import PDF libraries
 PDF_LIBRARY = None
@@ -201,8 +201,8 @@ def download_pdf(url: str, output_path: str = None) -> Tuple[bool, str]:
         return False, str(e)
 
 
-def extract_text_from_pdf(pdf_path: str) -> Tuple[bool, str]:
-    """Extract text content from PDF file."""
+def extract_text_from_pdf(pdf_path: Union[str, BinaryIO]) -> Tuple[bool, str]:
+    """Extract text content from a PDF file path or binary file object."""
     if not PDF_LIBRARY:
         return False, "No PDF library installed. Install with: pip install pdfplumber"
 
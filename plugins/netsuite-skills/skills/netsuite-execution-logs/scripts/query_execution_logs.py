@@ -9,14 +9,18 @@ Usage:
   python3 query_execution_logs.py --script customscript_pri_qt_sl_render_query --account dm --env prod
   python3 query_execution_logs.py --level DEBUG --hours 24 --account dm --format table
   python3 query_execution_logs.py --title "DEBUG-" --hours 1 --account dm --format json
+  python3 query_execution_logs.py --follow --level ERROR --account dm --group-by script
 """
 
 import sys
 import os
+import re
 import json
-import urllib.request
-import urllib.error
-from typing import Dict, Any, Optional, List
+import time
+import hashlib
+import datetime
+from collections import Counter, deque
+from typing import Dict, Any, Optional, List, Iterator
 
 # NetSuite API Gateway endpoint — override with NETSUITE_GATEWAY_URL env var
 _gw_base = os.environ.get('NETSUITE_GATEWAY_URL', 'https://nsapi.twistedx.tech').rstrip('/')
@@ -25,6 +29,12 @@ _API_KEY = os.environ.get('NETSUITE_API_KEY', '')
 if not _API_KEY and 'nsapi.twistedx.tech' in _gw_base:
     print("Warning: NETSUITE_API_KEY not set — requests to prod gateway will fail with 401", file=sys.stderr)
 
+# Pooled gateway client shared with the netsuite-suiteql skill
+_SUITEQL_SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'netsuite-suiteql', 'scripts')
+if _SUITEQL_SCRIPTS not in sys.path:
+    sys.path.insert(0, _SUITEQL_SCRIPTS)
+from netsuite_gateway import GatewayError, get_client  # noqa: E402
+
 # Account aliases
 ACCOUNT_ALIASES = {
     'twx': 'twistedx', 'twisted': 'twistedx', 'twistedx': 'twistedx',
@@ -41,6 +51,14 @@ ENV_ALIASES = {
 DEFAULT_ACCOUNT = 'dutyman'
 DEFAULT_ENVIRONMENT = 'production'
 
+# Follow mode: poll interval bounds (seconds). The interval drops to the minimum
+# when a poll returns new rows and grows by FOLLOW_BACKOFF per idle poll.
+FOLLOW_MIN_INTERVAL = 5.0
+FOLLOW_MAX_INTERVAL = 60.0
+FOLLOW_BACKOFF = 1.5
+FOLLOW_LIMIT = 100          # rows per poll; doubled (up to FOLLOW_MAX_LIMIT) while catching up
+FOLLOW_MAX_LIMIT = 1000
+
 
 def resolve_account(account: str) -> str:
     return ACCOUNT_ALIASES.get(account.lower(), account.lower())
@@ -105,93 +123,77 @@ def query_execution_logs(
         payload['title'] = title
 
     try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-            }
-        )
-
-        with urllib.request.urlopen(req, timeout=120) as response:
-            result = json.loads(response.read().decode('utf-8'))
-
-            if result.get('success'):
-                # Gateway returns {success: true, data: [...logs...]}
-                data = result.get('data', [])
-                # Handle both array and object responses
-                if isinstance(data, list):
-                    logs = data
-                elif isinstance(data, dict) and data.get('error'):
-                    return {
-                        'error': data.get('error'),
-                        'account': resolved_account,
-                        'environment': resolved_env
-                    }
-                else:
-                    logs = []
+        result = get_client().call(payload, timeout=120)
+
+        if result.get('success'):
+            # Gateway returns {success: true, data: [...logs...]}
+            data = result.get('data', [])
+            # Handle both array and object responses
+            if isinstance(data, list):
+                logs = data
+            elif isinstance(data, dict) and data.get('error'):
                 return {
-                    'success': True,
-                    'logs': logs,
-                    'count': len(logs),
+                    'error': data.get('error'),
                     'account': resolved_account,
                     'environment': resolved_env
                 }
             else:
-                error_msg = result.get('error', 'Unknown error')
-                if isinstance(error_msg, dict):
-                    error_msg = error_msg.get('message', str(error_msg))
-                return {
-                    'error': error_msg,
-                    'account': resolved_account,
-                    'environment': resolved_env
-                }
-
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_json = json.loads(error_body)
-            error_msg = error_json.get('error', {}).get('message', error_body)
-        except:
-            error_msg = error_body
-        return {'error': f'HTTP {e.code}: {error_msg}'}
+                logs = []
+            return {
+                'success': True,
+                'logs': logs,
+                'count': len(logs),
+                'account': resolved_account,
+                'environment': resolved_env
+            }
+        else:
+            error_msg = result.get('error', 'Unknown error')
+            if isinstance(error_msg, dict):
+                error_msg = error_msg.get('message', str(error_msg))
+            return {
+                'error': error_msg,
+                'account': resolved_account,
+                'environment': resolved_env
+            }
 
-    except urllib.error.URLError as e:
-        return {'error': f'Gateway connection error: {str(e.reason)}'}
+    except GatewayError as e:
+        return {'error': str(e)}
 
     except Exception as e:
         return {'error': f'Unexpected error: {str(e)}'}
 
 
+TABLE_COLUMNS = [
+    ('Date', 'date', 10),
+    ('Time', 'time', 12),
+    ('Level', 'type', 10),
+    ('Script', 'script', 40),
+    ('Title', 'title', 50),
+]
+
+
+def format_table_header() -> str:
+    """Header and separator lines for format_table / follow mode."""
+    header = ' | '.join(col[0].ljust(col[2]) for col in TABLE_COLUMNS)
+    separator = '-+-'.join('-' * col[2] for col in TABLE_COLUMNS)
+    return f"{header}\n{separator}"
+
+
+def format_table_row(log: Dict[str, Any]) -> str:
+    return ' | '.join(
+        str(log.get(col[1], '') or '')[:col[2]].ljust(col[2])
+        for col in TABLE_COLUMNS
+    )
+
+
 def format_table(logs: List[Dict[str, Any]]) -> str:
     """Format logs as ASCII table."""
     if not logs:
         return "No logs found."
 
-    # Define columns
-    columns = [
-        ('Date', 'date', 10),
-        ('Time', 'time', 12),
-        ('Level', 'type', 10),
-        ('Script', 'script', 40),
-        ('Title', 'title', 50),
-    ]
-
-    # Header
-    header = ' | '.join(col[0].ljust(col[2]) for col in columns)
-    separator = '-+-'.join('-' * col[2] for col in columns)
-
-    lines = [header, separator]
-
+    lines = [format_table_header()]
     for log in logs:
-        row = ' | '.join(
-            str(log.get(col[1], '') or '')[:col[2]].ljust(col[2])
-            for col in columns
-        )
-        lines.append(row)
+        lines.append(format_table_row(log))
 
     return '\n'.join(lines)
 
@@ -224,6 +226,192 @@ def format_detailed(logs: List[Dict[str, Any]]) -> str:
     return '\n'.join(lines)
 
 
+# ---------------------------------------------------------------------------
+# Follow mode
+# ---------------------------------------------------------------------------
+
+_TIME_FORMATS = ('%m/%d/%Y %I:%M:%S %p', '%m/%d/%Y %I:%M %p', '%m/%d/%Y %H:%M:%S', '%m/%d/%Y %H:%M')
+
+
+def log_timestamp(log: Dict[str, Any]) -> Optional[datetime.datetime]:
+    """Parse the log's date ('1/14/2026') and time ('5:30:15 PM'); None if unparseable."""
+    stamp = f"{log.get('date') or ''} {log.get('time') or ''}".strip()
+    for fmt in _TIME_FORMATS:
+        try:
+            return datetime.datetime.strptime(stamp, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def log_key(log: Dict[str, Any]) -> str:
+    """Internal ID of the log entry, or a content fingerprint when the search omits it."""
+    internal_id = log.get('id') or log.get('internalid')
+    if internal_id:
+        return str(internal_id)
+    raw = '\x1f'.join(str(log.get(k) or '') for k in ('date', 'time', 'type', 'script', 'user', 'title', 'detail'))
+    return 'h:' + hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def log_group(log: Dict[str, Any], group_by: str) -> str:
+    """Aggregation key for --group-by (script, deployment, level or title)."""
+    if group_by == 'level':
+        value = log.get('type')
+    elif group_by == 'deployment':
+        value = log.get('deployment') or log.get('scriptDeployment')
+    else:
+        value = log.get(group_by)
+    return str(value or '(unknown)')
+
+
+class LogCursor:
+    """
+    Memory of the rows already emitted, keyed by internal id.
+
+    Log times have one-second precision and a row can become visible to the
+    search after later rows, so admission is decided by the keys of emitted
+    rows, not by time. Only once the key memory is full are rows older than
+    the oldest remembered row dropped, since their keys may have been evicted.
+    """
+
+    def __init__(self, max_keys: int = 20000):
+        self._seen: set = set()
+        self._order: deque = deque()
+        self._floor: Optional[datetime.datetime] = None
+        self._max_keys = max_keys
+
+    def admit(self, log: Dict[str, Any]) -> bool:
+        """True (and the row is recorded) if the row has not been emitted before."""
+        key = log_key(log)
+        if key in self._seen:
+            return False
+        ts = log_timestamp(log)
+        if ts is not None and self._floor is not None and ts < self._floor:
+            return False
+        self._seen.add(key)
+        self._order.append((key, ts))
+        if len(self._order) > self._max_keys:
+            old_key, old_ts = self._order.popleft()
+            self._seen.discard(old_key)
+            if old_ts is not None and (self._floor is None or old_ts > self._floor):
+                self._floor = old_ts
+        return True
+
+
+def follow_execution_logs(
+    script_id: Optional[str] = None,
+    log_level: Optional[str] = None,
+    hours: int = 1,
+    title: Optional[str] = None,
+    limit: int = FOLLOW_LIMIT,
+    account: str = DEFAULT_ACCOUNT,
+    environment: str = DEFAULT_ENVIRONMENT,
+    min_interval: float = FOLLOW_MIN_INTERVAL,
+    max_interval: float = FOLLOW_MAX_INTERVAL,
+    duration: Optional[float] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Poll execution logs and yield each batch of rows not seen before, oldest first.
+
+    The first poll covers the last `hours` hours; later polls only ask for the
+    last hour (or the time since the last successful poll, if longer), and only
+    rows the cursor has not seen are yielded. When a poll returns a full page of
+    new rows, the page size doubles and the next poll runs at once so a burst is
+    not truncated.
+    Gateway errors are reported on stderr and retried on the idle backoff.
+    Stops after `duration` seconds, or runs until interrupted.
+    """
+    cursor = LogCursor()
+    interval = min_interval
+    page = max(1, limit)
+    window = max(1, hours)
+    started = time.monotonic()
+    last_ok: Optional[float] = None
+
+    while True:
+        polled_at = time.monotonic()
+        result = query_execution_logs(
+            script_id=script_id, log_level=log_level, hours=window, title=title,
+            limit=page, account=account, environment=environment
+        )
+        if result.get('error'):
+            print(f"[follow] {result['error']}", file=sys.stderr)
+            interval = min(max_interval, max(interval, min_interval) * FOLLOW_BACKOFF)
+        else:
+            first = last_ok is None
+            last_ok = polled_at
+            logs = result.get('logs', [])
+            fresh = [log for log in logs if cursor.admit(log)]
+            fresh.sort(key=lambda log: (log_timestamp(log) or datetime.datetime.min, log_key(log)))
+            if fresh:
+                yield fresh
+            # A full page of new rows (after the initial backlog) means the poll cut a burst short
+            truncated = not first and len(logs) >= page and len(fresh) == len(logs)
+            if truncated and page < FOLLOW_MAX_LIMIT:
+                page = min(FOLLOW_MAX_LIMIT, page * 2)
+                interval = 0.0
+            else:
+                if truncated:
+                    print(f"[follow] {len(logs)} new rows in one poll (limit {page}); "
+                          f"older rows in this burst may be missing", file=sys.stderr)
+                interval = min_interval if fresh else min(max_interval, max(interval, min_interval) * FOLLOW_BACKOFF)
+
+        if duration is not None and time.monotonic() - started + interval >= duration:
+            return
+        time.sleep(interval)
+        if last_ok is not None:
+            window = int((time.monotonic() - last_ok) // 3600) + 1
+
+
+def print_follow(
+    batches: Iterator[List[Dict[str, Any]]],
+    output_format: str = 'table',
+    match: Optional[str] = None,
+    deployment: Optional[str] = None,
+    group_by: Optional[str] = None,
+) -> Counter:
+    """
+    Stream followed rows to stdout as table rows, detailed blocks or JSON lines.
+
+    match (regex, case-insensitive, on title and detail) and deployment are
+    applied locally. With group_by, running counts go to stderr after each
+    batch. Ctrl-C ends the stream; the counts are returned either way.
+    """
+    pattern = re.compile(match, re.IGNORECASE) if match else None
+    counts: Counter = Counter()
+    shown = 0
+    if output_format == 'table':
+        print(format_table_header(), flush=True)
+
+    try:
+        for batch in batches:
+            rows = [
+                log for log in batch
+                if (pattern is None or pattern.search(f"{log.get('title') or ''}\n{log.get('detail') or ''}"))
+                and (deployment is None or log_group(log, 'deployment').lower() == deployment.lower())
+            ]
+            if not rows:
+                continue
+            for log in rows:
+                shown += 1
+                if output_format in ('json', 'jsonl'):
+                    print(json.dumps(log, separators=(',', ':')))
+                elif output_format == 'detailed':
+                    print(format_detailed([log]).replace('Log Entry 1', f'Log Entry {shown}', 1))
+                else:
+                    print(format_table_row(log))
+            sys.stdout.flush()
+
+            if group_by:
+                counts.update(log_group(log, group_by) for log in rows)
+                tally = ', '.join(f"{k}={n}" for k, n in counts.most_common(10))
+                print(f"[{group_by}] {tally}", file=sys.stderr)
+    except KeyboardInterrupt:
+        print("\nStopped.", file=sys.stderr)
+
+    return counts
+
+
 def print_usage():
     print("""NetSuite Script Execution Log Query Tool
 
@@ -242,6 +430,16 @@ Connection Options:
 
 Output Options:
   --format <fmt>       Output format: table, json, detailed (default: table)
+                       In follow mode json prints one object per line (jsonl)
+
+Follow Options:
+  --follow, -f         Keep polling and print only new entries (Ctrl-C to stop)
+  --interval <s>       Minimum seconds between polls (default: 5)
+  --max-interval <s>   Maximum seconds between idle polls (default: 60)
+  --duration <m>       Stop after N minutes
+  --match <regex>      Only show entries whose title or detail matches
+  --deployment <id>    Only show entries from this deployment
+  --group-by <field>   Running counts by script, deployment, level or title (stderr)
 
 Examples:
   # Get DEBUG logs from last hour for Query Renderer
@@ -256,6 +454,12 @@ Examples:
   # Get all recent logs as JSON
   python3 query_execution_logs.py --hours 1 --account dm --format json
 
+  # Follow new ERROR logs during an incident, with counts per script
+  python3 query_execution_logs.py --follow --level ERROR --account dm --group-by script
+
+  # Stream a script's logs as JSON lines for 30 minutes
+  python3 query_execution_logs.py -f --script customscript_pri_container_ss --format jsonl --duration 30
+
 Log Levels:
   DEBUG     - Detailed debugging information
   AUDIT     - Audit trail entries
@@ -271,12 +475,19 @@ def main():
 
     script_id = None
     log_level = None
-    hours = 24
+    hours = None
     title = None
     limit = 200
     account = DEFAULT_ACCOUNT
     environment = DEFAULT_ENVIRONMENT
     output_format = 'table'
+    follow = False
+    min_interval = FOLLOW_MIN_INTERVAL
+    max_interval = FOLLOW_MAX_INTERVAL
+    duration = None
+    match = None
+    deployment = None
+    group_by = None
 
     i = 1
     while i < len(sys.argv):
@@ -305,17 +516,65 @@ def main():
         elif arg == '--format' and i + 1 < len(sys.argv):
             output_format = sys.argv[i + 1].lower()
             i += 2
+        elif arg in ('--follow', '-f'):
+            follow = True
+            i += 1
+        elif arg == '--interval' and i + 1 < len(sys.argv):
+            min_interval = float(sys.argv[i + 1])
+            i += 2
+        elif arg == '--max-interval' and i + 1 < len(sys.argv):
+            max_interval = float(sys.argv[i + 1])
+            i += 2
+        elif arg == '--duration' and i + 1 < len(sys.argv):
+            duration = float(sys.argv[i + 1]) * 60
+            i += 2
+        elif arg == '--match' and i + 1 < len(sys.argv):
+            match = sys.argv[i + 1]
+            i += 2
+        elif arg == '--deployment' and i + 1 < len(sys.argv):
+            deployment = sys.argv[i + 1]
+            i += 2
+        elif arg == '--group-by' and i + 1 < len(sys.argv):
+            group_by = sys.argv[i + 1].lower()
+            i += 2
         else:
             i += 1
 
     resolved_account = resolve_account(account)
     resolved_env = resolve_environment(environment)
+
+    if group_by and group_by not in ('script', 'deployment', 'level', 'title'):
+        print("ERROR: --group-by must be script, deployment, level or title", file=sys.stderr)
+        sys.exit(1)
+
+    if follow:
+        print(f"Following execution logs from {resolved_account}/{resolved_env} "
+              f"(polling every {min_interval:g}-{max_interval:g}s, Ctrl-C to stop)...", file=sys.stderr)
+        batches = follow_execution_logs(
+            script_id=script_id,
+            log_level=log_level,
+            hours=hours or 1,
+            title=title,
+            limit=limit,
+            account=account,
+            environment=environment,
+            min_interval=min_interval,
+            max_interval=max(min_interval, max_interval),
+            duration=duration
+        )
+        counts = print_follow(batches, output_format, match=match, deployment=deployment, group_by=group_by)
+        if group_by and counts:
+            print(f"\nTotals by {group_by}:", file=sys.stderr)
+            for key, n in counts.most_common():
+                print(f"  {n:6}  {key}", file=sys.stderr)
+        sys.exit(0)
+
     print(f"Querying execution logs from {resolved_account}/{resolved_env}...", file=sys.stderr)
 
     result = query_execution_logs(
         script_id=script_id,
         log_level=log_level,
-        hours=hours,
+        hours=hours or 24,
         title=title,
         limit=limit,
         account=account,
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Benchmark for pci_scan card-number detection.
+
+Builds large synthetic corpora that look like the text pci_scan extracts (OCR'd
+order forms and spreadsheet dumps, with valid and invalid card numbers in every
+separator style), then times:
+
+  legacy   per-pattern reference scanner (a regex per brand and length + Python Luhn)
+  text     pci_scan.scan_text_for_cards()   (single-pass tokenizer)
+  mmap     pci_scan.scan_file_for_cards()   (same, over a memory-mapped file)
+
+All three must report identical hits; the script exits 1 if they differ.
+
+Usage:
+  python3 bench_card_scan.py
+  python3 bench_card_scan.py --size-mb 64 --repeat 5
+  python3 bench_card_scan.py --corpus ocr --seed 7
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Set
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+
+import pci_scan  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Legacy scanner (reference implementation the tokenizer must agree with)
+# ---------------------------------------------------------------------------
+
+SEP = r'[-. _]?'
+
+
+def layout_pattern(prefixes, length: int, bounds) -> str:
+    """One card length: the prefix, then digit groups with an optional separator at each boundary."""
+    head = '(?:' + '|'.join(p + '[0-9]{%d}' % (4 - len(p)) for p in prefixes) + ')'
+    edges = [b for b in sorted(bounds) if b < length] + [length]
+    return head + ''.join(SEP + '[0-9]{%d}' % (b - a) for a, b in zip(edges, edges[1:]))
+
+
+# Per brand: all lengths in one alternation (longest first, so finditer consumes the
+# longest window), plus each length alone to retry shorter windows on a Luhn failure
+LEGACY_PATTERNS = [
+    (name,
+     re.compile(r'(?<!\d)(?:' + '|'.join(layout_pattern(prefixes, n, bounds) for n in sorted(lengths, reverse=True)) + r')(?!\d)'),
+     [re.compile(layout_pattern(prefixes, n, bounds) + r'(?!\d)') for n in sorted(lengths, reverse=True)])
+    for name, lengths, bounds, prefixes in pci_scan.CARD_BRANDS
+]
+
+
+def legacy_luhn(number: str) -> bool:
+    digits = [int(c) for c in reversed(number) if c.isdigit()]
+    if len(digits) < 13:
+        return False
+    total = 0
+    for i, d in enumerate(digits):
+        if i % 2 == 1:
+            d *= 2
+            if d > 9:
+                d -= 9
+        total += d
+    return total % 10 == 0
+
+
+def legacy_scan(text: str) -> List[Dict[str, str]]:
+    text = re.sub(r'[\xa0\u00a0\u2007\u202f\u2009\u200a\u2002\u2003\u2004\u2005\u2006]', ' ', text)
+    text = text.replace('_', ' ')
+    hits = []
+    seen: Set[str] = set()
+    for card_type, pattern, by_length in LEGACY_PATTERNS:
+        for found in pattern.finditer(text):
+            windows = (p.match(text, found.start()) for p in by_length)
+            m = next((w for w in windows if w and legacy_luhn(w.group(0))), None)
+            if m is None:
+                continue
+            raw = m.group(0)
+            digits = re.sub(r'[^0-9]', '', raw)
+            if digits in seen:
+                continue
+            seen.add(digits)
+            context = text[max(0, m.start() - 30):min(len(text), m.end() + 30)].replace('\n', ' ').strip()
+            redacted = pci_scan.redact_card(raw)
+            hits.append({'card_type': card_type, 'redacted': redacted, 'context': context.replace(raw, redacted)})
+    return hits
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpora
+# ---------------------------------------------------------------------------
+
+# (prefix, length, layout)
+CARD_SHAPES = [
+    ('4', 16, (4, 4, 4, 4)), ('4', 13, (4, 4, 5)), ('4', 19, (4, 4, 4, 4, 3)),
+    ('51', 16, (4, 4, 4, 4)), ('55', 16, (4, 4, 4, 4)), ('22', 16, (4, 4, 4, 4)), ('27', 16, (4, 4, 4, 4)),
+    ('34', 15, (4, 6, 5)), ('37', 15, (4, 6, 5)),
+    ('6011', 16, (4, 4, 4, 4)), ('65', 16, (4, 4, 4, 4)),
+    ('62', 16, (4, 4, 4, 4)), ('62', 19, (4, 4, 4, 4, 3)),
+    ('6759', 18, (4, 4, 4, 4, 2)), ('50', 13, (4, 4, 5)),
+]
+SEPARATORS = [' ', '-', '.', '_', '', '\xa0', '\u2009']
+WORDS = ('order invoice customer ship bill total qty price each net terms remit account '
+         'phone fax signature authorized date amount freight boots western').split()
+
+
+def luhn_complete(partial: str) -> str:
+    """Append the check digit that makes partial Luhn-valid."""
+    for d in '0123456789':
+        if legacy_luhn(partial + d):
+            return partial + d
+    raise AssertionError('unreachable')
+
+
+def card_number(rng: random.Random, valid: bool) -> str:
+    prefix, length, layout = rng.choice(CARD_SHAPES)
+    body = prefix + ''.join(rng.choice('0123456789') for _ in range(length - len(prefix) - 1))
+    number = luhn_complete(body)
+    if not valid:
+        number = number[:-1] + str((int(number[-1]) + 1) % 10)
+    if rng.random() < 0.1:
+        layout = (length,)  # unseparated
+    sep = rng.choice(SEPARATORS)
+    parts, pos = [], 0
+    for size in layout:
+        parts.append(number[pos:pos + size])
+        pos += size
+    return sep.join(parts)
+
+
+def noise_number(rng: random.Random) -> str:
+    """Numbers that are not cards: amounts, dates, phones, SKUs, long IDs."""
+    kind = rng.random()
+    if kind < 0.3:
+        return f'{rng.randint(0, 99999)}.{rng.randint(0, 99):02d}'
+    if kind < 0.5:
+        return f'{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/20{rng.randint(10, 30)}'
+    if kind < 0.7:
+        return f'({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(0, 9999):04d}'
+    if kind < 0.9:
+        return str(rng.randint(10 ** 12, 10 ** 19))  # 13-20 digit IDs: tokenizer candidates
+    return ' '.join(str(rng.randint(0, 9999)) for _ in range(rng.randint(3, 6)))
+
+
+def build_corpus(kind: str, size: int, seed: int) -> str:
+    rng = random.Random(seed)
+    out: List[str] = []
+    n = 0
+    while n < size:
+        if kind == 'sheet':
+            row = '\t'.join(noise_number(rng) if rng.random() < 0.7 else rng.choice(WORDS) for _ in range(12))
+        else:
+            row = ' '.join(noise_number(rng) if rng.random() < 0.15 else rng.choice(WORDS) for _ in range(14))
+        if rng.random() < 0.02:
+            row += f' Card Number: __{card_number(rng, valid=rng.random() < 0.6)}__'
+        out.append(row)
+        n += len(row) + 1
+    return '\n'.join(out)
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+def best_time(fn: Callable[[], List[Dict[str, str]]], repeat: int):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark pci_scan card-number detection.')
+    parser.add_argument('--size-mb', type=float, default=16, help='Corpus size per kind in MB (default: 16)')
+    parser.add_argument('--corpus', choices=['ocr', 'sheet', 'all'], default='all')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per scanner; best time is reported')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    kinds = ['ocr', 'sheet'] if args.corpus == 'all' else [args.corpus]
+    size = int(args.size_mb * 1024 * 1024)
+    mismatched = False
+
+    print(f"{'corpus':<8} {'MB':>6} {'hits':>6}  {'legacy':>14}  {'text':>14}  {'mmap':>14}  {'speedup':>8}")
+    for kind in kinds:
+        text = build_corpus(kind, size, args.seed)
+        mb = len(text.encode('utf-8')) / (1024 * 1024)
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt', delete=False) as f:
+            f.write(text)
+            path = Path(f.name)
+        try:
+            t_legacy, legacy = best_time(lambda: legacy_scan(text), args.repeat)
+            t_text, hits = best_time(lambda: pci_scan.scan_text_for_cards(text), args.repeat)
+            t_mmap, mapped = best_time(lambda: pci_scan.scan_file_for_cards(path), args.repeat)
+        finally:
+            path.unlink()
+
+        def rate(t: float) -> str:
+            return f'{t:6.2f}s {mb / t:5.0f}MB/s'
+
+        print(f"{kind:<8} {mb:6.1f} {len(hits):6d}  {rate(t_legacy)}  {rate(t_text)}  {rate(t_mmap)}  "
+              f"{t_legacy / t_text:7.1f}x")
+        if hits != legacy:
+            mismatched = True
+            print(f"  MISMATCH: text scanner found {len(hits)} hits, legacy {len(legacy)}", file=sys.stderr)
+        if [(h['card_type'], h['redacted']) for h in mapped] != [(h['card_type'], h['redacted']) for h in legacy]:
+            mismatched = True
+            print(f"  MISMATCH: mmap scanner found {len(mapped)} hits, legacy {len(legacy)}", file=sys.stderr)
+
+    sys.exit(1 if mismatched else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -24,8 +24,6 @@ Usage:
 import sys
 import os
 import json
-import urllib.request
-import urllib.error
 import base64
 import time
 from typing import Dict, Any, Optional, List
@@ -39,6 +37,12 @@ _API_KEY = os.environ.get('NETSUITE_API_KEY', '')
 if not _API_KEY and 'nsapi.twistedx.tech' in _gw_base:
     print("Warning: NETSUITE_API_KEY not set — requests to prod gateway will fail with 401", file=sys.stderr)
 
+# Pooled gateway client shared with the netsuite-suiteql skill
+_SUITEQL_SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'netsuite-suiteql', 'scripts')
+if _SUITEQL_SCRIPTS not in sys.path:
+    sys.path.insert(0, _SUITEQL_SCRIPTS)
+from netsuite_gateway import get_client  # noqa: E402
+
 # Account aliases
 ACCOUNT_ALIASES = {
     'twx': 'twistedx', 'twisted': 'twistedx', 'twistedx': 'twistedx',
@@ -92,33 +96,18 @@ def execute_query(
     }
 
     try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-            }
-        )
-
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            result = json.loads(response.read().decode('utf-8'))
-
-            records = []
-            if result.get('success') and result.get('data'):
-                records = result.get('data', {}).get('records', [])
-            elif 'data' in result and 'records' in result['data']:
-                records = result['data']['records']
-            elif 'records' in result:
-                records = result['records']
-
-            return {'records': records, 'error': None}
-
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8') if e.fp else str(e)
-        return {'records': [], 'error': f"HTTP {e.code}: {error_body}"}
+        result = get_client().call(payload, timeout=timeout)
+
+        records = []
+        if result.get('success') and result.get('data'):
+            records = result.get('data', {}).get('records', [])
+        elif 'data' in result and 'records' in result['data']:
+            records = result['data']['records']
+        elif 'records' in result:
+            records = result['records']
+
+        return {'records': records, 'error': None}
+
     except Exception as e:
         return {'records': [], 'error': str(e)}
 
@@ -362,48 +351,36 @@ def download_file_content(file_id: int, account: str, environment: str) -> Optio
     }
 
     try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-            }
-        )
-
-        with urllib.request.urlopen(req, timeout=120) as response:
-            result = json.loads(response.read().decode('utf-8'))
-
-            if not result.get('success'):
-                error = result.get('error', 'unknown error')
-                print(f"  Gateway error for file {file_id}: {error}", file=sys.stderr)
-                return None
-
-            data = result.get('data', {})
-
-            # Format B: data.file.content (confirmed gateway format)
-            if isinstance(data, dict) and 'file' in data:
-                file_obj = data['file']
-                if isinstance(file_obj, dict) and file_obj.get('content'):
-                    return decode_file_content(file_obj['content'])
-
-            # Format A: data.content with encoding field
-            if isinstance(data, dict) and data.get('content'):
-                content = data['content']
-                encoding = data.get('encoding', 'UTF-8')
-                if encoding == 'BASE64' or data.get('isBase64'):
-                    return decode_file_content(content)
-                return content.encode('utf-8')
-
-            # Fallback: file at top level
-            if isinstance(result.get('file'), dict) and result['file'].get('content'):
-                return decode_file_content(result['file']['content'])
-
-            print(f"  No content in response for file {file_id}: keys={list(data.keys()) if isinstance(data, dict) else type(data).__name__}", file=sys.stderr)
+        result = get_client().call(payload, timeout=120)
+
+        if not result.get('success'):
+            error = result.get('error', 'unknown error')
+            print(f"  Gateway error for file {file_id}: {error}", file=sys.stderr)
             return None
 
+        data = result.get('data', {})
+
+        # Format B: data.file.content (confirmed gateway format)
+        if isinstance(data, dict) and 'file' in data:
+            file_obj = data['file']
+            if isinstance(file_obj, dict) and file_obj.get('content'):
+                return decode_file_content(file_obj['content'])
+
+        # Format A: data.content with encoding field
+        if isinstance(data, dict) and data.get('content'):
+            content = data['content']
+            encoding = data.get('encoding', 'UTF-8')
+            if encoding == 'BASE64' or data.get('isBase64'):
+                return decode_file_content(content)
+            return content.encode('utf-8')
+
+        # Fallback: file at top level
+        if isinstance(result.get('file'), dict) and result['file'].get('content'):
+            return decode_file_content(result['file']['content'])
+
+        print(f"  No content in response for file {file_id}: keys={list(data.keys()) if isinstance(data, dict) else type(data).__name__}", file=sys.stderr)
+        return None
+
     except Exception as e:
         print(f"  Download error for file {file_id}: {e}", file=sys.stderr)
         return None
@@ -14,8 +14,6 @@ Usage:
 import sys
 import os
 import json
-import urllib.request
-import urllib.error
 import base64
 import time
 from typing import Dict, Any, Optional, List
@@ -29,6 +27,12 @@ _API_KEY = os.environ.get('NETSUITE_API_KEY', '')
 if not _API_KEY and 'nsapi.twistedx.tech' in _gw_base:
     print("Warning: NETSUITE_API_KEY not set — requests to prod gateway will fail with 401", file=sys.stderr)
 
+# Pooled gateway client shared with the netsuite-suiteql skill
+_SUITEQL_SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'netsuite-suiteql', 'scripts')
+if _SUITEQL_SCRIPTS not in sys.path:
+    sys.path.insert(0, _SUITEQL_SCRIPTS)
+from netsuite_gateway import get_client  # noqa: E402
+
 # Account aliases
 ACCOUNT_ALIASES = {
     'twx': 'twistedx', 'twisted': 'twistedx', 'twistedx': 'twistedx',
@@ -77,33 +81,18 @@ def execute_query(
     }
 
     try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-            }
-        )
-
-        with urllib.request.urlopen(req, timeout=300) as response:
-            result = json.loads(response.read().decode('utf-8'))
-
-            records = []
-            if 'data' in result and 'records' in result['data']:
-                records = result['data']['records']
-            elif 'records' in result:
-                records = result['records']
-            elif 'data' in result:
-                records = result['data'] if isinstance(result['data'], list) else []
-
-            return {'records': records, 'error': None}
-
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8') if e.fp else str(e)
-        return {'records': [], 'error': f"HTTP {e.code}: {error_body}"}
+        result = get_client().call(payload, timeout=300)
+
+        records = []
+        if 'data' in result and 'records' in result['data']:
+            records = result['data']['records']
+        elif 'records' in result:
+            records = result['records']
+        elif 'data' in result:
+            records = result['data'] if isinstance(result['data'], list) else []
+
+        return {'records': records, 'error': None}
+
     except Exception as e:
         return {'records': [], 'error': str(e)}
 
@@ -205,31 +194,19 @@ def download_file_content(file_id: int, account: str, environment: str) -> Optio
     }
 
     try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
-            }
-        )
-
-        with urllib.request.urlopen(req, timeout=120) as response:
-            result = json.loads(response.read().decode('utf-8'))
-
-            # Extract content from response
-            file_data = None
-            if 'data' in result and 'file' in result['data']:
-                file_data = result['data']['file']
-            elif 'file' in result:
-                file_data = result['file']
-
-            if file_data and 'content' in file_data:
-                return decode_file_content(file_data['content'])
-
-            return None
+        result = get_client().call(payload, timeout=120)
+
+        # Extract content from response
+        file_data = None
+        if 'data' in result and 'file' in result['data']:
+            file_data = result['data']['file']
+        elif 'file' in result:
+            file_data = result['file']
+
+        if file_data and 'content' in file_data:
+            return decode_file_content(file_data['content'])
+
+        return None
 
     except Exception as e:
         print(f"  Download error: {e}", file=sys.stderr)
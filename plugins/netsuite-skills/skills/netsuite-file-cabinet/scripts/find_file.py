@@ -14,8 +14,6 @@ Usage:
 import sys
 import os
 import json
-import urllib.request
-import urllib.error
 from typing import Dict, Any, Optional, List
 
 # NetSuite API Gateway endpoint — override with NETSUITE_GATEWAY_URL env var
@@ -25,6 +23,12 @@ _API_KEY = os.environ.get('NETSUITE_API_KEY', '')
 if not _API_KEY and 'nsapi.twistedx.tech' in _gw_base:
     print("Warning: NETSUITE_API_KEY not set — requests to prod gateway will fail with 401", file=sys.stderr)
 
+# Pooled gateway client shared with the netsuite-suiteql skill
+_SUITEQL_SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'netsuite-suiteql', 'scripts')
+if _SUITEQL_SCRIPTS not in sys.path:
+    sys.path.insert(0, _SUITEQL_SCRIPTS)
+from netsuite_gateway import GatewayError, get_client  # noqa: E402
+
 # Account aliases
 ACCOUNT_ALIASES = {
     'twx': 'twistedx', 'twisted': 'twistedx', 'twistedx': 'twistedx',
@@ -64,41 +68,20 @@ def query_run(query: str, account: str, environment: str) -> Dict[str, Any]:
     }
 
     try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _API_KEY} if _API_KEY else {'Origin': _gw_base})
+        result = get_client().call(payload, timeout=60)
+
+        if result.get('success'):
+            return {
+                'success': True,
+                'records': result.get('data', {}).get('records', [])
             }
-        )
-
-        with urllib.request.urlopen(req, timeout=60) as response:
-            result = json.loads(response.read().decode('utf-8'))
-
-            if result.get('success'):
-                return {
-                    'success': True,
-                    'records': result.get('data', {}).get('records', [])
-                }
-            else:
-                return {
-                    'error': result.get('error', {}).get('message', 'Unknown error')
-                }
-
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_json = json.loads(error_body)
-            error_msg = error_json.get('error', {}).get('message', error_body)
-        except:
-            error_msg = error_body
-        return {'error': f'HTTP {e.code}: {error_msg}'}
-
-    except urllib.error.URLError as e:
-        return {'error': f'Gateway connection error: {str(e.reason)}'}
+        else:
+            return {
+                'error': result.get('error', {}).get('message', 'Unknown error')
+            }
+
+    except GatewayError as e:
+        return {'error': str(e)}
 
     except Exception as e:
         return {'error': f'Unexpected error: {str(e)}'}
@@ -0,0 +1,681 @@
+#!/usr/bin/env python3
+"""
+NetSuite File Cabinet - Parallel Mirror
+
+Mirrors a File Cabinet folder tree (or SuiteBundle) to disk:
+- Enumerates the tree up front: one CONNECT BY query for every folder, then
+  the files in ID-keyed pages (no per-folder queries)
+- Downloads with a bounded worker pool over the pooled gateway client; the
+  client's jittered retry on 429/5xx replaces the fixed per-file sleep
+- Stream-decodes the fileGet response: the base64 payload is decoded (both
+  gateway layers) chunk by chunk straight into <file>.part, never held whole
+- Dedupes by SHA-256: files with identical content are hard-linked (copied if
+  the filesystem can't link), and a file that only moved or was renamed is
+  relinked from its previous local copy instead of downloaded again
+- Resumes from _manifest.json, which records per-file state (pending,
+  downloaded, linked, failed) with size and hash; it is rewritten atomically
+  as work completes, so an interrupted run picks up where it stopped
+
+--incremental turns a rerun into a sync: the manifest keeps each file's
+lastmodifieddate and size plus a watermark (the newest lastmodifieddate
+seen), so only files modified since the watermark are queried in full and
+fetched. A light ID/folder listing catches moves and deletions; deleted files
+are reported (and removed locally with --prune).
+
+The folder structure is preserved under --output/<root folder name>/... and
+the manifest stays readable by download.py --verify / --fix-corrupted.
+
+Usage:
+  python3 mirror.py --folder-id 18625 --output ./mirror --env prod
+  python3 mirror.py --folder-id 18625 --output ./mirror --env prod --incremental
+  python3 mirror.py --folder-id 18625 --output ./mirror --env prod --incremental --prune
+  python3 mirror.py --bundle 311735 --output ./SuiteBundles --env prod --workers 12
+  python3 mirror.py --folder-id 18625 --output ./mirror --env prod --dry-run
+"""
+
+import argparse
+import base64
+import binascii
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+
+from download import (  # noqa: E402
+    DEFAULT_ACCOUNT,
+    DEFAULT_ENVIRONMENT,
+    download_file_content,
+    execute_query,
+    find_bundle_folder,
+    get_client,
+    resolve_account,
+    resolve_environment,
+    sanitize_path,
+    validate_file_content,
+)
+
+MANIFEST_NAME = '_manifest.json'
+MANIFEST_VERSION = 2
+DEFAULT_WORKERS = 8          # matches the gateway client's connection pool
+LIST_PAGE_SIZE = 1000
+FILE_TIMEOUT = 300
+READ_CHUNK = 256 * 1024      # multiple of 4 keeps base64 chunks aligned cheaply
+MAX_HEAD_BYTES = 1024 * 1024 # bytes scanned for the content key before giving up on streaming
+FLUSH_EVERY = 200            # completions between manifest flushes
+FLUSH_SECONDS = 10.0
+
+DONE_STATES = ('downloaded', 'linked')
+
+MODIFIED_FORMAT = 'YYYY-MM-DD HH24:MI:SS'  # sortable, second precision, server timezone
+FILE_COLUMNS = (f"f.id, f.name, f.folder, f.filesize, f.filetype, "
+                f"TO_CHAR(f.lastmodifieddate, '{MODIFIED_FORMAT}') AS modified")
+_WATERMARK_RE = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
+
+_CONTENT_KEY_RE = re.compile(rb'"content"\s*:\s*"')
+_FILE_OBJECT_RE = re.compile(rb'"file"\s*:\s*\{')
+_BASE64_TEXT_RE = re.compile(rb'[A-Za-z0-9+/=\r\n]*')
+
+
+# =============================================================================
+# Enumeration
+# =============================================================================
+
+def list_folder_tree(root_id: int, account: str, environment: str) -> Dict[int, Dict[str, Any]]:
+    """Every folder under root_id (inclusive) in one hierarchical query: {id: {name, parent}}."""
+    query = f"""
+    SELECT id, name, parent
+    FROM MediaItemFolder
+    START WITH id = {int(root_id)}
+    CONNECT BY PRIOR id = parent
+    """
+    result = execute_query(query, [], account, environment)
+    if result.get('error'):
+        raise RuntimeError(f"Folder query failed: {result['error']}")
+    return {int(r['id']): {'name': r.get('name') or str(r['id']), 'parent': r.get('parent')}
+            for r in result.get('records', [])}
+
+
+def folder_paths(folders: Dict[int, Dict[str, Any]], root_id: int) -> Dict[int, str]:
+    """Relative path for every folder, starting with the (sanitized) root folder name."""
+    paths: Dict[int, str] = {}
+
+    def path_of(fid: int) -> str:
+        if fid in paths:
+            return paths[fid]
+        chain = []
+        cur: Optional[int] = fid
+        while cur is not None and cur not in paths:
+            chain.append(cur)
+            if cur == root_id:
+                break
+            parent = folders.get(cur, {}).get('parent')
+            cur = int(parent) if parent not in (None, '') and int(parent) in folders else None
+        base = paths[cur] if cur in paths else ''
+        for f in reversed(chain):
+            name = sanitize_path(folders[f]['name'])
+            base = f'{base}/{name}' if base else name
+            paths[f] = base
+        return paths[fid]
+
+    for fid in folders:
+        path_of(fid)
+    return paths
+
+
+def iter_tree_files(root_id: int, account: str, environment: str,
+                    page_size: int = LIST_PAGE_SIZE, columns: str = FILE_COLUMNS,
+                    modified_since: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Files anywhere under root_id, paged by file ID (optionally only those modified since a watermark)."""
+    since = ''
+    if modified_since:
+        if not _WATERMARK_RE.match(modified_since):
+            raise ValueError(f'Bad watermark: {modified_since!r}')
+        since = f"AND f.lastmodifieddate >= TO_TIMESTAMP('{modified_since}', '{MODIFIED_FORMAT}')"
+    last_id = 0
+    while True:
+        query = f"""
+        SELECT {columns}
+        FROM File f
+        WHERE f.id > {last_id} {since}
+          AND f.folder IN (
+            SELECT id FROM MediaItemFolder
+            START WITH id = {int(root_id)}
+            CONNECT BY PRIOR id = parent
+        )
+        ORDER BY f.id
+        FETCH FIRST {page_size} ROWS ONLY
+        """
+        result = execute_query(query, [], account, environment)
+        if result.get('error'):
+            raise RuntimeError(f"File listing failed after ID {last_id}: {result['error']}")
+        records = result.get('records', [])
+        for r in records:
+            yield r
+        if len(records) < page_size:
+            return
+        last_id = max(int(r['id']) for r in records)
+
+
+# =============================================================================
+# Streaming fileGet
+# =============================================================================
+
+class _NotStreamable(Exception):
+    """Response isn't the data.file.content base64 shape; use the buffered path."""
+
+
+class _Base64Sink:
+    """
+    Incremental base64 decoder writing to a file and hashing the output.
+
+    The gateway wraps binary files twice (base64 of the RESTlet's base64). The
+    first decoded chunk decides: if it is itself base64 text, a second decoder
+    layer is stacked on top, mirroring decode_file_content().
+    """
+
+    def __init__(self, fh):
+        self.fh = fh
+        self.sha = hashlib.sha256()
+        self.size = 0
+        self._outer = b''
+        self._inner = b''
+        self._double: Optional[bool] = None
+
+    def _emit(self, data: bytes) -> None:
+        if data:
+            self.fh.write(data)
+            self.sha.update(data)
+            self.size += len(data)
+
+    def _inner_feed(self, layer1: bytes, final: bool) -> None:
+        if self._double is None:
+            if not layer1 and not final:
+                return
+            self._double = bool(layer1) and _BASE64_TEXT_RE.fullmatch(layer1) is not None
+        if not self._double:
+            self._emit(layer1)
+            return
+        data = self._inner + layer1.replace(b'\r', b'').replace(b'\n', b'')
+        cut = len(data) if final else len(data) - len(data) % 4
+        self._inner = data[cut:]
+        self._emit(base64.b64decode(data[:cut], validate=True))
+
+    def feed(self, chunk: bytes) -> None:
+        data = self._outer + chunk
+        cut = len(data) - len(data) % 4
+        self._outer = data[cut:]
+        if cut:
+            self._inner_feed(base64.b64decode(data[:cut], validate=True), final=False)
+
+    def close(self) -> None:
+        if self._outer:
+            raise binascii.Error('truncated base64 payload')
+        self._inner_feed(b'', final=True)
+
+
+def stream_file(file_id: int, dest: Path, account: str, environment: str) -> Tuple[int, str]:
+    """
+    fileGet straight to dest without materializing the payload.
+
+    Returns (bytes_written, sha256). Raises _NotStreamable when the response
+    isn't the data.file.content shape (or isn't valid base64), RuntimeError when
+    the gateway reports a failure.
+    """
+    payload = {
+        'action': 'fileGet',
+        'procedure': 'fileGet',
+        'id': file_id,
+        'returnContent': True,
+        'netsuiteAccount': resolve_account(account),
+        'netsuiteEnvironment': resolve_environment(environment),
+    }
+    with get_client().stream(payload, timeout=FILE_TIMEOUT) as resp, open(dest, 'wb') as fh:
+        sink = _Base64Sink(fh)
+        head = b''
+        in_content = False
+        done = False
+        try:
+            while True:
+                chunk = resp.read(READ_CHUNK)
+                if not chunk:
+                    break
+                if done:
+                    continue  # drain the tail so the keep-alive connection can be reused
+                if not in_content:
+                    head += chunk
+                    key = _CONTENT_KEY_RE.search(head)
+                    if key is None:
+                        if len(head) > MAX_HEAD_BYTES:
+                            raise _NotStreamable('content key not found')
+                        continue
+                    if not _FILE_OBJECT_RE.search(head, 0, key.start()):
+                        raise _NotStreamable('content is not under data.file')
+                    chunk = head[key.end():]
+                    in_content = True
+                    head = b''
+                end = chunk.find(b'"')
+                sink.feed(chunk if end < 0 else chunk[:end])
+                done = end >= 0
+            if not done:
+                try:
+                    result = json.loads(head.decode('utf-8'))
+                except ValueError:
+                    raise _NotStreamable('unrecognised response')
+                if not result.get('success', True):
+                    err = result.get('error', 'unknown error')
+                    raise RuntimeError(err.get('message', str(err)) if isinstance(err, dict) else str(err))
+                raise _NotStreamable('no data.file.content in response')
+            sink.close()
+        except binascii.Error as e:
+            raise _NotStreamable(f'invalid base64: {e}')
+    return sink.size, sink.sha.hexdigest()
+
+
+def fetch_file(file_id: int, dest: Path, account: str, environment: str) -> Tuple[int, str]:
+    """Stream a file to dest, falling back to download.py's buffered fileGet for other response shapes."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        return stream_file(file_id, dest, account, environment)
+    except _NotStreamable:
+        content = download_file_content(file_id, account, environment)
+        if content is None:
+            raise RuntimeError('download failed')
+        dest.write_bytes(content)
+        return len(content), hashlib.sha256(content).hexdigest()
+
+
+# =============================================================================
+# Manifest
+# =============================================================================
+
+def load_mirror_manifest(output_dir: Path) -> Dict[int, Dict[str, Any]]:
+    """Previous per-file entries keyed by file ID (empty if no usable manifest)."""
+    path = output_dir / MANIFEST_NAME
+    try:
+        with open(path) as fh:
+            manifest = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    return {int(e['id']): e for e in manifest.get('files', []) if e.get('id')}
+
+
+def write_manifest(output_dir: Path, header: Dict[str, Any], entries: List[Dict[str, Any]]) -> None:
+    """Atomic rewrite so an interrupted run never leaves a truncated manifest."""
+    path = output_dir / MANIFEST_NAME
+    tmp = output_dir / f'{MANIFEST_NAME}.tmp'
+    with open(tmp, 'w') as fh:
+        json.dump({**header, 'updated': datetime.now().isoformat(), 'files': entries}, fh, indent=1)
+    os.replace(tmp, path)
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if dest.exists():
+        dest.unlink()
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+
+def _same_version(prev: Dict[str, Any], entry: Dict[str, Any]) -> bool:
+    """Same NetSuite size and (when both runs recorded it) lastmodifieddate."""
+    if prev.get('filesize') != entry.get('filesize'):
+        return False
+    return not (prev.get('modified') and entry.get('modified')) or prev['modified'] == entry['modified']
+
+
+def _is_current(prev: Optional[Dict[str, Any]], entry: Dict[str, Any]) -> bool:
+    """Previous run already produced this exact file at this path."""
+    if not prev or prev.get('status') not in DONE_STATES:
+        return False
+    if prev.get('local_path') != entry['local_path'] or not _same_version(prev, entry):
+        return False
+    try:
+        return os.path.getsize(entry['local_path']) == prev.get('bytes')
+    except OSError:
+        return False
+
+
+# =============================================================================
+# Mirror
+# =============================================================================
+
+def _make_entry(rec: Dict[str, Any], paths: Dict[int, str], output_dir: Path,
+                claimed: Dict[str, int]) -> Dict[str, Any]:
+    fid = int(rec['id'])
+    folder = int(rec['folder'])
+    rel = f"{paths.get(folder, str(folder))}/{sanitize_path(rec.get('name') or fid)}"
+    if claimed.setdefault(rel, fid) != fid:
+        rel = f'{rel}_{fid}'  # two names sanitized to the same path
+    return {
+        'id': fid,
+        'name': rec.get('name'),
+        'folder': folder,
+        'folder_path': paths.get(folder, ''),
+        'filesize': rec.get('filesize'),
+        'filetype': rec.get('filetype'),
+        'modified': rec.get('modified'),
+        'local_path': str(output_dir / rel),
+        'status': 'pending',
+    }
+
+
+def plan_mirror(root_id: int, output_dir: Path, account: str, environment: str,
+                limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Enumerate the tree into manifest entries with their local paths (status 'pending')."""
+    paths = folder_paths(list_folder_tree(root_id, account, environment), root_id)
+    entries: List[Dict[str, Any]] = []
+    claimed: Dict[str, int] = {}
+    for rec in iter_tree_files(root_id, account, environment):
+        entries.append(_make_entry(rec, paths, output_dir, claimed))
+        if limit and len(entries) >= limit:
+            break
+    return entries
+
+
+def plan_incremental(root_id: int, output_dir: Path, account: str, environment: str,
+                     previous: Dict[int, Dict[str, Any]],
+                     watermark: str) -> Tuple[List[Dict[str, Any]], int, List[Dict[str, Any]]]:
+    """
+    Manifest entries for a sync since watermark.
+
+    Full metadata is queried only for files modified at or after the
+    watermark (plus any IDs the manifest has never seen); everything else is
+    carried over from the previous manifest, re-pathed if its folder moved or
+    was renamed. Returns (entries, changed_count, deleted_entries).
+    """
+    paths = folder_paths(list_folder_tree(root_id, account, environment), root_id)
+    changed = {int(r['id']): r for r in iter_tree_files(root_id, account, environment, modified_since=watermark)}
+    current = {int(r['id']): int(r['folder'])
+               for r in iter_tree_files(root_id, account, environment, columns='f.id, f.folder')}
+
+    unseen = [fid for fid in current if fid not in changed and fid not in previous]
+    for i in range(0, len(unseen), LIST_PAGE_SIZE):
+        batch = ', '.join(str(fid) for fid in unseen[i:i + LIST_PAGE_SIZE])
+        result = execute_query(f"SELECT {FILE_COLUMNS} FROM File f WHERE f.id IN ({batch})", [], account, environment)
+        if result.get('error'):
+            raise RuntimeError(f"File metadata query failed: {result['error']}")
+        changed.update({int(r['id']): r for r in result.get('records', [])})
+
+    entries: List[Dict[str, Any]] = []
+    claimed: Dict[str, int] = {}
+    for fid in sorted(current):
+        if fid in changed:
+            entries.append(_make_entry(changed[fid], paths, output_dir, claimed))
+            continue
+        # Unchanged since the watermark: reuse the last run's metadata at the current folder;
+        # run_mirror then skips it, relinks it (moved) or retries it (failed last time)
+        entries.append(_make_entry({**previous[fid], 'folder': current[fid]}, paths, output_dir, claimed))
+
+    deleted = [previous[fid] for fid in sorted(previous) if fid not in current]
+    return entries, len(changed), deleted
+
+
+def next_watermark(entries: List[Dict[str, Any]], previous: Optional[str] = None) -> Optional[str]:
+    """Newest lastmodifieddate among mirrored files (never moves backwards)."""
+    stamps = [e['modified'] for e in entries if e.get('modified')]
+    if previous:
+        stamps.append(previous)
+    return max(stamps) if stamps else None
+
+
+def load_manifest_header(output_dir: Path) -> Dict[str, Any]:
+    """Manifest fields other than the file list (empty if there is no manifest)."""
+    try:
+        with open(output_dir / MANIFEST_NAME) as fh:
+            manifest = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    manifest.pop('files', None)
+    return manifest
+
+
+def prune_deleted(deleted: List[Dict[str, Any]], keep_paths: set) -> int:
+    """Remove local copies of files deleted in NetSuite (unless another entry now uses the path)."""
+    removed = 0
+    for entry in deleted:
+        path = entry.get('local_path')
+        if path and path not in keep_paths and os.path.exists(path):
+            os.remove(path)
+            removed += 1
+    return removed
+
+
+def run_mirror(
+    root_id: int,
+    output_dir: Path,
+    account: str = DEFAULT_ACCOUNT,
+    environment: str = DEFAULT_ENVIRONMENT,
+    workers: int = DEFAULT_WORKERS,
+    limit: Optional[int] = None,
+    bundle: Optional[str] = None,
+    entries: Optional[List[Dict[str, Any]]] = None,
+    header_extra: Optional[Dict[str, Any]] = None
+) -> Dict[str, int]:
+    """
+    Mirror root_id into output_dir and return counts per outcome.
+
+    entries may be passed in pre-planned (see plan_mirror); otherwise the tree
+    is enumerated here.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    previous = load_mirror_manifest(output_dir)
+    if entries is None:
+        entries = plan_mirror(root_id, output_dir, account, environment, limit)
+
+    header = {
+        'version': MANIFEST_VERSION,
+        'download_date': datetime.now().isoformat(),
+        'account': resolve_account(account),
+        'environment': resolve_environment(environment),
+        'folder_id': root_id,
+        'bundle': bundle,
+        'strategy': 'mirror',
+        'total_files': len(entries),
+        **(header_extra or {}),
+    }
+
+    # Content index from earlier runs: sha256 -> an existing local copy
+    by_hash: Dict[str, str] = {}
+    for prev in previous.values():
+        if prev.get('status') in DONE_STATES and prev.get('sha256') and os.path.exists(prev.get('local_path', '')):
+            by_hash.setdefault(prev['sha256'], prev['local_path'])
+    hash_lock = threading.Lock()
+
+    counts = {'downloaded': 0, 'linked': 0, 'skipped': 0, 'failed': 0, 'warnings': 0}
+    todo: List[Dict[str, Any]] = []
+    for entry in entries:
+        prev = previous.get(entry['id'])
+        if _is_current(prev, entry):
+            entry.update({k: prev[k] for k in ('status', 'sha256', 'bytes') if k in prev})
+            counts['skipped'] += 1
+            continue
+        if (prev and prev.get('status') in DONE_STATES and _same_version(prev, entry)
+                and prev.get('sha256') and os.path.exists(prev.get('local_path', ''))):
+            # Moved or renamed since the last run: same file ID and size, reuse the local copy
+            _link_or_copy(Path(prev['local_path']), Path(entry['local_path']))
+            entry.update(status='linked', sha256=prev['sha256'], bytes=prev.get('bytes'),
+                         linked_from=prev['local_path'])
+            counts['linked'] += 1
+            continue
+        todo.append(entry)
+
+    def work(entry: Dict[str, Any]) -> Dict[str, Any]:
+        dest = Path(entry['local_path'])
+        part = dest.with_name(dest.name + '.part')
+        try:
+            size, digest = fetch_file(entry['id'], part, account, environment)
+        except Exception as e:
+            if part.exists():
+                part.unlink()
+            return {'status': 'failed', 'error': str(e)}
+
+        with open(part, 'rb') as fh:
+            warning = validate_file_content(fh.read(1024), entry.get('name') or dest.name)
+
+        with hash_lock:
+            existing = by_hash.get(digest)
+            if existing is None or existing == str(dest):
+                by_hash[digest] = str(dest)
+        if existing and existing != str(dest) and os.path.exists(existing):
+            part.unlink()
+            _link_or_copy(Path(existing), dest)
+            result = {'status': 'linked', 'linked_from': existing}
+        else:
+            os.replace(part, dest)
+            result = {'status': 'downloaded'}
+        result.update(sha256=digest, bytes=size, error=None)
+        if warning:
+            result['warning'] = warning
+        return result
+
+    write_manifest(output_dir, header, entries)
+    print(f"Files: {len(entries)} total, {counts['skipped']} up to date, "
+          f"{counts['linked']} relinked, {len(todo)} to download ({workers} workers)")
+
+    started = time.time()
+    last_flush = started
+    done = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {pool.submit(work, e): e for e in todo}
+            for fut in as_completed(futures):
+                entry = futures[fut]
+                result = fut.result()
+                entry.update(result)
+                counts[result['status']] += 1
+                done += 1
+                label = f"{entry['folder_path']}/{entry.get('name')}"
+                if result['status'] == 'failed':
+                    print(f"  [{done}/{len(todo)}] FAILED {label}: {result['error']}", file=sys.stderr)
+                elif result.get('warning'):
+                    counts['warnings'] += 1
+                    print(f"  [{done}/{len(todo)}] WARNING {label}: {result['warning']}")
+                elif done % 50 == 0 or done == len(todo):
+                    rate = done / max(time.time() - started, 1e-6)
+                    print(f"  [{done}/{len(todo)}] {rate:.1f} files/s")
+                if done % FLUSH_EVERY == 0 or time.time() - last_flush > FLUSH_SECONDS:
+                    write_manifest(output_dir, header, entries)
+                    last_flush = time.time()
+    finally:
+        write_manifest(output_dir, header, entries)
+    return counts
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Parallel, resumable File Cabinet mirror')
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--folder-id', type=int, help='Root folder ID to mirror')
+    target.add_argument('--bundle', help='SuiteBundle number to mirror')
+    parser.add_argument('--output', required=True, help='Local mirror directory')
+    parser.add_argument('--account', default=DEFAULT_ACCOUNT, help='Account: twx, dm (default: twx)')
+    parser.add_argument('--env', default=DEFAULT_ENVIRONMENT, help='Environment: prod, sb1, sb2 (default: prod)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Concurrent downloads (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--limit', type=int, help='Mirror at most N files (by file ID)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only fetch files modified since the manifest watermark; report deletions')
+    parser.add_argument('--prune', action='store_true',
+                        help='With --incremental, delete local copies of files deleted in NetSuite')
+    parser.add_argument('--dry-run', action='store_true', help='Enumerate and report without downloading')
+    args = parser.parse_args()
+
+    output_dir = Path(args.output)
+    print(f"Target: {resolve_account(args.account)}/{resolve_environment(args.env)}")
+
+    root_id = args.folder_id
+    if args.bundle:
+        folder = find_bundle_folder(args.bundle, args.account, args.env)
+        if not folder:
+            print(f"ERROR: Bundle {args.bundle} not found", file=sys.stderr)
+            sys.exit(1)
+        root_id = int(folder['id'])
+        print(f"Bundle {args.bundle}: folder ID {root_id}")
+
+    started = time.time()
+    previous = load_mirror_manifest(output_dir)
+    prev_header = load_manifest_header(output_dir)
+    watermark = prev_header.get('watermark') if prev_header.get('folder_id') == root_id else None
+    deleted: List[Dict[str, Any]] = []
+
+    incremental = bool(args.incremental and watermark and previous)
+    if incremental:
+        print(f"Incremental sync: files modified since {watermark}...")
+        entries, changed, deleted = plan_incremental(root_id, output_dir, args.account, args.env,
+                                                     previous, watermark)
+        print(f"  {changed} changed, {len(entries)} in tree, {len(deleted)} deleted "
+              f"({time.time() - started:.1f}s)")
+    else:
+        if args.incremental:
+            print("No watermark in manifest yet — running a full mirror to establish one")
+        print("Enumerating folder tree...")
+        entries = plan_mirror(root_id, output_dir, args.account, args.env, args.limit)
+        print(f"  {len(entries)} files in {time.time() - started:.1f}s")
+
+    for e in deleted[:20]:
+        print(f"  DELETED in NetSuite: {e.get('folder_path')}/{e.get('name')} (ID {e['id']})")
+    if len(deleted) > 20:
+        print(f"  ... and {len(deleted) - 20} more deletions")
+
+    if args.dry_run:
+        current = sum(1 for e in entries if _is_current(previous.get(e['id']), e))
+        print(f"\nDry run - {current} up to date, {len(entries) - current} would be downloaded or relinked")
+        for e in [e for e in entries if not _is_current(previous.get(e['id']), e)][:20]:
+            print(f"  {e['id']:<10} {e['local_path']}")
+        if len(entries) - current > 20:
+            print(f"  ... and {len(entries) - current - 20} more")
+        return
+
+    pruned = 0
+    if deleted and args.prune:
+        pruned = prune_deleted(deleted, {e['local_path'] for e in entries})
+    extra = {
+        # A --limit run lists only part of the tree, so it can't vouch for a watermark
+        'watermark': None if args.limit else next_watermark(entries, watermark),
+        'last_sync': {
+            'mode': 'incremental' if incremental else 'full',
+            'since': watermark if incremental else None,
+            'deleted': [{k: e.get(k) for k in ('id', 'name', 'folder_path', 'local_path')} for e in deleted],
+            'pruned': pruned,
+        },
+    }
+    counts = run_mirror(root_id, output_dir, args.account, args.env, args.workers,
+                        bundle=args.bundle, entries=entries, header_extra=extra)
+    print(f"\n{'='*50}")
+    print("MIRROR SUMMARY")
+    print(f"{'='*50}")
+    print(f"Downloaded: {counts['downloaded']}")
+    print(f"Linked:     {counts['linked']} (duplicate content or moved files)")
+    print(f"Up to date: {counts['skipped']}")
+    print(f"Failed:     {counts['failed']}")
+    if deleted:
+        print(f"Deleted:    {len(deleted)} in NetSuite" + (f" ({pruned} local copies removed)" if args.prune
+                                                          else " (local copies kept; --prune removes them)"))
+    if counts['warnings']:
+        print(f"Warnings:   {counts['warnings']} (content validation — review output above)")
+    print(f"Elapsed:    {time.time() - started:.1f}s")
+    print(f"\nManifest: {output_dir / MANIFEST_NAME}")
+    if counts['failed']:
+        print("Re-run the same command to retry failed files.")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
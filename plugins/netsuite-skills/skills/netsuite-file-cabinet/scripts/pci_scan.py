@@ -7,14 +7,20 @@ Validates flagged files for PCI-DSS compliance by:
 2. Resolving NetSuite file IDs via SuiteQL (subfolder name + filename matching)
 3. Downloading each file from NetSuite
 4. Extracting text (PDF, Excel, Word, OCR fallback for scanned PDFs)
-5. Scanning for credit card patterns (regex + Luhn checksum)
+5. Scanning for credit card patterns (digit-run tokenizer + Luhn checksum)
 6. Generating a JSON report + human-readable summary
 
+Steps 3-5 overlap: downloads run on a thread pool, extraction/OCR on a process
+pool, and scan findings (masked) are cached by file hash so rescans skip unchanged files.
+Each result is appended to scan_results.jsonl as soon as it is known.
+
 Usage:
   python3 pci_scan.py --file-list /tmp/confirmed_files.txt
   python3 pci_scan.py --file-list /tmp/confirmed_files.txt --output-dir /tmp/pci-results
   python3 pci_scan.py --file-list /tmp/confirmed_files.txt --resolve-only
   python3 pci_scan.py --file-list /tmp/confirmed_files.txt --skip-download --scan-dir /tmp/existing-downloads
+  python3 pci_scan.py --file-list /tmp/confirmed_files.txt --workers 12 --scan-workers 8
+  python3 pci_scan.py --rescan-report /tmp/pci-scan-results/scan_report.json
 """
 
 import sys
@@ -23,12 +29,16 @@ import re
 import json
 import argparse
 import base64
+import gzip
+import hashlib
+import mmap
+import multiprocessing
 import time
-import urllib.request
-import urllib.error
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple, Set
+from typing import Dict, Any, Optional, List, Tuple, Set, Callable
 
 # ---------------------------------------------------------------------------
 # NetSuite API Gateway (same pattern as query_netsuite.py)
@@ -40,10 +50,15 @@ _API_KEY = os.environ.get('NETSUITE_API_KEY', '')
 if not _API_KEY and 'nsapi.twistedx.tech' in _gw_base:
     print("Warning: NETSUITE_API_KEY not set — requests to prod gateway will fail with 401", file=sys.stderr)
 
+# Pooled gateway client shared with the netsuite-suiteql skill
+_SUITEQL_SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'netsuite-suiteql', 'scripts')
+if _SUITEQL_SCRIPTS not in sys.path:
+    sys.path.insert(0, _SUITEQL_SCRIPTS)
+from netsuite_gateway import get_client  # noqa: E402
+
 DEFAULT_ACCOUNT = 'twistedx'
 DEFAULT_ENVIRONMENT = 'production'
 ROOT_FOLDER_ID = 18625  # "Twisted X Attachments" root
-RATE_LIMIT_DELAY = 0.2  # seconds between downloads
 QUERY_BATCH_SIZE = 50   # max items per IN clause
 
 ACCOUNT_ALIASES = {
@@ -55,13 +70,6 @@ ENV_ALIASES = {
 }
 
 
-def _gateway_headers() -> dict:
-    """Return headers for API gateway requests, including API key if set."""
-    if _API_KEY:
-        return {'Content-Type': 'application/json', 'Accept': 'application/json', 'X-API-Key': _API_KEY}
-    return {'Content-Type': 'application/json', 'Accept': 'application/json', 'Origin': _gw_base}
-
-
 def resolve_account(account: str) -> str:
     return ACCOUNT_ALIASES.get(account.lower(), account.lower())
 
@@ -78,29 +86,21 @@ def execute_query(
     timeout: int = 300
 ) -> Dict[str, Any]:
     """Execute a SuiteQL query via the API Gateway."""
-    payload = {
-        'action': 'queryRun',
-        'procedure': 'queryRun',
-        'query': query,
-        'params': params or [],
-        'returnAllRows': True,
-        'netsuiteAccount': resolve_account(account),
-        'netsuiteEnvironment': resolve_environment(environment),
-    }
-    try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(GATEWAY_URL, data=data, headers=_gateway_headers())
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            result = json.loads(resp.read().decode('utf-8'))
-            records = (
-                result.get('data', {}).get('records', [])
-                or result.get('records', [])
-            )
-            return {'records': records, 'error': None}
-    except urllib.error.HTTPError as e:
-        return {'records': [], 'error': f"HTTP {e.code}: {e.read().decode('utf-8') if e.fp else str(e)}"}
-    except Exception as e:
-        return {'records': [], 'error': str(e)}
+    result = get_client().query(query, params, resolve_account(account), resolve_environment(environment),
+                                return_all_rows=True, timeout=timeout)
+    return {'records': result['records'], 'error': result['error']}
+
+
+def execute_queries(
+    queries: List[str],
+    account: str = DEFAULT_ACCOUNT,
+    environment: str = DEFAULT_ENVIRONMENT,
+    timeout: int = 300
+) -> List[Dict[str, Any]]:
+    """Execute independent SuiteQL queries concurrently; results in input order."""
+    results = get_client().query_many(queries, resolve_account(account), resolve_environment(environment),
+                                      return_all_rows=True, timeout=timeout)
+    return [{'records': r['records'], 'error': r['error']} for r in results]
 
 
 def _decode_gateway_content(content_b64: str) -> bytes:
@@ -133,30 +133,27 @@ def download_file_content(
         'netsuiteEnvironment': resolve_environment(environment),
     }
     try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(GATEWAY_URL, data=data, headers=_gateway_headers())
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            result = json.loads(resp.read().decode('utf-8'))
-            if not result.get('success'):
-                return None
-            d = result.get('data', {})
-            # Format B: data.file.content (double-base64 encoded)
-            if isinstance(d, dict) and 'file' in d:
-                content = d['file'].get('content')
-                if content:
-                    return _decode_gateway_content(content)
-            # Format A: data.content
-            if isinstance(d, dict) and d.get('content'):
-                content = d['content']
-                if d.get('encoding') == 'BASE64' or d.get('isBase64'):
-                    return _decode_gateway_content(content)
-                return content.encode('utf-8')
-            # Fallback
-            if isinstance(result.get('file'), dict) and result['file'].get('content'):
-                return _decode_gateway_content(result['file']['content'])
-            return None
+        result = get_client().call(payload, timeout=120)
     except Exception:
         return None
+    if not result.get('success'):
+        return None
+    d = result.get('data', {})
+    # Format B: data.file.content (double-base64 encoded)
+    if isinstance(d, dict) and 'file' in d:
+        content = d['file'].get('content')
+        if content:
+            return _decode_gateway_content(content)
+    # Format A: data.content
+    if isinstance(d, dict) and d.get('content'):
+        content = d['content']
+        if d.get('encoding') == 'BASE64' or d.get('isBase64'):
+            return _decode_gateway_content(content)
+        return content.encode('utf-8')
+    # Fallback
+    if isinstance(result.get('file'), dict) and result['file'].get('content'):
+        return _decode_gateway_content(result['file']['content'])
+    return None
 
 
 # ---------------------------------------------------------------------------
@@ -331,11 +328,12 @@ def resolve_folder_ids(
 
     all_ns_names = sorted(ns_to_win.keys())
 
-    # --- Pass 1: search under ROOT_FOLDER_ID tree ---
+    # --- Pass 1: search under ROOT_FOLDER_ID tree (batches run concurrently) ---
+    queries = []
     for i in range(0, len(all_ns_names), QUERY_BATCH_SIZE):
         batch = all_ns_names[i:i + QUERY_BATCH_SIZE]
         quoted = ', '.join(f"'{n.replace(chr(39), chr(39)*2)}'" for n in batch)
-        query = f"""
+        queries.append(f"""
             SELECT id, name
             FROM MediaItemFolder
             WHERE parent IN (
@@ -344,10 +342,10 @@ def resolve_folder_ids(
                 CONNECT BY PRIOR id = parent
             )
             AND name IN ({quoted})
-        """
-        result = execute_query(query, account=account, environment=environment)
+        """)
+    for batch_num, result in enumerate(execute_queries(queries, account, environment), 1):
         if result.get('error'):
-            print(f"  WARN: query error for batch {i//QUERY_BATCH_SIZE + 1}: {result['error']}", file=sys.stderr)
+            print(f"  WARN: query error for batch {batch_num}: {result['error']}", file=sys.stderr)
             continue
         for rec in result.get('records', []):
             ns_name = str(rec.get('name', ''))
@@ -355,7 +353,7 @@ def resolve_folder_ids(
             if ns_name in ns_to_win and folder_id:
                 win_name = ns_to_win[ns_name]
                 name_to_id[win_name] = folder_id
-        print(f"  Batch {i//QUERY_BATCH_SIZE + 1}: resolved {len(result.get('records', []))} folders")
+        print(f"  Batch {batch_num}: resolved {len(result.get('records', []))} folders")
 
     # --- Pass 2: broader search for anything still unresolved (temp folders, etc.) ---
     unresolved_win = [n for n in subfolder_names if n not in name_to_id]
@@ -366,12 +364,13 @@ def resolve_folder_ids(
             unresolved_ns.extend(_win_name_to_ns_candidates(win_name))
         unresolved_ns = sorted(set(unresolved_ns))
 
+        queries = []
         for i in range(0, len(unresolved_ns), QUERY_BATCH_SIZE):
             batch = unresolved_ns[i:i + QUERY_BATCH_SIZE]
             quoted = ', '.join(f"'{n.replace(chr(39), chr(39)*2)}'" for n in batch)
             # No parent restriction — search entire org
-            query = f"SELECT id, name FROM MediaItemFolder WHERE name IN ({quoted})"
-            result = execute_query(query, account=account, environment=environment)
+            queries.append(f"SELECT id, name FROM MediaItemFolder WHERE name IN ({quoted})")
+        for result in execute_queries(queries, account, environment):
             if result.get('error'):
                 continue
             for rec in result.get('records', []):
@@ -399,11 +398,12 @@ def resolve_file_ids(
     folder_to_files: Dict[Tuple[int, str], int] = {}
     folder_id_list = sorted(set(folder_ids))
 
+    queries = []
     for i in range(0, len(folder_id_list), QUERY_BATCH_SIZE):
         batch = folder_id_list[i:i + QUERY_BATCH_SIZE]
         in_clause = ', '.join(str(fid) for fid in batch)
-        query = f"SELECT id, name, folder FROM File WHERE folder IN ({in_clause})"
-        result = execute_query(query, account=account, environment=environment)
+        queries.append(f"SELECT id, name, folder FROM File WHERE folder IN ({in_clause})")
+    for result in execute_queries(queries, account, environment):
         if result.get('error'):
             print(f"  WARN: file query error: {result['error']}", file=sys.stderr)
             continue
@@ -488,84 +488,175 @@ def match_entries_to_file_ids(
 
 
 # ---------------------------------------------------------------------------
-# Credit card detection (regex + Luhn)
+# Credit card detection (single-pass tokenizer + Luhn)
 # ---------------------------------------------------------------------------
 
-# Separator: optional space, dash, dot, or underscore (underscore appears in CC auth forms)
-# Boundaries: negative digit lookahead/lookbehind instead of \b, because \b fails when the
-# card number is flanked by underscores (e.g. __4259 0900 1376 1839__) since _ is a word char.
-SEP = r'[-. _]?'
-
-CC_PATTERNS = [
-    ('Visa',       re.compile(r'(?<!\d)4[0-9]{3}' + SEP + r'[0-9]{4}' + SEP + r'[0-9]{4}' + SEP + r'[0-9]{4}(?!\d)')),
-    ('Mastercard', re.compile(r'(?<!\d)(?:5[1-5][0-9]{2}|2[2-7][0-9]{2})' + SEP + r'[0-9]{4}' + SEP + r'[0-9]{4}' + SEP + r'[0-9]{4}(?!\d)')),
-    ('Amex',       re.compile(r'(?<!\d)3[47][0-9]{2}' + SEP + r'[0-9]{6}' + SEP + r'[0-9]{5}(?!\d)')),
-    ('Discover',   re.compile(r'(?<!\d)6(?:011|5[0-9]{2})' + SEP + r'[0-9]{4}' + SEP + r'[0-9]{4}' + SEP + r'[0-9]{4}(?!\d)')),
+# Separators allowed between digit groups: space, dash, dot, underscore (CC auth forms use
+# underscore runs as field blanks, e.g. "__4259 0900 1376 1839__") and Unicode spaces that
+# OCR and PDF text layers emit. All of them normalize to an ASCII space in reported text.
+_UNICODE_SPACES = '\xa0\u2007\u202f\u2009\u200a\u2002\u2003\u2004\u2005\u2006'
+_NORMALIZE = str.maketrans({c: ' ' for c in _UNICODE_SPACES + '_'})
+_STRIP_SEPARATORS = str.maketrans('', '', ' -.')
+
+# (brand, digits, positions a separator may fall at, prefixes). Brands are reported in this
+# order; widening detection (e.g. 13- or 19-digit Visa) is a table edit, since the run
+# tokenizer below sizes itself from the lengths here.
+# (brand, card lengths, digit counts a separator may follow, prefixes). Prefixes are
+# disjoint across brands, so a number is only ever reported under one of them.
+CARD_BRANDS = [
+    ('Visa',       (13, 16, 19),         (4, 8, 12, 16), ('4',)),
+    ('Mastercard', (16,),                (4, 8, 12),     tuple(str(p) for p in range(51, 56)) + tuple(str(p) for p in range(22, 28))),
+    ('Amex',       (15,),                (4, 10),        ('34', '37')),
+    ('Discover',   (16, 19),             (4, 8, 12, 16), ('6011', '65')),
+    ('UnionPay',   (16, 17, 18, 19),     (4, 8, 12, 16), ('62',)),
+    ('Maestro',    tuple(range(13, 20)), (4, 8, 12, 16), ('50', '56', '57', '58', '6304', '6759', '6761', '6762', '6763')),
 ]
 
+# First two digits -> [(brand index, lengths, boundaries, prefix)]: one dict probe per group
+_BRANDS_BY_PREFIX: Dict[str, List[Tuple[int, frozenset, frozenset, str]]] = {}
+for _idx, (_name, _lengths, _bounds, _prefixes) in enumerate(CARD_BRANDS):
+    for _prefix in _prefixes:
+        for _pair in ([_prefix] if len(_prefix) >= 2 else [_prefix + d for d in '0123456789']):
+            _BRANDS_BY_PREFIX.setdefault(_pair[:2], []).append(
+                (_idx, frozenset(_lengths), frozenset(_bounds), _prefix))
+_CARD_LENGTHS = frozenset(length for _, lengths, _, _ in CARD_BRANDS for length in lengths)
 
-def luhn_check(number: str) -> bool:
-    """Validate a digit string using the Luhn algorithm."""
-    digits = [int(c) for c in reversed(number) if c.isdigit()]
+# Tokens: digits joined by single separators, starting at a digit some brand prefix starts
+# with (not preceded by a digit, so underscore-flanked numbers still match) and running to
+# the end of the digit run; later windows inside a token are found by the group walk.
+# Separator-free tokens match only at a card length (the "plain" branch), so long IDs and
+# account numbers never reach Python. The bytes variant spells the Unicode spaces as UTF-8
+# for memory-mapped files.
+_FIRST_DIGITS = '[' + ''.join(sorted({p[0] for _, _, _, prefixes in CARD_BRANDS for p in prefixes})) + ']'
+
+
+def _run_pattern(sep: str) -> str:
+    plain = '|'.join('[0-9]{%d}' % (n - 1) for n in sorted(_CARD_LENGTHS, reverse=True))
+    return (_FIRST_DIGITS + r'(?<![0-9]' + _FIRST_DIGITS + r')'
+            r'(?:(?P<plain>' + plain + r')(?![0-9])(?!' + sep + r'[0-9])'
+            r'|(?=[0-9]*' + sep + r'[0-9])(?:' + sep + r'?[0-9]){%d,})' % (min(_CARD_LENGTHS) - 1))
+
+
+_RUN_RE = re.compile(_run_pattern('[-. _' + _UNICODE_SPACES + ']'))
+_RUN_RE_BYTES = re.compile(_run_pattern(r'(?:[-. _]|\xc2\xa0|\xe2\x80[\x82-\x87\x89\x8a\xaf])').encode('latin-1'))
+_GROUP_RE = re.compile(r'[0-9]+')
+_GROUP_RE_BYTES = re.compile(rb'[0-9]+')
+
+# Luhn: every second digit from the right is doubled; this table maps d -> digit sum of 2d
+_LUHN_DOUBLED = str.maketrans('0123456789', '0246813579')
+
+
+def _luhn_ok(digits: str) -> bool:
     if len(digits) < 13:
         return False
-    total = 0
-    for i, d in enumerate(digits):
-        if i % 2 == 1:
-            d *= 2
-            if d > 9:
-                d -= 9
-        total += d
+    total = sum(map(int, digits[-1::-2])) + sum(map(int, digits[-2::-2].translate(_LUHN_DOUBLED)))
     return total % 10 == 0
 
 
+def luhn_check(number: str) -> bool:
+    """Validate a digit string using the Luhn algorithm."""
+    return _luhn_ok(re.sub(r'[^0-9]', '', number))
+
+
 def redact_card(match_str: str) -> str:
     """Redact all but last 4 digits of a matched card number."""
     digits_only = re.sub(r'[^0-9]', '', match_str)
     sep_char = '-' if '-' in match_str else (' ' if ' ' in match_str else '')
     if len(digits_only) == 15:  # Amex
         return f"XXXX{sep_char}XXXXXX{sep_char}{digits_only[-5:]}"
-    return f"XXXX{sep_char}XXXX{sep_char}XXXX{sep_char}{digits_only[-4:]}"
+    masked = ['XXXX'] * max(3, (len(digits_only) - 1) // 4)  # 3 groups up to 16 digits, 4 above
+    return sep_char.join(masked + [digits_only[-4:]])
 
 
-def scan_text_for_cards(text: str) -> List[Dict[str, str]]:
+def _as_text(chunk) -> str:
+    return chunk if isinstance(chunk, str) else chunk.decode('utf-8', 'replace')
+
+
+def _card_candidates(buf, run_re, group_re) -> List[Tuple[int, int, Tuple[int, ...]]]:
     """
-    Scan text for credit card numbers. Returns list of hits with card type,
-    redacted number, and surrounding context.
+    (brand index, start, ends) for every start that fits a brand's prefix and group
+    layout, with ends the window ends at the brand's lengths, longest first. Windows
+    start and end on digit-group edges, and per brand the longest window is consumed
+    whether or not any length passes Luhn, as a per-brand finditer would.
     """
-    # Normalize Unicode whitespace to ASCII space so the separator class matches consistently.
-    text = re.sub(r'[\xa0\u00a0\u2007\u202f\u2009\u200a\u2002\u2003\u2004\u2005\u2006]', ' ', text)
-    # Replace underscores with spaces — CC auth forms use underscore runs as field blanks,
-    # e.g. "Card Number: __4259 0900 1376 1839______". Without this, \b-free regex still
-    # needs digits not adjacent to other digits, which holds, but the underscore between
-    # groups (4259_0900) is included in SEP so it's already handled by the pattern.
-    # We replace here anyway to normalize before context extraction.
-    text = text.replace('_', ' ')
+    found = []
+    next_free = [0] * len(CARD_BRANDS)
+    for run in run_re.finditer(buf):
+        run_start, run_end = run.span()
+        segment = run.group()
+        if run.lastgroup == 'plain':
+            groups = [(run_start, run_end)]  # unformatted number of a card length: one window
+        else:
+            groups = [g.span() for g in group_re.finditer(buf, run_start, run_end)]
+        for i, (start, first_end) in enumerate(groups):
+            if first_end - start < 4:
+                continue  # every layout's first separator comes after >= 4 digits
+            head = _as_text(segment[start - run_start:start - run_start + 4])
+            for idx, lengths, bounds, prefix in _BRANDS_BY_PREFIX.get(head[:2], ()):
+                if start < next_free[idx] or not head.startswith(prefix):
+                    continue
+                count = 0
+                ends = []
+                for j in range(i, len(groups)):
+                    count += groups[j][1] - groups[j][0]
+                    if count in lengths:
+                        ends.append(groups[j][1])
+                    if count not in bounds:
+                        break
+                if ends:
+                    next_free[idx] = ends[-1]
+                    found.append((idx, start, tuple(reversed(ends))))
+    return found
+
+
+def _scan_buffer(buf, run_re, group_re) -> List[Dict[str, str]]:
     hits = []
     seen: Set[str] = set()
-    for card_type, pattern in CC_PATTERNS:
-        for m in pattern.finditer(text):
-            raw = m.group(0)
-            digits = re.sub(r'[^0-9]', '', raw)
-            if digits in seen:
-                continue
-            if not luhn_check(digits):
-                continue
-            seen.add(digits)
-            start = max(0, m.start() - 30)
-            end = min(len(text), m.end() + 30)
-            context = text[start:end].replace('\n', ' ').strip()
-            # Redact the actual number in context
-            redacted = redact_card(raw)
-            context_redacted = context.replace(raw, redacted)
-            hits.append({
-                'card_type': card_type,
-                'redacted': redacted,
-                'context': context_redacted,
-            })
+    # Sorted by brand, then position: the order the hits are reported in
+    for idx, start, ends in sorted(_card_candidates(buf, run_re, group_re)):
+        # Longest Luhn-valid window: "4111 1111 1111 1111 123" is a 16-digit card and its CVV
+        for end in ends:
+            raw = _as_text(buf[start:end]).translate(_NORMALIZE)
+            digits = raw.translate(_STRIP_SEPARATORS)
+            if _luhn_ok(digits):
+                break
+        else:
+            continue
+        if digits in seen:
+            continue
+        seen.add(digits)
+        context = _as_text(buf[max(0, start - 30):end + 30]).translate(_NORMALIZE).replace('\n', ' ').strip()
+        # Redact the actual number in context
+        redacted = redact_card(raw)
+        hits.append({
+            'card_type': CARD_BRANDS[idx][0],
+            'redacted': redacted,
+            'context': context.replace(raw, redacted),
+        })
     return hits
 
 
+def scan_text_for_cards(text: str) -> List[Dict[str, str]]:
+    """
+    Scan text for credit card numbers. Returns list of hits with card type,
+    redacted number, and surrounding context.
+
+    One regex pass finds candidate digit runs; only those (a tiny fraction of a
+    large OCR or spreadsheet dump) are split into groups, classified by prefix,
+    and Luhn-checked.
+    """
+    return _scan_buffer(text, _RUN_RE, _GROUP_RE)
+
+
+def scan_file_for_cards(file_path: Path) -> List[Dict[str, str]]:
+    """scan_text_for_cards() over a memory-mapped file (UTF-8 or ASCII text), without reading it into memory."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return _scan_buffer(buf, _RUN_RE_BYTES, _GROUP_RE_BYTES)
+
+
 # ---------------------------------------------------------------------------
 # Text extraction
 # ---------------------------------------------------------------------------
@@ -788,6 +879,301 @@ def extract_text(file_path: Path, use_ocr: bool = True) -> Tuple[str, str]:
             return '', f'read_error:{e}'
 
 
+# Types extract_text() parses; everything else is read as text
+_EXTRACTED_TYPES = frozenset({'.pdf', '.xlsx', '.xls', '.docx', '.doc', '.msg'})
+
+
+def scan_file(file_path: Path, use_ocr: bool = True) -> Dict[str, Any]:
+    """
+    Extract and scan one file. Returns {method, has_text, hits}; the text itself is
+    dropped. Plain-text files are scanned memory-mapped instead of being decoded.
+    """
+    if file_path.suffix.lower() not in _EXTRACTED_TYPES:
+        try:
+            return {'method': 'plaintext', 'has_text': file_path.stat().st_size > 0,
+                    'hits': scan_file_for_cards(file_path)}
+        except Exception as e:
+            return {'method': f'read_error:{e}', 'has_text': False, 'hits': []}
+    try:
+        text, method = extract_text(file_path, use_ocr=use_ocr)
+    except Exception as e:
+        text, method = '', f'extract_error:{e}'
+    has_text = bool(text.strip())
+    return {'method': method, 'has_text': has_text, 'hits': scan_text_for_cards(text) if has_text else []}
+
+
+# ---------------------------------------------------------------------------
+# Scanning engine: concurrent downloads, process-pool extraction, text cache
+# ---------------------------------------------------------------------------
+
+EXTRACTOR_VERSION = 1  # bump when extract_text*() output changes so cached findings are redone
+SCANNER_VERSION = 2    # bump when scan_text_for_cards() can find something it did not before
+DEFAULT_DOWNLOAD_WORKERS = 8
+DEFAULT_SCAN_WORKERS = os.cpu_count() or 2
+CACHE_DIR_NAME = '.scan-cache'
+LEGACY_CACHE_DIR_NAME = '.extract-cache'  # held extracted plaintext; no longer read or written
+STREAM_NAME = 'scan_results.jsonl'
+
+
+class ExtractionCache:
+    """
+    Scan findings on disk, keyed by file SHA-256 + extractor/scanner version + OCR
+    mode, so a rescan only re-extracts files whose bytes (or the code) changed.
+
+    Records are gzipped JSON at <cache_dir>/<key[:2]>/<key>.json.gz holding
+    {method, has_text, hits[, ocr_done]}; hits are the redacted findings that go
+    into the report. Extracted text is never written, so the cache is not
+    another copy of the card numbers.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def key(digest: str, use_ocr: bool) -> str:
+        return f"{digest}-v{EXTRACTOR_VERSION}.{SCANNER_VERSION}-{'ocr' if use_ocr else 'noocr'}"
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f'{key}.json.gz'
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with gzip.open(self._path(key), 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, record: Dict[str, Any]) -> None:
+        if 'error' in record.get('method', '').lower():
+            return  # a missing OCR binary or locked file should be retried next run, not remembered
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        with gzip.open(tmp, 'wt', encoding='utf-8') as f:
+            json.dump(record, f)
+        os.replace(tmp, path)
+
+
+def _file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _fetch_entry(entry: Dict, dest: Path, account: str, environment: str,
+                 force: bool) -> Tuple[Optional[str], bool]:
+    """Thread-pool worker: download to dest unless already there. Returns (sha256, reused)."""
+    if dest.exists() and not force:
+        return _file_digest(dest), True
+    content = download_file_content(entry['file_id'], account, environment)
+    if not content:
+        return None, False
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(dest.name + '.part')
+    tmp.write_bytes(content)
+    os.replace(tmp, dest)  # a half-written file must never look like a finished download
+    return hashlib.sha256(content).hexdigest(), False
+
+
+def _ocr_pdf_text(file_path: Path, dpi: int = 300) -> str:
+    try:
+        from pdf2image import convert_from_path
+        import pytesseract
+        images = convert_from_path(str(file_path), dpi=dpi)
+        return '\n'.join(pytesseract.image_to_string(img) for img in images)
+    except Exception:
+        return ''
+
+
+def _wants_ocr_retry(file_path: Path, record: Dict[str, Any], ocr_retry: bool) -> bool:
+    """
+    PDFs with a text layer but no card number get a high-dpi OCR pass: some are form
+    templates where the number was handwritten on a printed/faxed copy and only
+    exists in the image layer.
+    """
+    return (ocr_retry and not record.get('ocr_done') and file_path.suffix.lower() == '.pdf'
+            and record['has_text'] and not record['hits'])
+
+
+def _extract_worker(path_str: str, use_ocr: bool, ocr_retry: bool,
+                    record: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Process-pool worker: extract and scan the file (unless record, a cache hit,
+    already has the findings) and run the OCR retry pass when it applies.
+    Returns the cacheable findings record {method, has_text, hits[, ocr_done]};
+    the extracted text stays in this process.
+    """
+    file_path = Path(path_str)
+    if record is None:
+        record = scan_file(file_path, use_ocr=use_ocr)
+    if _wants_ocr_retry(file_path, record, ocr_retry):
+        record['ocr_done'] = True
+        hits = scan_text_for_cards(_ocr_pdf_text(file_path))
+        if hits:
+            record['hits'] = hits
+            record['method'] += '+ocr'
+    return record
+
+
+def _apply_extraction(entry: Dict, record: Dict[str, Any]) -> None:
+    """Set the entry's scan_status / card_hits from a findings record."""
+    method = record['method']
+    entry['extraction_method'] = method
+    if not record['has_text'] and not record['hits']:
+        is_error = 'error' in method.lower()
+        entry['scan_status'] = 'ERROR' if is_error else 'NOT_FOUND'
+        entry['scan_error'] = method if is_error else None
+        entry['card_hits'] = []
+        return
+    hits = record['hits']
+    entry['scan_status'] = 'CONFIRMED' if hits else 'NOT_FOUND'
+    entry['scan_error'] = None
+    entry['card_hits'] = hits
+
+
+def _describe_result(entry: Dict) -> str:
+    status = entry.get('scan_status')
+    method = entry.get('extraction_method')
+    if status == 'CONFIRMED':
+        n = len(entry['card_hits'])
+        return f"CONFIRMED ({n} hit{'s' if n != 1 else ''}, method={method})"
+    if status == 'ERROR':
+        return f"ERROR ({entry.get('scan_error')})"
+    return f"not found (method={method})"
+
+
+def _process_context():
+    # forkserver/spawn: forking while download threads hold the gateway pool's locks can deadlock
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def run_scan_engine(
+    downloads: List[Dict],
+    local: List[Dict],
+    download_dir: Optional[Path] = None,
+    account: str = DEFAULT_ACCOUNT,
+    environment: str = DEFAULT_ENVIRONMENT,
+    force: bool = False,
+    use_ocr: bool = True,
+    ocr_retry: bool = False,
+    download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    scan_workers: int = DEFAULT_SCAN_WORKERS,
+    cache: Optional[ExtractionCache] = None,
+    stream_path: Optional[Path] = None,
+    annotate: Optional[Callable[[Dict], str]] = None,
+) -> Dict[str, int]:
+    """
+    Download, extract and scan entries concurrently, updating each entry in place.
+
+    downloads are fetched into download_dir/<subfolder>/<filename> on a thread pool
+    (files already there are reused unless force); local entries already have a
+    local_path. Each file goes to the extraction process pool as soon as it is on
+    disk; cached findings are reused without re-extracting. Every finished entry is
+    appended to stream_path (JSONL) so partial results survive an interrupted run.
+    Returns counts {downloaded, reused, extracted, cached, failed}.
+    """
+    total = len(downloads) + len(local)
+    counts = {'downloaded': 0, 'reused': 0, 'extracted': 0, 'cached': 0, 'failed': 0}
+    done = 0
+    stream = open(stream_path, 'w') if stream_path else None
+
+    def finish(entry: Dict) -> None:
+        nonlocal done
+        done += 1
+        line = _describe_result(entry) + (annotate(entry) if annotate else '')
+        print(f"  [{done}/{total}] {entry['subfolder_name']}/{entry['filename']}: {line}", flush=True)
+        if stream:
+            stream.write(json.dumps(_entry_to_report(entry)) + '\n')
+            stream.flush()
+
+    def fail(entry: Dict, error: str) -> None:
+        counts['failed'] += 1
+        entry['scan_status'] = 'ERROR'
+        entry['scan_error'] = error
+        finish(entry)
+
+    try:
+        with ThreadPoolExecutor(max_workers=download_workers) as io_pool, \
+                ProcessPoolExecutor(max_workers=scan_workers, mp_context=_process_context()) as cpu_pool:
+            jobs: Dict[Future, Tuple[str, Dict, Any]] = {}
+
+            def extract(entry: Dict, digest: str) -> None:
+                key = ExtractionCache.key(digest, use_ocr)
+                record = cache.get(key) if cache else None
+                if record is not None and not _wants_ocr_retry(Path(entry['local_path']), record, ocr_retry):
+                    counts['cached'] += 1
+                    _apply_extraction(entry, record)
+                    finish(entry)
+                    return
+                try:
+                    fut = cpu_pool.submit(_extract_worker, entry['local_path'], use_ocr, ocr_retry, record)
+                except BrokenProcessPool as e:
+                    fail(entry, f'extract_error:{e}')
+                    return
+                jobs[fut] = ('extract', entry, key)
+
+            for entry in downloads:
+                dest = download_dir / entry['subfolder_name'] / entry['filename']
+                jobs[io_pool.submit(_fetch_entry, entry, dest, account, environment, force)] = ('fetch', entry, dest)
+            for entry in local:
+                jobs[io_pool.submit(_file_digest, Path(entry['local_path']))] = ('hash', entry, None)
+
+            while jobs:
+                finished, _ = wait(list(jobs), return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    kind, entry, extra = jobs.pop(fut)
+                    try:
+                        result = fut.result()
+                    except Exception as e:
+                        result = e
+                    if kind == 'extract':
+                        if isinstance(result, Exception):  # e.g. an extractor crashed its worker
+                            fail(entry, f'extract_error:{result}')
+                            continue
+                        counts['extracted'] += 1
+                        if cache:
+                            cache.put(extra, result)
+                        _apply_extraction(entry, result)
+                        finish(entry)
+                    elif kind == 'fetch':
+                        digest, reused = (None, False) if isinstance(result, Exception) else result
+                        if not digest:
+                            entry['local_path'] = None
+                            fail(entry, 'Download failed')
+                            continue
+                        counts['reused' if reused else 'downloaded'] += 1
+                        entry['local_path'] = str(extra)
+                        extract(entry, digest)
+                    else:
+                        if isinstance(result, Exception):
+                            fail(entry, f'read_error:{result}')
+                            continue
+                        extract(entry, result)
+    finally:
+        if stream:
+            stream.close()
+    return counts
+
+
+def _make_cache(args: argparse.Namespace, download_dir: Path) -> Optional[ExtractionCache]:
+    legacy = download_dir / LEGACY_CACHE_DIR_NAME
+    if legacy.is_dir():
+        print(f"WARNING: {legacy} is an old extracted-text cache that holds document plaintext "
+              f"(including card numbers). It is no longer used; delete it securely.", file=sys.stderr)
+    if args.no_cache:
+        return None
+    return ExtractionCache(Path(args.cache_dir) if args.cache_dir else download_dir / CACHE_DIR_NAME)
+
+
+def _print_engine_counts(counts: Dict[str, int], elapsed: float) -> None:
+    print(f"\n  Engine: {counts['downloaded']} downloaded, {counts['reused']} already on disk, "
+          f"{counts['extracted']} extracted, {counts['cached']} from findings cache, "
+          f"{counts['failed']} failed ({elapsed:.1f}s)")
+
+
 # ---------------------------------------------------------------------------
 # Re-scan mode (--rescan-report): re-run extraction+scan on existing downloads
 # ---------------------------------------------------------------------------
@@ -831,61 +1217,30 @@ def run_rescan(args: argparse.Namespace) -> None:
     print(f"  Will re-scan: {len(to_scan)} files  |  No local file: {len(no_file)}")
 
     was_confirmed = sum(1 for e in all_entries if e.get('scan_status') == 'CONFIRMED')
-    now_confirmed = 0
-
-    for i, entry in enumerate(to_scan, 1):
-        local_path = Path(entry['local_path'])
-        subfolder = entry['subfolder_name']
-        filename = entry['filename']
-        old_status = entry.get('scan_status', '?')
-        print(f"  [{i}/{len(to_scan)}] {subfolder}/{filename} [{old_status}]... ", end='', flush=True)
-
-        text, method = extract_text(local_path, use_ocr=not args.no_ocr)
-        entry['extraction_method'] = method
-
-        if not text.strip():
-            entry['scan_status'] = 'NOT_FOUND' if 'error' not in method.lower() else 'ERROR'
-            entry['scan_error'] = method if 'error' in method.lower() else None
-            entry['card_hits'] = []
-            print(f"no text ({method})")
-            continue
-
-        hits = scan_text_for_cards(text)
-        # If text was extracted but no card found, try OCR as additional pass for PDFs.
-        # Some PDFs contain form template text (extractable) but the card number was
-        # handwritten on a printed/faxed copy and only exists in the image layer.
-        if not hits and not args.no_ocr and local_path.suffix.lower() == '.pdf':
-            try:
-                from pdf2image import convert_from_path
-                import pytesseract
-                images = convert_from_path(str(local_path), dpi=300)
-                ocr_text = '\n'.join(pytesseract.image_to_string(img) for img in images)
-                if ocr_text.strip():
-                    ocr_hits = scan_text_for_cards(ocr_text)
-                    if ocr_hits:
-                        hits = ocr_hits
-                        method = method + '+ocr'
-                        entry['extraction_method'] = method
-            except Exception:
-                pass
-        if hits:
-            entry['scan_status'] = 'CONFIRMED'
-            entry['card_hits'] = hits
-            now_confirmed += 1
-            marker = '' if old_status == 'CONFIRMED' else ' *** UPGRADED'
-            print(f"CONFIRMED ({len(hits)} hit{'s' if len(hits)!=1 else ''}, method={method}){marker}")
-        else:
-            entry['scan_status'] = 'NOT_FOUND'
-            entry['card_hits'] = []
-            if old_status == 'CONFIRMED':
-                print(f"NOT_FOUND (method={method}) *** REGRESSION - was CONFIRMED")
-            else:
-                print(f"not found (method={method})")
+    old_status = {id(e): e.get('scan_status', '?') for e in to_scan}
+
+    def annotate(entry: Dict) -> str:
+        before = old_status[id(entry)]
+        if entry['scan_status'] == 'CONFIRMED' and before != 'CONFIRMED':
+            return ' *** UPGRADED'
+        if entry['scan_status'] != 'CONFIRMED' and before == 'CONFIRMED':
+            return ' *** REGRESSION - was CONFIRMED'
+        return f' [{before}]'
+
+    started = time.time()
+    counts = run_scan_engine(
+        [], to_scan,
+        use_ocr=not args.no_ocr,
+        ocr_retry=not args.no_ocr,
+        scan_workers=args.scan_workers,
+        cache=_make_cache(args, download_dir),
+        stream_path=output_dir / STREAM_NAME,
+        annotate=annotate,
+    )
+    _print_engine_counts(counts, time.time() - started)
 
     # Entries with no local file retain their prior status
-    for entry in no_file:
-        if entry.get('scan_status') == 'CONFIRMED':
-            now_confirmed += 1
+    now_confirmed = sum(1 for e in all_entries if e.get('scan_status') == 'CONFIRMED')
 
     print(f"\n  Re-scan complete: CONFIRMED {was_confirmed} -> {now_confirmed} (+{now_confirmed - was_confirmed})")
     regressions = [e for e in to_scan if e.get('scan_status') != 'CONFIRMED'
@@ -941,33 +1296,11 @@ def run_scan(args: argparse.Namespace) -> None:
         _write_report(entries, output_dir, download_only=True)
         return
 
-    # --- Step 3: Download files ---
+    # --- Steps 3+4: Download and scan (overlapped) ---
+    downloads: List[Dict] = []
+    local: List[Dict] = []
     if not args.skip_download:
-        print(f"\n=== Step 3: Downloading {len(resolved)} files ===")
-        for i, entry in enumerate(resolved, 1):
-            file_id = entry['file_id']
-            subfolder = entry['subfolder_name']
-            filename = entry['filename']
-            dest = download_dir / subfolder / filename
-            dest.parent.mkdir(parents=True, exist_ok=True)
-
-            if dest.exists() and not args.force:
-                print(f"  [{i}/{len(resolved)}] {subfolder}/{filename} (cached)")
-                entry['local_path'] = str(dest)
-                continue
-
-            print(f"  [{i}/{len(resolved)}] {subfolder}/{filename}... ", end='', flush=True)
-            content = download_file_content(file_id, account, environment)
-            if content:
-                dest.write_bytes(content)
-                entry['local_path'] = str(dest)
-                print(f"OK ({len(content):,} bytes)")
-            else:
-                entry['local_path'] = None
-                entry['scan_status'] = 'ERROR'
-                entry['scan_error'] = 'Download failed'
-                print("FAILED")
-            time.sleep(RATE_LIMIT_DELAY)
+        downloads = resolved
     else:
         scan_dir = Path(args.scan_dir) if args.scan_dir else download_dir
         for entry in resolved:
@@ -976,35 +1309,26 @@ def run_scan(args: argparse.Namespace) -> None:
             if not p.exists():
                 entry['scan_status'] = 'ERROR'
                 entry['scan_error'] = f"File not found at {p}"
+        local = [e for e in resolved if e.get('local_path') and not e.get('scan_status')]
+
+    print(f"\n=== Step 3: Downloading and scanning {len(downloads) + len(local)} files for PCI data "
+          f"({args.workers} download / {args.scan_workers} scan workers) ===")
+    started = time.time()
+    counts = run_scan_engine(
+        downloads, local,
+        download_dir=download_dir,
+        account=account,
+        environment=environment,
+        force=args.force,
+        use_ocr=not args.no_ocr,
+        download_workers=args.workers,
+        scan_workers=args.scan_workers,
+        cache=_make_cache(args, download_dir),
+        stream_path=output_dir / STREAM_NAME,
+    )
+    _print_engine_counts(counts, time.time() - started)
 
-    # --- Step 4: Scan files ---
-    print(f"\n=== Step 4: Scanning files for PCI data ===")
-    to_scan = [e for e in resolved if e.get('local_path') and not e.get('scan_status')]
-    for i, entry in enumerate(to_scan, 1):
-        local_path = Path(entry['local_path'])
-        subfolder = entry['subfolder_name']
-        filename = entry['filename']
-        print(f"  [{i}/{len(to_scan)}] {subfolder}/{filename}... ", end='', flush=True)
-
-        text, method = extract_text(local_path, use_ocr=not args.no_ocr)
-        if not text.strip():
-            entry['scan_status'] = 'NOT_FOUND' if 'error' not in method.lower() else 'ERROR'
-            entry['scan_error'] = method if 'error' in method.lower() else None
-            entry['extraction_method'] = method
-            print(f"no text ({method})")
-            continue
-
-        hits = scan_text_for_cards(text)
-        entry['extraction_method'] = method
-        if hits:
-            entry['scan_status'] = 'CONFIRMED'
-            entry['card_hits'] = hits
-            print(f"CONFIRMED ({len(hits)} hit{'s' if len(hits) != 1 else ''}, method={method})")
-        else:
-            entry['scan_status'] = 'NOT_FOUND'
-            print(f"not found (method={method})")
-
-    # --- Step 5: Write report ---
+    # --- Step 4: Write report ---
     _write_report(entries, output_dir)
     _write_xlsx_report(entries, download_dir, output_dir)
 
@@ -1229,6 +1553,15 @@ def main() -> None:
                         help='Re-scan existing downloads using an existing scan_report.json. '
                              'No network calls; only re-runs text extraction and card detection. '
                              'Use after fixing extraction bugs to avoid a full re-download.')
+    parser.add_argument('--workers', type=int, default=DEFAULT_DOWNLOAD_WORKERS,
+                        help=f'Concurrent downloads (default: {DEFAULT_DOWNLOAD_WORKERS})')
+    parser.add_argument('--scan-workers', type=int, default=DEFAULT_SCAN_WORKERS,
+                        help=f'Processes for text extraction/OCR (default: CPU count, {DEFAULT_SCAN_WORKERS})')
+    parser.add_argument('--cache-dir', default=None,
+                        help=f'Scan findings cache (default: <download-dir>/{CACHE_DIR_NAME}). '
+                             'Stores redacted hits only, never extracted text.')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always re-extract and rescan; do not read or write the cache')
     args = parser.parse_args()
 
     print(f"NetSuite PCI File Scanner")
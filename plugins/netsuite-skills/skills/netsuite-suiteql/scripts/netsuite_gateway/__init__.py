@@ -0,0 +1,48 @@
+"""
+Shared NetSuite API Gateway client.
+
+Every skill script that talks to the gateway goes through one pooled client
+instead of opening a fresh urllib connection per request:
+
+  from netsuite_gateway import get_client
+  client = get_client()
+  result = client.query('SELECT id FROM customer', account='twistedx', environment='production')
+  results = client.query_many(['SELECT ...', ('SELECT ... WHERE id = ?', [42])])
+
+Reference queries can opt in to the local SQLite result cache per call:
+
+  client.query('SELECT id, name FROM customrecord_twx_edi_tp', cache_ttl=3600)
+
+Scripts outside netsuite-suiteql add this directory to sys.path first.
+"""
+
+from .aio import AsyncGatewayClient
+from .cache import QueryCache, get_query_cache, normalize_sql, ttl_from_env
+from .client import (
+    ACCOUNT_ALIASES,
+    DEFAULT_GATEWAY_URL,
+    ENV_ALIASES,
+    GatewayClient,
+    GatewayError,
+    get_client,
+    is_idempotent,
+    resolve_account,
+    resolve_environment,
+)
+
+__all__ = [
+    'ACCOUNT_ALIASES',
+    'AsyncGatewayClient',
+    'DEFAULT_GATEWAY_URL',
+    'ENV_ALIASES',
+    'GatewayClient',
+    'GatewayError',
+    'QueryCache',
+    'get_client',
+    'get_query_cache',
+    'is_idempotent',
+    'normalize_sql',
+    'resolve_account',
+    'resolve_environment',
+    'ttl_from_env',
+]
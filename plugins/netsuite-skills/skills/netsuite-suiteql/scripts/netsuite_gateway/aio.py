@@ -0,0 +1,58 @@
+"""
+asyncio front-end for the pooled gateway client.
+
+Requests run on worker threads (asyncio.to_thread) against a shared
+GatewayClient, so sync and async callers draw from the same keep-alive pool;
+an asyncio.Semaphore keeps the event loop from queueing more work than the
+pool can serve.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence
+
+from .client import (
+    DEFAULT_ACCOUNT,
+    DEFAULT_ENVIRONMENT,
+    GatewayClient,
+    Statement,
+    get_client,
+)
+
+
+class AsyncGatewayClient:
+    """Async wrapper around GatewayClient (same return shapes, same pool)."""
+
+    def __init__(self, client: Optional[GatewayClient] = None, concurrency: Optional[int] = None):
+        self.client = client or get_client()
+        self._limit = concurrency or self.client.pool_size
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _sem(self) -> asyncio.Semaphore:
+        # Created lazily so the semaphore binds to the running loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._limit)
+        return self._semaphore
+
+    async def call(self, payload: Dict[str, Any], timeout: Optional[float] = None,
+                   idempotent: Optional[bool] = None) -> Dict[str, Any]:
+        async with self._sem():
+            return await asyncio.to_thread(self.client.call, payload, timeout, idempotent)
+
+    async def query(self, sql: str, params: Optional[List[Any]] = None, account: str = DEFAULT_ACCOUNT,
+                    environment: str = DEFAULT_ENVIRONMENT, return_all_rows: bool = False,
+                    timeout: Optional[float] = None, cache_ttl: Optional[float] = None,
+                    refresh: bool = False) -> Dict[str, Any]:
+        async with self._sem():
+            return await asyncio.to_thread(
+                self.client.query, sql, params, account, environment, return_all_rows, timeout, cache_ttl, refresh)
+
+    async def query_many(self, statements: Sequence[Statement], account: str = DEFAULT_ACCOUNT,
+                         environment: str = DEFAULT_ENVIRONMENT, return_all_rows: bool = False,
+                         timeout: Optional[float] = None, cache_ttl: Optional[float] = None,
+                         refresh: bool = False) -> List[Dict[str, Any]]:
+        """Run statements concurrently; results in input order."""
+        async def run(stmt: Statement) -> Dict[str, Any]:
+            sql, params = (stmt, None) if isinstance(stmt, str) else stmt
+            return await self.query(sql, params, account, environment, return_all_rows, timeout, cache_ttl, refresh)
+
+        return list(await asyncio.gather(*(run(s) for s in statements)))
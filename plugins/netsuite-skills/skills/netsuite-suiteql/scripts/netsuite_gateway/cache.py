@@ -0,0 +1,171 @@
+"""
+Local SQLite cache for SuiteQL results.
+
+Caching is opt-in per call: GatewayClient.query(..., cache_ttl=N) serves a
+stored result younger than N seconds, otherwise queries the gateway and stores
+the answer. Entries are keyed by normalized SQL, params, account, environment
+and row mode, so reformatting a query still hits. Each caller picks the TTL
+that suits its data (profile lists for minutes, trading partners for a day),
+and refresh=True skips the read but stores the fresh result.
+
+The database defaults to ~/.cache/netsuite-skills/query_cache.sqlite
+(override with NETSUITE_QUERY_CACHE); WAL mode lets several scripts share it.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+CACHE_PATH_ENV = 'NETSUITE_QUERY_CACHE'
+CACHE_TTL_ENV = 'NETSUITE_QUERY_CACHE_TTL'
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'netsuite-skills' / 'query_cache.sqlite'
+
+# Single-quoted literals ('' escapes a quote) and double-quoted identifiers keep their
+# case and spacing; everything else is case- and whitespace-insensitive in SuiteQL.
+_LITERAL_RE = re.compile(r"('(?:[^']|'')*'|\"[^\"]*\")")
+_SPACE_RE = re.compile(r'\s+')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS query_cache (
+    key         TEXT PRIMARY KEY,
+    sql         TEXT NOT NULL,
+    account     TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    fetched_at  REAL NOT NULL,
+    row_count   INTEGER NOT NULL,
+    payload     BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS query_cache_target ON query_cache (account, environment);
+"""
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace and lowercase everything outside quoted literals; drop a trailing ';'."""
+    parts = _LITERAL_RE.split(sql.strip().rstrip(';').strip())
+    return ''.join(p if i % 2 else _SPACE_RE.sub(' ', p).lower() for i, p in enumerate(parts)).strip()
+
+
+def is_cacheable(sql: str) -> bool:
+    """Only reads are cached; a DML statement always goes to the gateway."""
+    return normalize_sql(sql).startswith(('select', 'with'))
+
+
+def cache_key(sql: str, params: Optional[List[Any]], account: str, environment: str,
+              return_all_rows: bool) -> str:
+    raw = json.dumps([normalize_sql(sql), params or [], account, environment, bool(return_all_rows)],
+                     default=str, separators=(',', ':'))
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def ttl_from_env(default: Optional[float] = None) -> Optional[float]:
+    """Session-wide TTL from NETSUITE_QUERY_CACHE_TTL (seconds), for CLIs that opt in that way."""
+    value = os.environ.get(CACHE_TTL_ENV, '').strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+class QueryCache:
+    """Thread-safe SQLite store of query results (one connection, serialized by a lock)."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path or os.environ.get(CACHE_PATH_ENV) or DEFAULT_CACHE_PATH).expanduser()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str, ttl: float) -> Optional[Tuple[Dict[str, Any], float]]:
+        """(stored result, age in seconds) if an entry younger than ttl exists."""
+        with self._lock:
+            row = self._db().execute(
+                'SELECT fetched_at, payload FROM query_cache WHERE key = ?', (key,)).fetchone()
+        if not row:
+            return None
+        age = time.time() - row[0]
+        if age > ttl:
+            return None
+        try:
+            return json.loads(zlib.decompress(row[1])), age
+        except (zlib.error, ValueError):
+            return None
+
+    def put(self, key: str, sql: str, account: str, environment: str, result: Dict[str, Any]) -> None:
+        """Store the records/authType/analysis of a successful result."""
+        stored = {k: result.get(k) for k in ('records', 'authType', 'analysis')}
+        payload = zlib.compress(json.dumps(stored, default=str).encode('utf-8'))
+        with self._lock:
+            conn = self._db()
+            conn.execute(
+                'INSERT OR REPLACE INTO query_cache VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, normalize_sql(sql), account, environment, time.time(), len(stored['records'] or []), payload))
+            conn.commit()
+
+    def invalidate(self, account: Optional[str] = None, environment: Optional[str] = None,
+                   table: Optional[str] = None, older_than: Optional[float] = None) -> int:
+        """
+        Delete matching entries; no filters clears everything. table matches any
+        query that mentions it (e.g. 'customrecord_twx_edi_tp'). Returns rows deleted.
+        """
+        clauses, args = [], []
+        if account:
+            clauses.append('account = ?')
+            args.append(account)
+        if environment:
+            clauses.append('environment = ?')
+            args.append(environment)
+        if table:
+            clauses.append("sql LIKE ? ESCAPE '\\'")
+            escaped = table.lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            args.append(f'%{escaped}%')
+        if older_than is not None:
+            clauses.append('fetched_at < ?')
+            args.append(time.time() - older_than)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ''
+        with self._lock:
+            conn = self._db()
+            deleted = conn.execute(f'DELETE FROM query_cache{where}', args).rowcount
+            conn.commit()
+        return deleted
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count, rows, oldest = self._db().execute(
+                'SELECT COUNT(*), COALESCE(SUM(row_count), 0), MIN(fetched_at) FROM query_cache').fetchone()
+        return {
+            'path': str(self.path),
+            'entries': count,
+            'rows': rows,
+            'oldest_age_seconds': round(time.time() - oldest, 1) if oldest else None,
+        }
+
+
+_cache: Optional[QueryCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_query_cache() -> QueryCache:
+    """Process-wide QueryCache at the configured path."""
+    global _cache
+    with _cache_lock:
+        path = Path(os.environ.get(CACHE_PATH_ENV) or DEFAULT_CACHE_PATH).expanduser()
+        if _cache is None or _cache.path != path:
+            _cache = QueryCache(str(path))
+        return _cache
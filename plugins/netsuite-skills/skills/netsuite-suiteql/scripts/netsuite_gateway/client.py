@@ -0,0 +1,479 @@
+"""
+Pooled NetSuite API Gateway client.
+
+One GatewayClient keeps a small pool of keep-alive HTTP(S) connections to the
+gateway, caps in-flight requests at the pool size, and retries transient
+failures (429/502/503/504 and dropped connections) with exponential backoff
+and full jitter. Only reads (GET, and the procedures in IDEMPOTENT_PROCEDURES)
+get the full retry set; any other POST is retried only on 429 or when the
+request never reached the gateway, unless the caller passes idempotent=True.
+Use get_client() to share one client per process.
+"""
+
+import http.client
+import json
+import os
+import queue
+import random
+import socket
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+
+from .cache import cache_key, get_query_cache, is_cacheable
+
+DEFAULT_GATEWAY_URL = 'https://nsapi.twistedx.tech'
+SUITEAPI_PATH = '/api/suiteapi'
+
+DEFAULT_ACCOUNT = 'twistedx'
+DEFAULT_ENVIRONMENT = 'sandbox2'
+
+ACCOUNT_ALIASES = {
+    'twx': 'twistedx', 'twisted': 'twistedx', 'twistedx': 'twistedx',
+    'dm': 'dutyman', 'duty': 'dutyman', 'dutyman': 'dutyman',
+}
+
+ENV_ALIASES = {
+    'prod': 'production', 'production': 'production',
+    'sb1': 'sandbox', 'sandbox': 'sandbox', 'sandbox1': 'sandbox',
+    'sb2': 'sandbox2', 'sandbox2': 'sandbox2',
+}
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_TIMEOUT = 120
+DEFAULT_MAX_RETRIES = 3
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# 429 means the gateway turned the request away, so it is safe to resend anything
+UNSENT_RETRY_STATUSES = frozenset({429})
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+# Read-only SuiteAPI procedures; writes and renders (twxUpsertRecord, cre2Render,
+# statementRender, fileCreate, ...) may commit on the server before a 5xx/timeout.
+IDEMPOTENT_PROCEDURES = frozenset({'queryRun', 'fileGet', 'executionLogsGet'})
+BACKOFF_BASE = 0.5   # seconds; attempt n sleeps uniform(0, min(cap, base * 2**n))
+BACKOFF_CAP = 10.0
+
+# A pooled keep-alive connection the server already closed fails with one of these
+# on the next request; that is retried once on a fresh connection, not counted as a retry.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError,
+                            BrokenPipeError, http.client.CannotSendRequest)
+
+Statement = Union[str, Tuple[str, Optional[List[Any]]]]
+
+
+def resolve_account(account: str) -> str:
+    """Resolve account alias to canonical name."""
+    return ACCOUNT_ALIASES.get(account.lower(), account.lower())
+
+
+def resolve_environment(environment: str) -> str:
+    """Resolve environment alias to canonical name."""
+    return ENV_ALIASES.get(environment.lower(), environment.lower())
+
+
+class GatewayError(Exception):
+    """Gateway request failed after retries (HTTP status, or None for connection errors)."""
+
+    def __init__(self, message: str, status: Optional[int] = None, body: str = ''):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+
+
+class _TransportError(Exception):
+    """Connection-level failure; sent is False when the request never left this process."""
+
+    def __init__(self, cause: BaseException, sent: bool):
+        super().__init__(str(cause))
+        self.cause = cause
+        self.sent = sent
+
+
+def is_idempotent(method: str, payload: Optional[Dict[str, Any]] = None) -> bool:
+    """Whether a request can be resent after a 5xx or a dropped response without side effects."""
+    if method.upper() in IDEMPOTENT_METHODS:
+        return True
+    if not isinstance(payload, dict):
+        return False
+    procedure = payload.get('procedure') or payload.get('action')
+    return procedure in IDEMPOTENT_PROCEDURES
+
+
+def _connection_error(e: BaseException, base_url: str) -> 'GatewayError':
+    reason = 'timed out' if isinstance(e, socket.timeout) else str(e)
+    return GatewayError(f'Gateway connection error: {reason}. Is the gateway running at {base_url}?')
+
+
+class _ConnectionPool:
+    """LIFO pool of keep-alive connections; the semaphore bounds concurrent requests."""
+
+    def __init__(self, base_url: str, size: int):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or 'https'
+        self.host = parts.hostname or ''
+        self.port = parts.port
+        self.path_prefix = parts.path.rstrip('/')
+        self._idle: 'queue.LifoQueue[http.client.HTTPConnection]' = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._ssl_context = ssl.create_default_context() if self.scheme == 'https' else None
+
+    def _new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        if self.scheme == 'https':
+            return http.client.HTTPSConnection(self.host, self.port, timeout=timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+
+    @contextmanager
+    def connection(self, timeout: float, fresh: bool = False) -> Iterator[Tuple[http.client.HTTPConnection, bool]]:
+        """Yield (connection, reused). The connection returns to the pool unless the body raised."""
+        self._slots.acquire()
+        conn = None
+        reused = False
+        try:
+            if not fresh:
+                try:
+                    conn = self._idle.get_nowait()
+                    reused = True
+                except queue.Empty:
+                    pass
+            if conn is None:
+                conn = self._new_connection(timeout)
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            yield conn, reused
+        except BaseException:
+            if conn is not None:
+                conn.close()
+            conn = None
+            raise
+        finally:
+            if conn is not None:
+                self._idle.put(conn)
+            self._slots.release()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class GatewayClient:
+    """
+    Thread-safe NetSuite API Gateway client with keep-alive pooling and retries.
+
+    Args:
+        base_url: Gateway root (default NETSUITE_GATEWAY_URL or https://nsapi.twistedx.tech)
+        api_key: X-API-Key (default NETSUITE_API_KEY); without it the Origin header is sent
+        pool_size: Max concurrent requests / pooled connections
+        max_retries: Retries for 429/5xx/connection failures (0 disables); see request()
+        timeout: Default per-request timeout in seconds
+    """
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 pool_size: int = DEFAULT_POOL_SIZE, max_retries: int = DEFAULT_MAX_RETRIES,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self.base_url = (base_url or os.environ.get('NETSUITE_GATEWAY_URL', DEFAULT_GATEWAY_URL)).rstrip('/')
+        self.api_key = os.environ.get('NETSUITE_API_KEY', '') if api_key is None else api_key
+        self.pool_size = max(1, pool_size)
+        self.max_retries = max(0, max_retries)
+        self.timeout = timeout
+        self._pool = _ConnectionPool(self.base_url, self.pool_size)
+
+    @property
+    def suiteapi_url(self) -> str:
+        return f'{self.base_url}{SUITEAPI_PATH}'
+
+    def headers(self) -> Dict[str, str]:
+        if self.api_key:
+            return {'Content-Type': 'application/json', 'Accept': 'application/json', 'X-API-Key': self.api_key}
+        return {'Content-Type': 'application/json', 'Accept': 'application/json', 'Origin': self.base_url}
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def __enter__(self) -> 'GatewayClient':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- transport ----------------------------------------------------------
+
+    def _send_once(self, method: str, path: str, body: Optional[bytes],
+                   headers: Dict[str, str], timeout: float) -> Tuple[int, Dict[str, str], bytes]:
+        full_path = f'{self._pool.path_prefix}{path}'
+        for fresh in (False, True):
+            with self._pool.connection(timeout, fresh=fresh) as (conn, reused):
+                sent = False
+                try:
+                    conn.request(method, full_path, body=body, headers=headers)
+                    sent = True
+                    resp = conn.getresponse()
+                    data = resp.read()
+                except (OSError, http.client.HTTPException) as e:
+                    if reused and not fresh and isinstance(e, _STALE_CONNECTION_ERRORS):
+                        conn.close()
+                        continue  # server dropped an idle keep-alive connection
+                    raise _TransportError(e, sent) from e
+                if resp.will_close:
+                    conn.close()
+                return resp.status, {k.lower(): v for k, v in resp.getheaders()}, data
+        raise GatewayError('Gateway connection error: connection closed')  # pragma: no cover
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after:
+            try:
+                return min(BACKOFF_CAP, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+    def request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None,
+                timeout: Optional[float] = None, headers: Optional[Dict[str, str]] = None,
+                idempotent: Optional[bool] = None) -> Any:
+        """
+        Send a request to the gateway and return the parsed JSON body.
+
+        Idempotent requests (default: is_idempotent(method, payload)) retry
+        RETRY_STATUSES and connection errors; others retry only 429 and
+        connection errors raised before the request was sent. Retries run up to
+        max_retries times with jittered exponential backoff (Retry-After
+        honoured). Raises GatewayError for non-2xx responses or when retries
+        are exhausted.
+        """
+        body = json.dumps(payload).encode('utf-8') if payload is not None else None
+        hdrs = {**self.headers(), **(headers or {})}
+        timeout = timeout or self.timeout
+        if idempotent is None:
+            idempotent = is_idempotent(method, payload)
+        retry_statuses = RETRY_STATUSES if idempotent else UNSENT_RETRY_STATUSES
+        attempt = 0
+        while True:
+            try:
+                status, resp_headers, data = self._send_once(method, path, body, hdrs, timeout)
+            except _TransportError as e:
+                if attempt >= self.max_retries or (e.sent and not idempotent):
+                    raise _connection_error(e.cause, self.base_url) from e.cause
+                time.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+
+            if status in retry_statuses and attempt < self.max_retries:
+                time.sleep(self._backoff(attempt, resp_headers.get('retry-after')))
+                attempt += 1
+                continue
+
+            text = data.decode('utf-8', errors='replace')
+            if status >= 400:
+                raise self._http_error(status, text)
+            return json.loads(text) if text else {}
+
+    @staticmethod
+    def _http_error(status: int, text: str) -> GatewayError:
+        try:
+            err = json.loads(text).get('error', {})
+            msg = err.get('message', text) if isinstance(err, dict) else str(err)
+        except (ValueError, AttributeError):
+            msg = text
+        return GatewayError(f'HTTP {status}: {msg}', status=status, body=text)
+
+    @contextmanager
+    def stream(self, payload: Dict[str, Any], timeout: Optional[float] = None,
+               idempotent: Optional[bool] = None) -> Iterator[http.client.HTTPResponse]:
+        """
+        POST a procedure payload and yield the raw 2xx response for incremental reads.
+
+        Retries like request() up to the point the response is handed over. The
+        pooled connection is reused only if the caller reads the body to the end.
+        """
+        body = json.dumps(payload).encode('utf-8')
+        hdrs = self.headers()
+        timeout = timeout or self.timeout
+        if idempotent is None:
+            idempotent = is_idempotent('POST', payload)
+        retry_statuses = RETRY_STATUSES if idempotent else UNSENT_RETRY_STATUSES
+        full_path = f'{self._pool.path_prefix}{SUITEAPI_PATH}'
+        attempt = 0
+        fresh = False
+        while True:
+            retry_after = None
+            with self._pool.connection(timeout, fresh=fresh) as (conn, reused):
+                sent = False
+                try:
+                    conn.request('POST', full_path, body=body, headers=hdrs)
+                    sent = True
+                    resp = conn.getresponse()
+                except (OSError, http.client.HTTPException) as e:
+                    conn.close()
+                    if reused and not fresh and isinstance(e, _STALE_CONNECTION_ERRORS):
+                        fresh = True
+                        continue  # server dropped an idle keep-alive connection
+                    if attempt >= self.max_retries or (sent and not idempotent):
+                        raise _connection_error(e, self.base_url) from e
+                else:
+                    if resp.status in retry_statuses and attempt < self.max_retries:
+                        retry_after = resp.getheader('Retry-After')
+                        resp.read()
+                    elif resp.status >= 400:
+                        raise self._http_error(resp.status, resp.read().decode('utf-8', errors='replace'))
+                    else:
+                        try:
+                            yield resp
+                        finally:
+                            if not resp.isclosed():
+                                conn.close()
+                        return
+            time.sleep(self._backoff(attempt, retry_after))
+            attempt += 1
+
+    def call(self, payload: Dict[str, Any], timeout: Optional[float] = None,
+             idempotent: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        POST a procedure payload (queryRun, fileGet, twxUpsertRecord, ...) to /api/suiteapi.
+
+        Writes and renders are not resent after a 5xx or a lost response unless
+        idempotent=True is passed (see request()).
+        """
+        return self.request('POST', SUITEAPI_PATH, payload, timeout=timeout, idempotent=idempotent)
+
+    # -- SuiteQL ------------------------------------------------------------
+
+    def query(self, sql: str, params: Optional[List[Any]] = None, account: str = DEFAULT_ACCOUNT,
+              environment: str = DEFAULT_ENVIRONMENT, return_all_rows: bool = False,
+              timeout: Optional[float] = None, cache_ttl: Optional[float] = None,
+              refresh: bool = False) -> Dict[str, Any]:
+        """
+        Run one SuiteQL statement. Never raises: failures come back in 'error'.
+
+        With cache_ttl (seconds) the local result cache is used: a stored result
+        younger than cache_ttl is returned without a request, and successful
+        results are stored. refresh=True skips the lookup but still stores.
+        analysis['cache'] then reports status (hit/miss/refresh), age and TTL.
+
+        Returns:
+            Dictionary with records, count, account, environment, authType,
+            analysis and error (None on success).
+        """
+        acct = resolve_account(account)
+        env = resolve_environment(environment)
+        if not cache_ttl or cache_ttl <= 0 or not is_cacheable(sql):
+            return self._query_gateway(sql, params, acct, env, return_all_rows, timeout)
+
+        cache = get_query_cache()
+        key = cache_key(sql, params, acct, env, return_all_rows)
+        hit = None
+        if not refresh:
+            try:
+                hit = cache.get(key, cache_ttl)
+            except Exception:
+                hit = None  # an unreadable cache must never fail the query
+        if hit:
+            stored, age = hit
+            records = stored.get('records') or []
+            return {
+                'records': records,
+                'count': len(records),
+                'account': acct,
+                'environment': env,
+                'authType': stored.get('authType', 'unknown'),
+                'analysis': _with_cache_meta(stored.get('analysis'), 'hit', key, cache_ttl, age),
+                'error': None,
+            }
+
+        result = self._query_gateway(sql, params, acct, env, return_all_rows, timeout)
+        if not result.get('error'):
+            try:
+                cache.put(key, sql, acct, env, result)
+            except Exception:
+                pass
+        result['analysis'] = _with_cache_meta(result.get('analysis'), 'refresh' if refresh else 'miss',
+                                              key, cache_ttl, 0.0)
+        return result
+
+    def _query_gateway(self, sql: str, params: Optional[List[Any]], acct: str, env: str,
+                       return_all_rows: bool, timeout: Optional[float]) -> Dict[str, Any]:
+        payload = {
+            'action': 'queryRun',
+            'procedure': 'queryRun',
+            'query': sql,
+            'params': params or [],
+            'returnAllRows': return_all_rows,
+            'netsuiteAccount': acct,
+            'netsuiteEnvironment': env,
+        }
+        base = {'records': [], 'count': 0, 'account': acct, 'environment': env}
+        try:
+            result = self.call(payload, timeout=timeout)
+        except GatewayError as e:
+            return {**base, 'error': str(e)}
+        except Exception as e:
+            return {**base, 'error': f'Unexpected error: {e}'}
+
+        records: List[Dict[str, Any]] = []
+        data = result.get('data')
+        if isinstance(data, dict) and isinstance(data.get('records'), list):
+            records = data['records']
+        elif isinstance(result.get('records'), list):
+            records = result['records']
+        error = None
+        if not result.get('success', True):
+            err = result.get('error')
+            error = err.get('message', str(err)) if isinstance(err, dict) else (err or 'unknown error')
+        return {
+            **base,
+            'records': records,
+            'count': len(records),
+            'authType': result.get('authType', 'unknown'),
+            'analysis': result.get('analysis'),
+            'error': error,
+        }
+
+    def query_many(self, statements: Sequence[Statement], account: str = DEFAULT_ACCOUNT,
+                   environment: str = DEFAULT_ENVIRONMENT, return_all_rows: bool = False,
+                   max_workers: Optional[int] = None, timeout: Optional[float] = None,
+                   cache_ttl: Optional[float] = None, refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Run independent SuiteQL statements concurrently over the pool.
+
+        Each statement is either SQL text or (sql, params). Results come back in
+        input order, each shaped like query().
+        """
+        def run(stmt: Statement) -> Dict[str, Any]:
+            sql, params = (stmt, None) if isinstance(stmt, str) else stmt
+            return self.query(sql, params, account, environment, return_all_rows, timeout, cache_ttl, refresh)
+
+        if not statements:
+            return []
+        workers = min(len(statements), max_workers or self.pool_size)
+        if workers == 1:
+            return [run(s) for s in statements]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(run, statements))
+
+
+def _with_cache_meta(analysis: Any, status: str, key: str, ttl: float, age: float) -> Dict[str, Any]:
+    meta = {'status': status, 'age_seconds': round(age, 1), 'ttl_seconds': ttl, 'key': key[:16]}
+    if isinstance(analysis, dict):
+        return {**analysis, 'cache': meta}
+    return {'cache': meta} if analysis is None else {'gateway': analysis, 'cache': meta}
+
+
+_clients: Dict[Tuple[str, str], GatewayClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(base_url: Optional[str] = None, api_key: Optional[str] = None, **kwargs: Any) -> GatewayClient:
+    """Process-wide shared client per (gateway URL, API key) so every caller reuses one pool."""
+    base = (base_url or os.environ.get('NETSUITE_GATEWAY_URL', DEFAULT_GATEWAY_URL)).rstrip('/')
+    key = os.environ.get('NETSUITE_API_KEY', '') if api_key is None else api_key
+    with _clients_lock:
+        client = _clients.get((base, key))
+        if client is None:
+            client = GatewayClient(base, key, **kwargs)
+            _clients[(base, key)] = client
+        return client
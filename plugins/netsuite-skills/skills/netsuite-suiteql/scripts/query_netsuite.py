@@ -20,49 +20,21 @@ import sys
 import os
 import json
 import urllib.request
-import urllib.error
 from typing import Optional, List, Dict, Any
 
+from netsuite_gateway import (
+    get_client, get_query_cache, resolve_account, resolve_environment, ttl_from_env,
+)
+
 # NetSuite API Gateway endpoint — override with NETSUITE_GATEWAY_URL env var
 _gw_base = os.environ.get('NETSUITE_GATEWAY_URL', 'https://nsapi.twistedx.tech').rstrip('/')
 GATEWAY_URL = f'{_gw_base}/api/suiteapi'
 
-# Account aliases
-ACCOUNT_ALIASES = {
-    'twx': 'twistedx',
-    'twisted': 'twistedx',
-    'twistedx': 'twistedx',
-    'dm': 'dutyman',
-    'duty': 'dutyman',
-    'dutyman': 'dutyman'
-}
-
-# Environment aliases
-ENV_ALIASES = {
-    'prod': 'production',
-    'production': 'production',
-    'sb1': 'sandbox',
-    'sandbox': 'sandbox',
-    'sandbox1': 'sandbox',
-    'sb2': 'sandbox2',
-    'sandbox2': 'sandbox2'
-}
-
 # Default account and environment
 DEFAULT_ACCOUNT = 'twistedx'
 DEFAULT_ENVIRONMENT = 'sandbox2'
 
 
-def resolve_account(account: str) -> str:
-    """Resolve account alias to canonical name."""
-    return ACCOUNT_ALIASES.get(account.lower(), account.lower())
-
-
-def resolve_environment(environment: str) -> str:
-    """Resolve environment alias to canonical name."""
-    return ENV_ALIASES.get(environment.lower(), environment.lower())
-
-
 def list_accounts() -> Dict[str, Any]:
     """
     List available accounts and their environments from the gateway.
@@ -92,7 +64,9 @@ def execute_query(
     params: Optional[List[Any]] = None,
     account: str = DEFAULT_ACCOUNT,
     environment: str = DEFAULT_ENVIRONMENT,
-    return_all_rows: bool = False
+    return_all_rows: bool = False,
+    cache_ttl: Optional[float] = None,
+    refresh: bool = False
 ) -> Dict[str, Any]:
     """
     Execute a SuiteQL query against NetSuite via the API Gateway.
@@ -103,6 +77,8 @@ def execute_query(
         account: Account to query ('twistedx'/'twx' or 'dutyman'/'dm')
         environment: 'prod'/'production', 'sb1'/'sandbox', or 'sb2'/'sandbox2'
         return_all_rows: If True, fetch all rows with pagination
+        cache_ttl: Serve/store the result in the local cache for this many seconds
+        refresh: Bypass a cached result but store the fresh one
 
     Returns:
         Dictionary with:
@@ -111,7 +87,8 @@ def execute_query(
         - account: Resolved account name
         - environment: Resolved environment name
         - authType: Authentication type used (oauth1 or oauth2)
-        - analysis: Execution stats (if return_all_rows=True)
+        - analysis: Execution stats (if return_all_rows=True); analysis['cache']
+          has status/age when cache_ttl is set
         - error: Error message if failed
     """
     # Resolve aliases
@@ -134,83 +111,41 @@ def execute_query(
             'count': 0
         }
 
-    # Build request payload for gateway
-    payload = {
-        'action': 'queryRun',
-        'procedure': 'queryRun',
-        'query': query,
-        'params': params or [],
-        'returnAllRows': return_all_rows,
-        'netsuiteAccount': resolved_account,
-        'netsuiteEnvironment': resolved_env
-    }
-
-    try:
-        # Prepare request to gateway
-        data = json.dumps(payload).encode('utf-8')
-        _api_key = os.environ.get('NETSUITE_API_KEY', '')
-        req = urllib.request.Request(
-            GATEWAY_URL,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                **({'X-API-Key': _api_key} if _api_key else {'Origin': _gw_base}),
-            }
-        )
-
-        # Execute request through gateway
-        with urllib.request.urlopen(req, timeout=120) as response:
-            result = json.loads(response.read().decode('utf-8'))
-
-            # Gateway returns nested format: {success, data: {records}}
-            records = []
-            if result.get('success') and result.get('data'):
-                records = result.get('data', {}).get('records', [])
-
-            return {
-                'records': records,
-                'count': len(records),
-                'account': resolved_account,
-                'environment': resolved_env,
-                'authType': result.get('authType', 'unknown'),
-                'analysis': result.get('analysis'),
-                'error': result.get('error') if not result.get('success') else None
-            }
+    return get_client().query(query, params, resolved_account, resolved_env, return_all_rows,
+                              cache_ttl=cache_ttl, refresh=refresh)
 
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_json = json.loads(error_body)
-            error_msg = error_json.get('error', {}).get('message', error_body)
-        except:
-            error_msg = error_body
 
-        return {
-            'error': f'HTTP {e.code}: {error_msg}',
-            'records': [],
-            'count': 0,
-            'account': resolved_account,
-            'environment': resolved_env
-        }
+def execute_queries(
+    queries: List[Any],
+    account: str = DEFAULT_ACCOUNT,
+    environment: str = DEFAULT_ENVIRONMENT,
+    return_all_rows: bool = False,
+    max_workers: Optional[int] = None,
+    cache_ttl: Optional[float] = None,
+    refresh: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Execute many independent SuiteQL queries concurrently over the pooled gateway client.
 
-    except urllib.error.URLError as e:
-        return {
-            'error': f'Gateway connection error: {str(e.reason)}. Is the gateway running at {GATEWAY_URL}?',
-            'records': [],
-            'count': 0,
-            'account': resolved_account,
-            'environment': resolved_env
-        }
+    Args:
+        queries: Query strings or (query, params) tuples
+        account: Account to query ('twistedx'/'twx' or 'dutyman'/'dm')
+        environment: 'prod'/'production', 'sb1'/'sandbox', or 'sb2'/'sandbox2'
+        return_all_rows: If True, fetch all rows with pagination
+        max_workers: Concurrent requests (default: gateway pool size)
+        cache_ttl: Serve/store each result in the local cache for this many seconds
+        refresh: Bypass cached results but store the fresh ones
 
-    except Exception as e:
-        return {
-            'error': f'Unexpected error: {str(e)}',
-            'records': [],
-            'count': 0,
-            'account': resolved_account,
-            'environment': resolved_env
-        }
+    Returns:
+        One execute_query()-shaped result per query, in input order
+    """
+    resolved_account = resolve_account(account)
+    resolved_env = resolve_environment(environment)
+    if resolved_account not in ['twistedx', 'dutyman'] or resolved_env not in ['production', 'sandbox', 'sandbox2']:
+        invalid = execute_query('', None, account, environment)  # validation error only, nothing is sent
+        return [dict(invalid) for _ in queries]
+    return get_client().query_many(queries, resolved_account, resolved_env, return_all_rows, max_workers,
+                                   cache_ttl=cache_ttl, refresh=refresh)
 
 
 def format_results(results: Dict[str, Any], format_type: str = 'json', show_meta: bool = True) -> str:
@@ -237,7 +172,11 @@ def format_results(results: Dict[str, Any], format_type: str = 'json', show_meta
         account = results.get('account', 'unknown')
         env = results.get('environment', 'unknown')
         auth_type = results.get('authType', 'unknown')
-        meta = f"[{account}/{env}] ({auth_type}) - {count} record(s)\n"
+        meta = f"[{account}/{env}] ({auth_type}) - {count} record(s)"
+        cache = (results.get('analysis') or {}).get('cache')
+        if cache:
+            meta += f" [cache {cache['status']}, age {cache['age_seconds']:.0f}s, ttl {cache['ttl_seconds']:.0f}s]"
+        meta += "\n"
         if format_type == 'table':
             meta += "-" * 60 + "\n"
 
@@ -324,6 +263,21 @@ Options:
   --all-rows             Fetch all rows with automatic pagination
 
   --format <format>      Output format: json, table, csv (default: table)
+                         With --output also jsonl or parquet (default: from extension)
+
+  --output <path>        Stream the result to a file page by page instead of
+                         loading it all ('-' = stdout, csv/jsonl). Query needs ORDER BY.
+  --page-size <n>        Rows per page when streaming (default: 1000, max: 5000)
+  --start-row <n>        Skip the first n rows (resume an interrupted export)
+
+  --cache-ttl <seconds>  Serve this SELECT from the local result cache if it was
+                         fetched within <seconds>; otherwise query and cache it.
+                         NETSUITE_QUERY_CACHE_TTL sets a session-wide default.
+  --no-cache             Ignore the cache (and NETSUITE_QUERY_CACHE_TTL) for this run
+  --refresh              Re-query even if cached, and store the fresh result
+                         (needs --cache-ttl or NETSUITE_QUERY_CACHE_TTL)
+  --clear-cache [TABLE]  Delete cached results (only queries mentioning TABLE if given);
+                         alone, or after a query to clear before running it
 
   --list-accounts        List available accounts and environments
 
@@ -345,6 +299,12 @@ Examples:
   # JSON output for scripting
   python3 query_netsuite.py 'SELECT id FROM customer WHERE ROWNUM <= 3' --format json
 
+  # Stream a large table to disk (CSV / JSONL / Parquet by extension)
+  python3 query_netsuite.py 'SELECT * FROM TransactionLine ORDER BY transaction, id' --output lines.parquet --env prod
+
+  # Reuse a reference lookup for an hour (cache status shown in the header)
+  python3 query_netsuite.py 'SELECT id, name FROM subsidiary' --env prod --cache-ttl 3600
+
   # List available accounts
   python3 query_netsuite.py --list-accounts
 
@@ -424,6 +384,34 @@ def _run_schema_command(argv: List[str]) -> None:
         sys.argv = original_argv
 
 
+def _run_stream_export(query: str, params: Optional[List[Any]], account: str, environment: str,
+                       output_path: str, format_type: str, page_size: Optional[int], start_row: int) -> None:
+    """Handle --output: page through the result and write it incrementally via query_stream.py."""
+    from query_stream import DEFAULT_PAGE_SIZE, export_query
+
+    def progress(rows: int, pages: int) -> None:
+        print(f"\r  {rows:,} rows ({pages} pages)", end='', file=sys.stderr, flush=True)
+
+    print(f"Streaming {resolve_account(account)}/{resolve_environment(environment)} → {output_path}...", file=sys.stderr)
+    summary = export_query(query, output_path, format_type, params, account, environment,
+                           page_size or DEFAULT_PAGE_SIZE, start_row, progress=progress)
+    print(file=sys.stderr)
+    if summary.get('error'):
+        print(f"ERROR: {summary['error']}", file=sys.stderr)
+        if summary.get('partial_path'):
+            print(f"Partial output: {summary['partial_path']} — resume with --start-row {summary['resume_row']}",
+                  file=sys.stderr)
+        sys.exit(1)
+    print(f"Wrote {summary['rows']:,} rows, {len(summary['columns'])} columns ({summary['format']}) "
+          f"in {summary['elapsed_seconds']}s", file=sys.stderr)
+
+
+def _clear_cache(table: Optional[str] = None, out=sys.stdout) -> None:
+    cache = get_query_cache()
+    deleted = cache.invalidate(table=table)
+    print(f"Removed {deleted} cached result(s){f' mentioning {table}' if table else ''} from {cache.path}", file=out)
+
+
 def main():
     """CLI interface for query execution."""
     if len(sys.argv) < 2:
@@ -443,6 +431,11 @@ def main():
             print(json.dumps(accounts_info, indent=2))
         sys.exit(0)
 
+    if sys.argv[1] == '--clear-cache':
+        table = sys.argv[2] if len(sys.argv) > 2 and not sys.argv[2].startswith('-') else None
+        _clear_cache(table)
+        sys.exit(0)
+
     # Check for help
     if sys.argv[1] in ['-h', '--help', 'help']:
         print_usage()
@@ -487,6 +480,14 @@ def main():
     environment = DEFAULT_ENVIRONMENT
     return_all_rows = False
     format_type = 'table'
+    output_path = None
+    page_size = None
+    start_row = 0
+    cache_ttl = ttl_from_env()
+    refresh = False
+    no_cache = False
+    clear_cache = False
+    clear_table = None
 
     # Parse arguments
     i = 2
@@ -507,16 +508,55 @@ def main():
         elif arg == '--format' and i + 1 < len(sys.argv):
             format_type = sys.argv[i + 1]
             i += 2
+        elif arg == '--output' and i + 1 < len(sys.argv):
+            output_path = sys.argv[i + 1]
+            i += 2
+        elif arg == '--page-size' and i + 1 < len(sys.argv):
+            page_size = int(sys.argv[i + 1])
+            i += 2
+        elif arg == '--start-row' and i + 1 < len(sys.argv):
+            start_row = int(sys.argv[i + 1])
+            i += 2
+        elif arg == '--cache-ttl' and i + 1 < len(sys.argv):
+            cache_ttl = float(sys.argv[i + 1])
+            i += 2
+        elif arg == '--no-cache':
+            no_cache = True
+            i += 1
+        elif arg == '--refresh':
+            refresh = True
+            i += 1
+        elif arg == '--clear-cache':
+            clear_cache = True
+            if i + 1 < len(sys.argv) and not sys.argv[i + 1].startswith('-'):
+                clear_table = sys.argv[i + 1]
+                i += 2
+            else:
+                i += 1
         else:
             i += 1
 
+    if refresh and (no_cache or not cache_ttl or cache_ttl <= 0):
+        print("ERROR: --refresh re-fetches a cached result, but caching is off for this run.", file=sys.stderr)
+        print("       Add --cache-ttl <seconds> (or set NETSUITE_QUERY_CACHE_TTL) and drop --no-cache.", file=sys.stderr)
+        sys.exit(2)
+
+    if clear_cache:
+        # Before the query, so the query itself refills the cache; stderr keeps --format json clean
+        _clear_cache(clear_table, out=sys.stderr)
+
+    if output_path:
+        _run_stream_export(query, params, account, environment, output_path, format_type, page_size, start_row)
+        return
+
     # Show what we're querying
     resolved_account = resolve_account(account)
     resolved_env = resolve_environment(environment)
     print(f"Querying {resolved_account}/{resolved_env}...\n")
 
     # Execute query
-    results = execute_query(query, params, account, environment, return_all_rows)
+    results = execute_query(query, params, account, environment, return_all_rows,
+                            cache_ttl=None if no_cache else cache_ttl, refresh=refresh)
 
     # Format and print results
     output = format_results(results, format_type)
@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+NetSuite SuiteQL Streaming Export
+
+Pages through a SuiteQL result with ROWNUM windows instead of asking the
+gateway for every row at once, yields rows as a generator, and writes CSV,
+JSONL or Parquet to disk incrementally. Memory stays bounded by
+page_size * (prefetch + 1) rows no matter how large the table is.
+
+Each page wraps the query as:
+
+  SELECT * FROM (SELECT ROWNUM AS stream_rownum, q.* FROM (<query>) q)
+  WHERE stream_rownum BETWEEN <first> AND <last>
+
+so the query needs a deterministic ORDER BY for pages not to overlap or skip
+rows. The next `prefetch` pages are requested concurrently over the pooled
+gateway client while the current page is being written.
+
+Output files are written to <path>.part and renamed into place when the
+export completes. A failed export leaves the partial output behind; rerunning
+with start_row appends to it (Parquet keeps its JSONL spill for this). SuiteQL omits null columns from a row, so the column set
+can grow mid-stream: CSV starts with the first page's columns and is
+rewritten once with the widened header if new ones appear; Parquet spills
+rows to a JSONL file first and converts it at the end (requires pyarrow).
+
+Usage:
+  from query_stream import iter_rows, export_query
+  for row in iter_rows('SELECT id, tranid FROM transaction ORDER BY id', environment='prod'):
+      ...
+  summary = export_query('SELECT * FROM transactionline ORDER BY transaction, id',
+                         'lines.parquet', environment='prod')
+
+CLI (via query_netsuite.py):
+  python3 query_netsuite.py 'SELECT ... ORDER BY id' --output lines.csv --env prod
+  python3 query_netsuite.py 'SELECT ... ORDER BY id' --output - --format jsonl
+"""
+
+import csv
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from query_netsuite import DEFAULT_ACCOUNT, DEFAULT_ENVIRONMENT, execute_query
+
+DEFAULT_PAGE_SIZE = 1000
+# runSuiteQL returns at most this many rows per request; a larger window comes
+# back short and would be mistaken for the last page
+MAX_PAGE_SIZE = 5000
+DEFAULT_PREFETCH = 2
+STREAM_FORMATS = ('csv', 'jsonl', 'parquet')
+ROWNUM_COLUMN = 'stream_rownum'
+
+_ORDER_BY_RE = re.compile(r'\border\s+by\b', re.IGNORECASE)
+
+
+class StreamError(Exception):
+    """A page failed after the gateway client's retries; rows_done rows were already yielded."""
+
+    def __init__(self, message: str, rows_done: int):
+        super().__init__(message)
+        self.rows_done = rows_done
+
+
+def page_query(query: str, first_row: int, last_row: int) -> str:
+    """Wrap a query in a 1-based inclusive ROWNUM window."""
+    inner = query.strip().rstrip(';')
+    return (f'SELECT * FROM (SELECT ROWNUM AS {ROWNUM_COLUMN}, q.* FROM ({inner}) q) '
+            f'WHERE {ROWNUM_COLUMN} BETWEEN {first_row} AND {last_row}')
+
+
+def infer_format(path: str, format_type: Optional[str] = None) -> str:
+    """Pick the output format from an explicit --format or the file extension (default csv)."""
+    if format_type in STREAM_FORMATS:
+        return format_type
+    ext = os.path.splitext(path)[1].lower().lstrip('.')
+    if ext in ('jsonl', 'ndjson'):
+        return 'jsonl'
+    if ext in ('parquet', 'pq'):
+        return 'parquet'
+    return 'csv'
+
+
+def iter_pages(
+    query: str,
+    params: Optional[List[Any]] = None,
+    account: str = DEFAULT_ACCOUNT,
+    environment: str = DEFAULT_ENVIRONMENT,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    start_row: int = 0,
+    prefetch: int = DEFAULT_PREFETCH
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield successive pages (lists of row dicts, ROWNUM column removed).
+
+    Args:
+        start_row: Rows to skip (resume an interrupted export)
+        prefetch: Pages requested ahead of the consumer (0 = strictly sequential)
+
+    Raises:
+        StreamError: a page failed; rows_done says where to resume
+    """
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f'page_size must be between 1 and {MAX_PAGE_SIZE}')
+    if not _ORDER_BY_RE.search(query):
+        print('Warning: streaming query has no ORDER BY — pages may overlap or skip rows', file=sys.stderr)
+
+    def fetch(page_no: int) -> Dict[str, Any]:
+        first = start_row + page_no * page_size + 1
+        return execute_query(page_query(query, first, first + page_size - 1), params, account, environment)
+
+    rows_done = start_row
+    ahead = max(0, prefetch)
+    with ThreadPoolExecutor(max_workers=ahead + 1) as pool:
+        pending = [pool.submit(fetch, n) for n in range(ahead + 1)]
+        next_page = ahead + 1
+        while pending:
+            result = pending.pop(0).result()
+            if result.get('error'):
+                for f in pending:
+                    f.cancel()
+                raise StreamError(f"Page starting at row {rows_done + 1} failed: {result['error']}", rows_done)
+            records = result.get('records', [])
+            for rec in records:
+                rec.pop(ROWNUM_COLUMN, None)
+            if records:
+                rows_done += len(records)
+                yield records
+            if len(records) < page_size:
+                for f in pending:
+                    f.cancel()
+                return
+            pending.append(pool.submit(fetch, next_page))
+            next_page += 1
+
+
+def iter_rows(query: str, params: Optional[List[Any]] = None, account: str = DEFAULT_ACCOUNT,
+              environment: str = DEFAULT_ENVIRONMENT, page_size: int = DEFAULT_PAGE_SIZE,
+              start_row: int = 0, prefetch: int = DEFAULT_PREFETCH) -> Iterator[Dict[str, Any]]:
+    """Yield result rows one at a time (see iter_pages)."""
+    for page in iter_pages(query, params, account, environment, page_size, start_row, prefetch):
+        yield from page
+
+
+# ---------------------------------------------------------------------------
+# Writers
+# ---------------------------------------------------------------------------
+
+def _cell(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return value
+
+
+class _ColumnTracker:
+    """Columns in first-seen order plus a per-column Parquet type guess."""
+
+    def __init__(self):
+        self.columns: List[str] = []
+        self._seen = set()
+        self.types: Dict[str, str] = {}
+
+    def add(self, row: Dict[str, Any]) -> bool:
+        """Record a row; True when it introduced new columns."""
+        grew = False
+        for col, val in row.items():
+            if col not in self._seen:
+                self._seen.add(col)
+                self.columns.append(col)
+                grew = True
+            if val is None:
+                continue
+            if isinstance(val, bool):
+                kind = 'bool'
+            elif isinstance(val, int):
+                kind = 'int64'
+            elif isinstance(val, float):
+                kind = 'float64'
+            else:
+                kind = 'string'
+            prev = self.types.get(col)
+            if prev is None:
+                self.types[col] = kind
+            elif prev != kind:
+                # bool never mixes with numbers; int widens to float; anything else is string
+                numeric = {prev, kind} == {'int64', 'float64'}
+                self.types[col] = 'float64' if numeric else 'string'
+        return grew
+
+
+class _JsonlWriter:
+    def __init__(self, path: str, resume: bool = False):
+        self.tracker = _ColumnTracker()
+        if resume:
+            # Rebuild the column set (and Parquet types) from the rows already written
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    self.tracker.add(json.loads(line))
+        self.f = open(path, 'a' if resume else 'w', encoding='utf-8')
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        for r in rows:
+            self.tracker.add(r)
+        self.f.writelines(json.dumps(r, default=str) + '\n' for r in rows)
+
+    def close(self) -> None:
+        self.f.close()
+
+    abort = close
+
+
+class _StdoutWriter:
+    """CSV/JSONL to stdout. CSV keeps the first page's header (stdout can't be rewritten)."""
+
+    def __init__(self, fmt: str):
+        self.fmt = fmt
+        self.tracker = _ColumnTracker()
+        self.csv = csv.writer(sys.stdout) if fmt == 'csv' else None
+        self.header: Optional[List[str]] = None
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        for r in rows:
+            self.tracker.add(r)
+        if self.csv is None:
+            sys.stdout.writelines(json.dumps(r, default=str) + '\n' for r in rows)
+        else:
+            if self.header is None:
+                self.header = list(self.tracker.columns)
+                self.csv.writerow(self.header)
+            self.csv.writerows([_cell(r.get(c, '')) for c in self.header] for r in rows)
+        sys.stdout.flush()
+
+    def close(self) -> None:
+        pass
+
+    abort = close
+
+
+class _CsvWriter:
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        self.tracker = _ColumnTracker()
+        self.header: Optional[List[str]] = None
+        if resume:
+            # close() always leaves the full header on the first line, so later
+            # rows keep lining up with it and no second header is written
+            with open(path, encoding='utf-8', newline='') as f:
+                header = next(csv.reader(f), None)
+            if header:
+                self.header = header
+                self.tracker.add(dict.fromkeys(header))
+        self.f = open(path, 'a' if resume else 'w', encoding='utf-8', newline='')
+        self.writer = csv.writer(self.f)
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        for r in rows:
+            self.tracker.add(r)
+        if self.header is None:
+            self.header = list(self.tracker.columns)
+            self.writer.writerow(self.header)
+        # Extra columns are kept (as trailing cells) so close() can re-align them
+        extra = self.tracker.columns[len(self.header):]
+        cols = self.header + extra
+        self.writer.writerows([_cell(r.get(c, '')) for c in cols] for r in rows)
+
+    def close(self) -> None:
+        self.f.close()
+        if self.header is None or len(self.tracker.columns) == len(self.header):
+            return
+        # Columns appeared after the header was written: one sequential rewrite with the full header.
+        # Each row was written with the columns known at that time, always a prefix of the final list.
+        widened = f'{self.path}.widen'
+        width = len(self.tracker.columns)
+        with open(self.path, encoding='utf-8', newline='') as src, \
+                open(widened, 'w', encoding='utf-8', newline='') as dst:
+            reader = csv.reader(src)
+            writer = csv.writer(dst)
+            next(reader, None)
+            writer.writerow(self.tracker.columns)
+            for row in reader:
+                writer.writerow(row + [''] * (width - len(row)))
+        os.replace(widened, self.path)
+
+    abort = close
+
+
+class _ParquetWriter:
+    """Spill rows to JSONL, then convert in row groups once the schema is complete."""
+
+    def __init__(self, path: str, row_group_size: int, resume: bool = False):
+        try:
+            import pyarrow  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise RuntimeError('Parquet output requires pyarrow: pip install pyarrow')
+        self.path = path
+        self.spill_path = f'{path}.spill.jsonl'
+        self.spill = _JsonlWriter(self.spill_path, resume)
+        self.tracker = self.spill.tracker
+        self.row_group_size = row_group_size
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        self.spill.write(rows)
+
+    def abort(self) -> None:
+        """Keep the spill file so a resumed export can append to it."""
+        self.spill.close()
+
+    @staticmethod
+    def _convert(value: Any, kind: str) -> Any:
+        if value is None:
+            return None
+        if kind == 'string':
+            value = _cell(value)
+            return value if isinstance(value, str) else str(value)
+        if kind == 'float64':
+            return float(value)
+        return value
+
+    def close(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.spill.close()
+        cols = self.tracker.columns
+        types = {c: self.tracker.types.get(c, 'string') for c in cols}
+        schema = pa.schema([(c, getattr(pa, 'bool_' if types[c] == 'bool' else types[c])()) for c in cols])
+        try:
+            with pq.ParquetWriter(self.path, schema) as writer, \
+                    open(self.spill_path, encoding='utf-8') as spill:
+                batch: List[Dict[str, Any]] = []
+                for line in spill:
+                    batch.append(json.loads(line))
+                    if len(batch) >= self.row_group_size:
+                        writer.write_table(self._table(pa, schema, batch, types))
+                        batch = []
+                if batch or not cols:
+                    writer.write_table(self._table(pa, schema, batch, types))
+        finally:
+            os.remove(self.spill_path)
+
+    def _table(self, pa, schema, batch: List[Dict[str, Any]], types: Dict[str, str]):
+        return pa.Table.from_pydict(
+            {c: [self._convert(r.get(c), types[c]) for r in batch] for c in schema.names}, schema=schema)
+
+
+def export_query(
+    query: str,
+    output_path: str,
+    format_type: Optional[str] = None,
+    params: Optional[List[Any]] = None,
+    account: str = DEFAULT_ACCOUNT,
+    environment: str = DEFAULT_ENVIRONMENT,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    start_row: int = 0,
+    prefetch: int = DEFAULT_PREFETCH,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> Dict[str, Any]:
+    """
+    Stream a query to a CSV, JSONL or Parquet file.
+
+    Args:
+        output_path: Destination file ('-' writes CSV/JSONL to stdout)
+        format_type: 'csv', 'jsonl' or 'parquet' (default: from the extension)
+        progress: Called as progress(rows_written, pages_written) after each page
+
+    Returns:
+        Dictionary with path, format, rows, pages, columns, elapsed_seconds and
+        error (None on success). On error the partial output is left at
+        partial_path and resume_row tells --start-row where to continue;
+        rows counts only the rows written by this run.
+    """
+    fmt = infer_format(output_path, format_type)
+    to_stdout = output_path == '-'
+    if to_stdout and fmt == 'parquet':
+        return {'path': output_path, 'format': fmt, 'rows': 0, 'error': 'Parquet output needs a file path'}
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        return {'path': output_path, 'format': fmt, 'rows': 0,
+                'error': f'page_size must be between 1 and {MAX_PAGE_SIZE} (runSuiteQL row limit)'}
+
+    part_path = f'{output_path}.part'
+    resume = start_row > 0 and not to_stdout
+    if to_stdout:
+        writer = _StdoutWriter(fmt)
+    else:
+        resume_path = f'{part_path}.spill.jsonl' if fmt == 'parquet' else part_path
+        if resume and not os.path.exists(resume_path):
+            return {'path': output_path, 'format': fmt, 'rows': 0,
+                    'error': f'Cannot resume at row {start_row}: no partial output at {resume_path}'}
+        if fmt == 'parquet':
+            writer = _ParquetWriter(part_path, page_size * 10, resume)
+        elif fmt == 'jsonl':
+            writer = _JsonlWriter(part_path, resume)
+        else:
+            writer = _CsvWriter(part_path, resume)
+
+    started = time.time()
+    rows = pages = 0
+    summary: Dict[str, Any] = {'path': output_path, 'format': fmt}
+    try:
+        for page in iter_pages(query, params, account, environment, page_size, start_row, prefetch):
+            writer.write(page)
+            rows += len(page)
+            pages += 1
+            if progress:
+                progress(rows, pages)
+    except StreamError as e:
+        writer.abort()
+        partial = None if to_stdout else (writer.spill_path if fmt == 'parquet' else part_path)
+        summary.update(rows=rows, pages=pages, columns=writer.tracker.columns, error=str(e),
+                       resume_row=e.rows_done, partial_path=partial,
+                       elapsed_seconds=round(time.time() - started, 2))
+        return summary
+    except BaseException:
+        writer.abort()
+        raise
+
+    writer.close()
+    if not to_stdout:
+        os.replace(part_path, output_path)
+    summary.update(rows=rows, pages=pages, columns=writer.tracker.columns, error=None,
+                   elapsed_seconds=round(time.time() - started, 2))
+    return summary
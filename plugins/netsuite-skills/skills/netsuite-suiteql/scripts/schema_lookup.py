@@ -13,11 +13,15 @@ Falls back gracefully when cache is unavailable:
   L3: Real-time SuiteQL probe (SELECT * WHERE ROWNUM=1 to discover columns)
   L4: Error message with setup instructions
 
+Search is served from a trigram index (schema_index.py) persisted next to the
+cache as search_index.marshal and rebuilt when any schema file changes.
+
 Usage:
   python3 schema_lookup.py describe <TABLE> [--env sb2] [--format table|json|csv]
   python3 schema_lookup.py tables [PATTERN] [--env sb2]
   python3 schema_lookup.py search <PATTERN> [--env sb2]
   python3 schema_lookup.py relationships <TABLE> [--env sb2]
+  python3 schema_lookup.py join-path <TABLE> <TABLE> [TABLE ...] [--env sb2]
   python3 schema_lookup.py refresh-custom [--env sb2] [--account twx]
   python3 schema_lookup.py status [--env sb2] [--account twx]
 """
@@ -32,6 +36,9 @@ from typing import Optional, List, Dict, Any, Tuple
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from schema_index import load_or_build
+
 # Cache root directory
 CACHE_ROOT = os.path.expanduser('~/.cache/netsuite-schema')
 
@@ -438,48 +445,22 @@ def list_tables(pattern: Optional[str], account: str, environment: str, fmt: str
 # ---------------------------------------------------------------------------
 
 def search_schema(pattern: str, account: str, environment: str, fmt: str = 'table') -> str:
-    """Search table names and column names/descriptions for a pattern."""
+    """Search table names and column names/descriptions for a pattern via the trigram index."""
     if not pattern:
         return "ERROR: search requires a pattern argument"
 
     cache_dir = get_cache_dir(account, environment)
-    tables_data = load_cache(cache_dir, 'tables.json', account, environment)
-    cols_data = load_cache(cache_dir, 'columns.json', account, environment)
-    custom_records_data = load_cache(cache_dir, 'custom_records.json', account, environment)
-    custom_fields_data = load_cache(cache_dir, 'custom_fields.json', account, environment)
-
-    table_matches = []
-    col_matches = []
-
-    # Search tables
-    if tables_data:
-        for t in tables_data.get('tables', []):
-            name = t.get('table_name', '')
-            desc = t.get('description', '')
-            if matches_pattern(name, pattern) or matches_pattern(desc, pattern):
-                table_matches.append({'table': name, 'description': desc, 'custom': 'Yes' if t.get('is_custom') else 'No'})
-    elif custom_records_data:
-        for r in custom_records_data.get('custom_record_types', []):
-            name = r.get('scriptid', '')
-            label = r.get('name', '')
-            if matches_pattern(name, pattern) or matches_pattern(label, pattern):
-                table_matches.append({'table': name, 'description': label, 'custom': 'Yes'})
-
-    # Search columns
-    if cols_data:
-        for tname, cols in cols_data.get('columns', {}).items():
-            for c in cols:
-                cname = c.get('column_name', '')
-                desc = c.get('description', '')
-                if matches_pattern(cname, pattern) or matches_pattern(desc, pattern):
-                    col_matches.append({'table': tname, 'column': cname, 'type': c.get('data_type', ''), 'description': desc})
-    elif custom_fields_data:
-        for rec, fields in custom_fields_data.get('custom_fields', {}).items():
-            for f in fields:
-                sid = f.get('scriptid', '')
-                label = f.get('label', '')
-                if matches_pattern(sid, pattern) or matches_pattern(label, pattern):
-                    col_matches.append({'table': rec, 'column': sid, 'type': f.get('field_type', ''), 'description': label})
+    index = load_or_build(cache_dir, lambda fname: load_cache(cache_dir, fname, account, environment))
+    tables_found, cols_found = index.search(pattern)
+
+    table_matches = [
+        {'table': m['table'], 'description': m['description'], 'custom': 'Yes' if m['custom'] else 'No'}
+        for m in tables_found
+    ]
+    col_matches = [
+        {'table': m['table'], 'column': m['column'], 'type': m['type'], 'description': m['description']}
+        for m in cols_found
+    ]
 
     total = len(table_matches) + len(col_matches)
     header = f"[{account}/{environment}] Search results for \"{pattern}\" ({total} result{'s' if total != 1 else ''})\n"
@@ -568,6 +549,51 @@ def show_relationships(table_name: str, account: str, environment: str, fmt: str
     return '\n'.join(lines)
 
 
+# ---------------------------------------------------------------------------
+# Join path planning
+# ---------------------------------------------------------------------------
+
+def plan_joins(tables: List[str], account: str, environment: str, fmt: str = 'table',
+               max_paths: int = 3) -> str:
+    """Shortest FK join chain connecting two or more tables, with exact ON clauses."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    from schema_graph import FkGraph
+
+    cache_dir = get_cache_dir(account, environment)
+    fkeys_data = load_cache(cache_dir, 'fkeys.json', account, environment)
+    if not fkeys_data:
+        return (f"No FK cache found for {account}/{environment}.\n"
+                f"Run: python3 schema_refresh.py --account {account} --env {environment}")
+
+    plan = FkGraph.from_fkeys(fkeys_data).plan(tables, max_paths=max_paths)
+    refreshed = fkeys_data.get('_refreshed_at', 'unknown')[:10]
+    header = f"[{account}/{environment}] Join plan: {' + '.join(tables)}\nSource: ODBC cache ({refreshed})\n"
+
+    if fmt == 'json':
+        return header + json.dumps(plan, indent=2)
+
+    lines = [header]
+    if plan['unknown']:
+        lines.append(f"Unknown tables (not in FK cache): {', '.join(plan['unknown'])}")
+    if plan['unreachable']:
+        lines.append(f"No join path found to: {', '.join(plan['unreachable'])}")
+    if plan['steps']:
+        rows = [[s['from'], s['to'], s['on'], s['cardinality']] for s in plan['steps']]
+        lines.append(format_table_rows(['From', 'Join', 'ON', 'Cardinality'], rows, max_col=80))
+        lines.append('')
+        lines.append(plan['sql'])
+    for n, alt in enumerate(plan['alternatives'], 1):
+        lines.append(f"\nAlternative {n}:")
+        for s in alt:
+            lines.append(f"  INNER JOIN {s['to']} ON {s['on']}  ({s['cardinality']})")
+    if not plan['steps'] and not plan['unknown'] and not plan['unreachable']:
+        lines.append("Nothing to join.")
+
+    return '\n'.join(lines)
+
+
 # ---------------------------------------------------------------------------
 # Refresh Custom
 # ---------------------------------------------------------------------------
@@ -784,11 +810,13 @@ def parse_args(argv: List[str]) -> Dict[str, Any]:
     args = {
         'subcommand': None,
         'target': None,
+        'targets': [],
         'pattern': None,
         'account': DEFAULT_ACCOUNT,
         'environment': DEFAULT_ENVIRONMENT,
         'format': 'table',
         'upload': False,
+        'max_paths': 3,
         'error': None
     }
 
@@ -802,6 +830,7 @@ def parse_args(argv: List[str]) -> Dict[str, Any]:
     i = 2
     if i < len(argv) and not argv[i].startswith('--'):
         args['target'] = argv[i]
+        args['targets'].append(argv[i])
         i += 1
 
     # Named options
@@ -819,6 +848,17 @@ def parse_args(argv: List[str]) -> Dict[str, Any]:
         elif arg == '--upload':
             args['upload'] = True
             i += 1
+        elif arg == '--paths' and i + 1 < len(argv):
+            value = argv[i + 1]
+            if not value.isdigit() or int(value) < 1:
+                args['error'] = f'--paths must be a positive integer (got {value!r})'
+                return args
+            args['max_paths'] = int(value)
+            i += 2
+        elif not arg.startswith('--'):
+            # Extra positionals (join-path takes several table names)
+            args['targets'].append(arg)
+            i += 1
         else:
             i += 1
 
@@ -833,6 +873,7 @@ Usage:
   python3 schema_lookup.py tables [PATTERN] [options]
   python3 schema_lookup.py search <PATTERN> [options]
   python3 schema_lookup.py relationships <TABLE> [options]
+  python3 schema_lookup.py join-path <TABLE> <TABLE> [TABLE ...] [options]
   python3 schema_lookup.py sync [options]
   python3 schema_lookup.py refresh-custom [options]
   python3 schema_lookup.py status [options]
@@ -842,12 +883,14 @@ Options:
   --env <prod|sb1|sb2>          Environment (default: sandbox2)
   --format <table|json|csv>     Output format (default: table)
   --upload                      After refresh-custom, upload results to gateway
+  --paths <N>                   join-path: alternative chains to show for two tables (default: 3)
 
 Subcommands:
   describe <TABLE>      Show all columns, types, FKs for a table
   tables [PATTERN]      List tables (glob pattern optional, e.g. "custom*")
   search <PATTERN>      Search table names and column names
   relationships <TABLE> Show FK graph for a table
+  join-path <TABLES...> Shortest FK join chain (exact ON clauses) connecting the tables
   sync                  Pull all schema resources from gateway into local cache (first-time setup)
   refresh-custom        Pull CustomRecordType + CustomField from gateway SuiteQL
   status                Show cache age and record counts
@@ -858,6 +901,7 @@ Examples:
   python3 schema_lookup.py tables "custom*" --env sb2
   python3 schema_lookup.py search "shipping" --env sb2
   python3 schema_lookup.py relationships Transaction --env sb2
+  python3 schema_lookup.py join-path Customer TransactionLine Item --env sb2
   python3 schema_lookup.py refresh-custom --account twx --env sb2 --upload
   python3 schema_lookup.py status
 """
@@ -870,6 +914,8 @@ def main():
     fmt = args['format']
 
     if args['error'] or args['subcommand'] in (None, 'help', '--help', '-h'):
+        if args['error']:
+            print(f"ERROR: {args['error']}")
         print(USAGE)
         sys.exit(0 if not args['error'] else 1)
 
@@ -909,6 +955,12 @@ def main():
             sys.exit(1)
         print(show_relationships(target, account, environment, fmt))
 
+    elif sub == 'join-path':
+        if len(args['targets']) < 2:
+            print("ERROR: join-path requires at least two table names\nUsage: python3 schema_lookup.py join-path <TABLE> <TABLE> [TABLE ...]")
+            sys.exit(1)
+        print(plan_joins(args['targets'], account, environment, fmt, max_paths=args['max_paths']))
+
     elif sub == 'refresh-custom':
         result = refresh_custom(account, environment, upload=upload)
         print(result)
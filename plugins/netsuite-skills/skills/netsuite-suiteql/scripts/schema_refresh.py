@@ -17,23 +17,44 @@ Set NETSUITE_GATEWAY_URL to override (default: https://nsapi.twistedx.tech).
 
 Cache location: ~/.cache/netsuite-schema/{account}/{environment}/
 
+Rows are streamed with fetchmany() and written as compact JSON straight to
+<file>.part (renamed into place when complete), so OA_COLUMNS never sits in
+memory as one list. Several account/environment DSNs are refreshed at once,
+each on its own connection (--parallel, default 4).
+
+Each refresh records a digest per table in schema_digests.json and writes
+schema_diff.json listing the tables added, removed and changed since the
+previous refresh, per resource (tables, columns, fkeys), so downstream
+caches can update only what moved.
+
 Usage:
   python3 schema_refresh.py [--account twx] [--env sb2]
-  python3 schema_refresh.py --all-accounts --all-environments
+  python3 schema_refresh.py --all-accounts --all-environments [--parallel 4]
   python3 schema_refresh.py --status
 """
 
 import sys
 import os
 import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterable
 from urllib.request import urlopen, Request
 from urllib.error import URLError
 
 # Cache root
 CACHE_ROOT = os.path.expanduser('~/.cache/netsuite-schema')
 
+# Rows per fetchmany() round trip (OA_COLUMNS is ~19k rows)
+FETCH_BATCH = 2000
+
+# Account/environment DSNs refreshed concurrently (override with --parallel)
+DEFAULT_PARALLEL = 4
+
+DIGESTS_FILE = 'schema_digests.json'
+DIFF_FILE = 'schema_diff.json'
+
 # Gateway URL (override via env var)
 GATEWAY_URL = os.environ.get('NETSUITE_GATEWAY_URL', 'https://nsapi.twistedx.tech').rstrip('/')
 
@@ -141,27 +162,105 @@ def get_cache_dir(account: str, environment: str) -> str:
     return os.path.join(CACHE_ROOT, account, environment)
 
 
-def save_cache(cache_dir: str, filename: str, data: Dict[str, Any]) -> None:
+def save_cache(cache_dir: str, filename: str, data: Dict[str, Any], log: Callable[[str], None] = print) -> None:
     os.makedirs(cache_dir, exist_ok=True)
     path = os.path.join(cache_dir, filename)
     with open(path, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2)
-    print(f"    Saved {path} ({os.path.getsize(path) // 1024}KB)")
+    log(f"    Saved {path} ({os.path.getsize(path) // 1024}KB)")
+
 
+def _compact(obj: Any) -> str:
+    return json.dumps(obj, separators=(',', ':'))
 
-def upload_schema(account: str, environment: str, resource: str, data: Dict[str, Any]) -> bool:
+
+def _digest(obj: Any) -> str:
+    return hashlib.sha1(_compact(obj).encode('utf-8')).hexdigest()[:16]
+
+
+class CacheFileWriter:
     """
-    Upload a schema blob to the gateway's schema cache endpoint.
-    Requires SCHEMA_ADMIN_TOKEN env var. Logs warnings on failure; does not raise.
-    Returns True on success.
+    Streams one schema cache file as compact JSON:
+    {<header keys>, <body_key>: [...] or {table: [...]}, "_record_count": N}
+
+    Output goes to <file>.part and is renamed over the old file by close(), so
+    readers never see a half-written cache. A digest of every table's entry is
+    kept for the refresh diff.
     """
+
+    def __init__(self, cache_dir: str, filename: str, header: Dict[str, Any],
+                 body_key: str, grouped: bool = False):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, filename)
+        self._tmp = self.path + '.part'
+        self._grouped = grouped
+        self._first = True
+        self.count = 0
+        self.digests: Dict[str, str] = {}
+        self._f = open(self._tmp, 'w', encoding='utf-8')
+        self._f.write('{' + ''.join(f'{_compact(k)}:{_compact(v)},' for k, v in header.items()))
+        self._f.write(_compact(body_key) + (':{' if grouped else ':['))
+
+    def _sep(self) -> None:
+        if not self._first:
+            self._f.write(',')
+        self._first = False
+
+    def add(self, name: str, item: Dict[str, Any]) -> None:
+        """Append one record to a list body; name is the table it describes."""
+        self._sep()
+        self._f.write(_compact(item))
+        self.digests[name] = _digest(item)
+        self.count += 1
+
+    def add_group(self, name: str, items: List[Dict[str, Any]]) -> None:
+        """Write one table's records to a table-keyed body."""
+        self._sep()
+        self._f.write(f'{_compact(name)}:{_compact(items)}')
+        self.digests[name] = _digest(items)
+        self.count += len(items)
+
+    def close(self) -> str:
+        self._f.write(('}' if self._grouped else ']') + f',"_record_count":{self.count}}}')
+        self._f.close()
+        os.replace(self._tmp, self.path)
+        return self.path
+
+    def abort(self) -> None:
+        self._f.close()
+        try:
+            os.remove(self._tmp)
+        except OSError:
+            pass
+
+
+def _iter_rows(cursor: Any, sql: str) -> Iterable[Any]:
+    """Execute sql and yield rows FETCH_BATCH at a time."""
+    cursor.execute(sql)
+    while True:
+        rows = cursor.fetchmany(FETCH_BATCH)
+        if not rows:
+            return
+        yield from rows
+
+
+def diff_digests(old: Dict[str, str], new: Dict[str, str]) -> Dict[str, List[str]]:
+    """Tables added, removed and changed between two {table: digest} maps."""
+    return {
+        'added': sorted(new.keys() - old.keys()),
+        'removed': sorted(old.keys() - new.keys()),
+        'changed': sorted(t for t in new.keys() & old.keys() if new[t] != old[t]),
+    }
+
+
+def _post_schema(account: str, environment: str, resource: str, payload: bytes,
+                 log: Callable[[str], None] = print) -> bool:
     token = os.environ.get('SCHEMA_ADMIN_TOKEN', '')
     if not token:
-        print(f"    SKIP upload (SCHEMA_ADMIN_TOKEN not set)")
+        log(f"    SKIP upload (SCHEMA_ADMIN_TOKEN not set)")
         return False
 
     url = f"{GATEWAY_URL}/api/common/schema/{account}/{environment}/{resource}"
-    payload = json.dumps(data).encode('utf-8')
     req = Request(url, data=payload, method='POST', headers={
         'Content-Type': 'application/json',
         'X-Schema-Admin-Token': token,
@@ -169,13 +268,30 @@ def upload_schema(account: str, environment: str, resource: str, data: Dict[str,
     try:
         with urlopen(req, timeout=60) as resp:
             status = resp.getcode()
-        print(f"    Uploaded {resource} → gateway ({status})")
+        log(f"    Uploaded {resource} → gateway ({status})")
         return True
     except Exception as e:
-        print(f"    WARN: Upload {resource} failed: {e}")
+        log(f"    WARN: Upload {resource} failed: {e}")
         return False
 
 
+def upload_schema(account: str, environment: str, resource: str, data: Dict[str, Any],
+                  log: Callable[[str], None] = print) -> bool:
+    """
+    Upload a schema blob to the gateway's schema cache endpoint.
+    Requires SCHEMA_ADMIN_TOKEN env var. Logs warnings on failure; does not raise.
+    Returns True on success.
+    """
+    return _post_schema(account, environment, resource, json.dumps(data).encode('utf-8'), log)
+
+
+def upload_schema_file(account: str, environment: str, resource: str, path: str,
+                       log: Callable[[str], None] = print) -> bool:
+    """Upload a cache file as written (already compact JSON) without re-parsing it."""
+    with open(path, 'rb') as f:
+        return _post_schema(account, environment, resource, f.read(), log)
+
+
 def load_cache(cache_dir: str, filename: str) -> Optional[Dict[str, Any]]:
     path = os.path.join(cache_dir, filename)
     if not os.path.exists(path):
@@ -239,15 +355,127 @@ def get_odbc_credentials(account: str, environment: str) -> Tuple[str, str]:
     return user, password
 
 
+def _write_tables(cursor: Any, cache_dir: str, header: Dict[str, Any]) -> CacheFileWriter:
+    writer = CacheFileWriter(cache_dir, 'tables.json', header, 'tables')
+    try:
+        for row in _iter_rows(cursor, """
+            SELECT table_name, table_type, table_owner, oa_userdata, remarks
+            FROM oa_tables
+            ORDER BY table_name
+        """):
+            ud = parse_oa_userdata(row.oa_userdata)
+            tname = row.table_name or ''
+            writer.add(tname, {
+                'table_name': tname,
+                'table_type': row.table_type or '',
+                'table_owner': row.table_owner or '',
+                'is_custom': ud['is_custom'],
+                'is_hidden': ud['is_hidden'],
+                'has_last_modified': ud['has_last_modified'],
+                'has_hard_delete': ud['has_hard_delete'],
+                'required_features': ud['required_features'],
+                'description': row.remarks or ''
+            })
+        writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+    return writer
+
+
+def _write_columns(cursor: Any, cache_dir: str, header: Dict[str, Any]) -> CacheFileWriter:
+    """Rows arrive ordered by table, so each table's columns are written as soon as the next table starts."""
+    writer = CacheFileWriter(cache_dir, 'columns.json', header, 'columns', grouped=True)
+    try:
+        current: Optional[str] = None
+        group: List[Dict[str, Any]] = []
+        for row in _iter_rows(cursor, """
+            SELECT table_name, column_name, data_type, type_name,
+                   oa_length, oa_precision, oa_scale, remarks
+            FROM oa_columns
+            ORDER BY table_name, column_name
+        """):
+            tname = row.table_name or ''
+            if tname != current:
+                if current is not None:
+                    writer.add_group(current, group)
+                current, group = tname, []
+            group.append({
+                'column_name': row.column_name or '',
+                'data_type': _odbc_type_name(row.data_type),
+                'type_name': row.type_name or '',
+                'length': row.oa_length,
+                'precision': row.oa_precision,
+                'scale': row.oa_scale,
+                'description': row.remarks or ''
+            })
+        if current is not None:
+            writer.add_group(current, group)
+        writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+    return writer
+
+
+def _write_fkeys(cursor: Any, cache_dir: str, header: Dict[str, Any]) -> Tuple[str, int, int, Dict[str, str]]:
+    """OA_FKEYS is small and split into two lists, so it is collected before writing."""
+    foreign_keys = []
+    primary_keys = []
+    by_table: Dict[str, List[Dict[str, Any]]] = {}
+    for row in _iter_rows(cursor, """
+        SELECT pktable_name, pkcolumn_name, fktable_name, fkcolumn_name,
+               key_seq, fk_name, pk_name
+        FROM oa_fkeys
+    """):
+        if row.fktable_name:
+            entry = {
+                'pk_table': row.pktable_name or '',
+                'pk_column': row.pkcolumn_name or '',
+                'fk_table': row.fktable_name or '',
+                'fk_column': row.fkcolumn_name or '',
+                'key_seq': row.key_seq,
+                'fk_name': row.fk_name or '',
+                'pk_name': row.pk_name or ''
+            }
+            foreign_keys.append(entry)
+            by_table.setdefault(entry['fk_table'], []).append(entry)
+        else:
+            entry = {
+                'table_name': row.pktable_name or '',
+                'column_name': row.pkcolumn_name or '',
+                'pk_name': row.pk_name or '',
+                'key_seq': row.key_seq
+            }
+            primary_keys.append(entry)
+            by_table.setdefault(entry['table_name'], []).append(entry)
+
+    payload = dict(header)
+    payload['_record_count'] = len(foreign_keys) + len(primary_keys)
+    payload['foreign_keys'] = foreign_keys
+    payload['primary_keys'] = primary_keys
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, 'fkeys.json')
+    with open(path + '.part', 'w', encoding='utf-8') as f:
+        f.write(_compact(payload))
+    os.replace(path + '.part', path)
+
+    # Row order from OA_FKEYS is not guaranteed; digest each table's keys in a stable order
+    digests = {t: _digest(sorted(entries, key=_compact)) for t, entries in by_table.items()}
+    return path, len(foreign_keys), len(primary_keys), digests
+
+
 def refresh_account_environment(account: str, environment: str,
                                  user: str = '', password: str = '',
                                  tables_only: bool = False,
                                  columns_only: bool = False,
                                  fkeys_only: bool = False,
-                                 upload: bool = False) -> Dict[str, Any]:
+                                 upload: bool = False,
+                                 log: Callable[[str], None] = print) -> Dict[str, Any]:
     """
     Connect to NetSuite via ODBC and refresh schema cache for one account/environment.
-    Returns stats dict.
+    Safe to run for several account/environments at once (one connection each).
+    Returns stats dict, including a per-resource diff against the previous refresh.
     """
     try:
         import pyodbc
@@ -260,154 +488,94 @@ def refresh_account_environment(account: str, environment: str,
 
     cache_dir = get_cache_dir(account, environment)
     ts = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    header = {
+        '_source': 'odbc',
+        '_refreshed_at': ts,
+        '_account': account,
+        '_environment': environment,
+    }
 
-    print(f"\n  Connecting to DSN: {dsn}")
+    log(f"\n  Connecting to DSN: {dsn}")
     try:
         conn = pyodbc.connect(f"DSN={dsn};UID={user};PWD={password}", timeout=30)
     except pyodbc.Error as e:
         return {'error': f"ODBC connection failed for {dsn}: {e}\nVerify DSN in ~/.odbc.ini and credentials."}
 
     cursor = conn.cursor()
-    stats = {'account': account, 'environment': environment, 'dsn': dsn}
+    stats: Dict[str, Any] = {'account': account, 'environment': environment, 'dsn': dsn}
+    digests: Dict[str, Dict[str, str]] = {}
+    written: Dict[str, str] = {}
+
+    def saved(path: str) -> None:
+        log(f"    Saved {path} ({os.path.getsize(path) // 1024}KB)")
 
     try:
         # ---------------------------------------------------------------
         # OA_TABLES
         # ---------------------------------------------------------------
         if not columns_only and not fkeys_only:
-            print("    Querying OA_TABLES...")
-            cursor.execute("""
-                SELECT table_name, table_type, table_owner, oa_userdata, remarks
-                FROM oa_tables
-                ORDER BY table_name
-            """)
-            tables = []
-            for row in cursor.fetchall():
-                ud = parse_oa_userdata(row.oa_userdata)
-                tables.append({
-                    'table_name': row.table_name or '',
-                    'table_type': row.table_type or '',
-                    'table_owner': row.table_owner or '',
-                    'is_custom': ud['is_custom'],
-                    'is_hidden': ud['is_hidden'],
-                    'has_last_modified': ud['has_last_modified'],
-                    'has_hard_delete': ud['has_hard_delete'],
-                    'required_features': ud['required_features'],
-                    'description': row.remarks or ''
-                })
-
-            tables_payload = {
-                '_source': 'odbc',
-                '_refreshed_at': ts,
-                '_account': account,
-                '_environment': environment,
-                '_record_count': len(tables),
-                'tables': tables
-            }
-            save_cache(cache_dir, 'tables.json', tables_payload)
-            if upload:
-                upload_schema(account, environment, 'tables', tables_payload)
-            stats['tables_count'] = len(tables)
-            print(f"    {len(tables)} tables found")
+            log("    Querying OA_TABLES...")
+            writer = _write_tables(cursor, cache_dir, header)
+            saved(writer.path)
+            written['tables'] = writer.path
+            digests['tables'] = writer.digests
+            stats['tables_count'] = writer.count
+            log(f"    {writer.count} tables found")
 
         # ---------------------------------------------------------------
         # OA_COLUMNS
         # ---------------------------------------------------------------
         if not tables_only and not fkeys_only:
-            print("    Querying OA_COLUMNS (may take 30-90 seconds)...")
-            cursor.execute("""
-                SELECT table_name, column_name, data_type, type_name,
-                       oa_length, oa_precision, oa_scale, remarks
-                FROM oa_columns
-                ORDER BY table_name, column_name
-            """)
-
-            columns_grouped: Dict[str, List[Dict]] = {}
-            total_cols = 0
-            for row in cursor.fetchall():
-                tname = row.table_name or ''
-                if tname not in columns_grouped:
-                    columns_grouped[tname] = []
-                columns_grouped[tname].append({
-                    'column_name': row.column_name or '',
-                    'data_type': _odbc_type_name(row.data_type),
-                    'type_name': row.type_name or '',
-                    'length': row.oa_length,
-                    'precision': row.oa_precision,
-                    'scale': row.oa_scale,
-                    'description': row.remarks or ''
-                })
-                total_cols += 1
-
-            columns_payload = {
-                '_source': 'odbc',
-                '_refreshed_at': ts,
-                '_account': account,
-                '_environment': environment,
-                '_record_count': total_cols,
-                'columns': columns_grouped
-            }
-            save_cache(cache_dir, 'columns.json', columns_payload)
-            if upload:
-                upload_schema(account, environment, 'columns', columns_payload)
-            stats['columns_count'] = total_cols
-            print(f"    {total_cols} columns across {len(columns_grouped)} tables")
+            log("    Querying OA_COLUMNS (may take 30-90 seconds)...")
+            writer = _write_columns(cursor, cache_dir, header)
+            saved(writer.path)
+            written['columns'] = writer.path
+            digests['columns'] = writer.digests
+            stats['columns_count'] = writer.count
+            log(f"    {writer.count} columns across {len(writer.digests)} tables")
 
         # ---------------------------------------------------------------
         # OA_FKEYS
         # ---------------------------------------------------------------
         if not tables_only and not columns_only:
-            print("    Querying OA_FKEYS...")
+            log("    Querying OA_FKEYS...")
             try:
-                cursor.execute("""
-                    SELECT pktable_name, pkcolumn_name, fktable_name, fkcolumn_name,
-                           key_seq, fk_name, pk_name
-                    FROM oa_fkeys
-                """)
-                foreign_keys = []
-                primary_keys = []
-                for row in cursor.fetchall():
-                    if row.fktable_name:
-                        foreign_keys.append({
-                            'pk_table': row.pktable_name or '',
-                            'pk_column': row.pkcolumn_name or '',
-                            'fk_table': row.fktable_name or '',
-                            'fk_column': row.fkcolumn_name or '',
-                            'key_seq': row.key_seq,
-                            'fk_name': row.fk_name or '',
-                            'pk_name': row.pk_name or ''
-                        })
-                    else:
-                        primary_keys.append({
-                            'table_name': row.pktable_name or '',
-                            'column_name': row.pkcolumn_name or '',
-                            'pk_name': row.pk_name or '',
-                            'key_seq': row.key_seq
-                        })
-
-                fkeys_payload = {
-                    '_source': 'odbc',
-                    '_refreshed_at': ts,
-                    '_account': account,
-                    '_environment': environment,
-                    '_record_count': len(foreign_keys) + len(primary_keys),
-                    'foreign_keys': foreign_keys,
-                    'primary_keys': primary_keys
-                }
-                save_cache(cache_dir, 'fkeys.json', fkeys_payload)
-                if upload:
-                    upload_schema(account, environment, 'fkeys', fkeys_payload)
-                stats['fkeys_count'] = len(foreign_keys)
-                stats['primary_keys_count'] = len(primary_keys)
-                print(f"    {len(foreign_keys)} foreign keys, {len(primary_keys)} primary keys")
+                path, fk_count, pk_count, digests['fkeys'] = _write_fkeys(cursor, cache_dir, header)
+                saved(path)
+                written['fkeys'] = path
+                stats['fkeys_count'] = fk_count
+                stats['primary_keys_count'] = pk_count
+                log(f"    {fk_count} foreign keys, {pk_count} primary keys")
             except pyodbc.Error as e:
-                print(f"    WARNING: OA_FKEYS query failed: {e}")
+                log(f"    WARNING: OA_FKEYS query failed: {e}")
                 stats['fkeys_error'] = str(e)
 
     finally:
         cursor.close()
         conn.close()
 
+    if upload:
+        for resource, path in written.items():
+            upload_schema_file(account, environment, resource, path, log)
+
+    # Per-table diff against the previous refresh; resources not refreshed keep their digests
+    previous = load_cache(cache_dir, DIGESTS_FILE) or {}
+    previous_digests = previous.get('resources', {})
+    diff = {resource: diff_digests(previous_digests.get(resource, {}), new)
+            for resource, new in digests.items()}
+    save_cache(cache_dir, DIFF_FILE, {
+        '_refreshed_at': ts,
+        '_previous_refresh': previous.get('_refreshed_at'),
+        '_account': account,
+        '_environment': environment,
+        'resources': diff,
+    }, log)
+    with open(os.path.join(cache_dir, DIGESTS_FILE), 'w', encoding='utf-8') as f:
+        f.write(_compact({'_refreshed_at': ts, 'resources': {**previous_digests, **digests}}))
+    stats['diff'] = {resource: {k: len(v) for k, v in d.items()} for resource, d in diff.items()}
+    for resource, counts in stats['diff'].items():
+        log(f"    {resource}: +{counts['added']} -{counts['removed']} ~{counts['changed']} tables")
+
     # Update metadata
     metadata = load_cache(cache_dir, '_metadata.json') or {'account': account, 'environment': environment}
     odbc_refresh = {'timestamp': ts}
@@ -417,8 +585,9 @@ def refresh_account_environment(account: str, environment: str,
         odbc_refresh['columns_count'] = stats['columns_count']
     if 'fkeys_count' in stats:
         odbc_refresh['fkeys_count'] = stats['fkeys_count']
+    odbc_refresh['diff'] = stats['diff']
     metadata['odbc_refresh'] = odbc_refresh
-    save_cache(cache_dir, '_metadata.json', metadata)
+    save_cache(cache_dir, '_metadata.json', metadata, log)
 
     stats['success'] = True
     return stats
@@ -486,6 +655,7 @@ def main():
     default_environment = get_default_environment()
     account = default_account
     environment = default_environment
+    parallel = DEFAULT_PARALLEL
 
     i = 0
     while i < len(argv):
@@ -495,6 +665,9 @@ def main():
         elif argv[i] == '--env' and i + 1 < len(argv):
             environment = resolve_environment(argv[i + 1])
             i += 2
+        elif argv[i] == '--parallel' and i + 1 < len(argv):
+            parallel = max(1, int(argv[i + 1]))
+            i += 2
         else:
             i += 1
 
@@ -542,25 +715,44 @@ def main():
         print(f"Gateway URL: {GATEWAY_URL}")
         sys.exit(1)
 
-    print(f"Refreshing {len(pairs)} account/environment combination(s)...")
+    workers = min(parallel, len(pairs))
+    print(f"Refreshing {len(pairs)} account/environment combination(s)"
+          f"{f' ({workers} at a time)' if workers > 1 else ''}...")
 
-    errors = []
-    for acct, env in pairs:
-        print(f"\n{'='*60}")
-        print(f"Account: {acct}, Environment: {env}")
-        print('='*60)
-        stats = refresh_account_environment(
-            acct, env, user=user, password=password,
-            tables_only=tables_only,
-            columns_only=columns_only,
-            fkeys_only=fkeys_only,
-            upload=upload
-        )
-        if stats.get('error'):
-            print(f"  ERROR: {stats['error']}")
-            errors.append(f"{acct}/{env}: {stats['error']}")
+    def run(acct: str, env: str) -> Dict[str, Any]:
+        if workers > 1:
+            # Interleaved output from concurrent refreshes: one prefixed line per message
+            def log(msg: str) -> None:
+                print(f"[{acct}/{env}] {msg.strip()}", flush=True)
         else:
-            print(f"  ✓ Success")
+            log = print
+            print(f"\n{'='*60}")
+            print(f"Account: {acct}, Environment: {env}")
+            print('='*60)
+        try:
+            return refresh_account_environment(
+                acct, env, user=user, password=password,
+                tables_only=tables_only,
+                columns_only=columns_only,
+                fkeys_only=fkeys_only,
+                upload=upload,
+                log=log
+            )
+        except Exception as e:
+            return {'error': f"{type(e).__name__}: {e}"}
+
+    errors = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run, acct, env): (acct, env) for acct, env in pairs}
+        for future in as_completed(futures):
+            acct, env = futures[future]
+            stats = future.result()
+            prefix = f"[{acct}/{env}] " if workers > 1 else ''
+            if stats.get('error'):
+                print(f"  {prefix}ERROR: {stats['error']}")
+                errors.append(f"{acct}/{env}: {stats['error']}")
+            else:
+                print(f"  {prefix}✓ Success")
 
     print(f"\n{'='*60}")
     print(f"Refresh complete: {len(pairs) - len(errors)}/{len(pairs)} succeeded")
@@ -0,0 +1,80 @@
+"""Tests for query_stream.py"""
+
+import csv
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import query_stream
+from query_stream import export_query
+
+WINDOW_RE = re.compile(r"BETWEEN (\d+) AND (\d+)")
+
+
+def _rows(n):
+    # Column "memo" only shows up late, like a SuiteQL column that is null early on
+    return [{"id": i, "tranid": f"T{i}", **({"memo": f"m{i}"} if i >= 7 else {})} for i in range(1, n + 1)]
+
+
+@pytest.fixture
+def fake_gateway(monkeypatch):
+    state = {"rows": _rows(12), "fail_from": None}
+
+    def execute_query(query, params, account, environment):
+        first, last = map(int, WINDOW_RE.search(query).groups())
+        if state["fail_from"] is not None and first >= state["fail_from"]:
+            return {"error": "HTTP 503"}
+        return {"records": [dict(r, stream_rownum=r["id"]) for r in state["rows"][first - 1:last]]}
+
+    monkeypatch.setattr(query_stream, "execute_query", execute_query)
+    return state
+
+
+@pytest.mark.parametrize("ext", ["csv", "jsonl"])
+def test_resume_appends_to_partial_output(tmp_path, fake_gateway, ext):
+    out = tmp_path / f"lines.{ext}"
+    fake_gateway["fail_from"] = 9
+    first = export_query("SELECT id FROM t ORDER BY id", str(out), page_size=4, prefetch=0)
+    assert first["error"] and first["resume_row"] == 8
+    assert first["partial_path"] == f"{out}.part"
+
+    fake_gateway["fail_from"] = None
+    second = export_query("SELECT id FROM t ORDER BY id", str(out), page_size=4,
+                          start_row=first["resume_row"], prefetch=0)
+    assert second["error"] is None and second["rows"] == 4
+    assert not Path(f"{out}.part").exists()
+
+    if ext == "csv":
+        with open(out, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert list(rows[0]) == ["id", "tranid", "memo"]
+        assert rows[0]["memo"] == "" and rows[11]["memo"] == "m12"
+    else:
+        rows = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [int(r["id"]) for r in rows] == list(range(1, 13))
+
+
+def test_resume_without_partial_output_is_an_error(tmp_path, fake_gateway):
+    out = tmp_path / "lines.csv"
+    summary = export_query("SELECT id FROM t ORDER BY id", str(out), start_row=8)
+    assert "no partial output" in summary["error"]
+    assert not out.exists()
+
+
+def test_page_query_qualifies_star_with_alias():
+    sql = query_stream.page_query("SELECT id FROM t ORDER BY id;", 1001, 2000)
+    assert sql == ("SELECT * FROM (SELECT ROWNUM AS stream_rownum, q.* FROM (SELECT id FROM t ORDER BY id) q) "
+                   "WHERE stream_rownum BETWEEN 1001 AND 2000")
+
+
+def test_page_size_above_runsuiteql_limit_is_rejected(tmp_path, fake_gateway):
+    out = tmp_path / "lines.csv"
+    summary = export_query("SELECT id FROM t ORDER BY id", str(out), page_size=query_stream.MAX_PAGE_SIZE + 1)
+    assert "page_size" in summary["error"]
+    assert not out.exists() and not Path(f"{out}.part").exists()
+    with pytest.raises(ValueError):
+        next(query_stream.iter_pages("SELECT id FROM t ORDER BY id", page_size=query_stream.MAX_PAGE_SIZE + 1))
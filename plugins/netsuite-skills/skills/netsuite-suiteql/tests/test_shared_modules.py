@@ -0,0 +1,16 @@
+"""The MCP extension bundles its own copies of the shared schema modules; they must not drift."""
+
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+EXTENSION_SRC = Path(__file__).parents[5] / "extensions" / "netsuite-suiteql" / "src"
+
+
+@pytest.mark.parametrize("module", ["schema_index.py", "schema_graph.py"])
+def test_extension_copy_matches_skill_copy(module):
+    if not EXTENSION_SRC.is_dir():
+        pytest.skip("netsuite-suiteql extension not in this checkout")
+    assert (EXTENSION_SRC / module).read_bytes() == (SCRIPTS_DIR / module).read_bytes(), (
+        f"{module} differs between scripts/ and {EXTENSION_SRC}; copy the edited file over the other")